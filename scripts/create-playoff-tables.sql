@@ -27,12 +27,28 @@ CREATE TABLE IF NOT EXISTS playoff_confidence_points (
   UNIQUE(participant_id, pool_id, season, confidence_points)
 );
 
+-- Create playoff_leaderboards table
+-- Top-N leaderboard snapshot per pool, written by `populate-playoff-teams.py leaderboard`
+CREATE TABLE IF NOT EXISTS playoff_leaderboards (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  pool_id UUID NOT NULL REFERENCES pools(id) ON DELETE CASCADE,
+  season INTEGER NOT NULL,
+  participant_count INTEGER NOT NULL,
+  top_entries JSONB NOT NULL,
+  score_counts JSONB NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  UNIQUE(pool_id, season)
+);
+
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_playoff_teams_season ON playoff_teams(season);
 CREATE INDEX IF NOT EXISTS idx_playoff_confidence_points_participant_pool_season ON playoff_confidence_points(participant_id, pool_id, season);
 CREATE INDEX IF NOT EXISTS idx_playoff_confidence_points_pool_season ON playoff_confidence_points(pool_id, season);
+-- Matches the ORDER BY of the leaderboard/snapshot scans, so their pages are read in index order instead of sorted
+CREATE INDEX IF NOT EXISTS idx_playoff_confidence_points_season_order ON playoff_confidence_points(season, pool_id, participant_id, team_name);
 
 -- Add comments for documentation
 COMMENT ON TABLE playoff_teams IS 'Stores which teams made it to the playoffs for each season (same for all pools)';
 COMMENT ON TABLE playoff_confidence_points IS 'Stores user confidence points for playoff teams, submitted once at the beginning of playoffs';
-
+COMMENT ON TABLE playoff_leaderboards IS 'Top-N playoff leaderboard per pool: [rank, participant_id, score] entries and a score histogram for dense ranks';
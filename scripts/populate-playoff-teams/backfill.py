@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Historical playoff backfill for populate-playoff-teams.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py backfill --seasons 2002-2025 --yes
+
+For each season the postseason scoreboard (matchups, kickoffs, scores, winners) is read
+week by week using the season's playoff calendar, and the seeds come from the ESPN
+standings API. Seasons are fetched by a bounded worker pool; every request goes through
+the shared HTTP client (rate limiting, retries, coalescing) and the calendar and seeds
+are cached on disk, so reruns do not refetch them. Each season is written with two bulk
+upserts (playoff_teams, games) and recorded in a checkpoint file, so an interrupted
+backfill resumes with the first season that is not done.
+
+Seasons before 2020 had 6 seeds per conference (11 playoff games), later ones 7 (13).
+"""
+
+import os
+import sys
+import json
+import argparse
+import contextlib
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable
+
+import requests
+
+import playoff_calendar
+from http_client import get_http_client
+
+SCOREBOARD_URL = 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates={dates}&seasontype=3'
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backfill-checkpoint.json')
+DEFAULT_WORKERS = 4
+
+# Historical seeds don't change; reuse fetched standings for a week
+SEEDS_CACHE_TTL = 7 * 24 * 3600
+
+# ESPN competition state → games.status (same mapping as the season-games admin sync)
+STATUS_BY_STATE = {'post': 'final', 'in': 'live', 'pre': 'scheduled'}
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+
+def seeds_per_conference(season: int) -> int:
+    """Playoff seeds per conference: 7 since the 2020 season, 6 before."""
+    return 7 if season >= 2020 else 6
+
+
+def expected_playoff_games(season: int) -> int:
+    return 2 * seeds_per_conference(season) - 1
+
+
+def parse_seasons(value: str) -> List[int]:
+    """'2002-2025' or '2019,2021-2023' → sorted season list (ValueError if malformed)."""
+    seasons = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = (int(x) for x in part.split('-', 1))
+            if first > last:
+                raise ValueError(f"Season range {part} runs backwards")
+            seasons.update(range(first, last + 1))
+        else:
+            seasons.add(int(part))
+    if not seasons:
+        raise ValueError("No seasons given")
+    return sorted(seasons)
+
+
+def parse_scoreboard_results(data: Dict, season: int, week: int) -> List[Dict[str, Any]]:
+    """games rows (with scores, winner and status) from one ESPN postseason scoreboard response."""
+    rows = []
+    for event in data.get('events', []):
+        competitions = event.get('competitions', [])
+        if not event.get('id') or not competitions:
+            continue
+        comp = competitions[0]
+        sides = {c.get('homeAway'): c for c in comp.get('competitors', [])}
+        home, away = sides.get('home'), sides.get('away')
+        if not home or not away:
+            continue
+        home_team = home.get('team', {}).get('displayName', '').strip()
+        away_team = away.get('team', {}).get('displayName', '').strip()
+        if not home_team or not away_team or 'TBD' in (home_team, away_team):
+            continue
+        # The Pro Bowl falls between the conference championships and the Super Bowl
+        if any('pro bowl' in (note.get('headline') or '').lower() for note in comp.get('notes', [])):
+            continue
+
+        state = comp.get('status', event.get('status', {})).get('type', {}).get('state')
+        status = STATUS_BY_STATE.get(state, 'scheduled')
+        winner = next((c.get('team', {}).get('displayName') for c in (home, away) if c.get('winner')), None)
+        rows.append({
+            'id': str(event['id']),
+            'week': week,
+            'season': season,
+            'season_type': 3,
+            'home_team': home_team,
+            'away_team': away_team,
+            'kickoff_time': comp.get('date') or event.get('date'),
+            'home_score': int(home['score']) if status != 'scheduled' and str(home.get('score', '')).isdigit() else None,
+            'away_score': int(away['score']) if status != 'scheduled' and str(away.get('score', '')).isdigit() else None,
+            'winner': winner if status == 'final' else None,
+            'status': status,
+        })
+    return rows
+
+
+def fetch_season_games(season: int) -> List[Dict[str, Any]]:
+    """All playoff games of a season from the ESPN scoreboard (raises RuntimeError on failure)."""
+    calendar = playoff_calendar.get_calendar(season)
+    if len(calendar) < 4:
+        raise RuntimeError(f"No complete playoff calendar for {season}")
+    client = get_http_client()
+    games = {}
+    for week in sorted(calendar):
+        for dates in calendar[week]:
+            url = SCOREBOARD_URL.format(dates=dates)
+            try:
+                response = client.get(url, timeout=15)
+                if response.status_code != 200:
+                    raise RuntimeError(f"ESPN returned status {response.status_code} for {url}")
+                for row in parse_scoreboard_results(response.json(), season, week):
+                    games[row['id']] = row
+            except (requests.exceptions.RequestException, ValueError) as e:
+                raise RuntimeError(f"Could not fetch {season} week {week} scoreboard: {e}") from e
+    return sorted(games.values(), key=lambda g: (g['week'], g['kickoff_time'] or '', g['id']))
+
+
+def validate_season(season: int, teams: List[Dict[str, any]], games: List[Dict[str, Any]]) -> List[str]:
+    """Problems with a fetched season (empty list if it is complete and consistent)."""
+    problems = []
+    seeds = seeds_per_conference(season)
+    for conference in ['AFC', 'NFC']:
+        conf_seeds = sorted(t.get('seed') or 0 for t in teams if (t.get('conference') or '').upper() == conference)
+        if conf_seeds != list(range(1, seeds + 1)):
+            problems.append(f"{conference} seeds are {conf_seeds}, expected 1-{seeds}")
+    if len(games) != expected_playoff_games(season):
+        problems.append(f"expected {expected_playoff_games(season)} games, got {len(games)}")
+    team_names = {t['team_name'] for t in teams}
+    strangers = sorted({name for g in games for name in (g['home_team'], g['away_team'])} - team_names)
+    if teams and strangers:
+        problems.append(f"games involve teams without a seed: {', '.join(strangers)}")
+    return problems
+
+
+def fetch_season(season: int, fetch_teams: Callable[[int], List[Dict[str, any]]]) -> Dict[str, Any]:
+    """Seeds and games for one season (runs on a worker thread)."""
+    teams = [t for t in fetch_teams(season) if (t.get('seed') or 0) <= seeds_per_conference(season)]
+    games = fetch_season_games(season)
+    return {
+        'season': season,
+        'teams': teams,
+        'games': games,
+        'problems': validate_season(season, teams, games),
+        'final': bool(games) and all(g['status'] == 'final' for g in games),
+    }
+
+
+def write_season(supabase, result: Dict[str, Any]) -> None:
+    """Bulk upsert a fetched season: one round trip for playoff_teams and one for games."""
+    season = result['season']
+    if result['teams']:
+        supabase.table('playoff_teams').upsert([{
+            'season': season,
+            'team_name': t['team_name'],
+            'team_abbreviation': t.get('team_abbreviation'),
+            'conference': t.get('conference'),
+            'seed': t.get('seed'),
+        } for t in result['teams']], on_conflict='season,team_name').execute()
+
+    if result['games']:
+        # Keep the ids of games already stored under a generated id (same week and matchup)
+        existing = supabase.table('games').select('id, week, home_team, away_team') \
+            .eq('season', season).eq('season_type', 3).execute()
+        known_ids = {(g['week'], g['home_team'], g['away_team']): g['id'] for g in existing.data or []}
+        rows = [dict(g, id=known_ids.get((g['week'], g['home_team'], g['away_team']), g['id'])) for g in result['games']]
+        supabase.table('games').upsert(rows, on_conflict='id').execute()
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        checkpoint = {}
+    checkpoint.setdefault('seasons', {})
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically, so an interrupt never leaves it half written."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def run_backfill(supabase, seasons: List[int], fetch_teams: Callable[[int], List[Dict[str, any]]],
+                 workers: int = DEFAULT_WORKERS, checkpoint_path: str = DEFAULT_CHECKPOINT_PATH,
+                 write: bool = True, restart: bool = False) -> Dict[str, Any]:
+    """Fetch (and optionally write) every season; returns a JSON-serialisable summary.
+
+    A season is marked done in the checkpoint once it was written complete and final;
+    seasons that are incomplete, still in progress or failed are retried next run.
+    """
+    checkpoint = {'seasons': {}} if restart else load_checkpoint(checkpoint_path)
+    done = {int(s) for s, entry in checkpoint['seasons'].items() if entry.get('status') == 'done'}
+    pending = [s for s in seasons if s not in done]
+    summary = {'command': 'backfill', 'seasons': {}, 'skipped': sorted(set(seasons) & done)}
+    if summary['skipped']:
+        print(f"Skipping {len(summary['skipped'])} season(s) already done in {checkpoint_path}")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='backfill') as pool:
+        futures = {pool.submit(fetch_season, season, fetch_teams): season for season in pending}
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ {season}: {e}")
+                summary['seasons'][season] = {'status': 'failed', 'message': str(e)}
+                if write:
+                    checkpoint['seasons'][str(season)] = {'status': 'failed', 'message': str(e),
+                                                          'at': datetime.now().isoformat(timespec='seconds')}
+                    save_checkpoint(checkpoint_path, checkpoint)
+                continue
+
+            status = 'done' if result['final'] and not result['problems'] else 'partial'
+            entry = {'status': status, 'teams': len(result['teams']), 'games': len(result['games'])}
+            if result['problems']:
+                entry['problems'] = result['problems']
+                print(f"⚠️  {season}: {'; '.join(result['problems'])}")
+
+            if write:
+                try:
+                    write_season(supabase, result)
+                except Exception as e:
+                    print(f"❌ {season}: write failed: {e}")
+                    summary['seasons'][season] = {'status': 'failed', 'message': f"write failed: {e}"}
+                    continue
+                checkpoint['seasons'][str(season)] = dict(entry, at=datetime.now().isoformat(timespec='seconds'))
+                save_checkpoint(checkpoint_path, checkpoint)
+            else:
+                entry['status'] = f"dry_run ({status})"
+
+            print(f"✅ {season}: {entry['teams']} teams, {entry['games']} games ({entry['status']})")
+            summary['seasons'][season] = entry
+
+    summary['seasons'] = {s: summary['seasons'][s] for s in sorted(summary['seasons'])}
+    return summary
+
+
+def add_backfill_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `backfill` command on the main CLI parser."""
+    parser = subparsers.add_parser('backfill', parents=common_parents or [],
+                                   help='Load historical playoff seeds and games for a range of seasons')
+    parser.add_argument('--seasons', required=True, help='Seasons to load, e.g. 2002-2025 or 2019,2021-2023')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Seasons fetched in parallel (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help='Checkpoint file (default: backfill-checkpoint.json next to this script)')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and load every season again')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Write to the database (without it, only fetch and validate)')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON summary to stdout')
+    return parser
+
+
+def run_backfill_command(supabase, args, fetch_teams: Callable[[int], List[Dict[str, any]]]) -> int:
+    """Run `backfill`; returns the process exit code (1 if any season failed)."""
+    try:
+        seasons = parse_seasons(args.seasons)
+    except ValueError as e:
+        print(f"❌ Invalid --seasons: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        summary = run_backfill(supabase, seasons, fetch_teams, workers=args.workers,
+                               checkpoint_path=args.checkpoint, write=args.yes, restart=args.restart)
+    if args.json:
+        print(json.dumps(summary, default=str))
+    else:
+        failed = [s for s, entry in summary['seasons'].items() if entry['status'] == 'failed']
+        print(f"\nBackfill: {len(summary['seasons'])} season(s) processed, {len(summary['skipped'])} skipped, "
+              f"{len(failed)} failed")
+    return EXIT_ERROR if any(e['status'] == 'failed' for e in summary['seasons'].values()) else EXIT_OK
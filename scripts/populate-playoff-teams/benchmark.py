@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the populate-playoff-teams tool.
+
+Covers the main stages end to end without touching the network or production:
+  - extract:  ESPN/NFL.com standings HTML, ESPN standings API JSON and ESPN scoreboard JSON parsing
+  - load:     load_teams_from_file on large JSON and CSV inputs, and the streaming ingest check
+              (ingest.py) of the same records as NDJSON
+  - bracket:  every playoff bracket generator, and matching a week's games to ESPN events
+  - db:       insert_playoff_teams / insert_playoff_games against the local SQLite stand-in
+  - simulate: the postseason simulation with 1, 2, 4, ... worker processes up to the core count
+  - pools:    synthetic pools (synthetic_data.py, --pools of them) written to SQLite, then the
+              leaderboard and snapshot builds over them
+
+Recorded pages can be supplied with --espn-html/--espn-json/--nfl-html/--scoreboard-json; otherwise
+synthetic pages with the same embedded-data structure are generated.
+
+Usage:
+    python scripts/populate-playoff-teams/benchmark.py [--iterations 20] [--only extract,db]
+    python scripts/populate-playoff-teams/benchmark.py --save-baseline
+    python scripts/populate-playoff-teams/benchmark.py --baseline benchmark-baseline.json --fail-on-regression
+"""
+
+import os
+import sys
+import io
+import json
+import csv
+import time
+import platform
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Callable, Any
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+DEFAULT_RESULTS_FILE = os.path.join(current_dir, 'benchmark-results.json')
+DEFAULT_BASELINE_FILE = os.path.join(current_dir, 'benchmark-baseline.json')
+
+STAGES = ['extract', 'load', 'bracket', 'db', 'simulate', 'pools']
+
+
+def load_tool_modules():
+    """Import interactive_mode (which loads populate-playoff-teams.py) with its startup output silenced."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import interactive_mode
+    return interactive_mode.populate_playoff_teams, interactive_mode
+
+
+# --- Fixtures ---
+
+def sample_playoff_teams(nfl_teams: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Seeds 1-7 for each conference, taken in NFL_TEAMS order."""
+    teams = []
+    for conference in ['AFC', 'NFC']:
+        conf_teams = [t for t in nfl_teams if t['conference'] == conference][:7]
+        for seed, team in enumerate(conf_teams, 1):
+            teams.append({
+                'team_name': team['name'],
+                'team_abbreviation': team['abbreviation'],
+                'conference': conference,
+                'seed': seed
+            })
+    return teams
+
+
+def build_espn_standings_html(nfl_teams: List[Dict[str, str]], filler_kb: int = 512) -> str:
+    """Build a page shaped like ESPN's playoff standings (window['__espnfitt__'] JSON in a script tag)."""
+    groups = []
+    for conference in ['AFC', 'NFC']:
+        entries = []
+        conf_teams = [t for t in nfl_teams if t['conference'] == conference]
+        for idx, team in enumerate(conf_teams, 1):
+            entries.append({
+                'team': {'displayName': team['name'], 'abbreviation': team['abbreviation']},
+                'stats': [
+                    {'name': 'wins', 'value': 17 - idx},
+                    {'name': 'losses', 'value': idx},
+                    {'name': 'playoffSeed', 'value': idx},
+                ]
+            })
+        groups.append({'name': conference, 'standings': {'entries': entries}})
+
+    data = {
+        'page': {
+            'content': {
+                'standings': {'groups': groups},
+                # ESPN pages carry a lot of unrelated state; pad to a realistic size
+                'filler': [{'id': i, 'text': 'x' * 100} for i in range(filler_kb * 1024 // 120)]
+            }
+        }
+    }
+    body = ''.join(f'<div class="nav-item"><a href="/nfl/story/{i}">Story {i}</a></div>' for i in range(200))
+    return (
+        '<html><head><title>NFL Playoff Standings</title></head><body>'
+        f'{body}'
+        f"<script>window['__espnfitt__']={json.dumps(data, separators=(',', ':'))};</script>"
+        '</body></html>'
+    )
+
+
+def build_espn_standings_api_json(nfl_teams: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Build a response shaped like ESPN's standings JSON API (conference children with playoffSeed stats)."""
+    children = []
+    for conference in ['AFC', 'NFC']:
+        entries = []
+        conf_teams = [t for t in nfl_teams if t['conference'] == conference]
+        for idx, team in enumerate(conf_teams, 1):
+            entries.append({
+                'team': {'id': str(idx), 'displayName': team['name'], 'abbreviation': team['abbreviation']},
+                'stats': [
+                    {'name': 'wins', 'value': 17 - idx},
+                    {'name': 'losses', 'value': idx},
+                    {'name': 'playoffSeed', 'value': float(idx)},
+                ]
+            })
+        children.append({'name': f'{conference} Conference', 'abbreviation': conference, 'standings': {'entries': entries}})
+    return {'name': 'National Football League', 'children': children}
+
+
+def build_nfl_playoff_picture_html(nfl_teams: List[Dict[str, str]], filler_kb: int = 512) -> str:
+    """Build a page shaped like NFL.com's playoff picture (__NEXT_DATA__ JSON in a script tag)."""
+    teams = []
+    for team in sample_playoff_teams(nfl_teams):
+        teams.append({
+            'team': {
+                'fullName': team['team_name'],
+                'abbr': team['team_abbreviation'],
+                'conference': team['conference'],
+                'seed': team['seed']
+            }
+        })
+    data = {
+        'props': {
+            'pageProps': {
+                'filler': [{'id': i, 'text': 'x' * 100} for i in range(filler_kb * 1024 // 120)],
+                'playoffPicture': {'teams': teams}
+            }
+        }
+    }
+    return (
+        '<html><head><title>Playoff Picture</title></head><body>'
+        f"<script>window.__NEXT_DATA__ = {json.dumps(data, separators=(',', ':'))};</script>"
+        '</body></html>'
+    )
+
+
+def build_espn_scoreboard(teams: List[Dict[str, Any]], events: int = 6) -> Dict[str, Any]:
+    """Build an ESPN scoreboard API response with the wild card matchups."""
+    by_conf = {'AFC': {}, 'NFC': {}}
+    for team in teams:
+        by_conf[team['conference']][team['seed']] = team['team_name']
+    result = []
+    matchups = [(conf, high, low) for conf in ['AFC', 'NFC'] for high, low in [(2, 7), (3, 6), (4, 5)]]
+    for idx, (conf, high, low) in enumerate(matchups[:events]):
+        result.append({
+            'id': str(401772000 + idx),
+            'date': f'2026-01-{10 + idx // 3}T18:00Z',
+            'competitions': [{
+                'date': f'2026-01-{10 + idx // 3}T18:00Z',
+                'competitors': [
+                    {'homeAway': 'home', 'team': {'displayName': by_conf[conf][high]}},
+                    {'homeAway': 'away', 'team': {'displayName': by_conf[conf][low]}},
+                ]
+            }]
+        })
+    return {'events': result}
+
+
+def write_large_team_files(directory: str, teams: List[Dict[str, Any]], rows: int) -> Dict[str, str]:
+    """Write JSON and CSV team files with `rows` records (the sample teams repeated), and NDJSON
+    with one season per field so every record passes the ingest checks."""
+    records = [teams[i % len(teams)] for i in range(rows)]
+    json_path = os.path.join(directory, 'teams-large.json')
+    with open(json_path, 'w') as f:
+        json.dump(records, f)
+    csv_path = os.path.join(directory, 'teams-large.csv')
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['team_name', 'team_abbreviation', 'conference', 'seed'])
+        writer.writeheader()
+        writer.writerows(records)
+    ndjson_path = os.path.join(directory, 'teams-large.ndjson')
+    with open(ndjson_path, 'w') as f:
+        for i, record in enumerate(records):
+            f.write(json.dumps(dict(record, season=2020 + i // len(teams))) + '\n')
+    return {'json': json_path, 'csv': csv_path, 'ndjson': ndjson_path}
+
+
+# --- Measurement ---
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def measure(name: str, func: Callable[[], Any], items: int, iterations: int, warmup: int = 1,
+            setup: Optional[Callable[[], None]] = None, unit: str = 'rows') -> Dict[str, Any]:
+    """Run func repeatedly and return latency percentiles and throughput (units/second).
+
+    setup (if given) runs before every iteration and is excluded from the timing.
+    Output printed by the tool itself is discarded.
+    """
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(warmup + iterations):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                samples.append(elapsed)
+    total = sum(samples)
+    return {
+        'name': name,
+        'iterations': iterations,
+        'items_per_iteration': items,
+        'unit': unit,
+        'mean_ms': round(total / len(samples) * 1000, 4),
+        'p50_ms': round(percentile(samples, 50) * 1000, 4),
+        'p95_ms': round(percentile(samples, 95) * 1000, 4),
+        'throughput_per_s': round(items * len(samples) / total, 2) if total > 0 else None,
+    }
+
+
+# --- Stages ---
+
+def bench_extract(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    results = []
+
+    if args.espn_html:
+        with open(args.espn_html, 'rb') as f:
+            espn_html = f.read()
+    else:
+        espn_html = build_espn_standings_html(main_module.NFL_TEAMS).encode('utf-8')
+    found = main_module.parse_playoff_teams_from_espn_html(espn_html)
+    print(f"  ESPN page: {len(espn_html) / 1024:.0f} KB, {len(found)} teams extracted")
+    results.append(measure('extract.espn_standings_html',
+                           lambda: main_module.parse_playoff_teams_from_espn_html(espn_html),
+                           len(espn_html), args.iterations, unit='bytes'))
+
+    if args.espn_json:
+        with open(args.espn_json, 'r') as f:
+            espn_json = f.read()
+    else:
+        espn_json = json.dumps(build_espn_standings_api_json(main_module.NFL_TEAMS))
+    found = main_module.parse_playoff_teams_from_espn_standings_json(json.loads(espn_json))
+    print(f"  ESPN standings API: {len(espn_json) / 1024:.0f} KB, {len(found)} teams extracted")
+    results.append(measure('extract.espn_standings_api_json',
+                           lambda: main_module.parse_playoff_teams_from_espn_standings_json(json.loads(espn_json)),
+                           len(espn_json), args.iterations, unit='bytes'))
+
+    if args.nfl_html:
+        with open(args.nfl_html, 'rb') as f:
+            nfl_html = f.read()
+    else:
+        nfl_html = build_nfl_playoff_picture_html(main_module.NFL_TEAMS).encode('utf-8')
+    found = main_module.parse_playoff_teams_from_nfl_html(nfl_html)
+    print(f"  NFL.com page: {len(nfl_html) / 1024:.0f} KB, {len(found)} teams extracted")
+    results.append(measure('extract.nfl_playoff_picture_html',
+                           lambda: main_module.parse_playoff_teams_from_nfl_html(nfl_html),
+                           len(nfl_html), args.iterations, unit='bytes'))
+
+    if args.scoreboard_json:
+        with open(args.scoreboard_json, 'r') as f:
+            scoreboard_text = f.read()
+    else:
+        scoreboard_text = json.dumps(build_espn_scoreboard(teams))
+    results.append(measure('extract.espn_scoreboard_json',
+                           lambda: interactive_mode.parse_espn_scoreboard_events(json.loads(scoreboard_text), '20260110'),
+                           len(scoreboard_text), args.iterations, unit='bytes'))
+    return results
+
+
+def bench_load(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_large_team_files(tmp, teams, args.rows)
+        for fmt in ['json', 'csv']:
+            path = paths[fmt]
+            results.append(measure(f'load.teams_file_{fmt}',
+                                   lambda path=path: main_module.load_teams_from_file(path),
+                                   args.rows, max(3, args.iterations // 4)))
+        import ingest
+        results.append(measure('load.ingest_ndjson_check',
+                               lambda: ingest.ingest(None, paths['ndjson'], main_module.NFL_TEAMS, write=False),
+                               args.rows, max(3, args.iterations // 4)))
+    return results
+
+
+def bench_bracket(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    teams_by_conf = {'AFC': {}, 'NFC': {}}
+    for team in teams:
+        teams_by_conf[team['conference']][team['seed']] = team['team_name']
+    # Higher seed wins every game
+    week_1_winners = {conf: [seeds[2], seeds[3], seeds[4]] for conf, seeds in teams_by_conf.items()}
+    week_2_winners = {conf: [seeds[1], seeds[2]] for conf, seeds in teams_by_conf.items()}
+    week_3_winners = {conf: seeds[1] for conf, seeds in teams_by_conf.items()}
+
+    wild_card_games = interactive_mode.generate_wild_card_games(teams_by_conf)
+    scoreboard = build_espn_scoreboard(teams)
+    espn_games = interactive_mode.parse_espn_scoreboard_events(scoreboard, '20260110')
+
+    # Bracket generators are microsecond-scale; time batches of calls
+    batch = 1000
+    cases = [
+        ('bracket.wild_card', lambda: interactive_mode.generate_wild_card_games(teams_by_conf)),
+        ('bracket.divisional', lambda: interactive_mode.generate_divisional_games(teams_by_conf, week_1_winners)),
+        ('bracket.conference', lambda: interactive_mode.generate_conference_championship_games(teams_by_conf, week_2_winners)),
+        ('bracket.super_bowl', lambda: interactive_mode.generate_super_bowl_game(week_3_winners)),
+        ('bracket.espn_match', lambda: interactive_mode.build_playoff_game_rows(2025, 1, wild_card_games, espn_games)),
+    ]
+    results = []
+    for name, func in cases:
+        def run_batch(func=func):
+            for _ in range(batch):
+                func()
+        results.append(measure(name, run_batch, batch, args.iterations, unit='calls'))
+    return results
+
+
+def bench_db(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    import local_db
+
+    season = 2025
+    results = []
+    state = {}
+
+    def fresh_db():
+        if 'client' in state:
+            state['client'].close()
+        state['client'] = local_db.LocalClient(':memory:')
+
+    def seeded_db():
+        fresh_db()
+        with contextlib.redirect_stdout(io.StringIO()):
+            main_module.insert_playoff_teams(state['client'], season, teams, skip_approval=True)
+
+    results.append(measure('db.insert_playoff_teams',
+                           lambda: main_module.insert_playoff_teams(state['client'], season, teams, skip_approval=True),
+                           len(teams), args.iterations, setup=fresh_db))
+    results.append(measure('db.insert_playoff_teams_replace',
+                           lambda: main_module.insert_playoff_teams(state['client'], season, teams, skip_approval=True),
+                           len(teams), args.iterations, setup=seeded_db))
+    results.append(measure('db.insert_playoff_teams_update_mode',
+                           lambda: main_module.insert_playoff_teams(state['client'], season, teams, skip_approval=True, update_mode=True),
+                           len(teams), args.iterations, setup=seeded_db))
+
+    teams_by_conf = {'AFC': {}, 'NFC': {}}
+    for team in teams:
+        teams_by_conf[team['conference']][team['seed']] = team['team_name']
+    games = interactive_mode.generate_wild_card_games(teams_by_conf)
+    espn_games = interactive_mode.parse_espn_scoreboard_events(build_espn_scoreboard(teams), '20260110')
+
+    results.append(measure('db.insert_playoff_games',
+                           lambda: interactive_mode.insert_playoff_games(state['client'], season, 1, games, [], espn_games=espn_games, teams_by_conf=teams_by_conf),
+                           len(games), args.iterations, setup=fresh_db))
+
+    def existing_games_db():
+        fresh_db()
+        with contextlib.redirect_stdout(io.StringIO()):
+            interactive_mode.insert_playoff_games(state['client'], season, 1, games, [], espn_games=espn_games,
+                                                  teams_by_conf=teams_by_conf)
+        state['existing'] = state['client'].table('games').select('*').eq('season', season).execute().data
+
+    results.append(measure('db.insert_playoff_games_update',
+                           lambda: interactive_mode.insert_playoff_games(state['client'], season, 1, games, state['existing'], espn_games=espn_games, teams_by_conf=teams_by_conf),
+                           len(games), args.iterations, setup=existing_games_db))
+    state['client'].close()
+    return results
+
+
+def bench_simulate(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    import simulation
+    if simulation.np is None:
+        print("  numpy not installed; skipping")
+        return []
+
+    coin = simulation.np.full((14, 14), 0.5)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({min(2 ** i, cores) for i in range(cores.bit_length() + 1)})
+    # Each run starts its own pool, so process startup is part of the timing
+    iterations = min(args.iterations, 5)
+    results = []
+    for workers in worker_counts:
+        result = measure(f'simulate.workers_{workers}',
+                         lambda: simulation.run_simulation(coin, coin, 7, runs=args.sim_runs, workers=workers, random_seed=1),
+                         args.sim_runs, iterations, unit='runs')
+        results.append(result)
+    single = results[0]['throughput_per_s']
+    for result in results:
+        workers = int(result['name'].rsplit('_', 1)[1])
+        result['speedup'] = round(result['throughput_per_s'] / single, 2)
+        print(f"  {workers:>3} worker(s): {result['throughput_per_s']:>14,.0f} runs/s, "
+              f"{result['speedup']:.2f}x ({100 * result['speedup'] / workers:.0f}% of linear)")
+    return results
+
+
+def bench_pools(main_module, interactive_mode, args, teams) -> List[Dict[str, Any]]:
+    import local_db
+    import leaderboard
+    import snapshots
+    import synthetic_data
+    if synthetic_data.np is None:
+        print("  numpy not installed; skipping")
+        return []
+
+    season = 2099
+    nfl_teams = main_module.NFL_TEAMS
+    # Each step reads the whole synthetic season, so a few iterations are plenty
+    iterations = min(args.iterations, 3)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        state = {}
+
+        def fresh_db():
+            if 'client' in state:
+                state['client'].close()
+            path = os.path.join(tmp, f"pools-{len(os.listdir(tmp))}.db")
+            state['client'] = local_db.LocalClient(path)
+
+        def generate():
+            state['stats'] = synthetic_data.generate(state['client'], season, nfl_teams, pools=args.pools)
+
+        results.append(measure('pools.generate', generate, args.pools, 1, warmup=0, setup=fresh_db, unit='pools'))
+        points = state['stats']['tables']['playoff_confidence_points']['rows']
+        participants = state['stats']['tables']['participants']['rows']
+        print(f"  {args.pools:,} pools, {participants:,} participants, {points:,} confidence points")
+
+        client = state['client']
+        winners = leaderboard.decided_games(client, season)
+        results.append(measure('pools.leaderboard_top10', lambda: leaderboard.build_leaderboards(
+            leaderboard.participant_scores(leaderboard.stream_confidence_rows(client, season),
+                                           leaderboard.stream_pick_rows(client, winners), winners)),
+            participants, iterations, unit='people'))
+
+        snapshot_dir = os.path.join(tmp, 'snapshots')
+        results.append(measure('pools.snapshots_full',
+                               lambda: snapshots.publish_snapshots(client, season, snapshot_dir, full=True),
+                               args.pools, iterations, unit='pools'))
+        results.append(measure('pools.snapshots_unchanged',
+                               lambda: snapshots.publish_snapshots(client, season, snapshot_dir),
+                               args.pools, iterations, unit='pools'))
+        client.close()
+    return results
+
+
+STAGE_FUNCS = {
+    'extract': bench_extract,
+    'load': bench_load,
+    'bracket': bench_bracket,
+    'db': bench_db,
+    'simulate': bench_simulate,
+    'pools': bench_pools,
+}
+
+
+# --- Reporting ---
+
+def print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]] = None,
+                  threshold: float = 10.0) -> List[str]:
+    """Print a results table; returns names of cases whose p50 regressed past the threshold."""
+    regressions = []
+    print("\n" + "=" * 100)
+    header = f"{'Benchmark':40} {'p50 ms':>10} {'p95 ms':>10} {'throughput/s':>14} {'unit':6}"
+    if baseline:
+        header += f" {'base p50':>10} {'Δ p50':>8}"
+    print(header)
+    print("-" * 100)
+    for result in results:
+        line = (f"{result['name']:40} {result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} "
+                f"{result['throughput_per_s'] or 0:>14,.1f} {result.get('unit', ''):6}")
+        base = baseline.get(result['name']) if baseline else None
+        if base and base.get('p50_ms'):
+            delta = (result['p50_ms'] - base['p50_ms']) / base['p50_ms'] * 100
+            marker = ''
+            if delta > threshold:
+                marker = ' ⚠️'
+                regressions.append(result['name'])
+            line += f" {base['p50_ms']:>10.3f} {delta:>+7.1f}%{marker}"
+        elif baseline is not None:
+            line += f" {'-':>10} {'new':>8}"
+        print(line)
+    print("=" * 100)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark scrape → parse → bracket → DB sync stages of populate-playoff-teams',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run every stage and save results
+  python scripts/populate-playoff-teams/benchmark.py
+
+  # Store the current numbers as the baseline
+  python scripts/populate-playoff-teams/benchmark.py --save-baseline
+
+  # Compare against the baseline and fail (exit 1) if any p50 regressed by more than 15%
+  python scripts/populate-playoff-teams/benchmark.py --threshold 15 --fail-on-regression
+
+  # Use recorded pages instead of synthetic ones
+  python scripts/populate-playoff-teams/benchmark.py --only extract --espn-html espn-response-2025.html
+        """
+    )
+    parser.add_argument('--iterations', type=int, default=20, help='Timed iterations per benchmark (default: 20)')
+    parser.add_argument('--only', help=f'Comma-separated stages to run ({", ".join(STAGES)})')
+    parser.add_argument('--rows', type=int, default=100000, help='Records in the large JSON/CSV load inputs (default: 100000)')
+    parser.add_argument('--sim-runs', type=int, default=2_000_000,
+                        help='Postseasons per simulate benchmark iteration (default: 2000000)')
+    parser.add_argument('--pools', type=int, default=500, help='Synthetic pools for the pools stage (default: 500)')
+    parser.add_argument('--espn-html', help='Recorded ESPN playoff standings page')
+    parser.add_argument('--espn-json', help='Recorded ESPN standings API response')
+    parser.add_argument('--nfl-html', help='Recorded NFL.com playoff picture page')
+    parser.add_argument('--scoreboard-json', help='Recorded ESPN scoreboard API response')
+    parser.add_argument('--output', default=DEFAULT_RESULTS_FILE, help='Where to write results JSON')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_FILE, help='Baseline results JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Also write results to the baseline file')
+    parser.add_argument('--threshold', type=float, default=10.0, help='p50 regression threshold in percent (default: 10)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 if any benchmark regressed')
+    args = parser.parse_args()
+
+    stages = STAGES
+    if args.only:
+        stages = [s.strip() for s in args.only.split(',') if s.strip()]
+        unknown = [s for s in stages if s not in STAGE_FUNCS]
+        if unknown:
+            print(f"❌ Unknown stage(s): {', '.join(unknown)}. Choose from: {', '.join(STAGES)}")
+            sys.exit(1)
+
+    main_module, interactive_mode = load_tool_modules()
+    teams = sample_playoff_teams(main_module.NFL_TEAMS)
+
+    results = []
+    for stage in stages:
+        print(f"Running {stage} benchmarks...")
+        results.extend(STAGE_FUNCS[stage](main_module, interactive_mode, args, teams))
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = {r['name']: r for r in json.load(f).get('results', [])}
+        print(f"\nComparing against baseline: {args.baseline}")
+
+    regressions = print_results(results, baseline, args.threshold)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': args.iterations,
+            'rows': args.rows,
+            'stages': stages,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results saved to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Baseline saved to: {args.baseline}")
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0f}%: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Skip unchanged standings for populate-playoff-teams.
+
+For every season, source and database the last run's result is kept in
+source-state.json next to this script:
+  - the ETag / Last-Modified of the source response, sent back as If-None-Match /
+    If-Modified-Since so an unchanged page costs one 304 with no body
+  - a SHA-256 of the raw response, so an identical body is not parsed again
+  - a fingerprint of the extracted seeds (conference, seed, team), so a page whose
+    markup changed but whose seeds did not skips the preview and database write
+
+Any of the three raises SourceUnchanged (or, for the fingerprint, is reported by
+is_unchanged()); the CLI then exits with EXIT_UNCHANGED. State is only saved after the
+teams were written, so a failed or cancelled run is retried next time.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Any
+
+import requests
+
+from http_client import get_http_client
+
+DEFAULT_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source-state.json')
+
+# Exit status when the standings have not changed since the last successful run
+EXIT_UNCHANGED = 4
+
+
+class SourceUnchanged(Exception):
+    """Raised by conditional_get when the source response is the one already processed."""
+
+
+def fingerprint_teams(teams: List[Dict[str, any]]) -> str:
+    """Order-independent hash of the seeds that matter (conference, seed, team name)."""
+    seeds = sorted(((t.get('conference') or '').upper(), t.get('seed') or 0, t.get('team_name') or '') for t in teams)
+    return hashlib.sha256(json.dumps(seeds, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def conditional_get(url: str, headers: Dict[str, str], state: Optional[Dict[str, Any]] = None,
+                    timeout: float = 15) -> requests.Response:
+    """GET through the shared HTTP client, revalidating against a source's saved state.
+
+    With state None this is a plain get. Otherwise the saved validators are sent, a 304
+    or a body identical to the last processed one raises SourceUnchanged, and the new
+    validators are staged in state['pending'] for StateStore.save().
+    """
+    if state is None:
+        return get_http_client().get(url, headers=headers, timeout=timeout)
+
+    request_headers = dict(headers or {})
+    if state.get('etag'):
+        request_headers['If-None-Match'] = state['etag']
+    if state.get('last_modified'):
+        request_headers['If-Modified-Since'] = state['last_modified']
+
+    response = get_http_client().get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304:
+        raise SourceUnchanged(f"{url} not modified (HTTP 304)")
+    if response.status_code == 200:
+        raw_sha256 = hashlib.sha256(response.content).hexdigest()
+        if state.get('fingerprint') and raw_sha256 == state.get('raw_sha256'):
+            raise SourceUnchanged(f"{url} returned the same response as last time")
+        state['pending'] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'raw_sha256': raw_sha256,
+        }
+    return response
+
+
+class StateStore:
+    """Last-seen validators and fingerprints, keyed by database, season and source."""
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH, database: str = 'supabase'):
+        self.path = path
+        self.database = database
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, 'r') as f:
+                self._saved = json.load(f)
+        except (OSError, ValueError):
+            self._saved = {}
+
+    def _key(self, season: int, source: str) -> str:
+        return f"{self.database}|{season}|{source}"
+
+    def get(self, season: int, source: str) -> Dict[str, Any]:
+        """Mutable state for one season and source (passed to the source's fetch)."""
+        key = self._key(season, source)
+        with self._lock:
+            if key not in self._states:
+                self._states[key] = dict(self._saved.get(key, {}))
+            return self._states[key]
+
+    def is_unchanged(self, season: int, source: str, teams: List[Dict[str, any]]) -> bool:
+        """Whether teams match the fingerprint saved by the last successful run."""
+        return self.get(season, source).get('fingerprint') == fingerprint_teams(teams)
+
+    def save(self, season: int, source: str, teams: List[Dict[str, any]]) -> None:
+        """Record teams (and any staged response validators) as processed."""
+        key = self._key(season, source)
+        state = self.get(season, source)
+        state.update(state.pop('pending', {}))
+        state['fingerprint'] = fingerprint_teams(teams)
+        state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self._saved[key] = {k: v for k, v in state.items() if v is not None}
+            try:
+                with open(self.path, 'w') as f:
+                    json.dump(self._saved, f, indent=2, sort_keys=True)
+            except OSError as e:
+                print(f"Warning: Could not write source state {self.path}: {e}")
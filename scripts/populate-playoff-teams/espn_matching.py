@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Match generated playoff games to ESPN scoreboard events.
+
+Events are indexed once by canonical team (our abbreviation, resolved from ESPN's team
+id, abbreviation or display name), keyed by the unordered pair so either home/away
+orientation matches in O(1), and by kickoff date. Games without an exact match only
+get an event that is still TBD and whose known side (if any) and conference agree with
+the game; those slots are filled in a fixed order (kickoff date and time, then event id
+against bracket position), so a re-run always attaches the same ESPN ids and a known
+matchup is never given another game's id.
+
+Usage:
+    index = EspnEventIndex(espn_games, populate_playoff_teams.NFL_TEAMS)
+    matches = index.assign(games)          # aligned with games; None where nothing fits
+    event = index.find('Buffalo Bills', 'Kansas City Chiefs')
+"""
+
+from typing import List, Dict, Optional, Tuple
+
+# ESPN team ids by our abbreviation
+ESPN_TEAM_IDS = {
+    'ATL': '1', 'BUF': '2', 'CHI': '3', 'CIN': '4', 'CLE': '5', 'DAL': '6', 'DEN': '7', 'DET': '8',
+    'GB': '9', 'TEN': '10', 'IND': '11', 'KC': '12', 'LV': '13', 'LAR': '14', 'MIA': '15', 'MIN': '16',
+    'NE': '17', 'NO': '18', 'NYG': '19', 'NYJ': '20', 'PHI': '21', 'ARI': '22', 'PIT': '23', 'LAC': '24',
+    'SF': '25', 'SEA': '26', 'TB': '27', 'WSH': '28', 'CAR': '29', 'JAX': '30', 'BAL': '33', 'HOU': '34',
+}
+
+# Other abbreviations ESPN and NFL.com have used for the same franchises
+ABBREVIATION_ALIASES = {
+    'WAS': 'WSH', 'LA': 'LAR', 'STL': 'LAR', 'JAC': 'JAX', 'OAK': 'LV', 'SD': 'LAC',
+}
+
+# Former display names of the same franchises (historical games)
+FORMER_NAMES = {
+    'oakland raiders': 'LV', 'san diego chargers': 'LAC', 'st. louis rams': 'LAR',
+    'washington redskins': 'WSH', 'washington football team': 'WSH',
+}
+
+
+class EspnEventIndex:
+    """ESPN events for one playoff week, indexed for matching against generated games."""
+
+    def __init__(self, espn_games: List[Dict[str, str]], nfl_teams: List[Dict[str, str]]):
+        self._by_name = dict(FORMER_NAMES)
+        self._by_name.update({t['name'].lower(): t['abbreviation'] for t in nfl_teams})
+        self._by_abbreviation = {t['abbreviation']: t['abbreviation'] for t in nfl_teams}
+        self._by_abbreviation.update(ABBREVIATION_ALIASES)
+        self._by_espn_id = {espn_id: abbr for abbr, espn_id in ESPN_TEAM_IDS.items()}
+
+        self.events = espn_games
+        self.by_pair: Dict[frozenset, Dict[str, str]] = {}
+        self.by_date: Dict[str, List[Dict[str, str]]] = {}
+        self._sides: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+        for event in espn_games:
+            home = self.canonical(event.get('home_team'), event.get('home_abbreviation'), event.get('home_team_id'))
+            away = self.canonical(event.get('away_team'), event.get('away_abbreviation'), event.get('away_team_id'))
+            self._sides[event['id']] = (home, away)
+            if home and away:
+                self.by_pair.setdefault(frozenset((home, away)), event)
+            self.by_date.setdefault((event.get('kickoff_time') or '')[:10], []).append(event)
+
+    def canonical(self, name: Optional[str] = None, abbreviation: Optional[str] = None,
+                  espn_id: Optional[str] = None) -> Optional[str]:
+        """Our abbreviation for a team given any of its identifiers (None for TBD/unknown)."""
+        if espn_id and str(espn_id) in self._by_espn_id:
+            return self._by_espn_id[str(espn_id)]
+        if abbreviation:
+            abbr = self._by_abbreviation.get(abbreviation.upper())
+            if abbr:
+                return abbr
+        if name:
+            return self._by_name.get(name.strip().lower())
+        return None
+
+    def find(self, away_team: str, home_team: str) -> Optional[Dict[str, str]]:
+        """Event for this matchup in either orientation, or None."""
+        away, home = self.canonical(away_team), self.canonical(home_team)
+        if not away or not home:
+            return None
+        return self.by_pair.get(frozenset((away, home)))
+
+    def _fits(self, event: Dict[str, str], teams: set, conference: Optional[str]) -> bool:
+        """Whether a not-yet-decided event could be this game."""
+        known = {team for team in self._sides[event['id']] if team}
+        if len(known) == 2 or not known <= teams:
+            return False
+        event_conference = event.get('conference')
+        return not (conference and event_conference and event_conference != conference)
+
+    def assign(self, games: List[Dict[str, any]]) -> List[Optional[Dict[str, str]]]:
+        """ESPN event for each game (same order as games; None where no event fits)."""
+        matches: List[Optional[Dict[str, str]]] = [None] * len(games)
+        used = set()
+
+        for i, game in enumerate(games):
+            event = self.find(game['away_team'], game['home_team'])
+            if event and event['id'] not in used:
+                matches[i] = event
+                used.add(event['id'])
+
+        # TBD events in kickoff order, games in bracket order
+        open_events = [event for date in sorted(self.by_date)
+                       for event in sorted(self.by_date[date], key=lambda e: (e.get('kickoff_time') or '', e['id']))
+                       if event['id'] not in used]
+        pending = sorted((i for i in range(len(games)) if matches[i] is None),
+                         key=lambda i: (games[i].get('conference') or '', games[i].get('home_seed') or 0, i))
+
+        # Events that already show one of the game's teams first, then fully TBD ones
+        for partial_only in (True, False):
+            for i in pending:
+                if matches[i] is not None:
+                    continue
+                game = games[i]
+                teams = {self.canonical(game['away_team']), self.canonical(game['home_team'])} - {None}
+                for event in open_events:
+                    if event['id'] in used or not self._fits(event, teams, game.get('conference')):
+                        continue
+                    if partial_only and not any(self._sides[event['id']]):
+                        continue
+                    matches[i] = event
+                    used.add(event['id'])
+                    break
+
+        return matches
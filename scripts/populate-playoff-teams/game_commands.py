@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Headless playoff game commands for populate-playoff-teams (safe to run from cron).
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py games generate --season 2025 --week 2 --yes --json
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py games advance --season 2025 --yes --watch
+
+These reuse the same generators and write path as the interactive menu
+(generate_games_for_week / insert_playoff_games) but never prompt. With --json,
+progress messages go to stderr and JSON is printed to stdout (one object per result).
+`games advance` builds the next week as soon as the current one is final (see round_progression.py).
+
+Exit codes:
+    0  success (or dry run without --yes, or --plan)
+    1  error
+    3  not ready: the previous round has no winners yet, or no playoff teams exist
+"""
+
+import sys
+import json
+import argparse
+import contextlib
+from typing import List, Dict, Any, Optional
+
+import interactive_mode
+import round_progression
+import snapshots
+import write_plan
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_NOT_READY = 3
+
+
+def add_games_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `games` command and its subcommands on the main CLI parser."""
+    games_parser = subparsers.add_parser('games', help='Headless playoff game commands (no prompts)',
+                                         parents=common_parents or [])
+    games_subparsers = games_parser.add_subparsers(dest='games_command', metavar='SUBCOMMAND')
+    games_subparsers.required = True
+
+    generate = games_subparsers.add_parser(
+        'generate', parents=common_parents or [],
+        help="Generate a playoff week's games from the seeds and previous round winners")
+    generate.add_argument('--season', type=int, required=True, help='Season year (e.g., 2025)')
+    generate.add_argument('--week', type=int, required=True, choices=[1, 2, 3, 4],
+                          help='Playoff week: 1 Wild Card, 2 Divisional, 3 Conference, 4 Super Bowl')
+    generate.add_argument('--yes', '-y', action='store_true',
+                          help='Write the games (without it, only report what would be written)')
+    generate.add_argument('--json', action='store_true', help='Print a single JSON result to stdout')
+    generate.add_argument('--allow-missing-espn', action='store_true',
+                          help='Write games with generated IDs if the ESPN scoreboard cannot be fetched')
+    generate.add_argument('--plan', nargs='?', const='', metavar='PLAN_FILE',
+                          help='Report the exact insert/update requests instead of writing; save them to PLAN_FILE '
+                               'for --apply-plan')
+
+    advance = games_subparsers.add_parser(
+        'advance', parents=common_parents or [],
+        help='Generate the next playoff week once every game of the current week has a winner')
+    advance.add_argument('--season', type=int, required=True, help='Season year (e.g., 2025)')
+    advance.add_argument('--yes', '-y', action='store_true',
+                         help='Write the next round (without it, only report what would be written)')
+    advance.add_argument('--json', action='store_true', help='Print JSON results to stdout (one line per evaluation)')
+    advance.add_argument('--watch', action='store_true',
+                         help='Keep polling and advance each round as it completes (exits when the Super Bowl is final)')
+    advance.add_argument('--interval', type=float, default=60,
+                         help='Seconds between watermark polls in --watch mode (default: 60)')
+    advance.add_argument('--max-polls', type=int, help='Stop --watch after this many polls')
+    advance.add_argument('--allow-missing-espn', action='store_true',
+                         help='Write games with generated IDs if the ESPN scoreboard cannot be fetched')
+    advance.add_argument('--snapshots', nargs='?', const=snapshots.DEFAULT_SNAPSHOT_DIR, default=None, metavar='DIR',
+                         help='After each evaluation, update the static bracket/standings files (see snapshots.py)')
+    return games_parser
+
+
+def generate_week(supabase, season: int, week: int, write: bool, allow_missing_espn: bool = False,
+                  plan_path: Optional[str] = None) -> Dict[str, Any]:
+    """Generate (and optionally write) one playoff week. Returns a JSON-serialisable result.
+
+    plan_path: instead of writing, plan the writes (see write_plan.py), saving the plan there unless ''.
+    """
+    result = {
+        'command': 'games generate',
+        'season': season,
+        'week': week,
+        'round': interactive_mode.WEEK_NAMES[week],
+        'status': None,
+        'games': [],
+    }
+
+    teams_by_conf = interactive_mode.get_playoff_teams(supabase, season)
+    games, error = interactive_mode.generate_games_for_week(supabase, season, week, teams_by_conf)
+    if error:
+        result['status'] = 'not_ready' if error['reason'] in ('no_teams', 'not_ready') else 'error'
+        result['reason'] = error['reason']
+        result['message'] = f"{error['message']} {error['hint']}"
+        return result
+
+    result['games'] = [{k: g[k] for k in ('away_team', 'home_team', 'away_seed', 'home_seed', 'conference')} for g in games]
+
+    # Writes are validated by insert_playoff_games; dry runs and plans are checked here
+    if not write or plan_path is not None:
+        errors = interactive_mode.validate_playoff_games(supabase, season, week, games, teams_by_conf)
+        if errors:
+            return _invalid(result, errors)
+
+    if not write and plan_path is None:
+        result['status'] = 'dry_run'
+        result['message'] = f"{len(games)} game(s) would be written; pass --yes to write them"
+        return result
+
+    try:
+        espn_games = interactive_mode.get_espn_game_ids(season, week, strict=True)
+    except RuntimeError as e:
+        if not allow_missing_espn:
+            result['status'] = 'error'
+            result['reason'] = 'espn_unavailable'
+            result['message'] = f"{e} (use --allow-missing-espn to write games with generated IDs)"
+            return result
+        print(f"Warning: {e}; writing games with generated IDs")
+        espn_games = []
+
+    if plan_path is not None:
+        rows = interactive_mode.build_playoff_game_rows(season, week, games, espn_games)
+        plan = write_plan.plan_games(supabase, season, week, rows)
+        result['status'] = 'planned'
+        result['plan'] = plan
+        result['message'] = f"{plan['requests']} write request(s), {plan['rows']} row(s) planned; nothing was written"
+        if plan_path:
+            write_plan.save_plan(plan, plan_path)
+            result['plan_file'] = plan_path
+            result['message'] += f" (saved to {plan_path}; run it with --apply-plan)"
+        return result
+
+    existing_games = interactive_mode.get_existing_games(supabase, season, week)
+    summary = interactive_mode.insert_playoff_games(supabase, season, week, games, existing_games,
+                                                    espn_games=espn_games, teams_by_conf=teams_by_conf)
+    if summary is None:
+        result['status'] = 'error'
+        result['reason'] = 'write_failed'
+        result['message'] = 'Writing games failed; see stderr for details'
+        return result
+    if summary.get('errors'):
+        return _invalid(result, summary['errors'])
+
+    result['status'] = 'ok'
+    result['inserted'] = summary['inserted']
+    result['updated'] = summary['updated']
+    result['games'] = summary['games']
+    return result
+
+
+def _invalid(result: Dict[str, Any], errors: List[str]) -> Dict[str, Any]:
+    result['status'] = 'invalid'
+    result['message'] = 'Generated games failed validation; nothing was written'
+    result['errors'] = errors
+    return result
+
+
+def _exit_code(result: Dict[str, Any]) -> int:
+    if result['status'] in ('ok', 'dry_run', 'planned', 'advanced', 'waiting', 'complete'):
+        return EXIT_OK
+    if result['status'] == 'not_ready':
+        return EXIT_NOT_READY
+    return EXIT_ERROR
+
+
+def _print_human(result: Dict[str, Any]) -> None:
+    if result.get('week'):
+        print(f"\n{result['round']} (Week {result['week']}), season {result['season']}: {result['status']}")
+    else:
+        print(f"\nSeason {result['season']}: {result['status']}")
+    for game in result['games']:
+        print(f"  {game['away_team']} @ {game['home_team']}")
+    if result.get('plan'):
+        write_plan.print_plan(result['plan'])
+    if result.get('message'):
+        print(result['message'])
+    for error in result.get('errors', []):
+        print(f"  - {error}")
+
+
+def run_games_command(supabase, args) -> int:
+    """Dispatch `games <subcommand>`; returns the process exit code."""
+    if args.games_command == 'generate':
+        if args.json:
+            # Keep stdout clean for the JSON document
+            with contextlib.redirect_stdout(sys.stderr):
+                result = generate_week(supabase, args.season, args.week, args.yes, args.allow_missing_espn, args.plan)
+            print(json.dumps(result, default=str))
+        else:
+            result = generate_week(supabase, args.season, args.week, args.yes, args.allow_missing_espn, args.plan)
+            _print_human(result)
+        return _exit_code(result)
+
+    if args.games_command == 'advance':
+        def emit(result):
+            if args.snapshots and result['status'] not in ('dry_run', 'not_ready', 'error'):
+                # Results moved the watermark; the published files follow them
+                try:
+                    result['snapshots'] = snapshots.publish_snapshots(supabase, args.season, args.snapshots)
+                except Exception as e:
+                    print(f"❌ Error writing snapshots: {e}")
+            if args.json:
+                print(json.dumps(result, default=str), file=stdout, flush=True)
+            else:
+                _print_human(result)
+                if result.get('snapshots'):
+                    snapshots.print_publish_result(result['snapshots'])
+
+        stdout = sys.stdout
+        # Keep stdout clean for the JSON documents
+        redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+        try:
+            with redirect:
+                if args.watch:
+                    result = round_progression.watch(supabase, args.season, args.interval, emit,
+                                                     write=args.yes, max_polls=args.max_polls,
+                                                     allow_missing_espn=args.allow_missing_espn)
+                else:
+                    result = round_progression.advance_rounds(supabase, args.season, write=args.yes,
+                                                              allow_missing_espn=args.allow_missing_espn)
+                    emit(result)
+        except RuntimeError as e:
+            # ESPN scoreboard unavailable; nothing was written
+            result = round_progression.error_result(args.season, e)
+            emit(result)
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopped watching", file=sys.stderr)
+            return EXIT_OK
+        return _exit_code(result) if result else EXIT_OK
+
+    print(f"Unknown games subcommand: {args.games_command}", file=sys.stderr)
+    return EXIT_ERROR
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Local columnar store of playoff history for offline analytics.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py history refresh
+    python scripts/populate-playoff-teams/populate-playoff-teams.py history report
+
+playoff_teams and playoff games are kept as one binary file per column (history/ next to
+this script) plus a manifest with row counts, team/game dictionaries and refresh
+watermarks. Columns are memory-mapped on open, so queries touch only the columns they
+use. The store is append-only: refresh() appends rows changed since the last refresh
+(by updated_at), and a later row for the same game or team-season supersedes the
+earlier one. Rows deleted from the database are recorded as tombstones (deleted = 1):
+for every season (teams) and season/week (games) with changed rows, refresh() reads the
+scope's current keys and tombstones stored rows that are gone; --reconcile checks every
+stored scope. Live rows are indexed by season and week when the store is opened.
+
+Query helpers answer questions like "how often does a 6 seed reach the conference
+championship" from NumPy arrays without touching the database.
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import List, Dict, Optional, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the history commands
+    np = None
+
+DEFAULT_HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history')
+MANIFEST_NAME = 'manifest.json'
+PAGE_SIZE = 1000
+
+# Stored for missing scores, winners and seeds
+NULL = -1
+
+COLUMNS = {
+    'teams': {'season': 'int16', 'team': 'int16', 'conference': 'int8', 'seed': 'int8', 'deleted': 'int8'},
+    'games': {'season': 'int16', 'week': 'int8', 'game': 'int32', 'home': 'int16', 'away': 'int16',
+              'home_score': 'int16', 'away_score': 'int16', 'winner': 'int16', 'deleted': 'int8'},
+}
+CONFERENCES = ['AFC', 'NFC']
+
+# Round reached by a playoff team; index r > 0 means it played in week r + 1 (4 = won the Super Bowl)
+ROUNDS = ['Playoffs', 'Divisional', 'Conference', 'Super Bowl', 'Champion']
+MAX_SEED = 7
+
+
+class HistoryStore:
+    """Append-only, memory-mapped columns of playoff teams and games."""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_DIR):
+        if np is None:
+            raise RuntimeError("numpy is required for the history store (pip install numpy)")
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        try:
+            with open(os.path.join(path, MANIFEST_NAME), 'r') as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {'rows': {table: 0 for table in COLUMNS}, 'teams': [], 'game_ids': [], 'watermarks': {}}
+        self._team_codes = {name: code for code, name in enumerate(self.manifest['teams'])}
+        self._game_codes = {game_id: code for code, game_id in enumerate(self.manifest['game_ids'])}
+        self._open()
+
+    # --- storage ---
+
+    def _column_path(self, table: str, column: str) -> str:
+        return os.path.join(self.path, f"{table}.{column}.bin")
+
+    def _open(self) -> None:
+        """Map every column and rebuild the live-row and season/week indexes."""
+        self.columns = {}
+        for table, columns in COLUMNS.items():
+            rows = self.manifest['rows'][table]
+            for column, dtype in columns.items():
+                if rows and not os.path.exists(self._column_path(table, column)):
+                    # Column added after this store was written (e.g. 'deleted'): zero-filled
+                    with open(self._column_path(table, column), 'wb') as f:
+                        f.write(np.zeros(rows, dtype=dtype).tobytes())
+            self.columns[table] = {
+                column: (np.memmap(self._column_path(table, column), dtype=dtype, mode='r', shape=(rows,))
+                         if rows else np.empty(0, dtype=dtype))
+                for column, dtype in columns.items()
+            }
+
+        # Later rows supersede earlier ones with the same key; a tombstone hides the key
+        teams = self.columns['teams']
+        live_teams = _last_occurrence(teams['season'].astype(np.int64) * 65536 + teams['team'])
+        self.live_teams = live_teams[teams['deleted'][live_teams] == 0]
+        games = self.columns['games']
+        live_games = _last_occurrence(games['game'])
+        self.live_games = live_games[games['deleted'][live_games] == 0]
+
+        keys = games['season'][self.live_games].astype(np.int64) * 8 + games['week'][self.live_games]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        unique_keys, starts = np.unique(sorted_keys, return_index=True)
+        ends = np.append(starts[1:], len(sorted_keys))
+        self._by_season_week = {(int(k) // 8, int(k) % 8): self.live_games[order[s:e]]
+                                for k, s, e in zip(unique_keys, starts, ends)}
+
+    def _save_manifest(self) -> None:
+        tmp_path = os.path.join(self.path, MANIFEST_NAME + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp_path, os.path.join(self.path, MANIFEST_NAME))
+
+    def append(self, table: str, rows: Dict[str, Any]) -> int:
+        """Append column arrays to a table; returns the number of rows appended."""
+        count = len(next(iter(rows.values())))
+        if not count:
+            return 0
+        existing = self.manifest['rows'][table]
+        for column, dtype in COLUMNS[table].items():
+            values = np.asarray(rows[column], dtype=dtype)
+            with open(self._column_path(table, column), 'a+b') as f:
+                # Drop bytes from an append that never reached the manifest
+                f.truncate(existing * values.itemsize)
+                f.write(values.tobytes())
+        # The manifest row count is what makes the new rows visible
+        self.manifest['rows'][table] = existing + count
+        self._save_manifest()
+        self._open()
+        return count
+
+    def _code(self, codes: Dict[str, int], names: List[str], value: Optional[str]) -> int:
+        if not value:
+            return NULL
+        if value not in codes:
+            codes[value] = len(names)
+            names.append(value)
+        return codes[value]
+
+    def team_code(self, name: Optional[str]) -> int:
+        return self._code(self._team_codes, self.manifest['teams'], name)
+
+    def team_name(self, code: int) -> Optional[str]:
+        return self.manifest['teams'][code] if code >= 0 else None
+
+    # --- refresh ---
+
+    def _fetch_changed(self, supabase, table: str, columns: str, **filters) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """(rows updated since the table's watermark, the new watermark), paged by updated_at."""
+        watermark = self.manifest['watermarks'].get(table, {})
+        since = watermark.get('updated_at')
+        seen = set(watermark.get('ids', []))
+        changed = []
+        limit = PAGE_SIZE
+        while True:
+            query = supabase.table(table).select(columns)
+            for column, value in filters.items():
+                query = query.eq(column, value)
+            if since:
+                query = query.gte('updated_at', since)
+            page = query.order('updated_at').limit(limit).execute().data or []
+
+            fresh = [row for row in page if not (row.get('updated_at') == since and row['id'] in seen)]
+            changed.extend(fresh)
+            if len(page) < limit:
+                break
+            last = page[-1].get('updated_at')
+            if last == since:
+                # A whole page shares one timestamp; widen the page instead of looping
+                limit *= 2
+            else:
+                limit = PAGE_SIZE
+                since, seen = last, set()
+            seen.update(row['id'] for row in page if row.get('updated_at') == since)
+
+        if changed:
+            latest = max(row['updated_at'] for row in changed if row.get('updated_at'))
+            ids = [row['id'] for row in changed if row.get('updated_at') == latest]
+            if latest == watermark.get('updated_at'):
+                ids = sorted(set(ids) | set(watermark.get('ids', [])))
+            watermark = {'updated_at': latest, 'ids': ids}
+        return changed, watermark
+
+    def _deleted_teams(self, supabase, seasons, changed: List[Dict[str, Any]]) -> List[Tuple[int, str]]:
+        """(season, team_name) stored or changed for `seasons` that the database no longer has."""
+        if not seasons:
+            return []
+        current = {(row['season'], row['team_name'])
+                   for row in _fetch_all(supabase, 'playoff_teams', 'id, season, team_name', seasons)}
+        teams = self.columns['teams']
+        stored = {(int(season), self.team_name(int(code)))
+                  for season, code in zip(teams['season'][self.live_teams], teams['team'][self.live_teams])}
+        stored.update((t['season'], t['team_name']) for t in changed)
+        return sorted(key for key in stored if key[0] in seasons and key not in current)
+
+    def _deleted_games(self, supabase, season_weeks, changed: List[Dict[str, Any]]) -> List[Tuple[int, int, str]]:
+        """(season, week, id) of games stored or changed for `season_weeks` that the database no longer has."""
+        if not season_weeks:
+            return []
+        current = {row['id'] for row in _fetch_all(supabase, 'games', 'id, season, week',
+                                                   {season for season, _ in season_weeks}, season_type=3)}
+        games = self.columns['games']
+        stored = {}
+        for season, week in season_weeks:
+            for code in games['game'][self._by_season_week.get((season, week), [])]:
+                stored[self.manifest['game_ids'][int(code)]] = (season, week)
+        for g in changed:
+            stored[g['id']] = (g['season'], g['week'])
+        return sorted((season, week, game_id) for game_id, (season, week) in stored.items()
+                      if (season, week) in season_weeks and game_id not in current)
+
+    def refresh(self, supabase, reconcile: bool = False) -> Dict[str, int]:
+        """Append playoff_teams and playoff games changed since the last refresh, and tombstones
+        for rows deleted from the seasons/weeks that changed (every stored one with reconcile)."""
+        teams, teams_watermark = self._fetch_changed(supabase, 'playoff_teams',
+                                                     'id, season, team_name, conference, seed, updated_at')
+        games, games_watermark = self._fetch_changed(
+            supabase, 'games', 'id, season, week, home_team, away_team, home_score, away_score, winner, updated_at',
+            season_type=3)
+
+        team_seasons = {t['season'] for t in teams}
+        game_weeks = {(g['season'], g['week']) for g in games}
+        if reconcile:
+            team_seasons.update(int(s) for s in self.columns['teams']['season'][self.live_teams])
+            game_weeks.update(self._by_season_week)
+        removed_teams = self._deleted_teams(supabase, team_seasons, teams)
+        removed_games = self._deleted_games(supabase, game_weeks, games)
+
+        appended = {'teams': 0, 'games': 0, 'removed_teams': len(removed_teams), 'removed_games': len(removed_games)}
+        appended['teams'] = self.append('teams', {
+            'season': [t['season'] for t in teams] + [season for season, _ in removed_teams],
+            'team': [self.team_code(t['team_name']) for t in teams] + [self.team_code(name) for _, name in removed_teams],
+            'conference': [_conference_code(t.get('conference')) for t in teams] + [NULL] * len(removed_teams),
+            'seed': [t.get('seed') or NULL for t in teams] + [NULL] * len(removed_teams),
+            'deleted': [0] * len(teams) + [1] * len(removed_teams),
+        })
+        appended['games'] = self.append('games', {
+            'season': [g['season'] for g in games] + [season for season, _, _ in removed_games],
+            'week': [g['week'] for g in games] + [week for _, week, _ in removed_games],
+            'game': [self._code(self._game_codes, self.manifest['game_ids'], game_id)
+                     for game_id in [g['id'] for g in games] + [game_id for _, _, game_id in removed_games]],
+            'home': [self.team_code(g['home_team']) for g in games] + [NULL] * len(removed_games),
+            'away': [self.team_code(g['away_team']) for g in games] + [NULL] * len(removed_games),
+            'home_score': [NULL if g.get('home_score') is None else g['home_score'] for g in games]
+                          + [NULL] * len(removed_games),
+            'away_score': [NULL if g.get('away_score') is None else g['away_score'] for g in games]
+                          + [NULL] * len(removed_games),
+            'winner': [self.team_code(g.get('winner')) for g in games] + [NULL] * len(removed_games),
+            'deleted': [0] * len(games) + [1] * len(removed_games),
+        })
+        # Only advance the watermarks once the rows they cover are stored
+        self.manifest['watermarks']['playoff_teams'] = teams_watermark
+        self.manifest['watermarks']['games'] = games_watermark
+        self._save_manifest()
+        return appended
+
+    # --- queries ---
+
+    def seasons(self) -> List[int]:
+        return sorted({season for season, _ in self._by_season_week})
+
+    def games(self, season: Optional[int] = None, week: Optional[int] = None) -> Dict[str, Any]:
+        """Live game columns, optionally for one season and/or week."""
+        if season is None and week is None:
+            index = self.live_games
+        else:
+            parts = [rows for (s, w), rows in self._by_season_week.items()
+                     if (season is None or s == season) and (week is None or w == week)]
+            index = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+        return {column: values[index] for column, values in self.columns['games'].items()}
+
+    def seed_lookup(self) -> Tuple[int, Any]:
+        """(first season, array[season - first season, team code] → seed, 0 where not seeded)."""
+        teams = self.columns['teams']
+        live = self.live_teams
+        if not len(live):
+            return 0, np.zeros((0, max(1, len(self.manifest['teams']))), dtype=np.int8)
+        seasons = teams['season'][live].astype(np.int64)
+        first = int(seasons.min())
+        table = np.zeros((int(seasons.max()) - first + 1, max(1, len(self.manifest['teams']))), dtype=np.int8)
+        seeds = np.maximum(teams['seed'][live], 0)
+        table[seasons - first, teams['team'][live]] = seeds
+        return first, table
+
+    def _game_seeds(self, games: Dict[str, Any]) -> Tuple[Any, Any]:
+        first, table = self.seed_lookup()
+        if not len(games['season']) or not len(table):
+            return np.zeros(len(games['season']), np.int8), np.zeros(len(games['season']), np.int8)
+        row = games['season'].astype(np.int64) - first
+        valid = (row >= 0) & (row < len(table))
+        row = np.clip(row, 0, len(table) - 1)
+        home = np.where(valid, table[row, np.maximum(games['home'], 0)], 0)
+        away = np.where(valid, table[row, np.maximum(games['away'], 0)], 0)
+        return home, away
+
+    def seed_matchups(self, weeks=(1, 2, 3)) -> Tuple[Any, Any]:
+        """(wins, played): wins[a, b] is how often seed a beat seed b; played[a, b] their meetings.
+
+        Only decided games between two seeded teams in the given weeks count (the Super
+        Bowl, week 4, pairs seeds from different conferences).
+        """
+        games = self.games()
+        home_seed, away_seed = self._game_seeds(games)
+        mask = np.isin(games['week'], weeks) & (games['winner'] >= 0) & (home_seed > 0) & (away_seed > 0)
+        home_seed, away_seed = home_seed[mask], away_seed[mask]
+        home_won = games['winner'][mask] == games['home'][mask]
+        winner = np.where(home_won, home_seed, away_seed)
+        loser = np.where(home_won, away_seed, home_seed)
+
+        wins = np.zeros((MAX_SEED + 1, MAX_SEED + 1), dtype=np.int32)
+        np.add.at(wins, (winner, loser), 1)
+        return wins, wins + wins.T
+
+    def seed_win_rate(self, seed: int, opponent: int, weeks=(1, 2, 3)) -> Tuple[int, int]:
+        """(wins, games) for `seed` against `opponent`."""
+        wins, played = self.seed_matchups(weeks)
+        return int(wins[seed, opponent]), int(played[seed, opponent])
+
+    def round_advancement(self) -> Tuple[Any, Any]:
+        """(reached, teams): reached[seed, r] team-seasons of a seed reaching ROUNDS[r]; teams[seed] total."""
+        teams = self.columns['teams']
+        live = self.live_teams
+        seeds = teams['seed'][live]
+        keep = (seeds >= 1) & (seeds <= MAX_SEED)
+        live, seeds = live[keep], seeds[keep]
+        team_keys = teams['season'][live].astype(np.int64) * 65536 + teams['team'][live]
+
+        reached = np.zeros((MAX_SEED + 1, len(ROUNDS)), dtype=np.int32)
+        totals = np.bincount(seeds, minlength=MAX_SEED + 1)
+        reached[:, 0] = totals
+        for round_index in range(1, len(ROUNDS)):
+            week_games = self.games(week=min(round_index + 1, 4))
+            season = week_games['season'].astype(np.int64) * 65536
+            if round_index < 4:
+                keys = np.concatenate([season + week_games['home'], season + week_games['away']])
+            else:
+                keys = (season + week_games['winner'])[week_games['winner'] >= 0]
+            reached[:, round_index] = np.bincount(seeds[np.isin(team_keys, keys)], minlength=MAX_SEED + 1)
+        return reached, totals
+
+
+def _conference_code(conference: Optional[str]) -> int:
+    conference = (conference or '').upper()
+    return CONFERENCES.index(conference) if conference in CONFERENCES else NULL
+
+
+def _fetch_all(supabase, table: str, columns: str, seasons, **filters) -> List[Dict[str, Any]]:
+    """Every row of `table` for the given seasons, paged by id."""
+    rows = []
+    start = 0
+    while True:
+        query = supabase.table(table).select(columns).in_('season', sorted(seasons))
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        page = query.order('id').range(start, start + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+
+def _last_occurrence(keys) -> Any:
+    """Sorted indices of the last row for each distinct key."""
+    if not len(keys):
+        return np.empty(0, dtype=np.int64)
+    reversed_keys = np.asarray(keys)[::-1]
+    _, first_in_reversed = np.unique(reversed_keys, return_index=True)
+    return np.sort(len(keys) - 1 - first_in_reversed)
+
+
+def print_report(store: HistoryStore) -> None:
+    """Seed-vs-seed records and round advancement by seed."""
+    seasons = store.seasons()
+    if not seasons:
+        print("History store is empty; run `history refresh` first")
+        return
+    print(f"\nPlayoff history: {len(seasons)} season(s), {seasons[0]}-{seasons[-1]}, {len(store.live_games)} games")
+
+    wins, played = store.seed_matchups()
+    print("\nSeed vs seed (same-conference rounds): wins-games")
+    print("      " + ''.join(f"{f'vs {b}':>9}" for b in range(1, MAX_SEED + 1)))
+    for a in range(1, MAX_SEED + 1):
+        cells = ''.join(f"{f'{wins[a, b]}-{played[a, b]}' if played[a, b] else '':>9}" for b in range(1, MAX_SEED + 1))
+        print(f"Seed {a}{cells}")
+
+    reached, totals = store.round_advancement()
+    print("\nRound reached by seed (% of playoff teams)")
+    print("      " + ''.join(f"{name:>12}" for name in ROUNDS[1:]))
+    for seed in range(1, MAX_SEED + 1):
+        if not totals[seed]:
+            continue
+        cells = ''.join(f"{100.0 * reached[seed, r] / totals[seed]:>11.1f}%" for r in range(1, len(ROUNDS)))
+        print(f"Seed {seed}{cells}   (n={totals[seed]})")
+
+
+def add_history_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `history` command and its subcommands on the main CLI parser."""
+    history_parser = subparsers.add_parser('history', parents=common_parents or [],
+                                           help='Local columnar store of playoff history for analytics')
+    history_subparsers = history_parser.add_subparsers(dest='history_command', metavar='SUBCOMMAND')
+    history_subparsers.required = True
+    for name, help_text in [('refresh', 'Append playoff teams and games changed since the last refresh'),
+                            ('report', 'Print seed-vs-seed records and round advancement by seed')]:
+        sub = history_subparsers.add_parser(name, parents=common_parents or [], help=help_text)
+        sub.add_argument('--history-dir', default=DEFAULT_HISTORY_DIR,
+                         help='Store directory (default: history/ next to this script)')
+        if name == 'refresh':
+            sub.add_argument('--reconcile', action='store_true',
+                             help='Check every stored season and week for deleted rows, not only those that changed')
+    return history_parser
+
+
+def run_history_command(supabase, args) -> int:
+    """Dispatch `history <subcommand>`; returns the process exit code."""
+    try:
+        store = HistoryStore(args.history_dir)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.history_command == 'refresh':
+        try:
+            appended = store.refresh(supabase, reconcile=args.reconcile)
+        except Exception as e:
+            print(f"❌ Error refreshing the history store: {e}")
+            return 1
+        print(f"✅ Appended {appended['teams']} team row(s) and {appended['games']} game row(s) to {store.path} "
+              f"({appended['removed_teams']} team(s) and {appended['removed_games']} game(s) no longer in the database)")
+        return 0
+
+    print_report(store)
+    return 0
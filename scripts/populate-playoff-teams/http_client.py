@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Shared HTTP client for ESPN/NFL.com requests made by populate-playoff-teams.
+
+Every GET goes through:
+  - a per-host token bucket, so bursts (e.g. one request per playoff date) stay under the
+    rate ESPN tolerates
+  - a per-host circuit breaker, so a host that keeps failing is skipped for a cool-down
+    period instead of being hammered with retries
+  - retries with jittered exponential backoff on connection errors, timeouts, broken
+    response bodies and 429/5xx responses (Retry-After is honoured); every failed attempt,
+    retried or not, counts against the breaker
+  - request coalescing: concurrent GETs of the same URL share one in-flight request
+
+Usage:
+    from http_client import get_http_client
+    response = get_http_client().get(url, headers=headers, timeout=15)
+"""
+
+import time
+import random
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+import profiling
+
+# Statuses worth retrying; anything else is returned to the caller as-is
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Transient transport failures worth another attempt; any other RequestException is raised at once
+RETRYABLE_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5      # seconds; attempt n sleeps up to base * 2**n
+DEFAULT_BACKOFF_CAP = 8.0       # seconds
+DEFAULT_RATE_PER_SECOND = 4.0   # sustained requests per host
+DEFAULT_BURST = 8               # bucket capacity per host
+DEFAULT_FAILURE_THRESHOLD = 5   # consecutive failures before the circuit opens
+DEFAULT_RESET_TIMEOUT = 30.0    # seconds the circuit stays open before a trial request
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised without touching the network while a host's circuit breaker is open."""
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """Closed → open after `failure_threshold` consecutive failures; half-open after `reset_timeout`."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (only one trial request while half-open)."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Give back a half-open trial slot without counting a result (the attempt was aborted)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class HttpClient:
+    """requests.Session wrapper with rate limiting, retries, circuit breaking and coalescing."""
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_cap: float = DEFAULT_BACKOFF_CAP, rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+                 burst: int = DEFAULT_BURST, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._session = requests.Session()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._in_flight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, host: str) -> Tuple[TokenBucket, CircuitBreaker]:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate_per_second, self.burst)
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._buckets[host], self._breakers[host]
+
+    def circuit_state(self, url: str) -> str:
+        """'closed', 'open' or 'half-open' for the URL's host."""
+        return self._host_state(urlparse(url).netloc)[1].state
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, or the server's Retry-After when it sent one."""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_cap)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15) -> requests.Response:
+        """GET url; concurrent calls for the same URL and headers share one request.
+
+        Returns the final response (callers still check status_code). Raises
+        requests.exceptions.RequestException when every attempt failed at the
+        connection level, or CircuitOpenError if the host's circuit is open.
+        """
+        key = (url, tuple(sorted((headers or {}).items())))
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._get_with_retries(url, headers, timeout)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _get_with_retries(self, url: str, headers: Optional[Dict[str, str]], timeout: float) -> requests.Response:
+        host = urlparse(url).netloc
+        bucket, breaker = self._host_state(host)
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {host}; skipping request to {url}")
+
+            bucket.acquire()
+            response = None
+            try:
+                response = self._session.get(url, headers=headers, timeout=timeout)
+                profiling.record_request(len(response.content))
+            except requests.exceptions.RequestException as e:
+                # Every failed attempt counts, so a half-open trial always gives its slot back
+                breaker.record_failure()
+                if attempt == self.max_retries or not isinstance(e, RETRYABLE_EXCEPTIONS):
+                    raise
+                delay = self._backoff(attempt)
+                print(f"Warning: request to {host} failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # Not a request failure (e.g. KeyboardInterrupt): just free a half-open trial slot
+                breaker.release()
+                raise
+
+            if response.status_code not in RETRYABLE_STATUSES:
+                breaker.record_success()
+                return response
+
+            breaker.record_failure()
+            if attempt == self.max_retries:
+                return response
+            delay = self._backoff(attempt, response)
+            print(f"Warning: {host} returned status {response.status_code}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+        return response
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide client, so rate limits and circuit state are shared by every caller."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
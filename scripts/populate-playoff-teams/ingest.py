@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Streaming bulk ingest of playoff team and game records from NDJSON or CSV (or stdin).
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py ingest history.ndjson.gz --yes
+    zcat games.csv.gz | python scripts/populate-playoff-teams/populate-playoff-teams.py ingest - --format csv --yes
+
+Records are read a line at a time, checked as they arrive (validation.TeamChecker and
+validation.check_game_row) and collected into fixed-size batches: upserts into
+playoff_teams on season,team_name and into games on id. Batches are written on a
+background thread while the next ones are parsed, with at most --queue-depth batches
+waiting, so memory stays flat whatever the file size and parsing overlaps the network.
+Without --yes the file is only checked.
+
+A record is a team when it has team_name and a game (a games table row, as backfill
+writes them) when it has home_team, unless its "type" field ('team' or 'game') or --kind
+says otherwise. Its season comes from the record or --season; games without season_type
+are playoff games (3), and a game id repeated within a batch keeps the last record.
+Invalid records are skipped and reported; a failed batch stops the ingest (earlier
+batches stay written, and re-running the file is safe since every write is an upsert).
+"""
+
+import sys
+import csv
+import json
+import gzip
+import time
+import argparse
+import contextlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+
+import validation
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_QUEUE_DEPTH = 4
+MAX_REPORTED_ERRORS = 20
+PROGRESS_EVERY = 100  # batches
+FORMATS = ['ndjson', 'csv']
+KINDS = ['team', 'game']
+# CSV cells are text; these columns hold numbers
+INT_COLUMNS = {'season', 'seed', 'week', 'season_type', 'home_score', 'away_score'}
+GAME_COLUMNS = ('id', 'week', 'season', 'season_type', 'home_team', 'away_team', 'kickoff_time',
+                'home_score', 'away_score', 'winner', 'status')
+TABLES = {'team': ('playoff_teams', 'season,team_name'), 'game': ('games', 'id')}
+
+
+def detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    raise ValueError(f"Cannot tell the format of {path}; use .ndjson/.jsonl/.csv (optionally .gz) or --format")
+
+
+@contextlib.contextmanager
+def open_text(path: str):
+    """The file as text ('-' is stdin; .gz files are decompressed while reading)."""
+    if path == '-':
+        yield sys.stdin
+        return
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        yield f
+
+
+def _cell(column: str, value: Optional[str]) -> Any:
+    value = (value or '').strip()
+    if not value:
+        return None
+    if column in INT_COLUMNS and value.lstrip('-').isdigit():
+        return int(value)
+    # Anything else stays text, so validation reports it
+    return value
+
+
+def read_records(stream, fmt: str) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """(line number, record, parse error) for each record, one line at a time."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {column: _cell(column, value) for column, value in row.items() if column}, None
+        return
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"invalid JSON ({e})"
+
+
+def record_kind(record: Dict[str, Any], kind: Optional[str] = None) -> Optional[str]:
+    if kind:
+        return kind
+    if record.get('type') in KINDS:
+        return record['type']
+    if 'home_team' in record:
+        return 'game'
+    if 'team_name' in record:
+        return 'team'
+    return None
+
+
+class BatchWriter:
+    """Upserts batches on one background thread, with at most `depth` batches waiting."""
+
+    def __init__(self, supabase, depth: int = DEFAULT_QUEUE_DEPTH):
+        self.supabase = supabase
+        self.depth = max(1, depth)
+        self.rows = {kind: 0 for kind in KINDS}
+        self.batches = 0
+        self.submitted = 0
+        self.write_seconds = 0.0
+        self._pending = deque()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ingest')
+
+    def _write(self, kind: str, rows: List[Dict[str, Any]]) -> Tuple[str, int, float]:
+        table, on_conflict = TABLES[kind]
+        start = time.perf_counter()
+        self.supabase.table(table).upsert(rows, on_conflict=on_conflict).execute()
+        return kind, len(rows), time.perf_counter() - start
+
+    def _collect(self) -> None:
+        # Raises the batch's error, if any
+        kind, count, seconds = self._pending.popleft().result()
+        self.rows[kind] += count
+        self.batches += 1
+        self.write_seconds += seconds
+
+    def submit(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        while len(self._pending) >= self.depth:
+            self._collect()
+        self._pending.append(self._pool.submit(self._write, kind, rows))
+        self.submitted += 1
+
+    def close(self, wait: bool = True) -> None:
+        """Wait for the queued batches (wait=False drops those not started yet)."""
+        try:
+            while wait and self._pending:
+                self._collect()
+        finally:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def ingest(supabase, path: str, nfl_teams: List[Dict[str, str]], fmt: Optional[str] = None,
+           kind: Optional[str] = None, season: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+           queue_depth: int = DEFAULT_QUEUE_DEPTH, write: bool = True) -> Dict[str, Any]:
+    """Check (and with write=True upsert) every record of the file; returns a JSON-serialisable summary."""
+    fmt = fmt or detect_format(path)
+    checker = validation.TeamChecker(nfl_teams)
+    writer = BatchWriter(supabase, queue_depth) if write else None
+    result = {'command': 'ingest', 'source': path, 'format': fmt, 'written': write, 'records': 0,
+              'valid': {k: 0 for k in KINDS}, 'invalid': 0, 'errors': [], 'more_errors': 0}
+    team_batch: List[Dict[str, Any]] = []
+    game_batch: Dict[str, Dict[str, Any]] = {}
+    team_seasons = set()
+
+    def flush(kind: str, rows: List[Dict[str, Any]]) -> None:
+        if writer is None or not rows:
+            return
+        writer.submit(kind, rows)
+        if writer.submitted % PROGRESS_EVERY == 0:
+            print(f"  … {result['records']:,} records read, {sum(writer.rows.values()):,} rows written")
+
+    def reject(errors: List[str]) -> None:
+        result['invalid'] += 1
+        shown = errors[:max(0, MAX_REPORTED_ERRORS - len(result['errors']))]
+        result['errors'].extend(shown)
+        result['more_errors'] += len(errors) - len(shown)
+
+    start = time.perf_counter()
+    try:
+        with open_text(path) as stream:
+            for line_number, record, error in read_records(stream, fmt):
+                result['records'] += 1
+                label = f"Line {line_number}"
+                if error:
+                    reject([f"{label}: {error}"])
+                    continue
+                if not isinstance(record, dict):
+                    reject([f"{label}: expected an object, got {type(record).__name__}"])
+                    continue
+                record_type = record_kind(record, kind)
+                if record_type is None:
+                    reject([f"{label}: neither a team (team_name) nor a game (home_team) record"])
+                    continue
+                record_season = record.get('season', season)
+                if isinstance(record_season, bool) or not isinstance(record_season, int):
+                    reject([f"{label}: season must be a year (in the record or --season), got {record_season!r}"])
+                    continue
+
+                if record_type == 'team':
+                    errors = checker.check(record, record_season, label)
+                    if errors:
+                        reject(errors)
+                        continue
+                    team_seasons.add(record_season)
+                    team_batch.append({'season': record_season, 'team_name': record['team_name'].strip(),
+                                       'team_abbreviation': record.get('team_abbreviation'),
+                                       'conference': record['conference'].strip().upper(), 'seed': record['seed']})
+                else:
+                    row = {column: record.get(column) for column in GAME_COLUMNS}
+                    row['season'] = record_season
+                    if row['season_type'] is None:
+                        row['season_type'] = 3
+                    errors = validation.check_game_row(row, nfl_teams, label)
+                    if errors:
+                        reject(errors)
+                        continue
+                    game_batch[row['id']] = row
+                result['valid'][record_type] += 1
+
+                if len(team_batch) >= batch_size:
+                    flush('team', team_batch)
+                    team_batch = []
+                if len(game_batch) >= batch_size:
+                    flush('game', list(game_batch.values()))
+                    game_batch = {}
+
+        flush('team', team_batch)
+        flush('game', list(game_batch.values()))
+        if writer:
+            writer.close()
+    except BaseException:
+        if writer:
+            writer.close(wait=False)
+        raise
+    finally:
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        if writer:
+            result['rows_written'] = dict(writer.rows)
+            result['batches'] = writer.batches
+            result['write_seconds'] = round(writer.write_seconds, 3)
+
+    result['records_per_second'] = round(result['records'] / result['seconds'], 1) if result['seconds'] else None
+    # Fields are only complete once the whole file is read
+    result['incomplete_fields'] = {season: checker.missing_seeds(season) for season in sorted(team_seasons)
+                                   if checker.missing_seeds(season)}
+    return result
+
+
+def add_ingest_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `ingest` command on the main CLI parser."""
+    parser = subparsers.add_parser('ingest', parents=common_parents or [],
+                                   help='Stream team and game records from NDJSON/CSV (or stdin) into the database in batches')
+    parser.add_argument('source', help="NDJSON (.ndjson/.jsonl) or CSV file, optionally .gz; '-' reads stdin")
+    parser.add_argument('--format', choices=FORMATS, help='Input format (default: from the file name; ndjson for stdin)')
+    parser.add_argument('--kind', choices=KINDS, help='Treat every record as a team or a game (default: per record)')
+    parser.add_argument('--season', type=int, help='Season for records without one')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Rows per upsert request (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--queue-depth', type=int, default=DEFAULT_QUEUE_DEPTH,
+                        help=f'Batches parsed ahead of the writer (default: {DEFAULT_QUEUE_DEPTH})')
+    parser.add_argument('--yes', '-y', action='store_true', help='Write the records (without it, only check them)')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON result to stdout')
+    return parser
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    valid = result['valid']
+    print(f"\n📥 {result['source']} ({result['format']}): {result['records']:,} record(s), "
+          f"{valid['team']:,} team(s) and {valid['game']:,} game(s) valid, {result['invalid']:,} invalid "
+          f"in {result['seconds']:.2f}s ({result['records_per_second'] or 0:,.0f} records/s)")
+    if result['written']:
+        rows = result['rows_written']
+        print(f"✅ Upserted {rows['team']:,} team and {rows['game']:,} game row(s) in {result['batches']} batch(es) "
+              f"({result['write_seconds']:.2f}s of writes overlapped with parsing)")
+    else:
+        print("   Checked only; pass --yes to write the valid records")
+    for error in result['errors']:
+        print(f"   - {error}")
+    if result['more_errors']:
+        print(f"   … and {result['more_errors']:,} more problem(s)")
+    for season, problems in result['incomplete_fields'].items():
+        print(f"⚠️  {season}: {'; '.join(problems)}")
+
+
+def run_ingest_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Run `ingest`; returns the process exit code (1 if any record was invalid or a write failed)."""
+    fmt = args.format or ('ndjson' if args.source == '-' else None)
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        try:
+            result = ingest(supabase, args.source, nfl_teams, fmt=fmt, kind=args.kind, season=args.season,
+                            batch_size=args.batch_size, queue_depth=args.queue_depth, write=args.yes)
+        except Exception as e:
+            print(f"❌ Error ingesting {args.source}: {e}")
+            return 1
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print_result(result)
+    return 1 if result['invalid'] else 0
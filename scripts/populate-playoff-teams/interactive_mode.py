@@ -12,7 +12,6 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 from typing import List, Dict, Optional
-from supabase import Client
 
 # Load the main module using importlib since filename has hyphens
 main_module_path = os.path.join(current_dir, 'populate-playoff-teams.py')
@@ -20,13 +19,15 @@ spec = importlib.util.spec_from_file_location("populate_playoff_teams", main_mod
 populate_playoff_teams = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(populate_playoff_teams)
 
-# ESPN API dates for playoff games
-PLAYOFF_API_DATES = {
-    1: ['20260110', '20260111'],  # Wild Card (Week 1)
-    2: ['20260117', '20260118'],  # Divisional Round (Week 2)
-    3: ['20260125'],              # Conference Championship (Week 3)
-    4: ['20260208']               # Super Bowl (Week 4)
-}
+# supabase.Client, or Any when only the local SQLite backend is available
+Client = populate_playoff_teams.Client
+
+import profiling
+from http_client import get_http_client
+import backfill
+import playoff_calendar
+from espn_matching import EspnEventIndex
+import validation
 
 
 def display_main_menu() -> str:
@@ -500,59 +501,87 @@ def get_playoff_teams(supabase: Client, season: int) -> Dict[str, Dict[int, str]
         return {'AFC': {}, 'NFC': {}}
 
 
-def get_espn_game_ids(week: int) -> List[Dict[str, str]]:
+@profiling.traced()
+def get_espn_game_ids(season: int, week: int, strict: bool = False) -> List[Dict[str, str]]:
     """Fetch game IDs from ESPN API for a given playoff week.
     
     Returns a list of game info dicts with id, home_team, away_team, and kickoff_time.
+    The dates to query come from the season's postseason calendar (see playoff_calendar.py).
+    Requests go through the shared HTTP client (rate limited, retried with backoff).
+    If a date still fails, a warning is printed and that date is skipped, unless
+    strict is True, in which case a RuntimeError is raised.
     """
-    if week not in PLAYOFF_API_DATES:
+    dates = playoff_calendar.get_week_dates(season, week)
+    if not dates:
+        if strict:
+            raise RuntimeError(f"No ESPN playoff dates known for season {season}, week {week}")
+        print(f"Warning: No ESPN playoff dates known for season {season}, week {week}")
         return []
     
     games = []
-    dates = PLAYOFF_API_DATES[week]
+    client = get_http_client()
     
     for date_str in dates:
+        url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates={date_str}"
         try:
-            url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates={date_str}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get('events', [])
-                
-                for event in events:
-                    event_id = event.get('id')
-                    competitions = event.get('competitions', [])
-                    event_date = event.get('date', '')
-                    
-                    if event_id and competitions:
-                        comp = competitions[0]
-                        competitors = comp.get('competitors', [])
-                        start_date = comp.get('date', event_date)
-                        
-                        if len(competitors) >= 2:
-                            away_comp = competitors[1] if competitors[1].get('homeAway') == 'away' else competitors[0]
-                            home_comp = competitors[0] if competitors[0].get('homeAway') == 'home' else competitors[1]
-                            
-                            away_team = away_comp.get('team', {}).get('displayName', '').strip()
-                            home_team = home_comp.get('team', {}).get('displayName', '').strip()
-                            
-                            # Store game info even if TBD - we'll match it later
-                            games.append({
-                                'id': event_id,
-                                'home_team': home_team if home_team != 'TBD' else None,
-                                'away_team': away_team if away_team != 'TBD' else None,
-                                'kickoff_time': start_date,
-                                'date': date_str
-                            })
-                            
-        except Exception as e:
+            response = client.get(url, timeout=10)
+            if response.status_code != 200:
+                raise RuntimeError(f"ESPN returned status {response.status_code}")
+            games.extend(parse_espn_scoreboard_events(response.json(), date_str))
+        except (requests.exceptions.RequestException, RuntimeError, ValueError) as e:
+            if strict:
+                raise RuntimeError(f"Could not fetch game IDs for date {date_str}: {e}") from e
             print(f"Warning: Could not fetch game IDs for date {date_str}: {e}")
             continue
     
     return games
 
 
+def parse_espn_scoreboard_events(data: Dict, date_str: str) -> List[Dict[str, str]]:
+    """Extract game info dicts from one ESPN scoreboard API response."""
+    games = []
+    events = data.get('events', [])
+    
+    for event in events:
+        event_id = event.get('id')
+        competitions = event.get('competitions', [])
+        event_date = event.get('date', '')
+        
+        if event_id and competitions:
+            comp = competitions[0]
+            competitors = comp.get('competitors', [])
+            start_date = comp.get('date', event_date)
+            
+            if len(competitors) >= 2:
+                away_comp = competitors[1] if competitors[1].get('homeAway') == 'away' else competitors[0]
+                home_comp = competitors[0] if competitors[0].get('homeAway') == 'home' else competitors[1]
+                
+                away_info = away_comp.get('team', {})
+                home_info = home_comp.get('team', {})
+                away_team = away_info.get('displayName', '').strip()
+                home_team = home_info.get('displayName', '').strip()
+                
+                # "AFC Wild Card Playoffs" etc. narrows TBD matching to a conference
+                headline = ' '.join(note.get('headline', '') for note in comp.get('notes', []))
+                conference = next((conf for conf in ['AFC', 'NFC'] if conf in headline), None)
+                
+                # Store game info even if TBD - we'll match it later
+                games.append({
+                    'id': event_id,
+                    'home_team': home_team if home_team != 'TBD' else None,
+                    'away_team': away_team if away_team != 'TBD' else None,
+                    'home_abbreviation': home_info.get('abbreviation') if home_team != 'TBD' else None,
+                    'away_abbreviation': away_info.get('abbreviation') if away_team != 'TBD' else None,
+                    'home_team_id': home_info.get('id') if home_team != 'TBD' else None,
+                    'away_team_id': away_info.get('id') if away_team != 'TBD' else None,
+                    'conference': conference,
+                    'kickoff_time': start_date,
+                    'date': date_str
+                })
+    
+    return games
+
+
 def generate_wild_card_games(teams_by_conf: Dict[str, Dict[int, str]]) -> List[Dict[str, any]]:
     """Generate wild card round games (Week 1). #1 seeds don't play."""
     games = []
@@ -601,7 +630,7 @@ def generate_divisional_games(teams_by_conf: Dict[str, Dict[int, str]], week_1_w
         # #1 seed plays lowest remaining seed (worst team that won wild card)
         seed_1_team = teams.get(1)
         if seed_1_team and winner_seeds:
-            lowest_seed = min(winner_seeds)  # Lowest seed number = worst team
+            lowest_seed = max(winner_seeds)  # Highest seed number = worst team
             lowest_team = teams[lowest_seed]
             games.append({
                 'week': 2,
@@ -749,6 +778,64 @@ def display_week_menu() -> str:
         print("Invalid choice. Please enter 1, 2, or x.")
 
 
+WEEK_NAMES = {1: 'Wild Card Round', 2: 'Divisional Round', 3: 'Conference Championships', 4: 'Super Bowl'}
+
+
+def get_existing_games(supabase: Client, season: int, week: int) -> List[Dict]:
+    """Get playoff games already stored for a season and week."""
+    try:
+        response = supabase.table('games').select('*').eq('season', season).eq('week', week).eq('season_type', 3).execute()
+        return response.data if response.data else []
+    except Exception as e:
+        print(f"Error checking existing games: {e}")
+        return []
+
+
+def generate_games_for_week(supabase: Client, season: int, week: int, playoff_teams: Optional[Dict[str, Dict[int, str]]] = None):
+    """Build a playoff week's matchups from the seeds and the previous round's winners.
+    
+    Returns (games, error). error is None on success, otherwise a dict with
+    'reason' ('no_teams', 'not_ready' or 'no_games'), 'message' and 'hint'.
+    """
+    if playoff_teams is None:
+        playoff_teams = get_playoff_teams(supabase, season)
+    if not playoff_teams['AFC'] and not playoff_teams['NFC']:
+        return [], {'reason': 'no_teams',
+                    'message': f"No playoff teams found for season {season}.",
+                    'hint': "Please add playoff teams first."}
+    
+    games = []
+    if week == 1:
+        games = generate_wild_card_games(playoff_teams)
+    elif week == 2:
+        week_1_winners = get_week_winners(supabase, season, 1)
+        if not week_1_winners or (not week_1_winners.get('AFC') and not week_1_winners.get('NFC')):
+            return [], {'reason': 'not_ready',
+                        'message': "No winners found for Wild Card Round (Week 1).",
+                        'hint': "Please ensure Week 1 games are completed with winners set."}
+        games = generate_divisional_games(playoff_teams, week_1_winners)
+    elif week == 3:
+        week_2_winners = get_week_winners(supabase, season, 2)
+        if not week_2_winners or (not week_2_winners.get('AFC') and not week_2_winners.get('NFC')):
+            return [], {'reason': 'not_ready',
+                        'message': "No winners found for Divisional Round (Week 2).",
+                        'hint': "Please ensure Week 2 games are completed with winners set."}
+        games = generate_conference_championship_games(playoff_teams, week_2_winners)
+    elif week == 4:
+        week_3_winners = get_week_3_winners(supabase, season)
+        if 'AFC' not in week_3_winners or 'NFC' not in week_3_winners:
+            return [], {'reason': 'not_ready',
+                        'message': "Conference champions not determined yet.",
+                        'hint': "Please ensure Conference Championships (Week 3) are completed."}
+        games = generate_super_bowl_game(week_3_winners)
+    
+    if not games:
+        return [], {'reason': 'no_games',
+                    'message': f"Could not generate games for {WEEK_NAMES.get(week, f'Week {week}')}.",
+                    'hint': "Make sure playoff teams are set correctly."}
+    return games, None
+
+
 def interactive_add_update_games(supabase: Client, season: int):
     """Interactive flow for adding/updating playoff games."""
     from datetime import datetime, timedelta
@@ -769,21 +856,15 @@ def interactive_add_update_games(supabase: Client, season: int):
         if week is None:
             return
         
-        week_names = {1: 'Wild Card Round', 2: 'Divisional Round', 3: 'Conference Championships', 4: 'Super Bowl'}
+        week_names = WEEK_NAMES
         print(f"\n--- {week_names[week]} (Week {week}) ---")
         
         # Check existing games for this week
-        try:
-            existing_response = supabase.table('games').select('*').eq('season', season).eq('week', week).eq('season_type', 3).execute()
-            existing_games = existing_response.data if existing_response.data else []
-            
-            if existing_games:
-                print(f"\nExisting games for {week_names[week]}:")
-                for game in existing_games:
-                    print(f"  {game.get('away_team')} @ {game.get('home_team')} (Status: {game.get('status', 'scheduled')})")
-        except Exception as e:
-            print(f"Error checking existing games: {e}")
-            existing_games = []
+        existing_games = get_existing_games(supabase, season, week)
+        if existing_games:
+            print(f"\nExisting games for {week_names[week]}:")
+            for game in existing_games:
+                print(f"  {game.get('away_team')} @ {game.get('home_team')} (Status: {game.get('status', 'scheduled')})")
         
         choice = display_week_menu()
         
@@ -791,35 +872,10 @@ def interactive_add_update_games(supabase: Client, season: int):
             continue
         elif choice == '1':
             # Auto-generate
-            games = []
-            
-            if week == 1:
-                games = generate_wild_card_games(playoff_teams)
-            elif week == 2:
-                week_1_winners = get_week_winners(supabase, season, 1)
-                if not week_1_winners or (not week_1_winners.get('AFC') and not week_1_winners.get('NFC')):
-                    print("\n⚠️  No winners found for Wild Card Round (Week 1).")
-                    print("   Please ensure Week 1 games are completed with winners set.")
-                    continue
-                games = generate_divisional_games(playoff_teams, week_1_winners)
-            elif week == 3:
-                week_2_winners = get_week_winners(supabase, season, 2)
-                if not week_2_winners or (not week_2_winners.get('AFC') and not week_2_winners.get('NFC')):
-                    print("\n⚠️  No winners found for Divisional Round (Week 2).")
-                    print("   Please ensure Week 2 games are completed with winners set.")
-                    continue
-                games = generate_conference_championship_games(playoff_teams, week_2_winners)
-            elif week == 4:
-                week_3_winners = get_week_3_winners(supabase, season)
-                if 'AFC' not in week_3_winners or 'NFC' not in week_3_winners:
-                    print("\n⚠️  Conference champions not determined yet.")
-                    print("   Please ensure Conference Championships (Week 3) are completed.")
-                    continue
-                games = generate_super_bowl_game(week_3_winners)
-            
-            if not games:
-                print(f"\n⚠️  Could not generate games for {week_names[week]}.")
-                print("   Make sure playoff teams are set correctly.")
+            games, error = generate_games_for_week(supabase, season, week, playoff_teams)
+            if error:
+                print(f"\n⚠️  {error['message']}")
+                print(f"   {error['hint']}")
                 continue
             
             # Display generated games
@@ -829,15 +885,14 @@ def interactive_add_update_games(supabase: Client, season: int):
             
             confirm = input("\nCreate these games? (y/n): ").strip().lower()
             if confirm == 'y':
-                insert_playoff_games(supabase, season, week, games, existing_games)
+                insert_playoff_games(supabase, season, week, games, existing_games, teams_by_conf=playoff_teams)
         elif choice == '2':
             # Manual entry
             manual_add_game(supabase, season, week, existing_games)
 
 
 def manual_add_game(supabase: Client, season: int, week: int, existing_games: List[Dict]):
-    """Manually add a playoff game."""
-    from datetime import datetime, timedelta
+    """Manually add a playoff game (validated and written by insert_playoff_games)."""
     
     print("\n--- Manual Game Entry ---")
     
@@ -863,88 +918,43 @@ def manual_add_game(supabase: Client, season: int, week: int, existing_games: Li
     if not away_team:
         return
     
-    # Try to get game ID from ESPN API
-    espn_id = None
-    kickoff_time = None
+    # Seeds and conference from the stored field, so the game is validated like generated ones
+    seeds = {team: (conf, seed) for conf, conf_teams in playoff_teams.items() for seed, team in conf_teams.items()}
+    game = {
+        'home_team': home_team,
+        'away_team': away_team,
+        'home_seed': seeds[home_team][1],
+        'away_seed': seeds[away_team][1],
+        'conference': 'SUPER_BOWL' if week == 4 else seeds[home_team][0],
+    }
     
+    # Try to get game ID from ESPN API
     print("\nFetching game ID from ESPN API...")
-    espn_games = get_espn_game_ids(week)
-    for espn_game in espn_games:
-        if (espn_game.get('home_team') == home_team and 
-            espn_game.get('away_team') == away_team):
-            espn_id = espn_game['id']
-            kickoff_time = espn_game['kickoff_time']
-            print(f"✅ Found matching ESPN game ID: {espn_id}")
-            break
-    
-    # Get kickoff time (default to next Saturday/Sunday or from ESPN)
-    if not kickoff_time:
+    espn_games = get_espn_game_ids(season, week)
+    espn_game = EspnEventIndex(espn_games, populate_playoff_teams.NFL_TEAMS).find(away_team, home_team)
+    if espn_game:
+        print(f"✅ Found matching ESPN game ID: {espn_game['id']}")
+    else:
+        # Get kickoff time (default to next Saturday, see build_playoff_game_rows)
         print("\nEnter kickoff time (YYYY-MM-DD HH:MM, or press Enter for default):")
         kickoff_input = input().strip()
         if kickoff_input:
             try:
-                kickoff_time = datetime.strptime(kickoff_input, '%Y-%m-%d %H:%M')
+                game['kickoff_time'] = datetime.strptime(kickoff_input, '%Y-%m-%d %H:%M').isoformat()
             except ValueError:
                 print("Invalid format. Using default time.")
-                kickoff_time = datetime.now().replace(hour=13, minute=0, second=0, microsecond=0)
-                # Next Saturday
-                days_until_saturday = (5 - kickoff_time.weekday()) % 7 or 7
-                kickoff_time += timedelta(days=days_until_saturday)
-        else:
-            kickoff_time = datetime.now().replace(hour=13, minute=0, second=0, microsecond=0)
-            days_until_saturday = (5 - kickoff_time.weekday()) % 7 or 7
-            kickoff_time += timedelta(days=days_until_saturday)
-    
-    # Use ESPN ID if found, otherwise generate one
-    if espn_id:
-        game_id = espn_id
-    else:
-        game_id = f"{season}_3_{week}_{home_team.replace(' ', '_')}_{away_team.replace(' ', '_')}"
     
-    # Convert kickoff_time to string if it's a datetime object
-    if isinstance(kickoff_time, datetime):
-        kickoff_time_str = kickoff_time.isoformat()
-    else:
-        kickoff_time_str = kickoff_time
-    
-    game_data = {
-        'id': game_id,
-        'week': week,
-        'season': season,
-        'season_type': 3,
-        'home_team': home_team,
-        'away_team': away_team,
-        'kickoff_time': kickoff_time_str,
-        'status': 'scheduled'
-    }
+    game_data = build_playoff_game_rows(season, week, [game], espn_games)[0]
     
     print(f"\nGame to create:")
     print(f"  {away_team} @ {home_team}")
-    print(f"  Week {week}, Game ID: {game_id}")
-    if isinstance(kickoff_time, datetime):
-        print(f"  Kickoff: {kickoff_time.strftime('%Y-%m-%d %H:%M')}")
-    else:
-        print(f"  Kickoff: {kickoff_time}")
+    print(f"  Week {week}, Game ID: {game_data['id']}")
+    print(f"  Kickoff: {game_data['kickoff_time']}")
     
     confirm = input("\nCreate this game? (y/n): ").strip().lower()
     if confirm == 'y':
-        try:
-            # Check if game already exists
-            existing_ids = [g.get('id') for g in existing_games]
-            if game_id in existing_ids:
-                # Update existing
-                supabase.table('games').update({
-                    'home_team': home_team,
-                    'away_team': away_team,
-                    'kickoff_time': kickoff_time_str
-                }).eq('id', game_id).execute()
-                print("✅ Game updated successfully!")
-            else:
-                # Insert new
-                supabase.table('games').insert(game_data).execute()
-                print("✅ Game created successfully!")
-        except Exception as e:
-            print(f"❌ Error creating game: {e}")
+        insert_playoff_games(supabase, season, week, [game], existing_games, espn_games=espn_games,
+                             teams_by_conf=playoff_teams)
 
 
 def select_team_from_list(teams: List[str]) -> Optional[str]:
@@ -970,75 +980,88 @@ def select_team_from_list(teams: List[str]) -> Optional[str]:
             print("Please enter a valid number.")
 
 
-def insert_playoff_games(supabase: Client, season: int, week: int, games: List[Dict[str, any]], existing_games: List[Dict]):
-    """Insert or update playoff games."""
+def build_playoff_game_rows(season: int, week: int, games: List[Dict[str, any]], espn_games: List[Dict[str, str]]) -> List[Dict[str, any]]:
+    """Build games table rows for generated matchups, using ESPN game IDs and kickoff times where they match.
+    
+    A game's own 'kickoff_time' (e.g. entered by hand) is used when ESPN has no match.
+    """
     from datetime import datetime, timedelta
     
-    try:
-        # Fetch ESPN game IDs for this week
-        print(f"\nFetching game IDs from ESPN API for Week {week}...")
-        espn_games = get_espn_game_ids(week)
-        espn_game_map = {}  # Map by team names
+    espn_index = EspnEventIndex(espn_games, populate_playoff_teams.NFL_TEAMS)
+    matches = espn_index.assign(games)
+    
+    rows = []
+    
+    for game, espn_game in zip(games, matches):
+        espn_id = espn_game['id'] if espn_game else None
+        kickoff_time = espn_game['kickoff_time'] if espn_game else game.get('kickoff_time')
+        
+        # Use ESPN ID if found, otherwise generate one
+        if espn_id:
+            game_id = espn_id
+        else:
+            game_id = f"{season}_3_{week}_{game['home_team'].replace(' ', '_')}_{game['away_team'].replace(' ', '_')}"
         
-        # Build a map of ESPN games by team names (for matching)
-        for espn_game in espn_games:
-            if espn_game.get('home_team') and espn_game.get('away_team'):
-                key = f"{espn_game['away_team']}_{espn_game['home_team']}"
-                espn_game_map[key] = espn_game
-            elif not espn_game.get('home_team') or not espn_game.get('away_team'):
-                # TBD game - store by index
-                if 'tbd_games' not in espn_game_map:
-                    espn_game_map['tbd_games'] = []
-                espn_game_map['tbd_games'].append(espn_game)
+        # Generate default kickoff time if not from ESPN
+        if not kickoff_time:
+            default_kickoff = datetime.now().replace(hour=13, minute=0, second=0, microsecond=0)
+            days_until_saturday = (5 - default_kickoff.weekday()) % 7 or 7
+            default_kickoff += timedelta(days=days_until_saturday)
+            kickoff_time = default_kickoff.isoformat()
         
-        # Also create a list of TBD games for matching by position
-        tbd_games = espn_game_map.get('tbd_games', [])
-        tbd_index = 0
+        game_data = {
+            'id': game_id,
+            'week': week,
+            'season': season,
+            'season_type': 3,
+            'home_team': game['home_team'],
+            'away_team': game['away_team'],
+            'kickoff_time': kickoff_time,
+            'status': 'scheduled'
+        }
+        
+        rows.append(game_data)
+    
+    return rows
+
+
+@profiling.traced()
+def validate_playoff_games(supabase: Client, season: int, week: int, games: List[Dict[str, any]],
+                           teams_by_conf: Optional[Dict[str, Dict[int, str]]] = None) -> List[str]:
+    """validation.validate_games against the season's seed count and stored field (fetched when None)."""
+    if teams_by_conf is None:
+        teams_by_conf = get_playoff_teams(supabase, season)
+    return validation.validate_games(games, week, populate_playoff_teams.NFL_TEAMS, teams_by_conf,
+                                     seed_count=backfill.seeds_per_conference(season))
+
+
+def insert_playoff_games(supabase: Client, season: int, week: int, games: List[Dict[str, any]], existing_games: List[Dict],
+                         espn_games: Optional[List[Dict[str, str]]] = None,
+                         teams_by_conf: Optional[Dict[str, Dict[int, str]]] = None):
+    """Validate, then insert or update playoff games.
+    
+    espn_games: pre-fetched ESPN game info (see get_espn_game_ids); fetched from the API when None.
+    teams_by_conf: the season's field (see get_playoff_teams); read from playoff_teams when None.
+    Returns a summary dict ('inserted' and 'updated' game IDs, 'games' rows written), with
+    'errors' listing the problems when the games failed validation, or None on a write error.
+    """
+    errors = validate_playoff_games(supabase, season, week, games, teams_by_conf)
+    if errors:
+        validation.print_errors(errors, f"{WEEK_NAMES.get(week, f'Week {week}')} games")
+        return {'inserted': [], 'updated': [], 'games': [], 'errors': errors}
+    
+    try:
+        # Fetch ESPN game IDs for this week
+        if espn_games is None:
+            print(f"\nFetching game IDs from ESPN API for Week {week}...")
+            espn_games = get_espn_game_ids(season, week)
         
         existing_ids = {g.get('id') for g in existing_games}
         games_to_insert = []
         games_to_update = []
         
-        for game in games:
-            # Try to find matching ESPN game ID
-            espn_id = None
-            kickoff_time = None
-            
-            # Try exact match first
-            key = f"{game['away_team']}_{game['home_team']}"
-            if key in espn_game_map:
-                espn_id = espn_game_map[key]['id']
-                kickoff_time = espn_game_map[key]['kickoff_time']
-            elif tbd_games and tbd_index < len(tbd_games):
-                # Use next TBD game if available
-                espn_id = tbd_games[tbd_index]['id']
-                kickoff_time = tbd_games[tbd_index]['kickoff_time']
-                tbd_index += 1
-            
-            # Use ESPN ID if found, otherwise generate one
-            if espn_id:
-                game_id = espn_id
-            else:
-                game_id = f"{season}_3_{week}_{game['home_team'].replace(' ', '_')}_{game['away_team'].replace(' ', '_')}"
-            
-            # Generate default kickoff time if not from ESPN
-            if not kickoff_time:
-                default_kickoff = datetime.now().replace(hour=13, minute=0, second=0, microsecond=0)
-                days_until_saturday = (5 - default_kickoff.weekday()) % 7 or 7
-                default_kickoff += timedelta(days=days_until_saturday)
-                kickoff_time = default_kickoff.isoformat()
-            
-            game_data = {
-                'id': game_id,
-                'week': week,
-                'season': season,
-                'season_type': 3,
-                'home_team': game['home_team'],
-                'away_team': game['away_team'],
-                'kickoff_time': kickoff_time,
-                'status': 'scheduled'
-            }
-            
+        for game_data in build_playoff_game_rows(season, week, games, espn_games):
+            game_id = game_data['id']
             if game_id in existing_ids:
                 games_to_update.append((game_id, game_data))
             else:
@@ -1061,10 +1084,17 @@ def insert_playoff_games(supabase: Client, season: int, week: int, games: List[D
         if espn_games:
             print(f"   Used ESPN game IDs from API")
         
+        return {
+            'inserted': [g['id'] for g in games_to_insert],
+            'updated': [game_id for game_id, _ in games_to_update],
+            'games': games_to_insert + [game_data for _, game_data in games_to_update],
+        }
+        
     except Exception as e:
         print(f"❌ Error creating games: {e}")
         import traceback
         traceback.print_exc()
+        return None
 
 
 def run_interactive_mode(supabase: Client):
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Top-N playoff leaderboards per pool, built in one streaming pass.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py leaderboard --season 2025 --top 10
+
+Scoring matches the app's leaderboard (src/app/api/leaderboard/route.ts): for each decided
+playoff game (finished, with a winner) whose winner the participant picked in `picks`, they
+score the confidence points they gave that team in playoff_confidence_points (the pick's
+own confidence_points if they have none for it). Confidence rows and picks are both read in
+pages ordered by pool and participant and merged, so each participant's total is complete
+as soon as the next participant starts and nothing is kept per participant:
+  - a bounded min-heap of the best --top entries per pool
+  - a score -> count histogram per pool, for dense ranks of any score
+
+Ranks are dense (1, 2, 2, 3): a participant's rank is one more than the number of
+distinct higher scores. Every participant scoring more than someone in the heap is in
+the heap too, so the heap's ranks are exact. Equal scores at the cut-off keep the
+participant_id that sorts first.
+
+All pools' snapshots (top entries plus the histogram) are written to
+playoff_leaderboards with a single upsert.
+"""
+
+import sys
+import json
+import heapq
+import argparse
+import contextlib
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import List, Dict, Optional, Any, Iterator, Tuple, Callable
+
+import validation
+
+DEFAULT_TOP = 10
+PAGE_SIZE = 1000
+
+
+class _Entry:
+    """Heap entry ordered worst-first: lower score, then the later participant_id."""
+    __slots__ = ('score', 'participant_id')
+
+    def __init__(self, score: int, participant_id: str):
+        self.score = score
+        self.participant_id = participant_id
+
+    def __lt__(self, other: '_Entry') -> bool:
+        if self.score != other.score:
+            return self.score < other.score
+        return self.participant_id > other.participant_id
+
+
+class PoolLeaderboard:
+    """Bounded top-N and score histogram for one pool."""
+
+    def __init__(self, pool_id: str, top: int = DEFAULT_TOP):
+        self.pool_id = pool_id
+        self.top = top
+        self.score_counts: Counter = Counter()
+        self.tracked: Dict[str, int] = {}
+        self._heap: List[_Entry] = []
+
+    def add(self, participant_id: str, score: int) -> None:
+        self.score_counts[score] += 1
+        entry = _Entry(score, participant_id)
+        if len(self._heap) < self.top:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    @property
+    def participants(self) -> int:
+        return sum(self.score_counts.values())
+
+    def rank_of_score(self, score: int) -> int:
+        """Dense rank a participant with this score holds."""
+        return 1 + sum(1 for other in self.score_counts if other > score)
+
+    def rank_of(self, participant_id: str) -> Optional[Dict[str, Any]]:
+        """Rank entry for a participant tracked while building (None if not tracked or not in the pool)."""
+        if participant_id not in self.tracked:
+            return None
+        score = self.tracked[participant_id]
+        return {'participant_id': participant_id, 'score': score, 'rank': self.rank_of_score(score)}
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """The top entries, best first, with dense ranks."""
+        ordered = sorted(self._heap, key=lambda e: (-e.score, e.participant_id))
+        ranked = []
+        rank, previous = 0, None
+        for entry in ordered:
+            if entry.score != previous:
+                rank, previous = rank + 1, entry.score
+            ranked.append({'rank': rank, 'participant_id': entry.participant_id, 'score': entry.score})
+        return ranked
+
+    def snapshot(self, season: int) -> Dict[str, Any]:
+        """Row for playoff_leaderboards: top entries as [rank, participant_id, score] and the histogram."""
+        return {
+            'pool_id': self.pool_id,
+            'season': season,
+            'participant_count': self.participants,
+            'top_entries': [[e['rank'], e['participant_id'], e['score']] for e in self.entries()],
+            'score_counts': sorted(([score, count] for score, count in self.score_counts.items()), reverse=True),
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def decided_games(supabase, season: int) -> Dict[str, str]:
+    """Winner by game id for the season's finished playoff games."""
+    response = supabase.table('games').select('id, winner, status') \
+        .eq('season', season).eq('season_type', 3).execute()
+    return {g['id']: g['winner'] for g in response.data or [] if g.get('winner') and validation.is_finished(g.get('status'))}
+
+
+def _stream_by_participant(make_query: Callable[[], Any], tiebreak: str, page_size: int,
+                           pool_id: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """Rows of make_query() ordered by pool, participant and `tiebreak`, one page at a time.
+
+    Pages are keyset-paginated (the rest of the current pool after the last participant,
+    then the pools after it), so each page is an index range read rather than an OFFSET.
+    A full page's last participant may be cut off; its rows are left for the next page.
+    """
+    last_pool, last_participant = None, None
+    while True:
+        query = make_query()
+        if pool_id is not None:
+            query = query.eq('pool_id', pool_id)
+        if last_participant is not None:
+            query = query.eq('pool_id', last_pool).gt('participant_id', last_participant)
+        elif last_pool is not None:
+            query = query.gt('pool_id', last_pool)
+        page = query.order('pool_id').order('participant_id').order(tiebreak).limit(page_size).execute().data or []
+
+        full = len(page) == page_size
+        if full:
+            tail = (page[-1]['pool_id'], page[-1]['participant_id'])
+            complete = [row for row in page if (row['pool_id'], row['participant_id']) != tail]
+            if not complete:
+                raise ValueError(f"A participant has more than {page_size} rows; raise the page size")
+            page = complete
+        yield from page
+
+        if full:
+            last_pool, last_participant = page[-1]['pool_id'], page[-1]['participant_id']
+        elif last_participant is not None:
+            # Current pool done; continue with the next pools
+            last_pool, last_participant = page[-1]['pool_id'] if page else last_pool, None
+            if pool_id is not None:
+                return
+        else:
+            return
+
+
+def stream_confidence_rows(supabase, season: int, page_size: int = PAGE_SIZE,
+                           pool_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """playoff_confidence_points rows ordered by pool and participant, one page at a time."""
+    return _stream_by_participant(
+        lambda: supabase.table('playoff_confidence_points')
+        .select('pool_id, participant_id, team_name, confidence_points').eq('season', season),
+        'team_name', page_size, pool_id)
+
+
+def stream_pick_rows(supabase, game_ids, page_size: int = PAGE_SIZE,
+                     pool_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """picks rows for the given games ordered by pool and participant, one page at a time."""
+    if not game_ids:
+        return iter(())
+    return _stream_by_participant(
+        lambda: supabase.table('picks')
+        .select('pool_id, participant_id, game_id, predicted_winner, confidence_points').in_('game_id', sorted(game_ids)),
+        'game_id', page_size, pool_id)
+
+
+def participant_scores(rows: Iterator[Dict[str, Any]], picks: Iterator[Dict[str, Any]],
+                       winners: Dict[str, str]) -> Iterator[Tuple[str, str, int]]:
+    """(pool_id, participant_id, score) from confidence rows and picks, both grouped by pool and participant."""
+    def by_participant(stream):
+        return groupby(stream, key=lambda row: (row['pool_id'], row['participant_id']))
+
+    points_groups, pick_groups = by_participant(rows), by_participant(picks)
+    points_next, picks_next = next(points_groups, None), next(pick_groups, None)
+    while points_next is not None or picks_next is not None:
+        if picks_next is None or (points_next is not None and points_next[0] <= picks_next[0]):
+            key = points_next[0]
+        else:
+            key = picks_next[0]
+        points = {}
+        if points_next is not None and points_next[0] == key:
+            points = {row['team_name']: row['confidence_points'] for row in points_next[1]}
+            points_next = next(points_groups, None)
+        score = 0
+        if picks_next is not None and picks_next[0] == key:
+            for pick in picks_next[1]:
+                winner = winners.get(pick['game_id'])
+                predicted = pick.get('predicted_winner')
+                if winner and predicted and predicted.lower() == winner.lower():
+                    score += points.get(predicted, pick.get('confidence_points') or 0)
+            picks_next = next(pick_groups, None)
+        yield key[0], key[1], score
+
+
+def build_leaderboards(scores: Iterator[Tuple[str, str, int]], top: int = DEFAULT_TOP,
+                       track: Optional[List[str]] = None) -> Dict[str, PoolLeaderboard]:
+    """Leaderboard per pool from (pool_id, participant_id, score); scores of `track` participants are kept."""
+    track = set(track or [])
+    boards: Dict[str, PoolLeaderboard] = {}
+    for pool_id, participant_id, score in scores:
+        board = boards.get(pool_id)
+        if board is None:
+            board = boards[pool_id] = PoolLeaderboard(pool_id, top)
+        board.add(participant_id, score)
+        if participant_id in track:
+            board.tracked[participant_id] = score
+    return boards
+
+
+def write_snapshots(supabase, boards: Dict[str, PoolLeaderboard], season: int) -> int:
+    """Upsert every pool's snapshot in one request; returns the number of rows written."""
+    rows = [board.snapshot(season) for board in boards.values()]
+    if not rows:
+        return 0
+    supabase.table('playoff_leaderboards').upsert(rows, on_conflict='pool_id,season').execute()
+    return len(rows)
+
+
+def add_leaderboard_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `leaderboard` command on the main CLI parser."""
+    parser = subparsers.add_parser('leaderboard', parents=common_parents or [],
+                                   help='Build top-N playoff leaderboards per pool from confidence points')
+    parser.add_argument('--season', type=int, required=True, help='Season (e.g. 2025)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help=f'Entries kept per pool (default: {DEFAULT_TOP})')
+    parser.add_argument('--pool', help='Only print this pool (all pools are still written)')
+    parser.add_argument('--participant', action='append', default=[], metavar='PARTICIPANT_ID',
+                        help="Also report this participant's rank (repeatable)")
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE, help=f'Rows per request (default: {PAGE_SIZE})')
+    parser.add_argument('--no-write', action='store_true', help='Print the leaderboards without writing snapshots')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON document to stdout')
+    return parser
+
+
+def run_leaderboard_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Run `leaderboard`; returns the process exit code."""
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        try:
+            winners = decided_games(supabase, args.season)
+            rows = stream_confidence_rows(supabase, args.season, args.page_size)
+            picks = stream_pick_rows(supabase, winners, args.page_size)
+            boards = build_leaderboards(participant_scores(rows, picks, winners), top=args.top,
+                                        track=args.participant)
+        except Exception as e:
+            print(f"❌ Error building leaderboards: {e}")
+            return 1
+        if not boards:
+            print(f"⚠️  No {args.season} playoff confidence points in the database")
+            return 1
+        print(f"📊 {len(boards)} pool(s), {sum(b.participants for b in boards.values())} participant(s), "
+              f"{len(winners)} decided playoff game(s)")
+
+        written = 0
+        if not args.no_write:
+            try:
+                written = write_snapshots(supabase, boards, args.season)
+                print(f"✅ Wrote {written} leaderboard snapshot(s)")
+            except Exception as e:
+                print(f"❌ Error writing leaderboard snapshots: {e}")
+                return 1
+
+    shown = [boards[args.pool]] if args.pool in boards else list(boards.values())
+    if args.pool and args.pool not in boards:
+        print(f"⚠️  Pool {args.pool} has no confidence points for {args.season}", file=sys.stderr)
+    lookups = {board.pool_id: [board.rank_of(p) for p in args.participant if p in board.tracked] for board in shown}
+
+    if args.json:
+        print(json.dumps({
+            'season': args.season, 'written': written,
+            'pools': [{'pool_id': board.pool_id, 'participants': board.participants, 'top': board.entries(),
+                       'lookups': lookups[board.pool_id]} for board in shown],
+        }))
+        return 0
+
+    for board in shown:
+        print(f"\n🏆 Pool {board.pool_id} ({board.participants} participants)")
+        for entry in board.entries():
+            print(f"  {entry['rank']:>4}  {entry['score']:>5}  {entry['participant_id']}")
+        for lookup in lookups[board.pool_id]:
+            print(f"  👤 {lookup['participant_id']}: rank {lookup['rank']} with {lookup['score']} points")
+    return 0
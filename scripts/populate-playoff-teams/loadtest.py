@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Concurrent load test for playoff confidence-point submissions.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py --db sqlite loadtest --season 2099 --participants 5000
+
+Replays what POST /api/playoffs/[poolId]/confidence-points does for each submission:
+select the participant's existing rows, reject a complete set, delete a partial one, then
+insert the new set. Participants come from the season's synthetic pools (run `synthetic`
+first); their confidence points are deleted before the run.
+
+Each simulated participant arrives once, at a time drawn from --arrival over --duration
+seconds:
+  constant  evenly spread
+  ramp      rate grows linearly towards the end
+  spike     most arrivals in the last fifth, like the rush before kickoff
+A --partial-rate share first saves part of their picks and then amends to the full set;
+a --duplicate-rate share sends the final submission twice at once (double click, client
+retry), which races on UNIQUE(participant_id, pool_id, season, confidence_points).
+
+Arrivals go into an asyncio queue served by --concurrency workers; the blocking database
+calls run on a thread pool of the same size. The report gives throughput, p50/p95/p99
+latency (from arrival, so queueing counts) and the rate of constraint violations.
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+
+import interactive_mode
+import synthetic_data
+
+ARRIVAL_CURVES = ['constant', 'ramp', 'spike']
+DEFAULT_PARTICIPANTS = 2000
+DEFAULT_CONCURRENCY = 32
+DEFAULT_DURATION = 10.0
+DEFAULT_PARTIAL_RATE = 0.3
+DEFAULT_DUPLICATE_RATE = 0.05
+# Pool IDs per participants query (keeps the URL short) and rows per page
+POOLS_PER_QUERY = 200
+PAGE_SIZE = 1000
+# Share of --duration holding most spike arrivals (exponential towards the deadline)
+SPIKE_WINDOW = 0.2
+
+
+def arrival_times(count: int, duration: float, curve: str, rng: random.Random) -> List[float]:
+    """Sorted arrival offsets in [0, duration] following the named curve."""
+    if curve == 'constant':
+        times = [rng.random() * duration for _ in range(count)]
+    elif curve == 'ramp':
+        # Density proportional to t: inverse CDF of t^2
+        times = [duration * rng.random() ** 0.5 for _ in range(count)]
+    elif curve == 'spike':
+        times = [max(0.0, duration * (1 - rng.expovariate(1 / SPIKE_WINDOW))) for _ in range(count)]
+    else:
+        raise ValueError(f"Unknown arrival curve: {curve}")
+    return sorted(times)
+
+
+def is_unique_violation(error: Exception) -> bool:
+    """True for a duplicate-key error from Postgres (SQLSTATE 23505) or the local stand-in."""
+    return getattr(error, 'code', None) == '23505' or 'duplicate key' in str(error)
+
+
+def submit(supabase, participant_id: str, pool_id: str, season: int, picks: Dict[str, int]) -> str:
+    """One submission as the API route does it; returns 'ok', 'rejected' or 'violation'."""
+    existing = supabase.table('playoff_confidence_points').select('id') \
+        .eq('participant_id', participant_id).eq('pool_id', pool_id).eq('season', season).execute().data or []
+    if len(existing) >= synthetic_data.PLAYOFF_TEAMS:
+        return 'rejected'
+    if existing:
+        supabase.table('playoff_confidence_points').delete() \
+            .eq('participant_id', participant_id).eq('pool_id', pool_id).eq('season', season).execute()
+    rows = [{'participant_id': participant_id, 'pool_id': pool_id, 'season': season,
+             'team_name': team, 'confidence_points': points} for team, points in picks.items()]
+    try:
+        supabase.table('playoff_confidence_points').insert(rows).execute()
+    except Exception as e:
+        if is_unique_violation(e):
+            return 'violation'
+        raise
+    return 'ok'
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def load_participants(supabase, season: int, limit: int) -> List[Tuple[str, str]]:
+    """(participant_id, pool_id) of up to `limit` participants in the season's synthetic pools."""
+    pool_ids = synthetic_data.synthetic_pool_ids(supabase, season)
+    participants = []
+    for start in range(0, len(pool_ids), POOLS_PER_QUERY):
+        batch = pool_ids[start:start + POOLS_PER_QUERY]
+        # PostgREST caps a response (1000 rows by default), so page until a short page comes back
+        offset = 0
+        while len(participants) < limit:
+            rows = supabase.table('participants').select('id, pool_id').in_('pool_id', batch) \
+                .order('id').range(offset, offset + PAGE_SIZE - 1).execute().data or []
+            participants.extend((row['id'], row['pool_id']) for row in rows)
+            if len(rows) < PAGE_SIZE:
+                break
+            offset += PAGE_SIZE
+        if len(participants) >= limit:
+            break
+    return participants[:limit]
+
+
+def reset_points(supabase, participants: List[Tuple[str, str]], season: int) -> None:
+    """Delete the participants' confidence points, pool by pool."""
+    for pool_id in sorted({pool_id for _, pool_id in participants}):
+        supabase.table('playoff_confidence_points').delete().eq('pool_id', pool_id).eq('season', season).execute()
+
+
+def plan_submissions(participants: List[Tuple[str, str]], team_names: List[str], rng: random.Random,
+                     partial_rate: float, duplicate_rate: float) -> List[List[Dict[str, int]]]:
+    """Per participant, the pick sets they send in order (a partial set first, or the final set twice)."""
+    plans = []
+    for _ in participants:
+        points = list(range(1, len(team_names) + 1))
+        rng.shuffle(points)
+        final = dict(zip(team_names, points))
+        plan = []
+        if rng.random() < partial_rate:
+            saved = rng.randint(1, len(team_names) - 1)
+            plan.append(dict(list(final.items())[:saved]))
+        plan.append(final)
+        if rng.random() < duplicate_rate:
+            plan.append(final)
+        plans.append(plan)
+    return plans
+
+
+async def run_load(supabase, season: int, participants: List[Tuple[str, str]], plans: List[List[Dict[str, int]]],
+                   arrivals: List[float], concurrency: int) -> Dict[str, Any]:
+    """Replay the plans at their arrival times; returns latencies and outcome counts."""
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    queue: asyncio.Queue = asyncio.Queue()
+    latencies: Dict[str, List[float]] = {'submission': [], 'service': []}
+    outcomes = {'ok': 0, 'rejected': 0, 'violation': 0, 'error': 0}
+    errors: List[str] = []
+
+    async def call(participant_id: str, pool_id: str, picks: Dict[str, int], arrived: float) -> None:
+        started = time.perf_counter()
+        try:
+            outcome = await loop.run_in_executor(executor, submit, supabase, participant_id, pool_id, season, picks)
+        except Exception as e:
+            outcome = 'error'
+            if len(errors) < 5:
+                errors.append(str(e))
+        finished = time.perf_counter()
+        outcomes[outcome] += 1
+        latencies['submission'].append(finished - arrived)
+        latencies['service'].append(finished - started)
+
+    async def worker() -> None:
+        while True:
+            job = await queue.get()
+            try:
+                participant_id, pool_id, plan, arrived = job
+                # A partial save completes before the amendment; duplicates of the final set race each other
+                if len(plan) > 1 and plan[0] is not plan[1]:
+                    await call(participant_id, pool_id, plan[0], arrived)
+                    plan = plan[1:]
+                await asyncio.gather(*(call(participant_id, pool_id, picks, arrived) for picks in plan))
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for (participant_id, pool_id), plan, offset in zip(participants, plans, arrivals):
+        delay = start + offset - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        queue.put_nowait((participant_id, pool_id, plan, time.perf_counter()))
+    await queue.join()
+    elapsed = time.perf_counter() - start
+    for task in workers:
+        task.cancel()
+    executor.shutdown(wait=True)
+    return {'elapsed': elapsed, 'latencies': latencies, 'outcomes': outcomes, 'errors': errors}
+
+
+def summarize(run: Dict[str, Any], args) -> Dict[str, Any]:
+    """JSON-serialisable report of a run."""
+    submissions = sum(run['outcomes'].values())
+    duplicates = sum(1 for plan in run['plans'] if len(plan) > 1 and plan[-1] is plan[-2])
+    report = {
+        'season': args.season, 'participants': len(run['plans']), 'arrival': args.arrival,
+        'duration': args.duration, 'concurrency': args.concurrency, 'random_seed': args.random_seed,
+        'submissions': submissions, 'elapsed_s': round(run['elapsed'], 3),
+        'throughput_per_s': round(submissions / run['elapsed'], 1) if run['elapsed'] else None,
+        'outcomes': run['outcomes'],
+        'violation_rate': round(run['outcomes']['violation'] / submissions, 5) if submissions else 0.0,
+        'duplicate_participants': duplicates,
+        'errors': run['errors'],
+    }
+    for name, samples in run['latencies'].items():
+        report[f'{name}_ms'] = {f'p{pct}': round(percentile(samples, pct) * 1000, 2) for pct in (50, 95, 99)}
+    return report
+
+
+def add_loadtest_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `loadtest` command on the main CLI parser."""
+    parser = subparsers.add_parser('loadtest', parents=common_parents or [],
+                                   help='Load-test concurrent confidence-point submissions against synthetic pools')
+    parser.add_argument('--season', type=int, required=True, help='Season filled by `synthetic` (e.g. 2099)')
+    parser.add_argument('--participants', type=int, default=DEFAULT_PARTICIPANTS,
+                        help=f'Simulated participants (default: {DEFAULT_PARTICIPANTS:,})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Concurrent workers (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION,
+                        help=f'Seconds over which participants arrive (default: {DEFAULT_DURATION:g})')
+    parser.add_argument('--arrival', choices=ARRIVAL_CURVES, default='spike',
+                        help='Arrival curve: constant, ramp or spike before kickoff (default: spike)')
+    parser.add_argument('--partial-rate', type=float, default=DEFAULT_PARTIAL_RATE,
+                        help=f'Share who save a partial set first and amend it (default: {DEFAULT_PARTIAL_RATE})')
+    parser.add_argument('--duplicate-rate', type=float, default=DEFAULT_DUPLICATE_RATE,
+                        help=f'Share who send their final set twice at once (default: {DEFAULT_DUPLICATE_RATE})')
+    parser.add_argument('--random-seed', type=int, default=synthetic_data.DEFAULT_RANDOM_SEED,
+                        help=f'Seed for arrivals and picks (default: {synthetic_data.DEFAULT_RANDOM_SEED})')
+    parser.add_argument('--yes', '-y', action='store_true', help="Don't ask before deleting the participants' points")
+    parser.add_argument('--json', action='store_true', help='Print a single JSON report to stdout')
+    return parser
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    outcomes = report['outcomes']
+    print(f"\n📈 {report['submissions']:,} submissions from {report['participants']:,} participants "
+          f"({report['arrival']} arrivals over {report['duration']:g}s, {report['concurrency']} workers)")
+    print(f"  Throughput:   {report['throughput_per_s']:,.1f} submissions/s over {report['elapsed_s']:.1f}s")
+    for name in ('submission', 'service'):
+        latency = report[f'{name}_ms']
+        label = 'Latency' if name == 'submission' else '  in database'
+        print(f"  {label:13} p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms")
+    print(f"  Outcomes:     {outcomes['ok']:,} ok, {outcomes['rejected']:,} rejected (already complete), "
+          f"{outcomes['violation']:,} unique violations, {outcomes['error']:,} errors")
+    print(f"  Violation rate: {100 * report['violation_rate']:.2f}% "
+          f"({report['duplicate_participants']:,} participants double-submitted)")
+    for error in report['errors']:
+        print(f"  ❌ {error}")
+
+
+def run_loadtest_command(supabase, args) -> int:
+    """Run `loadtest`; returns the process exit code."""
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        try:
+            participants = load_participants(supabase, args.season, args.participants)
+        except Exception as e:
+            print(f"❌ Error loading participants: {e}")
+            return 1
+        if not participants:
+            print(f"❌ No synthetic pools for season {args.season} (run `synthetic --season {args.season}` first)")
+            return 1
+        teams_by_conf = interactive_mode.get_playoff_teams(supabase, args.season)
+        team_names = [teams_by_conf[conf][seed] for conf in ('AFC', 'NFC') for seed in sorted(teams_by_conf[conf])]
+        if len(team_names) != synthetic_data.PLAYOFF_TEAMS:
+            print(f"❌ Season {args.season} needs {synthetic_data.PLAYOFF_TEAMS} playoff teams (found {len(team_names)})")
+            return 1
+
+        pools = len({pool_id for _, pool_id in participants})
+        if not args.yes:
+            answer = input(f"Delete the {args.season} confidence points of {pools:,} synthetic pool(s) and replay "
+                           f"{len(participants):,} participants? (yes/no): ")
+            if answer.strip().lower() not in ('yes', 'y'):
+                print("❌ Cancelled.")
+                return 1
+        reset_points(supabase, participants, args.season)
+
+        rng = random.Random(args.random_seed)
+        arrivals = arrival_times(len(participants), args.duration, args.arrival, rng)
+        plans = plan_submissions(participants, team_names, rng, args.partial_rate, args.duplicate_rate)
+        print(f"🚦 Replaying {len(participants):,} participants in {pools:,} pool(s)...")
+        run = asyncio.run(run_load(supabase, args.season, participants, plans, arrivals, args.concurrency))
+        run['plans'] = plans
+        report = summarize(run, args)
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print_report(report)
+    return 1 if report['outcomes']['error'] else 0
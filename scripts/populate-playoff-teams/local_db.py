@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""Local SQLite stand-in for the subset of the Supabase client used by populate-playoff-teams.
+
+Only the query-builder calls the scripts make are implemented:
+
+    client.table('games').select('*').eq('season', 2025).execute()
+    client.table('games').select('updated_at').order('updated_at', desc=True).limit(1).execute()
+    client.table('games').select('*').gte('updated_at', watermark).order('updated_at').limit(1000).execute()
+    client.table('playoff_confidence_points').select('*').order('pool_id').range(0, 999).execute()
+    client.table('playoff_teams').insert([...]).execute()
+    client.table('games').upsert([...], on_conflict='id').execute()
+    client.table('playoff_teams').update({...}).eq('id', team_id).execute()
+    client.table('playoff_teams').delete().eq('season', 2025).execute()
+    client.table('participants').delete().in_('pool_id', pool_ids).execute()
+
+Select the backend with --db sqlite (or PLAYOFF_DB_BACKEND=sqlite) and point it at a
+file with --db-path (or PLAYOFF_SQLITE_PATH). Use ':memory:' for a throwaway database.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Any
+
+# Default database file (created next to this script)
+DEFAULT_DB_FILENAME = 'local-playoffs.db'
+
+# Column definitions mirror scripts/create-playoff-tables.sql and the games and picks tables in src/lib/supabase.ts
+# (pools and participants: only the columns the scripts use)
+SCHEMA = {
+    'playoff_teams': """
+        CREATE TABLE IF NOT EXISTS playoff_teams (
+            id TEXT PRIMARY KEY,
+            season INTEGER NOT NULL,
+            team_name TEXT NOT NULL,
+            team_abbreviation TEXT,
+            conference TEXT,
+            seed INTEGER,
+            created_at TEXT,
+            updated_at TEXT,
+            UNIQUE(season, team_name)
+        )
+    """,
+    'games': """
+        CREATE TABLE IF NOT EXISTS games (
+            id TEXT PRIMARY KEY,
+            week INTEGER NOT NULL,
+            season INTEGER NOT NULL,
+            season_type INTEGER NOT NULL DEFAULT 2,
+            home_team TEXT NOT NULL,
+            away_team TEXT NOT NULL,
+            kickoff_time TEXT NOT NULL,
+            home_score INTEGER,
+            away_score INTEGER,
+            winner TEXT,
+            status TEXT DEFAULT 'scheduled',
+            home_team_id TEXT,
+            away_team_id TEXT,
+            is_playoff INTEGER DEFAULT 0,
+            is_active INTEGER DEFAULT 1,
+            created_at TEXT,
+            updated_at TEXT
+        )
+    """,
+    'pools': """
+        CREATE TABLE IF NOT EXISTS pools (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            created_by TEXT NOT NULL,
+            created_at TEXT,
+            is_active INTEGER DEFAULT 1,
+            season INTEGER NOT NULL,
+            competition_type TEXT NOT NULL DEFAULT 'NFL_CONFIDENCE'
+        )
+    """,
+    'participants': """
+        CREATE TABLE IF NOT EXISTS participants (
+            id TEXT PRIMARY KEY,
+            pool_id TEXT,
+            name TEXT NOT NULL,
+            email TEXT,
+            created_at TEXT,
+            is_active INTEGER DEFAULT 1
+        )
+    """,
+    'playoff_confidence_points': """
+        CREATE TABLE IF NOT EXISTS playoff_confidence_points (
+            id TEXT PRIMARY KEY,
+            participant_id TEXT NOT NULL,
+            pool_id TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            team_name TEXT NOT NULL,
+            confidence_points INTEGER NOT NULL CHECK (confidence_points > 0),
+            created_at TEXT,
+            updated_at TEXT,
+            UNIQUE(participant_id, pool_id, season, team_name),
+            UNIQUE(participant_id, pool_id, season, confidence_points)
+        )
+    """,
+    'picks': """
+        CREATE TABLE IF NOT EXISTS picks (
+            id TEXT PRIMARY KEY,
+            participant_id TEXT,
+            pool_id TEXT,
+            game_id TEXT,
+            predicted_winner TEXT NOT NULL,
+            confidence_points INTEGER NOT NULL,
+            locked INTEGER DEFAULT 0,
+            submitted_by TEXT,
+            created_at TEXT,
+            UNIQUE(participant_id, pool_id, game_id)
+        )
+    """,
+    'playoff_leaderboards': """
+        CREATE TABLE IF NOT EXISTS playoff_leaderboards (
+            id TEXT PRIMARY KEY,
+            pool_id TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            participant_count INTEGER NOT NULL,
+            top_entries TEXT NOT NULL,
+            score_counts TEXT NOT NULL,
+            created_at TEXT,
+            updated_at TEXT,
+            UNIQUE(pool_id, season)
+        )
+    """,
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_playoff_teams_season ON playoff_teams(season)",
+    "CREATE INDEX IF NOT EXISTS idx_games_season_week ON games(season, week, season_type)",
+    "CREATE INDEX IF NOT EXISTS idx_games_updated_at ON games(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_pools_season ON pools(season)",
+    "CREATE INDEX IF NOT EXISTS idx_participants_pool ON participants(pool_id)",
+    "CREATE INDEX IF NOT EXISTS idx_playoff_confidence_points_pool_season ON playoff_confidence_points(pool_id, season)",
+    "CREATE INDEX IF NOT EXISTS idx_playoff_confidence_points_season_order "
+    "ON playoff_confidence_points(season, pool_id, participant_id, team_name)",
+    "CREATE INDEX IF NOT EXISTS idx_picks_pool_participant ON picks(pool_id, participant_id, game_id)",
+]
+
+# Tables whose primary key is generated when the caller does not provide one (gen_random_uuid())
+GENERATED_ID_TABLES = {'playoff_teams', 'pools', 'participants', 'playoff_confidence_points', 'picks',
+                       'playoff_leaderboards'}
+
+
+class LocalDatabaseError(Exception):
+    """Raised for constraint violations and unknown tables/columns, like a PostgREST APIError."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class LocalResponse:
+    """Mimics the APIResponse returned by supabase-py (only .data and .count are used)."""
+
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+        self.count = len(data)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class LocalQuery:
+    """Query builder for a single table; mirrors supabase-py's chaining style."""
+
+    def __init__(self, client: 'LocalClient', table_name: str):
+        self._client = client
+        self._table = table_name
+        self._operation = None
+        self._columns = '*'
+        self._payload = None
+        self._filters = []
+        self._order = []
+        self._limit = None
+        self._offset = None
+        self._on_conflict = []
+
+    # --- operations ---
+
+    def select(self, columns: str = '*') -> 'LocalQuery':
+        self._operation = 'select'
+        self._columns = columns
+        return self
+
+    def insert(self, rows) -> 'LocalQuery':
+        self._operation = 'insert'
+        self._payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def update(self, values: Dict[str, Any]) -> 'LocalQuery':
+        self._operation = 'update'
+        self._payload = values
+        return self
+
+    def delete(self) -> 'LocalQuery':
+        self._operation = 'delete'
+        return self
+
+    def upsert(self, rows, on_conflict: str = 'id') -> 'LocalQuery':
+        """Insert rows, updating the existing row when `on_conflict` columns collide."""
+        self._operation = 'upsert'
+        self._payload = rows if isinstance(rows, list) else [rows]
+        self._on_conflict = [c.strip() for c in on_conflict.split(',') if c.strip()]
+        return self
+
+    # --- modifiers ---
+
+    def order(self, column: str, desc: bool = False) -> 'LocalQuery':
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, count: int) -> 'LocalQuery':
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int) -> 'LocalQuery':
+        """Rows start..end inclusive, like PostgREST's Range header."""
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    # --- filters ---
+
+    def eq(self, column: str, value: Any) -> 'LocalQuery':
+        self._filters.append((column, '=', value))
+        return self
+
+    def gt(self, column: str, value: Any) -> 'LocalQuery':
+        self._filters.append((column, '>', value))
+        return self
+
+    def gte(self, column: str, value: Any) -> 'LocalQuery':
+        self._filters.append((column, '>=', value))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> 'LocalQuery':
+        self._filters.append((column, 'IN', list(values)))
+        return self
+
+    def execute(self) -> LocalResponse:
+        if self._operation is None:
+            raise LocalDatabaseError("No operation specified (call select/insert/update/delete first)")
+        return self._client._execute(self)
+
+
+class LocalClient:
+    """SQLite-backed replacement for supabase.Client with the playoff_teams/games schema."""
+
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._columns = {}
+        with self._lock:
+            for ddl in SCHEMA.values():
+                self._conn.execute(ddl)
+            for ddl in INDEXES:
+                self._conn.execute(ddl)
+            self._conn.commit()
+            for table in SCHEMA:
+                info = self._conn.execute(f"PRAGMA table_info({table})").fetchall()
+                self._columns[table] = [row['name'] for row in info]
+
+    def table(self, name: str) -> LocalQuery:
+        if name not in self._columns:
+            raise LocalDatabaseError(f'relation "public.{name}" does not exist')
+        return LocalQuery(self, name)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- internals ---
+
+    def _check_columns(self, table: str, columns) -> None:
+        unknown = [c for c in columns if c not in self._columns[table]]
+        if unknown:
+            raise LocalDatabaseError(f"column {table}.{unknown[0]} does not exist")
+
+    def _where(self, query: LocalQuery):
+        if not query._filters:
+            return '', []
+        self._check_columns(query._table, [c for c, _, _ in query._filters])
+        clauses = []
+        params = []
+        for column, op, value in query._filters:
+            if value is None and op == '=':
+                clauses.append(f"{column} IS NULL")
+            elif op == 'IN':
+                clauses.append(f"{column} IN ({', '.join('?' for _ in value)})" if value else '0')
+                params.extend(_to_sql(v) for v in value)
+            else:
+                clauses.append(f"{column} {op} ?")
+                params.append(_to_sql(value))
+        return ' WHERE ' + ' AND '.join(clauses), params
+
+    def _select_rows(self, table: str, columns: str, where: str, params: list) -> List[Dict[str, Any]]:
+        if columns.strip() == '*':
+            column_sql = '*'
+        else:
+            names = [c.strip() for c in columns.split(',') if c.strip()]
+            self._check_columns(table, names)
+            column_sql = ', '.join(names)
+        rows = self._conn.execute(f"SELECT {column_sql} FROM {table}{where}", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def _execute(self, query: LocalQuery) -> LocalResponse:
+        table = query._table
+        with self._lock:
+            try:
+                if query._operation == 'select':
+                    where, params = self._where(query)
+                    if query._order:
+                        self._check_columns(table, [c for c, _ in query._order])
+                        where += ' ORDER BY ' + ', '.join(f"{c} {'DESC' if d else 'ASC'}" for c, d in query._order)
+                    if query._limit is not None:
+                        where += f" LIMIT {int(query._limit)}"
+                        if query._offset:
+                            where += f" OFFSET {int(query._offset)}"
+                    return LocalResponse(self._select_rows(table, query._columns, where, params))
+
+                if query._operation == 'upsert':
+                    written = []
+                    conflict = query._on_conflict
+                    self._check_columns(table, conflict)
+                    for row in query._payload:
+                        row = dict(row)
+                        if table in GENERATED_ID_TABLES and not row.get('id'):
+                            row['id'] = str(uuid.uuid4())
+                        now = _now()
+                        if 'updated_at' in self._columns[table]:
+                            row.setdefault('updated_at', now)
+                        self._check_columns(table, row.keys())
+                        columns = list(row.keys())
+                        # created_at/id are only set on insert; everything else is overwritten on conflict
+                        updates = [c for c in columns if c not in conflict and c not in ('id', 'created_at')]
+                        insert_columns = columns + (['created_at'] if 'created_at' not in row else [])
+                        values = [_to_sql(row[c]) for c in columns] + ([now] if 'created_at' not in row else [])
+                        on_conflict_sql = (f"DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in updates)}"
+                                           if updates else "DO NOTHING")
+                        self._conn.execute(
+                            f"INSERT INTO {table} ({', '.join(insert_columns)}) "
+                            f"VALUES ({', '.join('?' for _ in insert_columns)}) "
+                            f"ON CONFLICT({', '.join(conflict)}) {on_conflict_sql}",
+                            values
+                        )
+                        match = ' AND '.join(f"{c} = ?" for c in conflict)
+                        written.extend(self._select_rows(table, '*', f" WHERE {match}", [_to_sql(row[c]) for c in conflict]))
+                    self._conn.commit()
+                    return LocalResponse(written)
+
+                if query._operation == 'insert':
+                    inserted = []
+                    now = _now()
+                    # Rows with the same columns go to SQLite as one executemany (bulk inserts are common)
+                    batches: Dict[tuple, List[list]] = {}
+                    for row in query._payload:
+                        row = dict(row)
+                        if table in GENERATED_ID_TABLES and not row.get('id'):
+                            row['id'] = str(uuid.uuid4())
+                        row.setdefault('created_at', now)
+                        if 'updated_at' in self._columns[table]:
+                            row.setdefault('updated_at', row['created_at'])
+                        columns = tuple(row.keys())
+                        if columns not in batches:
+                            self._check_columns(table, columns)
+                            batches[columns] = []
+                        batches[columns].append([_to_sql(row[c]) for c in columns])
+                        inserted.append(row)
+                    for columns, values in batches.items():
+                        placeholders = ', '.join('?' for _ in columns)
+                        self._conn.executemany(
+                            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", values)
+                    self._conn.commit()
+                    ids = [r['id'] for r in inserted]
+                    return LocalResponse(self._rows_by_id(table, ids))
+
+                if query._operation == 'update':
+                    values = dict(query._payload)
+                    # Mirrors the update_updated_at_column() trigger in Postgres
+                    if 'updated_at' in self._columns[table]:
+                        values.setdefault('updated_at', _now())
+                    self._check_columns(table, values.keys())
+                    where, params = self._where(query)
+                    ids = [r['id'] for r in self._select_rows(table, 'id', where, params)]
+                    assignments = ', '.join(f"{c} = ?" for c in values)
+                    self._conn.execute(
+                        f"UPDATE {table} SET {assignments}{where}",
+                        [_to_sql(v) for v in values.values()] + params
+                    )
+                    self._conn.commit()
+                    return LocalResponse(self._rows_by_id(table, ids))
+
+                if query._operation == 'delete':
+                    where, params = self._where(query)
+                    deleted = self._select_rows(table, '*', where, params)
+                    self._conn.execute(f"DELETE FROM {table}{where}", params)
+                    self._conn.commit()
+                    return LocalResponse(deleted)
+            except sqlite3.IntegrityError as e:
+                self._conn.rollback()
+                raise LocalDatabaseError(f"duplicate key value violates unique constraint ({e})")
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                raise LocalDatabaseError(str(e))
+
+        raise LocalDatabaseError(f"Unsupported operation: {query._operation}")
+
+    def _rows_by_id(self, table: str, ids: List[Any]) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+        placeholders = ', '.join('?' for _ in ids)
+        return self._select_rows(table, '*', f" WHERE id IN ({placeholders})", list(ids))
+
+
+def _to_sql(value: Any) -> Any:
+    """Convert Python values to something sqlite3 can bind."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def create_local_client(path: Optional[str] = None) -> LocalClient:
+    """Create a LocalClient, defaulting to local-playoffs.db next to this script."""
+    if not path:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_DB_FILENAME)
+    return LocalClient(path)
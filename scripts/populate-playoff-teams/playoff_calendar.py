@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Postseason calendar discovery for the ESPN scoreboard API.
+
+ESPN's scoreboard response carries the season's calendar (leagues[0].calendar): one
+entry per season type, each listing its weeks with start and end dates. The postseason
+weeks are read from it once per season, turned into scoreboard date ranges
+(YYYYMMDD-YYYYMMDD, so each playoff week is one request) and cached on disk keyed by
+season. Later runs, and every date-based fetch in the same run, use the cache.
+
+Usage:
+    import playoff_calendar
+    dates = playoff_calendar.get_week_dates(2025, 1)   # ['20260106-20260112']
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from http_client import get_http_client
+
+CALENDAR_URL = 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?seasontype=3&week=1&dates={season}'
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'playoff-calendar-cache.json')
+
+# ESPN postseason week labels → our playoff week numbers (the Pro Bowl week is skipped)
+WEEK_LABELS = [
+    ('wild card', 1),
+    ('divisional', 2),
+    ('conference', 3),
+    ('super bowl', 4),
+]
+
+# Game days used when discovery fails (the original hard-coded 2025 season dates)
+KNOWN_DATES = {
+    2025: {
+        1: ['20260110', '20260111'],  # Wild Card (Week 1)
+        2: ['20260117', '20260118'],  # Divisional Round (Week 2)
+        3: ['20260125'],              # Conference Championship (Week 3)
+        4: ['20260208'],              # Super Bowl (Week 4)
+    },
+}
+
+# Seconds a failed or partial discovery is reused before ESPN is asked again
+FAILED_DISCOVERY_TTL = 60.0
+
+_lock = threading.Lock()
+_calendars: Dict[int, Dict[int, List[str]]] = {}
+# season → (monotonic time of the failed discovery, dates returned for it)
+_fallbacks: Dict[int, Tuple[float, Dict[int, List[str]]]] = {}
+
+
+def _espn_date(value: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value[:10], '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_postseason_calendar(data: Dict) -> Dict[int, List[str]]:
+    """Playoff week → scoreboard date ranges from a scoreboard API response ({} if absent)."""
+    weeks = {}
+    for league in data.get('leagues', []):
+        for season_type in league.get('calendar', []):
+            # Some sports return plain date strings here; the NFL returns season types
+            if not isinstance(season_type, dict) or str(season_type.get('value')) != '3':
+                continue
+            for entry in season_type.get('entries', []):
+                label = entry.get('label', '').lower()
+                week = next((number for text, number in WEEK_LABELS if text in label), None)
+                start = _espn_date(entry.get('startDate'))
+                end = _espn_date(entry.get('endDate'))
+                if week is None or start is None or end is None:
+                    continue
+                # endDate is the exclusive boundary at the start of the next week
+                if end > start:
+                    end -= timedelta(days=1)
+                weeks[week] = [f"{start:%Y%m%d}-{end:%Y%m%d}"]
+    return weeks
+
+
+def _load_cache(cache_path: str) -> Dict[str, Dict[str, List[str]]]:
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path: str, season: int, weeks: Dict[int, List[str]]) -> None:
+    cache = _load_cache(cache_path)
+    cache[str(season)] = {str(week): dates for week, dates in weeks.items()}
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Warning: Could not write playoff calendar cache {cache_path}: {e}")
+
+
+def discover_calendar(season: int) -> Dict[int, List[str]]:
+    """Ask ESPN for the season's postseason calendar ({} if it cannot be fetched or parsed)."""
+    url = CALENDAR_URL.format(season=season)
+    try:
+        response = get_http_client().get(url, timeout=10)
+        if response.status_code != 200:
+            print(f"Warning: ESPN calendar request for {season} returned status {response.status_code}")
+            return {}
+        return parse_postseason_calendar(response.json())
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Warning: Could not fetch the ESPN playoff calendar for {season}: {e}")
+        return {}
+
+
+def get_calendar(season: int, cache_path: str = DEFAULT_CACHE_PATH, refresh: bool = False) -> Dict[int, List[str]]:
+    """Playoff week → scoreboard dates for a season: memory, then disk cache, then ESPN.
+
+    Only complete discoveries (all four weeks) are cached, in memory and on disk. After an
+    incomplete one, KNOWN_DATES (or whatever was discovered) is returned for
+    FAILED_DISCOVERY_TTL seconds, then the next call asks ESPN again; refresh=True asks
+    right away. The lock covers the cache lookups and stores, not the ESPN request.
+    """
+    with _lock:
+        if not refresh and season in _calendars:
+            return _calendars[season]
+        if not refresh and season in _fallbacks:
+            failed_at, weeks = _fallbacks[season]
+            if time.monotonic() - failed_at < FAILED_DISCOVERY_TTL:
+                return weeks
+
+        if not refresh:
+            cached = _load_cache(cache_path).get(str(season))
+            if cached:
+                weeks = {int(week): dates for week, dates in cached.items()}
+                _calendars[season] = weeks
+                return weeks
+
+    # Concurrent misses for a season share one request (http_client coalesces identical GETs)
+    weeks = discover_calendar(season)
+    complete = len(weeks) == len(WEEK_LABELS)
+    if not complete and KNOWN_DATES.get(season):
+        print(f"Warning: Using built-in playoff dates for {season}")
+        weeks = KNOWN_DATES[season]
+
+    with _lock:
+        if complete:
+            _save_cache(cache_path, season, weeks)
+            _calendars[season] = weeks
+            _fallbacks.pop(season, None)
+        else:
+            _fallbacks[season] = (time.monotonic(), weeks)
+    return weeks
+
+
+def get_week_dates(season: int, week: int) -> List[str]:
+    """Scoreboard `dates` values to query for one playoff week (empty if unknown)."""
+    return get_calendar(season).get(week, [])
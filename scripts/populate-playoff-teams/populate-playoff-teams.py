@@ -5,7 +5,7 @@ Script to populate playoff_teams table with NFL playoff team data.
 This script scrapes playoff teams from ESPN's or NFL.com's playoff standings page and inserts them into the Supabase database.
 
 Usage:
-    python scripts/populate-playoff-teams/populate-playoff-teams.py --season <season> [--source espn|nfl] [options]
+    python scripts/populate-playoff-teams/populate-playoff-teams.py --season <season> [--source espn-api,espn,nfl] [options]
 
 Requirements:
     pip install supabase requests python-dotenv beautifulsoup4
@@ -14,25 +14,46 @@ Requirements:
 import os
 import sys
 import argparse
+import functools
 import requests
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any
 from dotenv import load_dotenv
 
 try:
     from supabase import create_client, Client
 except ImportError:
-    print("Error: supabase package not installed. Run: pip install supabase")
-    sys.exit(1)
+    # Only required for the Supabase backend; --db sqlite runs without it
+    create_client = None
+    Client = Any
+
+import local_db
+import profiling
+import sources
+import change_detection
+import backfill
+import history_store
+import ratings
+import seeding
+import scenarios
+import simulation
+import leaderboard
+import snapshots
+import synthetic_data
+import loadtest
+import validation
+import write_plan
+import ingest
 
 # Load environment variables (look for .env.local in project root, two levels up from this script)
+# Diagnostics go to stderr so headless commands can emit clean JSON on stdout
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(script_dir))
 env_path = os.path.join(project_root, '.env.local')
-print(f"Loading environment variables from: {env_path}")
-print(f"Project root: {project_root}")
-print(f"Script directory: {script_dir}")
-print(f"Environment path: {env_path}")
+print(f"Loading environment variables from: {env_path}", file=sys.stderr)
+print(f"Project root: {project_root}", file=sys.stderr)
+print(f"Script directory: {script_dir}", file=sys.stderr)
+print(f"Environment path: {env_path}", file=sys.stderr)
 if os.path.exists(env_path):
     load_dotenv(env_path)
     # Print loaded environment variables (mask sensitive values)
@@ -47,12 +68,16 @@ if os.path.exists(env_path):
     #     masked_key = supabase_key[:10] + "..." + supabase_key[-10:] if len(supabase_key) > 20 else "***"
     #     print(f"    Value: {masked_key}")
 else:
-    # Throw an error
-    raise ValueError(f"Environment file not found at: {env_path}")
+    # Not fatal here: the local SQLite backend needs no credentials, and
+    # get_supabase_client() raises if the Supabase variables are missing
+    print(f"Warning: Environment file not found at: {env_path}", file=sys.stderr)
 
 # ESPN playoff standings page
 ESPN_PLAYOFF_STANDINGS_URL = "https://www.espn.com/nfl/standings/_/view/playoff"
 
+# ESPN standings JSON API (conference level; a few KB instead of the full page)
+ESPN_STANDINGS_API_URL = "https://site.api.espn.com/apis/v2/sports/football/nfl/standings?season={season}&level=1"
+
 
 def get_supabase_client() -> Client:
     """Create and return a Supabase client."""
@@ -65,50 +90,70 @@ def get_supabase_client() -> Client:
     if not supabase_key:
         raise ValueError("NEXT_PUBLIC_SUPABASE_SERVICE_KEY or SUPABASE_SERVICE_ROLE_KEY environment variable is required")
     
+    if create_client is None:
+        raise ImportError("supabase package not installed. Run: pip install supabase (or use --db sqlite)")
+    
     return create_client(supabase_url, supabase_key)
 
 
-# List of all NFL teams for interactive selection (as JSON objects)
+def get_db_client(backend: Optional[str] = None, db_path: Optional[str] = None) -> Client:
+    """Return the database client for the selected backend.
+    
+    backend is 'supabase' (default) or 'sqlite'; falls back to the PLAYOFF_DB_BACKEND env var.
+    The sqlite backend is a local stand-in (see local_db.py) that needs no network or credentials.
+    """
+    backend = (backend or os.getenv('PLAYOFF_DB_BACKEND') or 'supabase').lower()
+    
+    if backend == 'supabase':
+        return get_supabase_client()
+    
+    if backend == 'sqlite':
+        return local_db.create_local_client(db_path or os.getenv('PLAYOFF_SQLITE_PATH'))
+    
+    raise ValueError(f"Unknown database backend: {backend} (use 'supabase' or 'sqlite')")
+
+
+# List of all NFL teams for interactive selection (as JSON objects), grouped by division
 NFL_TEAMS = [
-    {'name': 'Arizona Cardinals', 'abbreviation': 'ARI', 'conference': 'NFC'},
-    {'name': 'Los Angeles Rams', 'abbreviation': 'LAR', 'conference': 'NFC'},
-    {'name': 'San Francisco 49ers', 'abbreviation': 'SF', 'conference': 'NFC'},
-    {'name': 'Seattle Seahawks', 'abbreviation': 'SEA', 'conference': 'NFC'},
-
-    {'name': 'Atlanta Falcons', 'abbreviation': 'ATL', 'conference': 'NFC'},
-    {'name': 'Carolina Panthers', 'abbreviation': 'CAR', 'conference': 'NFC'},
-    {'name': 'New Orleans Saints', 'abbreviation': 'NO', 'conference': 'NFC'},
-    {'name': 'Tampa Bay Buccaneers', 'abbreviation': 'TB', 'conference': 'NFC'},
-
-    {'name': 'Chicago Bears', 'abbreviation': 'CHI', 'conference': 'NFC'},
-    {'name': 'Detroit Lions', 'abbreviation': 'DET', 'conference': 'NFC'},
-    {'name': 'Green Bay Packers', 'abbreviation': 'GB', 'conference': 'NFC'},
-    {'name': 'Minnesota Vikings', 'abbreviation': 'MIN', 'conference': 'NFC'},
-
-    {'name': 'Dallas Cowboys', 'abbreviation': 'DAL', 'conference': 'NFC'},
-    {'name': 'New York Giants', 'abbreviation': 'NYG', 'conference': 'NFC'},
-    {'name': 'Philadelphia Eagles', 'abbreviation': 'PHI', 'conference': 'NFC'},
-    {'name': 'Washington Commanders', 'abbreviation': 'WSH', 'conference': 'NFC'},
-    
-    {'name': 'Baltimore Ravens', 'abbreviation': 'BAL', 'conference': 'AFC'},
-    {'name': 'Cincinnati Bengals', 'abbreviation': 'CIN', 'conference': 'AFC'},
-    {'name': 'Cleveland Browns', 'abbreviation': 'CLE', 'conference': 'AFC'},
-    {'name': 'Pittsburgh Steelers', 'abbreviation': 'PIT', 'conference': 'AFC'},
-
-    {'name': 'Buffalo Bills', 'abbreviation': 'BUF', 'conference': 'AFC'},
-    {'name': 'Miami Dolphins', 'abbreviation': 'MIA', 'conference': 'AFC'},   
-    {'name': 'New England Patriots', 'abbreviation': 'NE', 'conference': 'AFC'},
-    {'name': 'New York Jets', 'abbreviation': 'NYJ', 'conference': 'AFC'},
-
-    {'name': 'Denver Broncos', 'abbreviation': 'DEN', 'conference': 'AFC'},
-    {'name': 'Kansas City Chiefs', 'abbreviation': 'KC', 'conference': 'AFC'},
-    {'name': 'Las Vegas Raiders', 'abbreviation': 'LV', 'conference': 'AFC'},
-    {'name': 'Los Angeles Chargers', 'abbreviation': 'LAC', 'conference': 'AFC'},
-
-    {'name': 'Houston Texans', 'abbreviation': 'HOU', 'conference': 'AFC'},
-    {'name': 'Indianapolis Colts', 'abbreviation': 'IND', 'conference': 'AFC'},
-    {'name': 'Jacksonville Jaguars', 'abbreviation': 'JAX', 'conference': 'AFC'},
-    {'name': 'Tennessee Titans', 'abbreviation': 'TEN', 'conference': 'AFC'},
+    {'name': 'Arizona Cardinals', 'abbreviation': 'ARI', 'conference': 'NFC', 'division': 'NFC West'},
+    {'name': 'Los Angeles Rams', 'abbreviation': 'LAR', 'conference': 'NFC', 'division': 'NFC West'},
+    {'name': 'San Francisco 49ers', 'abbreviation': 'SF', 'conference': 'NFC', 'division': 'NFC West'},
+    {'name': 'Seattle Seahawks', 'abbreviation': 'SEA', 'conference': 'NFC', 'division': 'NFC West'},
+
+    {'name': 'Atlanta Falcons', 'abbreviation': 'ATL', 'conference': 'NFC', 'division': 'NFC South'},
+    {'name': 'Carolina Panthers', 'abbreviation': 'CAR', 'conference': 'NFC', 'division': 'NFC South'},
+    {'name': 'New Orleans Saints', 'abbreviation': 'NO', 'conference': 'NFC', 'division': 'NFC South'},
+    {'name': 'Tampa Bay Buccaneers', 'abbreviation': 'TB', 'conference': 'NFC', 'division': 'NFC South'},
+
+    {'name': 'Chicago Bears', 'abbreviation': 'CHI', 'conference': 'NFC', 'division': 'NFC North'},
+    {'name': 'Detroit Lions', 'abbreviation': 'DET', 'conference': 'NFC', 'division': 'NFC North'},
+    {'name': 'Green Bay Packers', 'abbreviation': 'GB', 'conference': 'NFC', 'division': 'NFC North'},
+    {'name': 'Minnesota Vikings', 'abbreviation': 'MIN', 'conference': 'NFC', 'division': 'NFC North'},
+
+    {'name': 'Dallas Cowboys', 'abbreviation': 'DAL', 'conference': 'NFC', 'division': 'NFC East'},
+    {'name': 'New York Giants', 'abbreviation': 'NYG', 'conference': 'NFC', 'division': 'NFC East'},
+    {'name': 'Philadelphia Eagles', 'abbreviation': 'PHI', 'conference': 'NFC', 'division': 'NFC East'},
+    {'name': 'Washington Commanders', 'abbreviation': 'WSH', 'conference': 'NFC', 'division': 'NFC East'},
+    
+    {'name': 'Baltimore Ravens', 'abbreviation': 'BAL', 'conference': 'AFC', 'division': 'AFC North'},
+    {'name': 'Cincinnati Bengals', 'abbreviation': 'CIN', 'conference': 'AFC', 'division': 'AFC North'},
+    {'name': 'Cleveland Browns', 'abbreviation': 'CLE', 'conference': 'AFC', 'division': 'AFC North'},
+    {'name': 'Pittsburgh Steelers', 'abbreviation': 'PIT', 'conference': 'AFC', 'division': 'AFC North'},
+
+    {'name': 'Buffalo Bills', 'abbreviation': 'BUF', 'conference': 'AFC', 'division': 'AFC East'},
+    {'name': 'Miami Dolphins', 'abbreviation': 'MIA', 'conference': 'AFC', 'division': 'AFC East'},
+    {'name': 'New England Patriots', 'abbreviation': 'NE', 'conference': 'AFC', 'division': 'AFC East'},
+    {'name': 'New York Jets', 'abbreviation': 'NYJ', 'conference': 'AFC', 'division': 'AFC East'},
+
+    {'name': 'Denver Broncos', 'abbreviation': 'DEN', 'conference': 'AFC', 'division': 'AFC West'},
+    {'name': 'Kansas City Chiefs', 'abbreviation': 'KC', 'conference': 'AFC', 'division': 'AFC West'},
+    {'name': 'Las Vegas Raiders', 'abbreviation': 'LV', 'conference': 'AFC', 'division': 'AFC West'},
+    {'name': 'Los Angeles Chargers', 'abbreviation': 'LAC', 'conference': 'AFC', 'division': 'AFC West'},
+
+    {'name': 'Houston Texans', 'abbreviation': 'HOU', 'conference': 'AFC', 'division': 'AFC South'},
+    {'name': 'Indianapolis Colts', 'abbreviation': 'IND', 'conference': 'AFC', 'division': 'AFC South'},
+    {'name': 'Jacksonville Jaguars', 'abbreviation': 'JAX', 'conference': 'AFC', 'division': 'AFC South'},
+    {'name': 'Tennessee Titans', 'abbreviation': 'TEN', 'conference': 'AFC', 'division': 'AFC South'},
 ]
 
 def get_team_abbreviation(full_name: str) -> str:
@@ -121,16 +166,184 @@ def get_team_abbreviation(full_name: str) -> str:
     return full_name.split()[-1][:3].upper()
 
 
-def fetch_playoff_teams_from_nfl(season: int) -> List[Dict[str, any]]:
+def parse_playoff_teams_from_nfl_html(content) -> List[Dict[str, any]]:
+    """
+    Extract playoff teams from an NFL.com playoff picture page (HTML string or bytes).
+    
+    Returns teams de-duplicated and sorted by conference and seed; empty list if nothing matched.
+    """
+    from bs4 import BeautifulSoup
+    import json
+    import re
+    
+    with profiling.span('nfl.html_parse'):
+        soup = BeautifulSoup(content, 'html.parser')
+    playoff_teams = []
+    
+    # NFL.com structure: Look for script tags with JSON data
+    scripts = soup.find_all('script')
+    for script in scripts:
+        if script.string:
+            script_text = script.string
+            
+            # Try to find JSON data with playoff/standings information
+            # NFL.com may use different patterns, try multiple approaches
+            json_matches = []
+            
+            # Pattern 1: Look for window.__NEXT_DATA__ or similar
+            next_data_pattern = r'__NEXT_DATA__\s*=\s*({.+?});'
+            matches = re.findall(next_data_pattern, script_text, re.DOTALL)
+            if matches:
+                json_matches = matches
+            
+            # Pattern 2: Look for playoff-related JSON structures
+            if not json_matches:
+                playoff_patterns = [
+                    r'playoffPicture["\']?\s*[:=]\s*({.+?})',
+                    r'standings["\']?\s*[:=]\s*({.+?})',
+                    r'playoffTeams["\']?\s*[:=]\s*\[({.+?})\]',
+                ]
+                for pattern in playoff_patterns:
+                    matches = re.findall(pattern, script_text, re.DOTALL | re.IGNORECASE)
+                    if matches:
+                        json_matches = matches
+                        break
+            
+            if json_matches:
+                for match in json_matches:
+                    try:
+                        data = json.loads(match)
+                        # Recursively search for playoff team data
+                        def find_playoff_teams(obj, path=""):
+                            """Recursively find playoff teams structure."""
+                            if isinstance(obj, dict):
+                                # Look for common patterns in NFL.com data
+                                if 'teams' in obj and isinstance(obj['teams'], list):
+                                    return obj.get('teams', [])
+                                if 'playoffTeams' in obj:
+                                    return obj['playoffTeams']
+                                if 'standings' in obj:
+                                    standings = obj['standings']
+                                    if isinstance(standings, list):
+                                        return standings
+                                    elif isinstance(standings, dict) and 'teams' in standings:
+                                        return standings['teams']
+                                # Search deeper
+                                for key, value in obj.items():
+                                    result = find_playoff_teams(value, f"{path}.{key}" if path else key)
+                                    if result:
+                                        return result
+                            elif isinstance(obj, list):
+                                # If it's a list of teams, return it
+                                if len(obj) > 0 and isinstance(obj[0], dict):
+                                    if 'team' in obj[0] or 'name' in obj[0] or 'abbreviation' in obj[0]:
+                                        return obj
+                                # Otherwise search items
+                                for idx, item in enumerate(obj):
+                                    result = find_playoff_teams(item, f"{path}[{idx}]")
+                                    if result:
+                                        return result
+                            return None
+                        
+                        with profiling.span('nfl.json_search'):
+                            teams_data = find_playoff_teams(data)
+                        if teams_data and isinstance(teams_data, list):
+                            for team_data in teams_data:
+                                # Handle different data structures
+                                team = team_data.get('team', {}) if isinstance(team_data, dict) else team_data
+                                
+                                if isinstance(team, dict):
+                                    team_name = team.get('displayName') or team.get('name') or team.get('fullName') or team.get('teamName', '')
+                                    abbreviation = team.get('abbreviation') or team.get('abbr', '')
+                                    conference = team.get('conference') or team_data.get('conference', '')
+                                    seed = team.get('seed') or team_data.get('seed') or team.get('playoffSeed')
+                                    
+                                    if team_name and conference:
+                                        conference = conference.upper()
+                                        if conference in ['AFC', 'NFC'] and seed and 1 <= seed <= 7:
+                                            playoff_teams.append({
+                                                'team_name': team_name,
+                                                'team_abbreviation': abbreviation or get_team_abbreviation(team_name),
+                                                'conference': conference,
+                                                'seed': int(seed)
+                                            })
+                        
+                        if playoff_teams:
+                            break
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                        continue
+                if playoff_teams:
+                    break
+    
+    # Method 2: If JSON extraction failed, try HTML parsing
+    if not playoff_teams:
+        print("JSON extraction failed, trying HTML table parsing...")
+        # Look for tables or divs with playoff information
+        # NFL.com typically has conference sections
+        conference_sections = soup.find_all(['section', 'div'], class_=re.compile(r'conference|afc|nfc', re.I))
+        
+        for section in conference_sections:
+            section_text = section.get_text().upper()
+            conference = None
+            
+            if 'AFC' in section_text and ('NFC' not in section_text or section_text.find('AFC') < section_text.find('NFC')):
+                conference = 'AFC'
+            elif 'NFC' in section_text:
+                conference = 'NFC'
+            
+            if not conference:
+                continue
+            
+            # Find team links/names in this section
+            team_links = section.find_all('a', href=re.compile(r'/teams/'))
+            for idx, link in enumerate(team_links[:7]):  # Max 7 teams per conference
+                team_name = link.get_text(strip=True)
+                if team_name:
+                    # Try to find seed nearby
+                    parent = link.find_parent(['tr', 'div', 'li'])
+                    seed = None
+                    if parent:
+                        seed_text = parent.get_text()
+                        seed_match = re.search(r'\b([1-7])\b', seed_text)
+                        if seed_match:
+                            seed = int(seed_match.group(1))
+                    
+                    if not seed:
+                        seed = idx + 1  # Use position as seed
+                    
+                    if team_name and 1 <= seed <= 7:
+                        playoff_teams.append({
+                            'team_name': team_name,
+                            'team_abbreviation': get_team_abbreviation(team_name),
+                            'conference': conference,
+                            'seed': seed
+                        })
+    
+    # Remove duplicates and sort
+    seen = set()
+    unique_teams = []
+    for team in playoff_teams:
+        key = (team['team_name'], team['conference'], team['seed'])
+        if key not in seen:
+            seen.add(key)
+            unique_teams.append(team)
+    
+    # Sort by conference and seed
+    unique_teams.sort(key=lambda x: (x['conference'], x['seed']))
+    
+    return unique_teams
+
+
+@profiling.traced()
+def fetch_playoff_teams_from_nfl(season: int, state: Optional[Dict[str, any]] = None) -> List[Dict[str, any]]:
     """
     Scrape playoff teams from NFL.com playoff picture page.
     
     Fetches data from: https://www.nfl.com/standings/playoff-picture
+    With a change-detection state (see change_detection.py), raises SourceUnchanged if nothing changed.
     """
     try:
-        from bs4 import BeautifulSoup
-        import json
-        import re
+        from bs4 import BeautifulSoup  # Fail fast before fetching if bs4 is missing
         
         url = "https://www.nfl.com/standings/playoff-picture"
         
@@ -145,7 +358,10 @@ def fetch_playoff_teams_from_nfl(season: int) -> List[Dict[str, any]]:
             'Referer': 'https://www.nfl.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        with profiling.span('nfl.http_fetch'):
+            # Shared client: rate limited per host, retries transient failures with backoff;
+            # with a saved state, raises SourceUnchanged on a 304 or an identical page
+            response = change_detection.conditional_get(url, headers, state)
         
         if response.status_code != 200:
             print(f"Warning: NFL.com returned status {response.status_code}")
@@ -158,158 +374,7 @@ def fetch_playoff_teams_from_nfl(season: int) -> List[Dict[str, any]]:
             f.write(response.text)
         print(f"Saved response to: {html_file}")
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        playoff_teams = []
-        
-        # NFL.com structure: Look for script tags with JSON data
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string:
-                script_text = script.string
-                
-                # Try to find JSON data with playoff/standings information
-                # NFL.com may use different patterns, try multiple approaches
-                json_matches = []
-                
-                # Pattern 1: Look for window.__NEXT_DATA__ or similar
-                next_data_pattern = r'__NEXT_DATA__\s*=\s*({.+?});'
-                matches = re.findall(next_data_pattern, script_text, re.DOTALL)
-                if matches:
-                    json_matches = matches
-                
-                # Pattern 2: Look for playoff-related JSON structures
-                if not json_matches:
-                    playoff_patterns = [
-                        r'playoffPicture["\']?\s*[:=]\s*({.+?})',
-                        r'standings["\']?\s*[:=]\s*({.+?})',
-                        r'playoffTeams["\']?\s*[:=]\s*\[({.+?})\]',
-                    ]
-                    for pattern in playoff_patterns:
-                        matches = re.findall(pattern, script_text, re.DOTALL | re.IGNORECASE)
-                        if matches:
-                            json_matches = matches
-                            break
-                
-                if json_matches:
-                    for match in json_matches:
-                        try:
-                            data = json.loads(match)
-                            # Recursively search for playoff team data
-                            def find_playoff_teams(obj, path=""):
-                                """Recursively find playoff teams structure."""
-                                if isinstance(obj, dict):
-                                    # Look for common patterns in NFL.com data
-                                    if 'teams' in obj and isinstance(obj['teams'], list):
-                                        return obj.get('teams', [])
-                                    if 'playoffTeams' in obj:
-                                        return obj['playoffTeams']
-                                    if 'standings' in obj:
-                                        standings = obj['standings']
-                                        if isinstance(standings, list):
-                                            return standings
-                                        elif isinstance(standings, dict) and 'teams' in standings:
-                                            return standings['teams']
-                                    # Search deeper
-                                    for key, value in obj.items():
-                                        result = find_playoff_teams(value, f"{path}.{key}" if path else key)
-                                        if result:
-                                            return result
-                                elif isinstance(obj, list):
-                                    # If it's a list of teams, return it
-                                    if len(obj) > 0 and isinstance(obj[0], dict):
-                                        if 'team' in obj[0] or 'name' in obj[0] or 'abbreviation' in obj[0]:
-                                            return obj
-                                    # Otherwise search items
-                                    for idx, item in enumerate(obj):
-                                        result = find_playoff_teams(item, f"{path}[{idx}]")
-                                        if result:
-                                            return result
-                                return None
-                            
-                            teams_data = find_playoff_teams(data)
-                            if teams_data and isinstance(teams_data, list):
-                                for team_data in teams_data:
-                                    # Handle different data structures
-                                    team = team_data.get('team', {}) if isinstance(team_data, dict) else team_data
-                                    
-                                    if isinstance(team, dict):
-                                        team_name = team.get('displayName') or team.get('name') or team.get('fullName') or team.get('teamName', '')
-                                        abbreviation = team.get('abbreviation') or team.get('abbr', '')
-                                        conference = team.get('conference') or team_data.get('conference', '')
-                                        seed = team.get('seed') or team_data.get('seed') or team.get('playoffSeed')
-                                        
-                                        if team_name and conference:
-                                            conference = conference.upper()
-                                            if conference in ['AFC', 'NFC'] and seed and 1 <= seed <= 7:
-                                                playoff_teams.append({
-                                                    'team_name': team_name,
-                                                    'team_abbreviation': abbreviation or get_team_abbreviation(team_name),
-                                                    'conference': conference,
-                                                    'seed': int(seed)
-                                                })
-                            
-                            if playoff_teams:
-                                break
-                        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-                            continue
-                    if playoff_teams:
-                        break
-        
-        # Method 2: If JSON extraction failed, try HTML parsing
-        if not playoff_teams:
-            print("JSON extraction failed, trying HTML table parsing...")
-            # Look for tables or divs with playoff information
-            # NFL.com typically has conference sections
-            conference_sections = soup.find_all(['section', 'div'], class_=re.compile(r'conference|afc|nfc', re.I))
-            
-            for section in conference_sections:
-                section_text = section.get_text().upper()
-                conference = None
-                
-                if 'AFC' in section_text and ('NFC' not in section_text or section_text.find('AFC') < section_text.find('NFC')):
-                    conference = 'AFC'
-                elif 'NFC' in section_text:
-                    conference = 'NFC'
-                
-                if not conference:
-                    continue
-                
-                # Find team links/names in this section
-                team_links = section.find_all('a', href=re.compile(r'/teams/'))
-                for idx, link in enumerate(team_links[:7]):  # Max 7 teams per conference
-                    team_name = link.get_text(strip=True)
-                    if team_name:
-                        # Try to find seed nearby
-                        parent = link.find_parent(['tr', 'div', 'li'])
-                        seed = None
-                        if parent:
-                            seed_text = parent.get_text()
-                            seed_match = re.search(r'\b([1-7])\b', seed_text)
-                            if seed_match:
-                                seed = int(seed_match.group(1))
-                        
-                        if not seed:
-                            seed = idx + 1  # Use position as seed
-                        
-                        if team_name and 1 <= seed <= 7:
-                            playoff_teams.append({
-                                'team_name': team_name,
-                                'team_abbreviation': get_team_abbreviation(team_name),
-                                'conference': conference,
-                                'seed': seed
-                            })
-        
-        # Remove duplicates and sort
-        seen = set()
-        unique_teams = []
-        for team in playoff_teams:
-            key = (team['team_name'], team['conference'], team['seed'])
-            if key not in seen:
-                seen.add(key)
-                unique_teams.append(team)
-        
-        # Sort by conference and seed
-        unique_teams.sort(key=lambda x: (x['conference'], x['seed']))
+        unique_teams = parse_playoff_teams_from_nfl_html(response.content)
         
         if unique_teams:
             print(f"✅ Successfully scraped {len(unique_teams)} playoff teams from NFL.com")
@@ -320,6 +385,8 @@ def fetch_playoff_teams_from_nfl(season: int) -> List[Dict[str, any]]:
             print("\nTry using --teams-file option with a JSON/CSV file instead.")
             return []
             
+    except change_detection.SourceUnchanged:
+        raise
     except ImportError:
         print("Error: beautifulsoup4 package required for web scraping")
         print("Install it with: pip install beautifulsoup4")
@@ -336,16 +403,246 @@ def fetch_playoff_teams_from_nfl(season: int) -> List[Dict[str, any]]:
         return []
 
 
-def fetch_playoff_teams_from_espn(season: int) -> List[Dict[str, any]]:
+def parse_playoff_teams_from_espn_html(content) -> List[Dict[str, any]]:
+    """
+    Extract playoff teams from an ESPN playoff standings page (HTML string or bytes).
+    
+    Returns teams de-duplicated and sorted by conference and seed; empty list if nothing matched.
+    """
+    from bs4 import BeautifulSoup
+    import json
+    import re
+    
+    with profiling.span('espn.html_parse'):
+        soup = BeautifulSoup(content, 'html.parser')
+    playoff_teams = []
+    
+    # Method 1: Try to extract JSON data from script tags (ESPN embeds data this way)
+    scripts = soup.find_all('script')
+    for script in scripts:
+        if script.string:
+            # Look for window.__espnfitt__ or similar data structures
+            script_text = script.string
+            
+            # Try to find JSON data structures - ESPN uses window['__espnfitt__'] format
+            # Pattern 1: window['__espnfitt__'] = {...} or window["__espnfitt__"] = {...}
+            json_matches = re.findall(r"window\['__espnfitt__'\]\s*=\s*({.+?});", script_text, re.DOTALL)
+            if not json_matches:
+                json_matches = re.findall(r'window\["__espnfitt__"\]\s*=\s*({.+?});', script_text, re.DOTALL)
+            if not json_matches:
+                # Pattern 2: window.__espnfitt__ = {...};
+                json_matches = re.findall(r'window\.__espnfitt__\s*=\s*({.+?});', script_text, re.DOTALL)
+            if not json_matches:
+                # Pattern 3: __espnfitt__: {...} (in object literal)
+                json_matches = re.findall(r'__espnfitt__\s*:\s*({.+?}),?\s*[;\n}]', script_text, re.DOTALL)
+            
+            if json_matches:
+                for match in json_matches:
+                    try:
+                        data = json.loads(match)
+                        
+                        # Recursively search for standings data
+                        def find_standings_data(obj, path=""):
+                            """Recursively find standings/groups/entries structure."""
+                            if isinstance(obj, dict):
+                                # Check if this looks like standings data
+                                if 'groups' in obj and isinstance(obj['groups'], list):
+                                    return obj
+                                if 'standings' in obj:
+                                    standings = obj['standings']
+                                    if isinstance(standings, dict) and 'groups' in standings:
+                                        return standings
+                                # Search deeper
+                                for key, value in obj.items():
+                                    result = find_standings_data(value, f"{path}.{key}" if path else key)
+                                    if result:
+                                        return result
+                            elif isinstance(obj, list):
+                                for idx, item in enumerate(obj):
+                                    result = find_standings_data(item, f"{path}[{idx}]")
+                                    if result:
+                                        return result
+                            return None
+                        
+                        with profiling.span('espn.json_search'):
+                            standings = find_standings_data(data)
+                        
+                        if standings and 'groups' in standings:
+                            # ESPN structure: standings.groups[] contains conferences
+                            for group in standings['groups']:
+                                conference = group.get('name', '').upper()
+                                if conference not in ['AFC', 'NFC']:
+                                    # Try alternative conference field names
+                                    conference = group.get('abbreviation', '').upper()
+                                    if conference not in ['AFC', 'NFC']:
+                                        conference = group.get('conference', '').upper()
+                                        if conference not in ['AFC', 'NFC']:
+                                            continue
+                                
+                                entries = group.get('standings', {})
+                                if isinstance(entries, dict):
+                                    entries = entries.get('entries', [])
+                                if not isinstance(entries, list):
+                                    entries = []
+                                
+                                for entry in entries:
+                                    team = entry.get('team', {})
+                                    team_name = team.get('displayName', '') or team.get('name', '') or team.get('fullName', '')
+                                    
+                                    # Get seed from stats or direct field
+                                    seed = entry.get('playoffSeed') or entry.get('seed')
+                                    if not seed:
+                                        stats = entry.get('stats', [])
+                                        for stat in stats:
+                                            if isinstance(stat, dict):
+                                                if stat.get('name') == 'playoffSeed' or stat.get('type') == 'playoffSeed':
+                                                    seed_val = stat.get('value') or stat.get('displayValue')
+                                                    if seed_val:
+                                                        try:
+                                                            seed = int(seed_val)
+                                                        except (ValueError, TypeError):
+                                                            continue
+                                                        break
+                                            elif isinstance(stat, str) and 'seed' in stat.lower():
+                                                # Try to extract number from string
+                                                seed_match = re.search(r'\d+', stat)
+                                                if seed_match:
+                                                    seed = int(seed_match.group())
+                                                    break
+                                    
+                                    if team_name and seed and 1 <= seed <= 7:
+                                        abbreviation = team.get('abbreviation') or team.get('shortDisplayName', '')
+                                        playoff_teams.append({
+                                            'team_name': team_name,
+                                            'team_abbreviation': abbreviation or get_team_abbreviation(team_name),
+                                            'conference': conference,
+                                            'seed': int(seed)
+                                        })
+                        
+                        if playoff_teams:
+                            break
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                        continue
+                if playoff_teams:
+                    break
+            
+            # Alternative: Look for other JSON patterns
+            # Try to find standalone JSON objects
+            json_patterns = re.findall(r'\{[^{}]*"standings"[^{}]*\}', script_text)
+            for pattern in json_patterns:
+                try:
+                    data = json.loads(pattern)
+                    # Try to extract teams from various possible structures
+                    # This is a fallback if the main structure doesn't match
+                except:
+                    continue
+    
+    # Method 2: If JSON extraction failed, try HTML table parsing
+    if not playoff_teams:
+        print("JSON extraction failed, trying HTML table parsing...")
+        # Find all table elements
+        tables = soup.find_all('table')
+        
+        for table in tables:
+            # Find parent container to identify conference
+            parent = table.find_parent(['div', 'section', 'article'])
+            conference = None
+            
+            # Look for conference in parent text or nearby headings
+            if parent:
+                parent_text = parent.get_text().upper()
+                # Check for AFC/NFC labels
+                if 'AFC' in parent_text:
+                    # Make sure it's not NFC
+                    if parent_text.find('AFC') < parent_text.find('NFC') or 'NFC' not in parent_text:
+                        conference = 'AFC'
+                if 'NFC' in parent_text and not conference:
+                    conference = 'NFC'
+            
+            # Also check for conference in table headers
+            if not conference:
+                headers = table.find_all(['th', 'thead'])
+                for header in headers:
+                    header_text = header.get_text().upper()
+                    if 'AFC' in header_text and 'NFC' not in header_text:
+                        conference = 'AFC'
+                        break
+                    elif 'NFC' in header_text:
+                        conference = 'NFC'
+                        break
+            
+            if not conference:
+                continue
+            
+            # Parse rows
+            rows = table.find_all('tr')
+            row_num = 0
+            for row in rows:
+                # Skip header rows
+                if row.find('th') or 'header' in str(row.get('class', [])).lower():
+                    continue
+                
+                cells = row.find_all(['td', 'th'])
+                if len(cells) < 2:
+                    continue
+                
+                # Team name is usually in a link
+                team_link = row.find('a', href=re.compile(r'/nfl/team/'))
+                if not team_link:
+                    continue
+                
+                team_name = team_link.get_text(strip=True)
+                
+                # Look for seed number in cells
+                seed = None
+                for cell in cells:
+                    cell_text = cell.get_text(strip=True)
+                    # Seed is typically a single digit 1-7
+                    if cell_text.isdigit():
+                        seed_val = int(cell_text)
+                        if 1 <= seed_val <= 7:
+                            seed = seed_val
+                            break
+                
+                # If no seed found, try using row position as seed
+                if not seed:
+                    row_num += 1
+                    if row_num <= 7:  # Only first 7 teams per conference
+                        seed = row_num
+                
+                if team_name and conference and seed:
+                    playoff_teams.append({
+                        'team_name': team_name,
+                        'team_abbreviation': get_team_abbreviation(team_name),
+                        'conference': conference,
+                        'seed': seed
+                    })
+    
+    # Remove duplicates and sort
+    seen = set()
+    unique_teams = []
+    for team in playoff_teams:
+        key = (team['team_name'], team['conference'], team['seed'])
+        if key not in seen:
+            seen.add(key)
+            unique_teams.append(team)
+    
+    # Sort by conference and seed
+    unique_teams.sort(key=lambda x: (x['conference'], x['seed']))
+    
+    return unique_teams
+
+
+@profiling.traced()
+def fetch_playoff_teams_from_espn(season: int, state: Optional[Dict[str, any]] = None) -> List[Dict[str, any]]:
     """
     Scrape playoff teams from ESPN playoff standings page.
     
     Fetches data from: https://www.espn.com/nfl/standings/_/view/playoff
+    With a change-detection state (see change_detection.py), raises SourceUnchanged if nothing changed.
     """
     try:
-        from bs4 import BeautifulSoup
-        import json
-        import re
+        from bs4 import BeautifulSoup  # Fail fast before fetching if bs4 is missing
         
         url = "https://www.espn.com/nfl/standings/_/view/playoff"
         
@@ -360,7 +657,10 @@ def fetch_playoff_teams_from_espn(season: int) -> List[Dict[str, any]]:
             'Referer': 'https://www.espn.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        with profiling.span('espn.http_fetch'):
+            # Shared client: rate limited per host, retries transient failures with backoff;
+            # with a saved state, raises SourceUnchanged on a 304 or an identical page
+            response = change_detection.conditional_get(url, headers, state)
         
         if response.status_code != 200:
             print(f"Warning: ESPN returned status {response.status_code}")
@@ -373,221 +673,7 @@ def fetch_playoff_teams_from_espn(season: int) -> List[Dict[str, any]]:
             f.write(response.text)
         print(f"Saved response to: {html_file}")
         
-        # Use the response content for parsing
-        soup = BeautifulSoup(response.content, 'html.parser')
-        playoff_teams = []
-        
-        # Method 1: Try to extract JSON data from script tags (ESPN embeds data this way)
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string:
-                # Look for window.__espnfitt__ or similar data structures
-                script_text = script.string
-                
-                # Try to find JSON data structures - ESPN uses window['__espnfitt__'] format
-                # Pattern 1: window['__espnfitt__'] = {...} or window["__espnfitt__"] = {...}
-                json_matches = re.findall(r"window\['__espnfitt__'\]\s*=\s*({.+?});", script_text, re.DOTALL)
-                if not json_matches:
-                    json_matches = re.findall(r'window\["__espnfitt__"\]\s*=\s*({.+?});', script_text, re.DOTALL)
-                if not json_matches:
-                    # Pattern 2: window.__espnfitt__ = {...};
-                    json_matches = re.findall(r'window\.__espnfitt__\s*=\s*({.+?});', script_text, re.DOTALL)
-                if not json_matches:
-                    # Pattern 3: __espnfitt__: {...} (in object literal)
-                    json_matches = re.findall(r'__espnfitt__\s*:\s*({.+?}),?\s*[;\n}]', script_text, re.DOTALL)
-                
-                if json_matches:
-                    for match in json_matches:
-                        try:
-                            data = json.loads(match)
-                            
-                            # Recursively search for standings data
-                            def find_standings_data(obj, path=""):
-                                """Recursively find standings/groups/entries structure."""
-                                if isinstance(obj, dict):
-                                    # Check if this looks like standings data
-                                    if 'groups' in obj and isinstance(obj['groups'], list):
-                                        return obj
-                                    if 'standings' in obj:
-                                        standings = obj['standings']
-                                        if isinstance(standings, dict) and 'groups' in standings:
-                                            return standings
-                                    # Search deeper
-                                    for key, value in obj.items():
-                                        result = find_standings_data(value, f"{path}.{key}" if path else key)
-                                        if result:
-                                            return result
-                                elif isinstance(obj, list):
-                                    for idx, item in enumerate(obj):
-                                        result = find_standings_data(item, f"{path}[{idx}]")
-                                        if result:
-                                            return result
-                                return None
-                            
-                            standings = find_standings_data(data)
-                            
-                            if standings and 'groups' in standings:
-                                # ESPN structure: standings.groups[] contains conferences
-                                for group in standings['groups']:
-                                    conference = group.get('name', '').upper()
-                                    if conference not in ['AFC', 'NFC']:
-                                        # Try alternative conference field names
-                                        conference = group.get('abbreviation', '').upper()
-                                        if conference not in ['AFC', 'NFC']:
-                                            conference = group.get('conference', '').upper()
-                                            if conference not in ['AFC', 'NFC']:
-                                                continue
-                                    
-                                    entries = group.get('standings', {})
-                                    if isinstance(entries, dict):
-                                        entries = entries.get('entries', [])
-                                    if not isinstance(entries, list):
-                                        entries = []
-                                    
-                                    for entry in entries:
-                                        team = entry.get('team', {})
-                                        team_name = team.get('displayName', '') or team.get('name', '') or team.get('fullName', '')
-                                        
-                                        # Get seed from stats or direct field
-                                        seed = entry.get('playoffSeed') or entry.get('seed')
-                                        if not seed:
-                                            stats = entry.get('stats', [])
-                                            for stat in stats:
-                                                if isinstance(stat, dict):
-                                                    if stat.get('name') == 'playoffSeed' or stat.get('type') == 'playoffSeed':
-                                                        seed_val = stat.get('value') or stat.get('displayValue')
-                                                        if seed_val:
-                                                            try:
-                                                                seed = int(seed_val)
-                                                            except (ValueError, TypeError):
-                                                                continue
-                                                            break
-                                                elif isinstance(stat, str) and 'seed' in stat.lower():
-                                                    # Try to extract number from string
-                                                    seed_match = re.search(r'\d+', stat)
-                                                    if seed_match:
-                                                        seed = int(seed_match.group())
-                                                        break
-                                        
-                                        if team_name and seed and 1 <= seed <= 7:
-                                            abbreviation = team.get('abbreviation') or team.get('shortDisplayName', '')
-                                            playoff_teams.append({
-                                                'team_name': team_name,
-                                                'team_abbreviation': abbreviation or get_team_abbreviation(team_name),
-                                                'conference': conference,
-                                                'seed': int(seed)
-                                            })
-                            
-                            if playoff_teams:
-                                break
-                        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-                            continue
-                    if playoff_teams:
-                        break
-                
-                # Alternative: Look for other JSON patterns
-                # Try to find standalone JSON objects
-                json_patterns = re.findall(r'\{[^{}]*"standings"[^{}]*\}', script_text)
-                for pattern in json_patterns:
-                    try:
-                        data = json.loads(pattern)
-                        # Try to extract teams from various possible structures
-                        # This is a fallback if the main structure doesn't match
-                    except:
-                        continue
-        
-        # Method 2: If JSON extraction failed, try HTML table parsing
-        if not playoff_teams:
-            print("JSON extraction failed, trying HTML table parsing...")
-            # Find all table elements
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                # Find parent container to identify conference
-                parent = table.find_parent(['div', 'section', 'article'])
-                conference = None
-                
-                # Look for conference in parent text or nearby headings
-                if parent:
-                    parent_text = parent.get_text().upper()
-                    # Check for AFC/NFC labels
-                    if 'AFC' in parent_text:
-                        # Make sure it's not NFC
-                        if parent_text.find('AFC') < parent_text.find('NFC') or 'NFC' not in parent_text:
-                            conference = 'AFC'
-                    if 'NFC' in parent_text and not conference:
-                        conference = 'NFC'
-                
-                # Also check for conference in table headers
-                if not conference:
-                    headers = table.find_all(['th', 'thead'])
-                    for header in headers:
-                        header_text = header.get_text().upper()
-                        if 'AFC' in header_text and 'NFC' not in header_text:
-                            conference = 'AFC'
-                            break
-                        elif 'NFC' in header_text:
-                            conference = 'NFC'
-                            break
-                
-                if not conference:
-                    continue
-                
-                # Parse rows
-                rows = table.find_all('tr')
-                row_num = 0
-                for row in rows:
-                    # Skip header rows
-                    if row.find('th') or 'header' in str(row.get('class', [])).lower():
-                        continue
-                    
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) < 2:
-                        continue
-                    
-                    # Team name is usually in a link
-                    team_link = row.find('a', href=re.compile(r'/nfl/team/'))
-                    if not team_link:
-                        continue
-                    
-                    team_name = team_link.get_text(strip=True)
-                    
-                    # Look for seed number in cells
-                    seed = None
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
-                        # Seed is typically a single digit 1-7
-                        if cell_text.isdigit():
-                            seed_val = int(cell_text)
-                            if 1 <= seed_val <= 7:
-                                seed = seed_val
-                                break
-                    
-                    # If no seed found, try using row position as seed
-                    if not seed:
-                        row_num += 1
-                        if row_num <= 7:  # Only first 7 teams per conference
-                            seed = row_num
-                    
-                    if team_name and conference and seed:
-                        playoff_teams.append({
-                            'team_name': team_name,
-                            'team_abbreviation': get_team_abbreviation(team_name),
-                            'conference': conference,
-                            'seed': seed
-                        })
-        
-        # Remove duplicates and sort
-        seen = set()
-        unique_teams = []
-        for team in playoff_teams:
-            key = (team['team_name'], team['conference'], team['seed'])
-            if key not in seen:
-                seen.add(key)
-                unique_teams.append(team)
-        
-        # Sort by conference and seed
-        unique_teams.sort(key=lambda x: (x['conference'], x['seed']))
+        unique_teams = parse_playoff_teams_from_espn_html(response.content)
         
         if unique_teams:
             print(f"✅ Successfully scraped {len(unique_teams)} playoff teams from ESPN")
@@ -600,6 +686,8 @@ def fetch_playoff_teams_from_espn(season: int) -> List[Dict[str, any]]:
             print("  https://www.espn.com/nfl/standings/_/view/playoff")
             return []
             
+    except change_detection.SourceUnchanged:
+        raise
     except ImportError:
         print("Error: beautifulsoup4 package required for web scraping")
         print("Install it with: pip install beautifulsoup4")
@@ -616,6 +704,104 @@ def fetch_playoff_teams_from_espn(season: int) -> List[Dict[str, any]]:
         return []
 
 
+def parse_playoff_teams_from_espn_standings_json(data: Dict[str, any]) -> List[Dict[str, any]]:
+    """
+    Extract playoff teams from an ESPN standings API response (parsed JSON).
+    
+    Each conference group lists its teams with a playoffSeed stat; seeds 1-7 are kept.
+    Returns teams sorted by conference and seed; empty list if nothing matched.
+    """
+    playoff_teams = []
+    
+    def walk(group, conference):
+        abbreviation = (group.get('abbreviation') or '').upper()
+        if abbreviation in ('AFC', 'NFC'):
+            conference = abbreviation
+        
+        for entry in group.get('standings', {}).get('entries', []):
+            team = entry.get('team', {})
+            seed = next((stat.get('value') for stat in entry.get('stats', [])
+                         if stat.get('name') == 'playoffSeed'), None)
+            team_name = team.get('displayName', '').strip()
+            if conference and team_name and seed and 1 <= int(seed) <= 7:
+                playoff_teams.append({
+                    'team_name': team_name,
+                    'team_abbreviation': get_team_abbreviation(team_name),
+                    'conference': conference,
+                    'seed': int(seed)
+                })
+        
+        for child in group.get('children', []):
+            walk(child, conference)
+    
+    with profiling.span('espn_api.json_parse'):
+        walk(data, None)
+    
+    playoff_teams.sort(key=lambda x: (x['conference'], x['seed']))
+    return playoff_teams
+
+
+@profiling.traced()
+def fetch_playoff_teams_from_espn_api(season: int, state: Optional[Dict[str, any]] = None) -> List[Dict[str, any]]:
+    """
+    Fetch playoff seeds from ESPN's standings JSON API (no HTML parsing).
+    
+    Fetches data from: https://site.api.espn.com/apis/v2/sports/football/nfl/standings
+    With a change-detection state (see change_detection.py), raises SourceUnchanged if nothing changed.
+    """
+    try:
+        url = ESPN_STANDINGS_API_URL.format(season=season)
+        
+        print(f"Fetching playoff seeds from the ESPN standings API for season {season}...")
+        print(f"Fetching: {url}")
+        
+        with profiling.span('espn_api.http_fetch'):
+            response = change_detection.conditional_get(url, {'Accept': 'application/json'}, state)
+        
+        if response.status_code != 200:
+            print(f"Warning: ESPN standings API returned status {response.status_code}")
+            return []
+        
+        unique_teams = parse_playoff_teams_from_espn_standings_json(response.json())
+        
+        if unique_teams:
+            print(f"✅ Successfully fetched {len(unique_teams)} playoff teams from the ESPN standings API")
+        else:
+            print("⚠️  No playoff seeds in the ESPN standings API response")
+        return unique_teams
+        
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching from the ESPN standings API: {e}")
+        return []
+    except ValueError as e:
+        print(f"Error parsing the ESPN standings API response: {e}")
+        return []
+
+
+def get_source_adapters(cache_ttl: float = 0, supabase: Optional[Client] = None) -> Dict[str, 'sources.SourceAdapter']:
+    """Playoff team sources by --source name (see sources.py).
+
+    With a database client, 'games' projects the seeds from regular-season results (seeding.py).
+    """
+    fetchers = {
+        'espn-api': ('ESPN standings API', fetch_playoff_teams_from_espn_api),
+        'espn': ('ESPN standings page', fetch_playoff_teams_from_espn),
+        'nfl': ('NFL.com playoff picture', fetch_playoff_teams_from_nfl),
+    }
+    if supabase is not None:
+        # Nothing to revalidate: the projection reads our own database
+        fetchers['games'] = ('Projection from games results',
+                             lambda season, state=None: seeding.fetch_projected_seeds(supabase, season, NFL_TEAMS))
+    return sources.build_adapters(fetchers, cache_ttl=cache_ttl)
+
+
+def _parse_seed(value: Optional[str]):
+    value = (value or '').strip()
+    if not value:
+        return None
+    return int(value) if value.isdigit() else value
+
+
 def load_teams_from_file(filepath: str) -> List[Dict[str, any]]:
     """Load teams from a JSON or CSV file."""
     import json
@@ -633,6 +819,13 @@ def load_teams_from_file(filepath: str) -> List[Dict[str, any]]:
                 teams = data
             elif isinstance(data, dict) and 'teams' in data:
                 teams = data['teams']
+    elif filepath.endswith(('.ndjson', '.jsonl')):
+        # One team per line (the format `ingest` streams)
+        with ingest.open_text(filepath) as f:
+            for line_number, record, error in ingest.read_records(f, 'ndjson'):
+                if error:
+                    raise ValueError(f"{filepath}, line {line_number}: {error}")
+                teams.append(record)
     elif filepath.endswith('.csv'):
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
@@ -641,10 +834,11 @@ def load_teams_from_file(filepath: str) -> List[Dict[str, any]]:
                     'team_name': row.get('team_name', ''),
                     'team_abbreviation': row.get('team_abbreviation', ''),
                     'conference': row.get('conference', ''),
-                    'seed': int(row.get('seed', 0)) if row.get('seed') else None
+                    # Kept as text when not a number, so validation can report it
+                    'seed': _parse_seed(row.get('seed'))
                 })
     else:
-        raise ValueError("Unsupported file format. Use .json or .csv")
+        raise ValueError("Unsupported file format. Use .json, .ndjson/.jsonl or .csv")
     
     return teams
 
@@ -685,6 +879,7 @@ def preview_teams(season: int, teams: List[Dict[str, any]], save_json: bool = Fa
         print("   You can review and edit this file, then use --teams-file to load it.")
 
 
+@profiling.traced()
 def get_existing_teams(supabase: Client, season: int) -> Dict[str, Dict[str, any]]:
     """Get existing playoff teams from database, organized by conference and seed."""
     try:
@@ -715,12 +910,19 @@ def get_user_approval() -> bool:
             print("Please enter 'yes' or 'no'")
 
 
+@profiling.traced()
 def insert_playoff_teams(supabase: Client, season: int, teams: List[Dict[str, any]], skip_approval: bool = False, save_preview: bool = False, update_mode: bool = False) -> bool:
     """Insert playoff teams into the database."""
     if not teams:
         print("No teams to insert.")
         return False
     
+    # Reject bad input before any database request (updates may carry part of the field)
+    errors = validation.validate_teams(teams, season, NFL_TEAMS, complete=not update_mode)
+    if errors:
+        validation.print_errors(errors, f"Playoff teams for season {season}")
+        return False
+    
     # Preview teams before insertion
     preview_teams(season, teams, save_json=save_preview)
     
@@ -809,7 +1011,26 @@ def insert_playoff_teams(supabase: Client, season: int, teams: List[Dict[str, an
         return False
 
 
+def add_common_arguments(parser: argparse.ArgumentParser, subcommand: bool = False) -> None:
+    """Options shared by the main CLI and its subcommands (profiling and database backend).
+    
+    Subcommand copies default to SUPPRESS so they don't overwrite values given before the command.
+    """
+    default = {'default': argparse.SUPPRESS} if subcommand else {}
+    parser.add_argument('--profile', nargs='?', const='', metavar='TRACE_FILE', **default,
+                        help='Record per-stage timing; writes a Chrome trace-event JSON (default: profile-trace-<timestamp>.json '
+                             'next to this script) and prints a summary of wall time, requests and bytes per stage')
+    parser.add_argument('--db', choices=['supabase', 'sqlite'], **default,
+                        help='Database backend: supabase (default) or sqlite (local stand-in). Env: PLAYOFF_DB_BACKEND')
+    parser.add_argument('--db-path', **default,
+                        help=f'SQLite database file for --db sqlite (default: local-playoffs.db next to this script, '
+                             f'":memory:" for a throwaway database). Env: PLAYOFF_SQLITE_PATH')
+
+
 def main():
+    # Imported here: game_commands loads interactive_mode, which loads this module
+    import game_commands
+    
     parser = argparse.ArgumentParser(
         description='Populate playoff_teams table with NFL playoff team data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -818,12 +1039,21 @@ Examples:
   # Interactive menu mode (recommended for manual entry)
   python scripts/populate-playoff-teams/populate-playoff-teams.py --interactive
 
-  # Scrape from ESPN and insert
+  # Fetch from ESPN (standings API, falling back to the ESPN and NFL.com pages) and insert
   python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024
 
   # Scrape from NFL.com instead
   python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --source nfl
 
+  # Try the ESPN standings API, then NFL.com
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --source espn-api,nfl
+
+  # Cron: exits 4 without touching the database when the standings haven't changed
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --yes
+
+  # Query every source at once; take the first complete field (or --quorum 2 to cross-check seeds)
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --source auto
+
   # Use manually specified teams (JSON format)
   python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 \\
     --teams '[{"team_name": "Kansas City Chiefs", "team_abbreviation": "KC", "conference": "AFC", "seed": 1}]'
@@ -836,6 +1066,51 @@ Examples:
 
   # Save preview JSON to file before approval
   python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --save-preview
+
+  # Show the exact database operations (and their cost) without writing; save them, review, apply
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --teams-file teams.json --plan plan.json
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --apply-plan plan.json
+
+  # Profile a run: per-stage summary plus a Chrome trace file
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --yes --profile trace.json
+
+  # Headless: generate the Divisional Round games (for cron; prints JSON, exit 3 if Week 1 isn't final)
+  python scripts/populate-playoff-teams/populate-playoff-teams.py games generate --season 2025 --week 2 --yes --json
+
+  # Load every postseason since 2002 (resumable; 4 seasons fetched at a time)
+  python scripts/populate-playoff-teams/populate-playoff-teams.py backfill --seasons 2002-2025 --yes
+
+  # Refresh the local playoff history store and print seed statistics
+  python scripts/populate-playoff-teams/populate-playoff-teams.py history refresh
+  python scripts/populate-playoff-teams/populate-playoff-teams.py history report
+
+  # Fit team ratings from completed games and show playoff win probabilities
+  python scripts/populate-playoff-teams/populate-playoff-teams.py ratings update --seasons 2002-2025
+  python scripts/populate-playoff-teams/populate-playoff-teams.py ratings show --season 2025
+
+  # Late season: who has clinched, who is out, and seed probabilities from the remaining games
+  python scripts/populate-playoff-teams/populate-playoff-teams.py scenarios --season 2025 --ratings
+
+  # Simulate the postseason a million times on every core (repeatable with --random-seed)
+  python scripts/populate-playoff-teams/populate-playoff-teams.py simulate --season 2025 --ratings --random-seed 7
+
+  # Top 10 per pool from playoff confidence points (one snapshot row per pool), plus one participant's rank
+  python scripts/populate-playoff-teams/populate-playoff-teams.py leaderboard --season 2025 --participant <participant-id>
+
+  # Keep advancing rounds and refresh the gzipped bracket/standings files after every final
+  python scripts/populate-playoff-teams/populate-playoff-teams.py games advance --season 2025 --watch --yes --snapshots
+
+  # Benchmark data: 20,000 synthetic pools with confidence points and a finished postseason
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --db sqlite synthetic --season 2099 --pools 20000 --yes
+
+  # Then replay 5,000 participants submitting confidence points in the rush before kickoff
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --db sqlite loadtest --season 2099 --participants 5000 --yes
+
+  # Stream a large NDJSON/CSV file of team and game records into the database in batches
+  python scripts/populate-playoff-teams/populate-playoff-teams.py ingest history.ndjson.gz --yes
+
+  # Run offline against the local SQLite stand-in instead of Supabase
+  python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2024 --teams-file teams.json --db sqlite
         """
     )
     
@@ -844,22 +1119,110 @@ Examples:
                         help='Run in interactive menu mode (optional if no other args provided)')
     parser.add_argument('--teams', help='JSON array of teams (alternative to scraping)')
     parser.add_argument('--teams-file', help='Path to JSON/CSV file containing teams')
-    parser.add_argument('--source', choices=['espn', 'nfl', 'manual', 'file'], default='espn',
-                        help='Data source: espn (ESPN.com), nfl (NFL.com), manual (--teams arg), or file (--teams-file) (default: espn)')
+    parser.add_argument('--source', default=','.join(sources.DEFAULT_SOURCE_ORDER),
+                        help='Data source, or a comma-separated fallback order: espn-api (ESPN standings JSON API), '
+                             'espn (ESPN.com page), nfl (NFL.com page), games (projected from regular-season results '
+                             'in the database); auto fetches the three web sources at once; '
+                             'manual/file use --teams/--teams-file '
+                             f'(default: {",".join(sources.DEFAULT_SOURCE_ORDER)})')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Fetch, preview and write even if the standings are unchanged since the last run '
+                             f'(otherwise unchanged standings exit with status {change_detection.EXIT_UNCHANGED})')
+    parser.add_argument('--quorum', type=int, default=1, metavar='N',
+                        help='With --source auto: wait for N sources to return a valid field and compare them seed by seed (default: 1, first valid wins)')
+    parser.add_argument('--cross-check', action='store_true',
+                        help='Compare the fetched seeds with the projection from regular-season results and report differences')
+    parser.add_argument('--source-cache-ttl', type=float, default=0, metavar='SECONDS',
+                        help='Reuse teams fetched from a source within this many seconds (cached in source-cache.json; default: 0, off). '
+                             'A fresh entry is used without any request; once it expires, the source is revalidated with a conditional request')
     parser.add_argument('--yes', '-y', action='store_true',
                         help='Skip confirmation prompt and insert immediately')
     parser.add_argument('--save-preview', action='store_true',
                         help='Save preview JSON to file before asking for approval')
+    parser.add_argument('--plan', nargs='?', const='', metavar='PLAN_FILE',
+                        help='Print the database operations the write would make (with their request and row counts) '
+                             'instead of writing; save them to PLAN_FILE for --apply-plan')
+    parser.add_argument('--apply-plan', metavar='PLAN_FILE',
+                        help='Execute a plan saved by --plan (teams or games generate) exactly as written; '
+                             'refuses if the rows it was made against changed since, unless --force')
+    add_common_arguments(parser)
+    
+    # Headless subcommands (e.g. `games generate`) accept the common options after the command too
+    common_parent = argparse.ArgumentParser(add_help=False)
+    add_common_arguments(common_parent, subcommand=True)
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    game_commands.add_games_parser(subparsers, [common_parent])
+    backfill.add_backfill_parser(subparsers, [common_parent])
+    history_store.add_history_parser(subparsers, [common_parent])
+    ratings.add_ratings_parser(subparsers, [common_parent])
+    scenarios.add_scenarios_parser(subparsers, [common_parent])
+    simulation.add_simulate_parser(subparsers, [common_parent])
+    leaderboard.add_leaderboard_parser(subparsers, [common_parent])
+    snapshots.add_snapshots_parser(subparsers, [common_parent])
+    synthetic_data.add_synthetic_parser(subparsers, [common_parent])
+    loadtest.add_loadtest_parser(subparsers, [common_parent])
+    ingest.add_ingest_parser(subparsers, [common_parent])
     
     args = parser.parse_args()
     
-    # Initialize Supabase client
+    if args.profile is not None:
+        import atexit
+        trace_path = args.profile or os.path.join(
+            script_dir, f"profile-trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        profiling.enable()
+        # Runs on every exit path, including sys.exit()
+        atexit.register(profiling.finish, trace_path)
+    
+    # Reports read only the local history store
+    if args.command == 'history' and args.history_command == 'report':
+        sys.exit(history_store.run_history_command(None, args))
+    
+    # Initialize database client (Supabase unless the local SQLite backend is selected)
     try:
-        supabase = get_supabase_client()
+        supabase = get_db_client(args.db, args.db_path)
     except Exception as e:
-        print(f"❌ Error connecting to Supabase: {e}")
+        print(f"❌ Error connecting to database: {e}")
         sys.exit(1)
     
+    if isinstance(supabase, local_db.LocalClient):
+        backend_label = f"local SQLite database: {supabase.path}"
+        database_key = f"sqlite:{os.path.abspath(supabase.path)}"
+    else:
+        backend_label = None
+        database_key = 'supabase'
+    
+    # Count database round trips per stage when profiling (no-op otherwise)
+    supabase = profiling.instrument_client(supabase)
+    
+    # A saved plan was reviewed when it was made: no fetching, no prompt
+    if args.apply_plan:
+        sys.exit(write_plan.run_apply_plan(supabase, args.apply_plan, force=args.force))
+    
+    # Headless subcommands never prompt
+    if args.command == 'games':
+        sys.exit(game_commands.run_games_command(supabase, args))
+    if args.command == 'history':
+        sys.exit(history_store.run_history_command(supabase, args))
+    if args.command == 'ratings':
+        sys.exit(ratings.run_ratings_command(supabase, args, NFL_TEAMS))
+    if args.command == 'scenarios':
+        sys.exit(scenarios.run_scenarios_command(supabase, args, NFL_TEAMS))
+    if args.command == 'simulate':
+        sys.exit(simulation.run_simulate_command(supabase, args, NFL_TEAMS))
+    if args.command == 'leaderboard':
+        sys.exit(leaderboard.run_leaderboard_command(supabase, args, NFL_TEAMS))
+    if args.command == 'snapshots':
+        sys.exit(snapshots.run_snapshots_command(supabase, args))
+    if args.command == 'synthetic':
+        sys.exit(synthetic_data.run_synthetic_command(supabase, args, NFL_TEAMS))
+    if args.command == 'loadtest':
+        sys.exit(loadtest.run_loadtest_command(supabase, args))
+    if args.command == 'ingest':
+        sys.exit(ingest.run_ingest_command(supabase, args, NFL_TEAMS))
+    if args.command == 'backfill':
+        seeds_source = get_source_adapters(cache_ttl=backfill.SEEDS_CACHE_TTL)['espn-api']
+        sys.exit(backfill.run_backfill_command(supabase, args, seeds_source.fetch))
+    
     # If no args provided or interactive mode requested, run interactive mode
     if args.interactive or (not args.season and not args.teams_file and not args.teams):
         # Import interactive functions
@@ -883,10 +1246,15 @@ Examples:
     print("=" * 60)
     print("NFL Playoff Teams Populator")
     print("=" * 60)
-    print("✅ Connected to Supabase")
+    if backend_label:
+        print(f"✅ Using {backend_label}")
+    else:
+        print("✅ Connected to Supabase")
     
     # Get teams based on source
     teams = []
+    source_name = None
+    state_store = None
     
     if args.teams_file:
         try:
@@ -903,32 +1271,82 @@ Examples:
         except json.JSONDecodeError as e:
             print(f"❌ Error parsing JSON teams: {e}")
             sys.exit(1)
-    elif args.source == 'espn':
-        teams = fetch_playoff_teams_from_espn(args.season)
+    elif args.source in ('manual', 'file'):
+        print("❌ No teams provided. Use --teams or --teams-file with --source manual/file")
+        sys.exit(1)
+    else:
+        adapters = get_source_adapters(args.source_cache_ttl, supabase)
+        # Remembers what the last successful run wrote, per database, season and source
+        state_store = change_detection.StateStore(database=database_key)
+        state_for = None if args.force else functools.partial(state_store.get, args.season)
+        try:
+            if args.source == 'auto':
+                # The projection always returns a full field at once, so it would win every race
+                web_adapters = {name: adapter for name, adapter in adapters.items() if name != 'games'}
+                if not 1 <= args.quorum <= len(web_adapters):
+                    print(f"❌ --quorum must be between 1 and {len(web_adapters)}")
+                    sys.exit(1)
+                # A quorum needs every source's seeds, so only single-winner races revalidate
+                teams, source_name, _ = sources.race_sources(web_adapters, args.season, NFL_TEAMS, quorum=args.quorum,
+                                                             state_for=state_for if args.quorum == 1 else None)
+                source_label = f"a quorum of {args.quorum} sources" if source_name == 'quorum' else None
+            else:
+                try:
+                    order = sources.parse_source_order(args.source, list(adapters))
+                except ValueError as e:
+                    print(f"❌ {e}")
+                    sys.exit(1)
+                teams, source_name = sources.fetch_with_fallback(adapters, order, args.season, state_for=state_for)
+                source_label = None
+        except change_detection.SourceUnchanged as e:
+            print(f"✅ No changes since the last run ({e}); nothing to do")
+            sys.exit(change_detection.EXIT_UNCHANGED)
+        
+        if teams and args.cross_check and source_name != 'games':
+            projected = adapters['games'].fetch(args.season)
+            if projected:
+                conflicts = sources.seed_conflicts({'fetched': teams, 'projected': projected})
+                for (conference, seed), picks in conflicts.items():
+                    print(f"⚠️  {conference} #{seed}: fetched {picks.get('fetched', '-')}, "
+                          f"projected from results {picks.get('projected', '-')}")
+                if not conflicts:
+                    print("✅ Seeds match the projection from regular-season results")
+        
+        if teams and not args.force and state_store.is_unchanged(args.season, source_name, teams):
+            print(f"✅ Seeds from {source_label or adapters[source_name].label} unchanged since the last run; skipping the database write")
+            # Keep the new response validators so the next run can stop at a 304
+            state_store.save(args.season, source_name, teams)
+            sys.exit(change_detection.EXIT_UNCHANGED)
         if teams:
-            print(f"✅ Fetched {len(teams)} teams from ESPN")
+            print(f"✅ Fetched {len(teams)} teams from {source_label or adapters[source_name].label}")
         else:
-            print("⚠️  No teams fetched from ESPN. You may need to use --teams or --teams-file")
+            print("⚠️  No teams fetched from any source. You may need to use --teams or --teams-file")
             print("\nExample manual input:")
             print('  --teams \'[{"team_name": "Team Name", "team_abbreviation": "TEA", "conference": "AFC", "seed": 1}]\'')
             sys.exit(1)
-    elif args.source == 'nfl':
-        teams = fetch_playoff_teams_from_nfl(args.season)
-        if teams:
-            print(f"✅ Fetched {len(teams)} teams from NFL.com")
-        else:
-            print("⚠️  No teams fetched from NFL.com. You may need to use --teams or --teams-file")
-            print("\nExample manual input:")
-            print('  --teams \'[{"team_name": "Team Name", "team_abbreviation": "TEA", "conference": "AFC", "seed": 1}]\'')
+    
+    if args.plan is not None:
+        errors = validation.validate_teams(teams, args.season, NFL_TEAMS)
+        if errors:
+            validation.print_errors(errors, f"Playoff teams for season {args.season}")
             sys.exit(1)
-    else:
-        print("❌ No teams provided. Use --teams, --teams-file, or --source espn")
-        sys.exit(1)
+        try:
+            plan = write_plan.plan_teams(supabase, args.season, teams)
+        except Exception as e:
+            print(f"❌ Error reading existing teams: {e}")
+            sys.exit(1)
+        write_plan.print_plan(plan)
+        if args.plan:
+            write_plan.save_plan(plan, args.plan)
+            print(f"\n📄 Plan saved to: {args.plan} (run it with --apply-plan {args.plan})")
+        sys.exit(0)
     
     # Insert teams (no pool_id needed - playoff teams are the same for all pools)
     success = insert_playoff_teams(supabase, args.season, teams, skip_approval=args.yes, save_preview=args.save_preview)
     
     if success:
+        if state_store:
+            state_store.save(args.season, source_name, teams)
         print("\n✅ Playoff teams population completed successfully!")
         sys.exit(0)
     else:
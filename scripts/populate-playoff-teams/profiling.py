@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Lightweight per-stage timing spans for populate-playoff-teams.
+
+Spans are recorded only after enable() is called (the --profile flag). While disabled,
+span() returns a shared no-op context manager and traced() functions call straight
+through, so instrumented code pays one boolean check per call.
+
+Output:
+  - a Chrome trace-event JSON file (open in chrome://tracing or https://ui.perfetto.dev)
+  - an end-of-run summary of wall time, request counts and bytes transferred per stage
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+from typing import Dict, Optional, Any
+
+_enabled = False
+_lock = threading.Lock()
+_local = threading.local()
+_events = []
+_stats = {}
+_origin = time.perf_counter()
+
+
+def enable() -> None:
+    """Start recording spans."""
+    global _enabled, _origin
+    with _lock:
+        _events.clear()
+        _stats.clear()
+        _origin = time.perf_counter()
+        _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _stage_stats(name: str) -> Dict[str, Any]:
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = {'calls': 0, 'wall_s': 0.0, 'requests': 0, 'bytes': 0}
+    return stats
+
+
+class _NullSpan:
+    """Returned by span() when profiling is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, name: str, category: str):
+        self.name = name
+        self.category = category
+        self.start = 0.0
+
+    def __enter__(self):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        _local.stack.pop()
+        event = {
+            'name': self.name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': round((self.start - _origin) * 1e6, 3),
+            'dur': round((end - self.start) * 1e6, 3),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if exc_type is not None:
+            event['args'] = {'error': exc_type.__name__}
+        with _lock:
+            _events.append(event)
+            stats = _stage_stats(self.name)
+            stats['calls'] += 1
+            stats['wall_s'] += end - self.start
+        return False
+
+
+def span(name: str, category: str = 'stage'):
+    """Context manager timing a block as stage `name`."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator timing every call of a function as one span (named after the function by default)."""
+    def decorator(func):
+        stage = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(stage, 'stage'):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_request(nbytes: Optional[int] = None, payload: Any = None) -> None:
+    """Count one network request (and its size) against the innermost active span.
+
+    Pass nbytes when the raw size is known, or payload (e.g. response.data) to have its
+    JSON size estimated; the estimate is only computed while profiling is enabled.
+    """
+    if not _enabled:
+        return
+    if nbytes is None:
+        try:
+            nbytes = len(json.dumps(payload, default=str)) if payload is not None else 0
+        except (TypeError, ValueError):
+            nbytes = 0
+    stack = getattr(_local, 'stack', None)
+    stage = stack[-1] if stack else '(untraced)'
+    with _lock:
+        stats = _stage_stats(stage)
+        stats['requests'] += 1
+        stats['bytes'] += nbytes
+
+
+class _CountingQuery:
+    """Wraps a query builder so execute() is counted as a request."""
+
+    def __init__(self, query):
+        self._query = query
+
+    def __getattr__(self, attr):
+        value = getattr(self._query, attr)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            if attr == 'execute':
+                record_request(payload=getattr(result, 'data', None))
+                return result
+            return _CountingQuery(result)
+        return call
+
+
+class CountingClient:
+    """Wraps a Supabase (or local) client so every executed query is counted per stage."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name: str):
+        return _CountingQuery(self._client.table(name))
+
+    def __getattr__(self, attr):
+        return getattr(self._client, attr)
+
+
+def instrument_client(client):
+    """Return client wrapped for request counting when profiling is enabled, else client unchanged."""
+    return CountingClient(client) if _enabled else client
+
+
+def write_trace(path: str) -> None:
+    """Write recorded spans as Chrome trace-event JSON."""
+    with _lock:
+        events = list(_events)
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def print_summary() -> None:
+    """Print wall time (inclusive of nested stages), request counts and bytes per stage."""
+    with _lock:
+        stats = {name: dict(values) for name, values in _stats.items()}
+    if not stats:
+        print("\nProfile: no stages recorded")
+        return
+
+    print("\n" + "=" * 84)
+    print("PROFILE SUMMARY (wall time includes nested stages)")
+    print("=" * 84)
+    print(f"{'Stage':40} {'Calls':>6} {'Wall ms':>12} {'Requests':>10} {'Bytes':>12}")
+    print("-" * 84)
+    for name, values in sorted(stats.items(), key=lambda item: -item[1]['wall_s']):
+        print(f"{name:40} {values['calls']:>6} {values['wall_s'] * 1000:>12.1f} "
+              f"{values['requests']:>10} {values['bytes']:>12,}")
+    print("=" * 84)
+
+
+def finish(trace_path: str) -> None:
+    """Write the trace file and print the summary (registered with atexit by --profile)."""
+    if not _enabled:
+        return
+    write_trace(trace_path)
+    print_summary()
+    print(f"📄 Trace written to: {trace_path} (open in chrome://tracing or https://ui.perfetto.dev)")
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Team strength ratings (Elo) fitted from the games table.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py ratings update --seasons 2002-2025
+    python scripts/populate-playoff-teams/populate-playoff-teams.py ratings show --season 2025
+
+Every completed game (regular season and playoffs; preseason is ignored) is applied in week order. The games
+of one week are updated together with NumPy: each side's expected result comes from the
+rating difference plus home-field advantage (none in the Super Bowl), and the change is
+scaled by the margin of victory, damped when the favourite wins big. Ratings regress a
+third of the way to the mean between seasons.
+
+Ratings after every week are saved in team-ratings.json next to this script along with
+the last week applied, so `ratings update` only reads the seasons from that week on and
+applies the weeks completed since. A week is applied once all of its games are final;
+games that will never be (cancelled or postponed, or still unfinished once a later week
+has results, like BUF @ CIN in 2022 week 17) are skipped rather than holding the week back.
+
+win_probability_matrix() turns the ratings into pairwise win probabilities for the 14
+teams in playoff_teams, for the playoff simulator.
+"""
+
+import os
+import sys
+import json
+import argparse
+import contextlib
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple, Callable
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the ratings commands
+    np = None
+
+import validation
+from backfill import parse_seasons
+from espn_matching import EspnEventIndex
+
+DEFAULT_RATINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'team-ratings.json')
+
+MEAN_RATING = 1500.0
+K_FACTOR = 20.0
+HOME_FIELD = 48.0
+SEASON_REVERSION = 1 / 3
+ELO_SCALE = 400.0
+
+# Game statuses for a game that won't be played in its week (see convertStatus in src/app/api/games/route.ts)
+UNPLAYED_STATUSES = {'postponed', 'cancelled', 'canceled', 'abandoned'}
+# Regular season and playoffs
+RATED_SEASON_TYPES = [2, 3]
+
+GAME_COLUMNS = 'id, season, season_type, week, home_team, away_team, home_score, away_score, status, winner'
+
+
+def week_key(season: int, season_type: int, week: int) -> int:
+    """Sortable key for a week: regular season (type 2) weeks come before playoff (type 3) weeks."""
+    return season * 1000 + season_type * 100 + week
+
+
+def split_week_key(key: int) -> Tuple[int, int, int]:
+    """(season, season_type, week) for a week_key."""
+    return key // 1000, key // 100 % 10, key % 100
+
+
+def week_label(key: int) -> str:
+    season, season_type, week = split_week_key(key)
+    return f"{season} {'playoff ' if season_type == 3 else ''}week {week}"
+
+
+def expected_score(diff):
+    """Chance the side with rating advantage `diff` (home field included) wins."""
+    return 1.0 / (1.0 + 10.0 ** (-np.asarray(diff, dtype=np.float64) / ELO_SCALE))
+
+
+def update_week(ratings, home, away, margin, neutral) -> None:
+    """Apply one week's games to ratings in place.
+
+    home/away are team indexes, margin is home score minus away score and neutral marks
+    games without home-field advantage. Every game uses the ratings from before the week.
+    """
+    diff = ratings[home] - ratings[away] + np.where(neutral, 0.0, HOME_FIELD)
+    expected = expected_score(diff)
+    actual = np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+    winner_edge = np.where(margin >= 0, diff, -diff)
+    multiplier = np.log(np.maximum(np.abs(margin), 1) + 1.0) * 2.2 / (winner_edge * 0.001 + 2.2)
+    delta = K_FACTOR * multiplier * (actual - expected)
+    np.add.at(ratings, home, delta)
+    np.add.at(ratings, away, -delta)
+
+
+def is_completed(game: Dict[str, Any]) -> bool:
+    return (game.get('home_score') is not None and game.get('away_score') is not None
+            and (validation.is_finished(game.get('status')) or bool(game.get('winner'))))
+
+
+def is_unplayed(game: Dict[str, Any]) -> bool:
+    return str(game.get('status') or '').lower() in UNPLAYED_STATUSES
+
+
+def stream_games(supabase, seasons: Iterable[int]) -> Iterator[Dict[str, Any]]:
+    """Every regular season and playoff games row for the seasons, one query per season."""
+    for season in seasons:
+        response = supabase.table('games').select(GAME_COLUMNS).eq('season', season) \
+            .in_('season_type', RATED_SEASON_TYPES).execute()
+        yield from response.data or []
+
+
+class RatingModel:
+    """Current ratings plus a snapshot after every applied week, persisted as JSON."""
+
+    def __init__(self, path: str = DEFAULT_RATINGS_PATH, canonical: Optional[Callable[[str], Optional[str]]] = None):
+        if np is None:
+            raise RuntimeError("numpy is required for team ratings (pip install numpy)")
+        self.path = path
+        self._canonical = canonical or (lambda name: None)
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        if saved and saved.get('params') != self.params():
+            print(f"⚠️  Rating parameters changed since {path} was written; ratings will be rebuilt")
+            saved = {}
+        self.reset(saved)
+
+    @staticmethod
+    def params() -> Dict[str, float]:
+        return {'mean': MEAN_RATING, 'k': K_FACTOR, 'home_field': HOME_FIELD, 'reversion': round(SEASON_REVERSION, 6)}
+
+    def reset(self, saved: Optional[Dict[str, Any]] = None) -> None:
+        saved = saved or {}
+        self.teams: List[str] = list(saved.get('teams', []))
+        self._codes = {team: code for code, team in enumerate(self.teams)}
+        self.ratings = np.array(saved.get('ratings', [MEAN_RATING] * len(self.teams)), dtype=np.float64)
+        self.last_week: Optional[int] = saved.get('last_week')
+        self.snapshots: Dict[str, Dict[str, float]] = saved.get('snapshots', {})
+
+    def save(self) -> None:
+        data = {'params': self.params(), 'teams': self.teams, 'ratings': [round(r, 3) for r in self.ratings],
+                'last_week': self.last_week, 'snapshots': self.snapshots}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def team(self, name: str) -> str:
+        """Rating key for a team name (its abbreviation, so renamed franchises keep one rating)."""
+        return self._canonical(name) or name
+
+    def _index(self, name: str) -> int:
+        team = self.team(name)
+        if team not in self._codes:
+            self._codes[team] = len(self.teams)
+            self.teams.append(team)
+        return self._codes[team]
+
+    def fit(self, games: Iterable[Dict[str, Any]]) -> List[int]:
+        """Apply the weeks after last_week whose games are all completed; returns their keys.
+
+        Weeks are applied in order and stop at the first week that is not finished yet,
+        so that week is picked up by the next update. Unfinished games that are cancelled or
+        postponed, or that sit in a week before one with results, are skipped instead.
+        """
+        after = self.last_week or 0
+        keys, home, away, margin, neutral, done, unplayed = [], [], [], [], [], [], []
+        for game in games:
+            key = week_key(game['season'], game.get('season_type') or 2, game['week'])
+            if key <= after:
+                continue
+            completed = is_completed(game)
+            keys.append(key)
+            done.append(completed)
+            unplayed.append(not completed and is_unplayed(game))
+            home.append(self._index(game['home_team']) if completed else 0)
+            away.append(self._index(game['away_team']) if completed else 0)
+            margin.append(game['home_score'] - game['away_score'] if completed else 0)
+            # The Super Bowl is the only playoff game at a neutral site
+            neutral.append(key % 1000 == 304)
+        if not keys:
+            return []
+
+        keys = np.array(keys, dtype=np.int64)
+        order = np.argsort(keys, kind='stable')
+        keys, done = keys[order], np.array(done, dtype=bool)[order]
+        unplayed = np.array(unplayed, dtype=bool)[order]
+        # Weeks before the last one with a result have moved on; their unfinished games never will
+        last_result = int(keys[done].max()) if done.any() else 0
+        home, away = np.array(home, dtype=np.int64)[order], np.array(away, dtype=np.int64)[order]
+        margin, neutral = np.array(margin, dtype=np.int64)[order], np.array(neutral, dtype=bool)[order]
+        if len(self.ratings) < len(self.teams):
+            self.ratings = np.append(self.ratings, np.full(len(self.teams) - len(self.ratings), MEAN_RATING))
+
+        applied = []
+        unique_keys, starts = np.unique(keys, return_index=True)
+        for key, start, end in zip(unique_keys, starts, np.append(starts[1:], len(keys))):
+            key = int(key)
+            week_done = done[start:end]
+            if not week_done.all():
+                skipped = ~week_done if key < last_result else unplayed[start:end]
+                if not (week_done | skipped).all():
+                    print(f"⏸️  {week_label(key)} is not finished; stopping there")
+                    break
+                print(f"⏭️  {week_label(key)}: skipping {int(skipped.sum())} game(s) that won't be played")
+            if self.last_week is not None and key // 1000 != self.last_week // 1000:
+                self.ratings = MEAN_RATING + (self.ratings - MEAN_RATING) * (1 - SEASON_REVERSION)
+            played = slice(start, end) if week_done.all() else start + np.flatnonzero(week_done)
+            update_week(self.ratings, home[played], away[played], margin[played], neutral[played])
+            self.last_week = key
+            self.snapshots[str(key)] = {team: round(float(r), 1) for team, r in zip(self.teams, self.ratings)}
+            applied.append(key)
+        return applied
+
+    def ratings_for(self, season: int, through_week: Optional[int] = None) -> Dict[str, float]:
+        """Ratings by team as of the last applied week of a season (or before `through_week`'s key).
+
+        For a season with no applied weeks yet, the latest earlier ratings regressed to the mean.
+        """
+        limit = through_week if through_week is not None else week_key(season, 9, 99)
+        keys = [int(k) for k in self.snapshots if int(k) <= limit]
+        if not keys:
+            return {}
+        latest = max(keys)
+        ratings = dict(self.snapshots[str(latest)])
+        if latest // 1000 < season:
+            ratings = {team: MEAN_RATING + (r - MEAN_RATING) * (1 - SEASON_REVERSION) for team, r in ratings.items()}
+        return ratings
+
+    def win_probability_matrix(self, teams: List[str], season: int, home_field: float = HOME_FIELD,
+                               through_week: Optional[int] = None) -> Any:
+        """P[i, j]: chance teams[i] beats teams[j] with teams[i] at home (home_field=0 for neutral)."""
+        ratings = self.ratings_for(season, through_week)
+        values = np.array([ratings.get(self.team(name), MEAN_RATING) for name in teams], dtype=np.float64)
+        matrix = expected_score(values[:, None] - values[None, :] + home_field)
+        np.fill_diagonal(matrix, 0.5)
+        return matrix
+
+
+def get_playoff_field(supabase, season: int) -> List[Dict[str, Any]]:
+    """Playoff teams for a season ordered by conference and seed."""
+    response = supabase.table('playoff_teams').select('team_name, conference, seed').eq('season', season).execute()
+    return sorted(response.data or [], key=lambda t: ((t.get('conference') or '').upper(), t.get('seed') or 99))
+
+
+def update_ratings(supabase, model: RatingModel, seasons: List[int], rebuild: bool = False) -> Dict[str, Any]:
+    """Apply newly completed weeks for the seasons and save; returns a summary."""
+    if rebuild:
+        model.reset()
+    elif model.last_week is not None:
+        # Earlier seasons are already in the ratings
+        seasons = [s for s in seasons if s >= model.last_week // 1000]
+    applied = model.fit(stream_games(supabase, seasons))
+    if applied:
+        model.save()
+    return {
+        'weeks_applied': [week_label(k) for k in applied],
+        'last_week': week_label(model.last_week) if model.last_week else None,
+        'teams': len(model.teams),
+    }
+
+
+def add_ratings_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `ratings` command and its subcommands on the main CLI parser."""
+    ratings_parser = subparsers.add_parser('ratings', parents=common_parents or [],
+                                           help='Team strength ratings and playoff win probabilities')
+    ratings_subparsers = ratings_parser.add_subparsers(dest='ratings_command', metavar='SUBCOMMAND')
+    ratings_subparsers.required = True
+
+    update_parser = ratings_subparsers.add_parser('update', parents=common_parents or [],
+                                                  help='Apply weeks completed since the last update')
+    update_parser.add_argument('--seasons', required=True, help='Seasons to rate, e.g. 2002-2025')
+    update_parser.add_argument('--rebuild', action='store_true', help='Discard saved ratings and refit every season')
+
+    show_parser = ratings_subparsers.add_parser('show', parents=common_parents or [],
+                                                help="Print ratings and win probabilities for a season's playoff teams")
+    show_parser.add_argument('--season', type=int, required=True, help='Season (e.g. 2025)')
+    show_parser.add_argument('--neutral', action='store_true', help='No home-field advantage (Super Bowl)')
+
+    for sub in (update_parser, show_parser):
+        sub.add_argument('--ratings-file', default=DEFAULT_RATINGS_PATH,
+                         help='Ratings file (default: team-ratings.json next to this script)')
+        sub.add_argument('--json', action='store_true', help='Print a single JSON document to stdout')
+    return ratings_parser
+
+
+def run_ratings_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Dispatch `ratings <subcommand>`; returns the process exit code."""
+    index = EspnEventIndex([], nfl_teams)
+    try:
+        model = RatingModel(args.ratings_file, canonical=index.canonical)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    if args.ratings_command == 'update':
+        try:
+            seasons = parse_seasons(args.seasons)
+        except ValueError as e:
+            print(f"❌ Invalid --seasons: {e}", file=sys.stderr)
+            return 1
+        with redirect:
+            try:
+                summary = update_ratings(supabase, model, seasons, rebuild=args.rebuild)
+            except Exception as e:
+                print(f"❌ Error updating ratings: {e}")
+                return 1
+        if args.json:
+            print(json.dumps(summary))
+        else:
+            print(f"✅ Applied {len(summary['weeks_applied'])} week(s); ratings through {summary['last_week'] or 'none'}")
+        return 0
+
+    with redirect:
+        try:
+            field = get_playoff_field(supabase, args.season)
+        except Exception as e:
+            print(f"❌ Error reading playoff teams: {e}")
+            return 1
+    names = [t['team_name'] for t in field]
+    ratings = model.ratings_for(args.season)
+    matrix = model.win_probability_matrix(names, args.season, home_field=0.0 if args.neutral else HOME_FIELD)
+    if args.json:
+        print(json.dumps({'season': args.season, 'teams': field,
+                          'ratings': {name: ratings.get(model.team(name), MEAN_RATING) for name in names},
+                          'win_probability': [[round(float(p), 4) for p in row] for row in matrix]}))
+        return 0
+    if not ratings:
+        print("No ratings yet; run `ratings update` first")
+        return 0
+
+    print(f"\nRatings for {args.season} playoff teams")
+    for team in field:
+        name = team['team_name']
+        print(f"  {team.get('conference') or '':3} #{team.get('seed') or '-'} {name:<25} "
+              f"{ratings.get(model.team(name), MEAN_RATING):7.1f}")
+    if names:
+        labels = [model.team(name)[:4] for name in names]
+        print(f"\nWin probability (row team {'on a neutral field' if args.neutral else 'at home'})")
+        print("      " + ''.join(f"{label:>6}" for label in labels))
+        for label, row in zip(labels, matrix):
+            print(f"{label:<6}" + ''.join(f"{p:6.2f}" for p in row))
+    return 0
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Content-addressed cache for simulation and scenario results.
+
+A result is stored under the SHA-256 of the canonical JSON of everything it was
+computed from (seeds, known results, probability model, run count, random seed), so an
+identical request is answered from the cache and any change in the inputs is a miss.
+
+Two tiers:
+  - memory: an LRU of the most recent entries, for repeated requests in one process
+  - disk: one JSON file per entry in result-cache/ next to this script, with an index;
+    when the files exceed max_disk_bytes the least recently used ones are deleted
+
+Each entry also records a scope (e.g. "simulate:2025") and the hash of its inputs
+without the run parameters. Storing an entry whose inputs differ from the ones already
+cached for its scope evicts the old entries: once a result comes in they are stale.
+
+Usage:
+    cache = ResultCache()
+    key = canonical_hash({'seeds': ..., 'winners': ..., 'runs': 100000})
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.put(key, result, scope='simulate:2025', inputs=canonical_hash({'seeds': ..., 'winners': ...}))
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'result-cache')
+DEFAULT_MEMORY_ENTRIES = 128
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+INDEX_NAME = 'index.json'
+
+
+def canonical_hash(value: Any) -> str:
+    """SHA-256 of value as canonical JSON (sorted keys, no whitespace)."""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Memory LRU in front of a size-bounded directory of JSON results."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = {'memory': 0, 'disk': 0}
+        self.misses = 0
+        try:
+            with open(os.path.join(path, INDEX_NAME), 'r') as f:
+                self._index: Dict[str, Dict[str, Any]] = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def _save_index(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = os.path.join(self.path, INDEX_NAME + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, os.path.join(self.path, INDEX_NAME))
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _remove(self, key: str) -> None:
+        self._memory.pop(key, None)
+        self._index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached result for key, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits['memory'] += 1
+                return self._memory[key]
+            if key in self._index:
+                try:
+                    with open(self._entry_path(key), 'r') as f:
+                        value = json.load(f)
+                except (OSError, ValueError):
+                    self._remove(key)
+                    self._save_index()
+                else:
+                    self._index[key]['used_at'] = time.time()
+                    self._save_index()
+                    self._remember(key, value)
+                    self.hits['disk'] += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any, scope: Optional[str] = None, inputs: Optional[str] = None) -> None:
+        """Store a result; evicts the scope's entries for other inputs and the least recently used over the size limit."""
+        with self._lock:
+            self._remember(key, value)
+            if scope is not None:
+                stale = [k for k, entry in self._index.items()
+                         if entry.get('scope') == scope and entry.get('inputs') != inputs]
+                for stale_key in stale:
+                    self._remove(stale_key)
+
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                tmp_path = self._entry_path(key) + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(value, f, separators=(',', ':'))
+                os.replace(tmp_path, self._entry_path(key))
+                now = time.time()
+                self._index[key] = {'scope': scope, 'inputs': inputs, 'size': os.path.getsize(self._entry_path(key)),
+                                    'created_at': now, 'used_at': now}
+                self._evict()
+                self._save_index()
+            except OSError as e:
+                print(f"Warning: Could not write result cache {self.path}: {e}")
+
+    def _evict(self) -> None:
+        total = sum(entry.get('size', 0) for entry in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k].get('used_at', 0)):
+            if total <= self.max_disk_bytes:
+                break
+            total -= self._index[key].get('size', 0)
+            self._remove(key)
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many were on disk."""
+        with self._lock:
+            count = len(self._index)
+            for key in list(self._index):
+                self._remove(key)
+            self._memory.clear()
+            self._save_index()
+            return count
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Automatic playoff round progression.
+
+When every game of a playoff week has a winner, the next week is built with the
+bracket generators and written in one batched upsert. Evaluating a season costs two
+reads (playoff_teams and the season's playoff games); nothing is written when the
+next round already exists with the right matchups, so repeated triggers are free.
+
+Used by `games advance` (see game_commands.py), either once per cron run or in a
+--watch loop that re-evaluates only when the games' updated_at watermark moves.
+"""
+
+import time
+from typing import List, Dict, Optional, Any, Callable
+
+import interactive_mode
+
+# Games per playoff week: Wild Card, Divisional, Conference Championships, Super Bowl
+EXPECTED_GAMES = {1: 6, 2: 4, 3: 2, 4: 1}
+
+
+def fetch_playoff_games(supabase, season: int) -> Dict[int, List[Dict[str, Any]]]:
+    """All playoff games for a season in one query, grouped by week."""
+    response = supabase.table('games').select('id, week, home_team, away_team, winner, status, updated_at') \
+        .eq('season', season).eq('season_type', 3).execute()
+    games_by_week = {week: [] for week in EXPECTED_GAMES}
+    for game in response.data or []:
+        games_by_week.setdefault(game.get('week'), []).append(game)
+    return games_by_week
+
+
+def get_games_watermark(supabase, season: int) -> Optional[str]:
+    """Latest updated_at among the season's playoff games (None if there are none)."""
+    response = supabase.table('games').select('updated_at').eq('season', season).eq('season_type', 3) \
+        .order('updated_at', desc=True).limit(1).execute()
+    return response.data[0].get('updated_at') if response.data else None
+
+
+def is_week_complete(week: int, games: List[Dict[str, Any]]) -> bool:
+    return len(games) >= EXPECTED_GAMES[week] and all(g.get('winner') for g in games)
+
+
+def winners_by_conference(games: List[Dict[str, Any]], teams_by_conf: Dict[str, Dict[int, str]]) -> Dict[str, List[str]]:
+    """Group game winners by conference (same shape as get_week_winners, without another query)."""
+    conference_of = {name: conf for conf, seeds in teams_by_conf.items() for name in seeds.values()}
+    winners = {}
+    for game in games:
+        winner = game.get('winner')
+        conf = conference_of.get(winner)
+        if conf:
+            winners.setdefault(conf, []).append(winner)
+    return winners
+
+
+def build_week(week: int, teams_by_conf: Dict[str, Dict[int, str]], previous_games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Matchups for `week` from the seeds and the previous week's results."""
+    if week == 1:
+        return interactive_mode.generate_wild_card_games(teams_by_conf)
+    winners = winners_by_conference(previous_games, teams_by_conf)
+    if week == 2:
+        return interactive_mode.generate_divisional_games(teams_by_conf, winners)
+    if week == 3:
+        return interactive_mode.generate_conference_championship_games(teams_by_conf, winners)
+    champions = {conf: names[0] for conf, names in winners.items() if names}
+    return interactive_mode.generate_super_bowl_game(champions)
+
+
+def _matchups(games: List[Dict[str, Any]]) -> set:
+    return {(g['away_team'], g['home_team']) for g in games}
+
+
+def advance_rounds(supabase, season: int, write: bool = True,
+                   fetch_espn_games: Optional[Callable[[int], List[Dict[str, str]]]] = None,
+                   allow_missing_espn: bool = False) -> Dict[str, Any]:
+    """Generate the next playoff week if the current one is complete.
+
+    Returns a result dict whose 'status' is one of:
+        advanced     the next week was written (or would be, with write=False: 'dry_run')
+        waiting      the current week exists with the right matchups and is not finished
+                     (stored games of that week with other matchups and no winner, e.g. from
+                     an earlier bracket, are deleted in the same run and listed in 'removed')
+        not_ready    no playoff teams for the season
+        conflict     the next week has games with results that don't match the bracket (left untouched)
+        invalid      the generated games failed validation (see 'errors'; nothing written)
+        complete     the Super Bowl has a winner
+    fetch_espn_games(week) supplies ESPN event info for IDs/kickoffs (defaults to a strict
+    get_espn_game_ids, so an ESPN failure raises instead of writing generated IDs, unless
+    allow_missing_espn is set).
+    """
+    if fetch_espn_games is None:
+        def fetch_espn_games(week: int) -> List[Dict[str, str]]:
+            try:
+                return interactive_mode.get_espn_game_ids(season, week, strict=True)
+            except RuntimeError as e:
+                if not allow_missing_espn:
+                    raise
+                print(f"Warning: {e}; writing games with generated IDs")
+                return []
+
+    result = {'command': 'games advance', 'season': season, 'status': None, 'week': None, 'games': []}
+
+    teams_by_conf = interactive_mode.get_playoff_teams(supabase, season)
+    if len(teams_by_conf['AFC']) < 7 or len(teams_by_conf['NFC']) < 7:
+        result['status'] = 'not_ready'
+        result['message'] = f"Season {season} needs 7 playoff teams per conference (AFC {len(teams_by_conf['AFC'])}, NFC {len(teams_by_conf['NFC'])})"
+        return result
+
+    games_by_week = fetch_playoff_games(supabase, season)
+
+    for week in sorted(EXPECTED_GAMES):
+        existing = games_by_week.get(week, [])
+        if is_week_complete(week, existing):
+            continue
+
+        result['week'] = week
+        result['round'] = interactive_mode.WEEK_NAMES[week]
+        desired = build_week(week, teams_by_conf, games_by_week.get(week - 1, []))
+        if not desired:
+            result['status'] = 'not_ready'
+            result['message'] = f"Could not build {result['round']} from the stored seeds and results"
+            return result
+
+        desired_matchups = _matchups(desired)
+        stale = [g for g in existing if (g['away_team'], g['home_team']) not in desired_matchups]
+        missing = [g for g in desired if (g['away_team'], g['home_team']) not in _matchups(existing)]
+        if not missing and not stale:
+            # Round already generated; nothing to do until its results are in
+            result['status'] = 'waiting'
+            result['message'] = f"{result['round']} in progress ({sum(1 for g in existing if g.get('winner'))}/{len(existing)} final)"
+            return result
+
+        if any(g.get('winner') for g in stale):
+            result['status'] = 'conflict'
+            result['message'] = f"{result['round']} has results that don't match the generated bracket; not overwriting"
+            result['games'] = existing
+            return result
+
+        errors = interactive_mode.validate_playoff_games(supabase, season, week, desired, teams_by_conf)
+        if errors:
+            result['status'] = 'invalid'
+            result['message'] = f"{result['round']} failed validation; nothing was written"
+            result['errors'] = errors
+            return result
+
+        # Games already stored with the right matchup are left alone (their status and scores stand)
+        rows = interactive_mode.build_playoff_game_rows(season, week, missing, fetch_espn_games(week)) if missing else []
+        row_ids = {row['id'] for row in rows}
+        stale_ids = [g['id'] for g in stale if g['id'] not in row_ids]
+        result['games'] = rows
+        result['removed'] = stale_ids
+        if not write:
+            result['status'] = 'dry_run'
+            result['message'] = f"{len(rows)} {result['round']} game(s) would be written and {len(stale_ids)} stale game(s) removed; pass --yes to write them"
+            return result
+
+        # One round trip for the round's games, one more for leftovers from an earlier bracket
+        if rows:
+            supabase.table('games').upsert(rows, on_conflict='id').execute()
+        if stale_ids:
+            supabase.table('games').delete().in_('id', stale_ids).execute()
+        result['status'] = 'advanced'
+        result['message'] = f"Wrote {len(rows)} {result['round']} game(s), removed {len(stale_ids)} stale game(s)"
+        return result
+
+    result['status'] = 'complete'
+    result['message'] = f"Season {season} playoffs are complete"
+    return result
+
+
+def error_result(season: int, error: Exception) -> Dict[str, Any]:
+    """Result for an evaluation that raised (nothing was written)."""
+    if isinstance(error, RuntimeError):
+        # Strict ESPN lookup: the scoreboard could not be fetched
+        return {'command': 'games advance', 'season': season, 'status': 'error', 'reason': 'espn_unavailable',
+                'games': [], 'message': f"{error} (use --allow-missing-espn to write games with generated IDs)"}
+    return {'command': 'games advance', 'season': season, 'status': 'error', 'reason': 'evaluation_failed',
+            'games': [], 'message': f"{error.__class__.__name__}: {error}"}
+
+
+def watch(supabase, season: int, interval: float, on_result: Callable[[Dict[str, Any]], None],
+          write: bool = True, max_polls: Optional[int] = None, allow_missing_espn: bool = False) -> Dict[str, Any]:
+    """Poll the games watermark and run advance_rounds whenever it changes.
+
+    A poll that fails (ESPN or the database unavailable) is reported through on_result as
+    an error result and retried on the next poll. Returns the last result once the
+    playoffs are complete (or after max_polls polls).
+    """
+    last_watermark = object()
+    result = None
+    polls = 0
+    while True:
+        try:
+            watermark = get_games_watermark(supabase, season)
+            if watermark != last_watermark:
+                result = advance_rounds(supabase, season, write=write, allow_missing_espn=allow_missing_espn)
+                on_result(result)
+                if result['status'] == 'complete':
+                    return result
+                # Pick up our own write so it doesn't trigger another evaluation
+                last_watermark = get_games_watermark(supabase, season) if result['status'] == 'advanced' else watermark
+        except Exception as e:
+            # Leave the watermark alone so the next poll evaluates again
+            result = error_result(season, e)
+            on_result(result)
+        polls += 1
+        if max_polls is not None and polls >= max_polls:
+            return result
+        time.sleep(interval)
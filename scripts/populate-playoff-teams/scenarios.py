@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Clinch / elimination scenarios for the rest of the regular season.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py scenarios --season 2025
+
+The season's completed regular-season games are the fixed part of the standings; each
+remaining game is a win for one side (ties are ignored). With k remaining games:
+  - k <= --exact-limit: all 2^k outcomes are enumerated and seeded (seeding.py), each
+    weighted by its probability, so clinched/eliminated are exact
+  - otherwise --samples outcomes are drawn at random (Monte Carlo)
+
+Outcomes are split into chunks and seeded on a process pool; each chunk returns a
+teams x seeds array of weights that is summed as chunks complete.
+
+Before any enumeration, record bounds (every remaining game won vs every one lost) mark
+teams that have clinched a playoff spot or are eliminated whatever happens. A game
+between two eliminated teams can still move the strength of victory/schedule of anyone
+who plays them, so it is only pruned from the enumeration (and counted as a home win)
+when neither team has met or will meet a team that is still alive; then no seed depends
+on it and the results stay exact (--no-prune keeps every game).
+
+Games are 50/50 unless --ratings is given, which uses team-ratings.json (ratings.py).
+Results are cached by their inputs (result_cache.py).
+"""
+
+import os
+import sys
+import json
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the scenarios command
+    np = None
+
+import seeding
+import result_cache
+from espn_matching import EspnEventIndex
+from backfill import seeds_per_conference
+from ratings import RatingModel, DEFAULT_RATINGS_PATH, is_completed, expected_score, HOME_FIELD
+
+DEFAULT_EXACT_LIMIT = 14
+DEFAULT_SAMPLES = 20000
+DEFAULT_CHUNK_SIZE = 512
+
+# Filled in each worker process by _init_worker
+_context: Dict[str, Any] = {}
+
+
+def remaining_games(games: List[Dict[str, Any]], code) -> List[Tuple[int, int]]:
+    """(home, away) team indexes of the regular-season games not completed yet."""
+    pairs = []
+    for game in games:
+        if is_completed(game):
+            continue
+        home, away = code(game['home_team']), code(game['away_team'])
+        if home is not None and away is not None:
+            pairs.append((home, away))
+    return pairs
+
+
+def record_bounds(standings: 'seeding.Standings', remaining: List[Tuple[int, int]]) -> Tuple[Any, Any]:
+    """(lowest, highest) win percentage each team can still finish with."""
+    size = len(standings.names)
+    left = np.zeros(size, dtype=np.int32)
+    for home, away in remaining:
+        left[home] += 1
+        left[away] += 1
+    wins = standings.wins.sum(axis=1) + 0.5 * standings.ties.sum(axis=1)
+    games = standings.played.sum(axis=1) + left
+    return seeding._ratio(wins, games), seeding._ratio(wins + left, games)
+
+
+def clinch_status(standings: 'seeding.Standings', remaining: List[Tuple[int, int]],
+                  seed_count: int) -> Tuple[Any, Any]:
+    """(clinched, eliminated) boolean arrays that hold in every remaining outcome.
+
+    Eliminated: some division rival is guaranteed a better record and at least seed_count
+    conference teams are too (at most four of them can be division champions, so the
+    better teams fill every wild card). Clinched: every division rival is guaranteed a
+    worse record, or fewer teams than there are wild cards could finish level or ahead.
+    """
+    lowest, highest = record_bounds(standings, remaining)
+    better = lowest[None, :] > highest[:, None]       # better[t, o]: o finishes ahead of t whatever happens
+    could_match = highest[None, :] >= lowest[:, None]  # could_match[t, o]: o could finish level or ahead
+    np.fill_diagonal(could_match, False)
+
+    rivals = standings.same_division.copy()
+    np.fill_diagonal(rivals, False)
+    wild_cards = seed_count - 4
+    eliminated = (better & rivals).any(axis=1) & ((better & standings.same_conference).sum(axis=1) >= seed_count)
+    clinched = ~(could_match & rivals).any(axis=1) | \
+        ((could_match & standings.same_conference).sum(axis=1) < wild_cards)
+    return clinched, eliminated
+
+
+def prunable_games(standings: 'seeding.Standings', remaining: List[Tuple[int, int]],
+                   eliminated) -> List[Tuple[int, int]]:
+    """Remaining games whose result cannot change any seed.
+
+    Both teams must be eliminated, and neither may be an opponent (played or still to
+    play) of a team that is alive, whose strength of victory/schedule would move with it.
+    """
+    opponents = standings.played > 0
+    for home, away in remaining:
+        opponents[home, away] = opponents[away, home] = True
+    faces_contender = opponents[~eliminated].any(axis=0)
+    free = eliminated & ~faces_contender
+    return [(h, a) for h, a in remaining if free[h] and free[a]]
+
+
+def _init_worker(context: Dict[str, Any]) -> None:
+    _context.clear()
+    _context.update(context)
+
+
+def _seed_outcomes(home_wins, weights) -> Tuple[Any, Any]:
+    """(weights, outcomes): teams x (seed_count + 1) arrays; column s > 0 is seed s, column 0 missed the playoffs."""
+    ctx = _context
+    teams, seed_count = ctx['nfl_teams'], ctx['seed_count']
+    counts = np.zeros((len(teams), seed_count + 1), dtype=np.float64)
+    hits = np.zeros((len(teams), seed_count + 1), dtype=np.int64)
+    home, away = ctx['home'], ctx['away']
+    for outcome, weight in zip(home_wins, weights):
+        wins = ctx['wins'].copy()
+        np.add.at(wins, (np.where(outcome, home, away), np.where(outcome, away, home)), 1)
+        standings = seeding.Standings(teams, wins, ctx['ties'], ctx['points_for'])
+        seeded = np.zeros(len(teams), dtype=np.int64)
+        for conference in seeding.CONFERENCES:
+            for seed, team in enumerate(standings.seeds(conference, seed_count), start=1):
+                seeded[team] = seed
+        counts[np.arange(len(teams)), seeded] += weight
+        hits[np.arange(len(teams)), seeded] += 1
+    return counts, hits
+
+
+def _exact_chunk(start: int, stop: int) -> Tuple[Any, Any]:
+    """Outcomes start..stop-1, game i won by the home team when bit i is set."""
+    ctx = _context
+    indexes = np.arange(start, stop, dtype=np.int64)
+    home_wins = ((indexes[:, None] >> np.arange(len(ctx['home']))) & 1).astype(bool)
+    p = ctx['home_probability']
+    weights = np.where(home_wins, p, 1 - p).prod(axis=1)
+    return _seed_outcomes(home_wins, weights)
+
+
+def _sample_chunk(count: int, seed_sequence) -> Tuple[Any, Any]:
+    """`count` random outcomes from an independent random stream."""
+    rng = np.random.default_rng(seed_sequence)
+    home_wins = rng.random((count, len(_context['home']))) < _context['home_probability']
+    return _seed_outcomes(home_wins, np.ones(count))
+
+
+def run_scenarios(games: List[Dict[str, Any]], nfl_teams: List[Dict[str, str]], season: int,
+                  exact_limit: int = DEFAULT_EXACT_LIMIT, samples: int = DEFAULT_SAMPLES,
+                  workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  home_probability=None, prune: bool = True, random_seed: Optional[int] = None) -> Dict[str, Any]:
+    """Seed probabilities and clinch/elimination status for every team.
+
+    home_probability(home, away) gives the chance the home team wins a remaining game
+    (team indexes; 0.5 when None).
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for scenarios (pip install numpy)")
+    seed_count = seeds_per_conference(season)
+    wins, ties, points_for = seeding.result_matrices(nfl_teams, games)
+    current = seeding.Standings(nfl_teams, wins, ties, points_for)
+    remaining = remaining_games(games, seeding.team_codes(nfl_teams))
+    clinched, eliminated = clinch_status(current, remaining, seed_count)
+
+    pruned = []
+    if prune:
+        pruned = prunable_games(current, remaining, eliminated)
+        remaining = [game for game in remaining if game not in pruned]
+        wins = wins.copy()
+        for home, away in pruned:
+            wins[home, away] += 1
+
+    home = np.array([h for h, _ in remaining], dtype=np.int64)
+    away = np.array([a for _, a in remaining], dtype=np.int64)
+    probability = np.array([home_probability(h, a) if home_probability else 0.5 for h, a in remaining])
+    exact = len(remaining) <= exact_limit
+    context = {'nfl_teams': nfl_teams, 'seed_count': seed_count, 'wins': wins, 'ties': ties,
+               'points_for': points_for, 'home': home, 'away': away, 'home_probability': probability}
+
+    if exact:
+        total = 1 << len(remaining)
+        tasks = [(_exact_chunk, (start, min(start + chunk_size, total))) for start in range(0, total, chunk_size)]
+    else:
+        streams = np.random.SeedSequence(random_seed).spawn((samples + chunk_size - 1) // chunk_size)
+        tasks = [(_sample_chunk, (min(chunk_size, samples - i * chunk_size), stream)) for i, stream in enumerate(streams)]
+
+    counts = np.zeros((len(nfl_teams), seed_count + 1), dtype=np.float64)
+    hits = np.zeros((len(nfl_teams), seed_count + 1), dtype=np.int64)
+    print(f"🎲 {len(remaining)} remaining game(s)"
+          f"{f' ({len(pruned)} pruned)' if pruned else ''}: "
+          f"{'enumerating all ' + str(1 << len(remaining)) if exact else 'sampling ' + str(samples)} outcomes "
+          f"in {len(tasks)} chunk(s)")
+    if len(tasks) == 1:
+        _init_worker(context)
+        chunk_counts, chunk_hits = tasks[0][0](*tasks[0][1])
+        counts += chunk_counts
+        hits += chunk_hits
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,)) as pool:
+            futures = [pool.submit(func, *task_args) for func, task_args in tasks]
+            for future in as_completed(futures):
+                chunk_counts, chunk_hits = future.result()
+                counts += chunk_counts
+                hits += chunk_hits
+
+    if not exact:
+        # Integer counts sum the same in any completion order, so a --random-seed run is repeatable
+        counts = hits / samples
+    if exact:
+        # Every outcome was seeded, so what held in all of them is proven
+        clinched |= hits[:, 0] == 0
+        eliminated |= hits[:, 1:].sum(axis=1) == 0
+
+    lowest, highest = record_bounds(current, remaining + pruned)
+    teams = []
+    for index, team in enumerate(nfl_teams):
+        seed_probability = counts[index, 1:]
+        status = 'eliminated' if eliminated[index] else 'clinched' if clinched[index] else 'alive'
+        if exact and status == 'clinched' and hits[index, 1:].max() == hits[index].sum():
+            status = f"clinched #{int(hits[index, 1:].argmax()) + 1}"
+        teams.append({
+            'team_name': team['name'], 'team_abbreviation': team['abbreviation'],
+            'conference': team['conference'], 'division': team['division'],
+            'wins': int(current.wins[index].sum()), 'losses': int(current.wins[:, index].sum()),
+            'ties': int(current.ties[index].sum()),
+            'status': status,
+            'playoff_probability': round(float(1 - counts[index, 0]), 4),
+            'seed_probability': {str(seed): round(float(p), 4) for seed, p in enumerate(seed_probability, start=1) if p > 0},
+            'best_pct': round(float(highest[index]), 3), 'worst_pct': round(float(lowest[index]), 3),
+        })
+    return {'season': season, 'method': 'exact' if exact else 'monte_carlo',
+            'remaining_games': len(remaining) + len(pruned), 'pruned_games': len(pruned),
+            'outcomes': (1 << len(remaining)) if exact else samples, 'teams': teams}
+
+
+def print_scenarios(result: Dict[str, Any]) -> None:
+    method = 'exact' if result['method'] == 'exact' else f"Monte Carlo, {result['outcomes']} samples"
+    print(f"\n{result['season']} playoff scenarios ({result['remaining_games']} games left, {method})")
+    seed_count = max((int(s) for t in result['teams'] for s in t['seed_probability']), default=7)
+    for conference in seeding.CONFERENCES:
+        teams = sorted((t for t in result['teams'] if t['conference'] == conference),
+                       key=lambda t: -t['playoff_probability'])
+        print(f"\n{conference}            W-L-T   Status        Playoffs" + ''.join(f"{f'#{s}':>7}" for s in range(1, seed_count + 1)))
+        for t in teams:
+            record = f"{t['wins']}-{t['losses']}-{t['ties']}"
+            cells = ''.join(f"{100 * t['seed_probability'].get(str(s), 0):6.1f}%" for s in range(1, seed_count + 1))
+            print(f"  {t['team_abbreviation']:<5} {record:>10}   {t['status']:<12} {100 * t['playoff_probability']:7.1f}%{cells}")
+
+
+def add_scenarios_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `scenarios` command on the main CLI parser."""
+    parser = subparsers.add_parser('scenarios', parents=common_parents or [],
+                                   help='Clinch/elimination status and seed probabilities from the remaining schedule')
+    parser.add_argument('--season', type=int, required=True, help='Season (e.g. 2025)')
+    parser.add_argument('--exact-limit', type=int, default=DEFAULT_EXACT_LIMIT,
+                        help=f'Enumerate every outcome up to this many remaining games (default: {DEFAULT_EXACT_LIMIT})')
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES,
+                        help=f'Monte Carlo samples above the exact limit (default: {DEFAULT_SAMPLES})')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Outcomes per task sent to a worker (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--ratings', nargs='?', const=DEFAULT_RATINGS_PATH, default=None, metavar='RATINGS_FILE',
+                        help='Weight outcomes by team ratings (default file: team-ratings.json) instead of 50/50')
+    parser.add_argument('--no-prune', action='store_true',
+                        help='Also enumerate games between eliminated teams that no contender plays')
+    parser.add_argument('--random-seed', type=int, help='Seed for Monte Carlo sampling (repeatable results)')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompute, and do not store the result')
+    parser.add_argument('--cache-dir', default=result_cache.DEFAULT_CACHE_DIR,
+                        help='Result cache directory (default: result-cache/ next to this script)')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON document to stdout')
+    return parser
+
+
+def run_scenarios_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Run `scenarios`; returns the process exit code."""
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        try:
+            response = supabase.table('games') \
+                .select('home_team, away_team, home_score, away_score, status, winner') \
+                .eq('season', args.season).eq('season_type', 2).execute()
+            games = response.data or []
+            if not games:
+                print(f"❌ No {args.season} regular-season games in the database")
+                return 1
+
+            home_probability = None
+            ratings = {}
+            if args.ratings:
+                if not os.path.exists(args.ratings):
+                    print(f"❌ Ratings file not found: {args.ratings} (run `ratings update` first)")
+                    return 1
+                model = RatingModel(args.ratings, canonical=EspnEventIndex([], nfl_teams).canonical)
+                ratings = model.ratings_for(args.season)
+                values = np.array([ratings.get(t['abbreviation'], 1500.0) for t in nfl_teams])
+                home_probability = lambda h, a: float(expected_score(values[h] - values[a] + HOME_FIELD))
+
+            # The database's results and the ratings; a change makes the season's cached scenarios stale
+            inputs = result_cache.canonical_hash({
+                'command': 'scenarios', 'season': args.season,
+                'games': sorted(([g['home_team'], g['away_team'], g['home_score'], g['away_score']] if is_completed(g)
+                                 else [g['home_team'], g['away_team'], -1, -1]) for g in games),
+                'ratings': {team: round(r, 3) for team, r in ratings.items()},
+            })
+            key = result_cache.canonical_hash({'inputs': inputs, 'exact_limit': args.exact_limit, 'samples': args.samples,
+                                               'chunk_size': args.chunk_size,
+                                               'prune': None if args.no_prune else 'no_contender_opponents',
+                                               'random_seed': args.random_seed})
+            cache = None if args.no_cache else result_cache.ResultCache(args.cache_dir)
+            result = cache.get(key) if cache else None
+            if result is None:
+                result = run_scenarios(games, nfl_teams, args.season, exact_limit=args.exact_limit,
+                                       samples=args.samples, workers=args.workers, chunk_size=args.chunk_size,
+                                       home_probability=home_probability, prune=not args.no_prune,
+                                       random_seed=args.random_seed)
+                if cache:
+                    cache.put(key, result, scope=f"scenarios:{args.season}", inputs=inputs)
+            else:
+                print("⚡ Scenarios from cache")
+        except Exception as e:
+            print(f"❌ Error computing scenarios: {e}")
+            return 1
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print_scenarios(result)
+    return 0
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Project playoff seeds from regular-season results in the games table.
+
+No network: completed regular-season games are turned into 32x32 matrices (wins[i, j]
+is how often team i beat team j, ties[i, j] their ties, points_for[i, j] the points i
+scored against j) so each tiebreak step is an array reduction over a group of teams.
+
+Seeding follows the NFL procedure:
+  1. Division champions: best record in each division, ties broken by head-to-head,
+     division record, common games, conference record, strength of victory, strength
+     of schedule and net points.
+  2. Division champions are seeded 1-4 by record, then the wild cards (5-7, or 5-6
+     before 2020) are the best remaining teams; ties use head-to-head (only a sweep
+     counts for three or more teams), conference record, common games (minimum four),
+     strength of victory, strength of schedule and net points. Before comparing wild
+     card candidates, only the highest-ranked team of each division stays in the tie.
+
+With three or more tied teams, as soon as a step separates the best team(s) the steps
+start over for the teams still tied. A tie nothing separates goes to the team first in
+alphabetical order, standing in for the coin toss.
+
+Usage:
+    teams = seeding.fetch_projected_seeds(supabase, 2025, populate_playoff_teams.NFL_TEAMS)
+    standings = seeding.Standings(nfl_teams, *seeding.result_matrices(nfl_teams, games))
+"""
+
+from typing import List, Dict, Optional, Any, Callable, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the projection
+    np = None
+
+from backfill import seeds_per_conference
+from espn_matching import EspnEventIndex
+from ratings import is_completed
+
+CONFERENCES = ['AFC', 'NFC']
+MIN_COMMON_GAMES = 4
+
+
+def team_codes(nfl_teams: List[Dict[str, str]]) -> Callable[[str], Optional[int]]:
+    """Index into nfl_teams for a team name (None for TBD/unknown teams)."""
+    codes = {t['abbreviation']: i for i, t in enumerate(nfl_teams)}
+    canonical = EspnEventIndex([], nfl_teams).canonical
+    return lambda name: codes.get(canonical(name))
+
+
+def result_matrices(nfl_teams: List[Dict[str, str]], games: List[Dict[str, Any]]) -> Tuple[Any, Any, Any]:
+    """(wins, ties, points_for) matrices from the completed games."""
+    if np is None:
+        raise RuntimeError("numpy is required for seed projection (pip install numpy)")
+    code = team_codes(nfl_teams)
+    size = len(nfl_teams)
+    wins = np.zeros((size, size), dtype=np.int32)
+    ties = np.zeros((size, size), dtype=np.int32)
+    points_for = np.zeros((size, size), dtype=np.int32)
+    for game in games:
+        if not is_completed(game):
+            continue
+        home, away = code(game['home_team']), code(game['away_team'])
+        if home is None or away is None:
+            continue
+        home_score, away_score = game['home_score'], game['away_score']
+        if home_score > away_score:
+            wins[home, away] += 1
+        elif away_score > home_score:
+            wins[away, home] += 1
+        else:
+            ties[home, away] += 1
+            ties[away, home] += 1
+        points_for[home, away] += home_score
+        points_for[away, home] += away_score
+    return wins, ties, points_for
+
+
+class Standings:
+    """Standings and tiebreakers from win/tie/points matrices (see result_matrices)."""
+
+    def __init__(self, nfl_teams: List[Dict[str, str]], wins, ties, points_for):
+        self.teams = nfl_teams
+        self.names = [t['abbreviation'] for t in nfl_teams]
+        size = len(nfl_teams)
+        self.wins = wins
+        self.ties = ties
+        self.points_for = points_for
+
+        self.played = self.wins + self.wins.T + self.ties
+        conference = np.array([t['conference'] for t in nfl_teams])
+        division = np.array([t['division'] for t in nfl_teams])
+        self.same_conference = conference[:, None] == conference[None, :]
+        self.same_division = division[:, None] == division[None, :]
+        self.conference = conference
+        self.division = division
+
+        all_teams = np.ones((size, size), dtype=bool)
+        self.pct = self.pct_against(np.arange(size), all_teams)
+        # Combined win percentage of the teams played (or beaten), counted once per game
+        self.strength_of_schedule = _ratio(self.played @ self.pct, self.played.sum(axis=1))
+        self.strength_of_victory = _ratio(self.wins @ self.pct, self.wins.sum(axis=1))
+        self.net_points = self.points_for.sum(axis=1) - self.points_for.sum(axis=0)
+
+    def pct_against(self, group, opponents) -> Any:
+        """Win percentage (ties count half) of each team in group against opponents (a mask per row)."""
+        wins = (self.wins[group] * opponents).sum(axis=1)
+        ties = (self.ties[group] * opponents).sum(axis=1)
+        played = (self.played[group] * opponents).sum(axis=1)
+        return _ratio(wins + 0.5 * ties, played)
+
+    # --- tiebreak steps: each returns a score per team in group (higher is better) or None ---
+
+    def head_to_head(self, group, sweep_only: bool = False) -> Optional[Any]:
+        among = np.zeros(len(self.names), dtype=bool)
+        among[group] = True
+        mask = np.broadcast_to(among, (len(group), len(among))).copy()
+        mask[np.arange(len(group)), group] = False
+        if not sweep_only or len(group) == 2:
+            if (self.played[np.ix_(group, group)].sum(axis=1) == 0).any():
+                return None
+            return self.pct_against(group, mask)
+        # Three or more wild card teams: only a team that beat (or lost to) all the others is separated
+        sub_wins = self.wins[np.ix_(group, group)]
+        others = len(group) - 1
+        swept = ((sub_wins > 0).sum(axis=1) == others) & ((sub_wins.T > 0).sum(axis=1) == 0)
+        was_swept = ((sub_wins.T > 0).sum(axis=1) == others) & ((sub_wins > 0).sum(axis=1) == 0)
+        return swept.astype(float) - was_swept.astype(float)
+
+    def division_record(self, group) -> Any:
+        return self.pct_against(group, self.same_division[group])
+
+    def conference_record(self, group) -> Any:
+        return self.pct_against(group, self.same_conference[group])
+
+    def common_games(self, group, minimum: int = 0) -> Optional[Any]:
+        common = (self.played[group] > 0).all(axis=0)
+        common[group] = False
+        mask = np.broadcast_to(common, (len(group), len(common)))
+        if (self.played[group] * mask).sum(axis=1).min() < max(minimum, 1):
+            return None
+        return self.pct_against(group, mask)
+
+    # --- ranking ---
+
+    def _steps(self, kind: str) -> List[Callable]:
+        if kind == 'division':
+            return [self.head_to_head, self.division_record, self.common_games, self.conference_record,
+                    lambda g: self.strength_of_victory[g], lambda g: self.strength_of_schedule[g],
+                    lambda g: self.net_points[g]]
+        return [lambda g: self.head_to_head(g, sweep_only=True), self.conference_record,
+                lambda g: self.common_games(g, MIN_COMMON_GAMES),
+                lambda g: self.strength_of_victory[g], lambda g: self.strength_of_schedule[g],
+                lambda g: self.net_points[g]]
+
+    def _break_tie(self, group: List[int], kind: str) -> int:
+        """The team that wins a tie among teams with the same record."""
+        group = sorted(group, key=lambda i: self.names[i])
+        while len(group) > 1:
+            for step in self._steps(kind):
+                scores = step(np.array(group))
+                if scores is None:
+                    continue
+                scores = np.asarray(scores, dtype=float)
+                best = np.isclose(scores, scores.max())
+                if not best.all():
+                    group = [team for team, keep in zip(group, best) if keep]
+                    break
+            else:
+                # Coin toss stand-in
+                return group[0]
+        return group[0]
+
+    def rank(self, teams: List[int], kind: str, limit: Optional[int] = None) -> List[int]:
+        """Teams in order of record, ties broken by the division or wild card steps (the first `limit`)."""
+        remaining = list(teams)
+        ranked = []
+        while remaining and (limit is None or len(ranked) < limit):
+            pcts = self.pct[remaining]
+            # Each percentage is a single division, so equal records compare exactly equal
+            tied = [remaining[i] for i in np.flatnonzero(pcts == pcts.max())]
+            if kind == 'wildcard' and len(tied) > 1:
+                # Only the best team of each division stays in a wild card tie
+                tied = [self.rank([t for t in tied if self.division[t] == division], 'division', limit=1)[0]
+                        for division in sorted({self.division[t] for t in tied})]
+            best = self._break_tie(tied, kind) if len(tied) > 1 else tied[0]
+            ranked.append(best)
+            remaining.remove(best)
+        return ranked
+
+    def seeds(self, conference: str, seed_count: int = 7) -> List[int]:
+        """Team indexes holding seeds 1..seed_count in a conference."""
+        in_conference = [i for i in range(len(self.names)) if self.conference[i] == conference]
+        divisions = sorted({self.division[i] for i in in_conference})
+        champions = [self.rank([i for i in in_conference if self.division[i] == d], 'division', limit=1)[0]
+                     for d in divisions]
+        wild_cards = self.rank([i for i in in_conference if i not in champions], 'wildcard',
+                               limit=seed_count - len(champions))
+        return self.rank(champions, 'wildcard') + wild_cards
+
+
+def _ratio(numerator, denominator) -> Any:
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+def project_seeds(games: List[Dict[str, Any]], nfl_teams: List[Dict[str, str]], season: int) -> List[Dict[str, any]]:
+    """Playoff team dicts (team_name, team_abbreviation, conference, seed) from regular-season games."""
+    standings = Standings(nfl_teams, *result_matrices(nfl_teams, games))
+    teams = []
+    for conference in CONFERENCES:
+        for seed, index in enumerate(standings.seeds(conference, seeds_per_conference(season)), start=1):
+            team = nfl_teams[index]
+            teams.append({'team_name': team['name'], 'team_abbreviation': team['abbreviation'],
+                          'conference': conference, 'seed': seed})
+    return teams
+
+
+def fetch_projected_seeds(supabase, season: int, nfl_teams: List[Dict[str, str]]) -> List[Dict[str, any]]:
+    """Seeds projected from the season's completed regular-season games (empty list on failure)."""
+    try:
+        response = supabase.table('games') \
+            .select('home_team, away_team, home_score, away_score, status, winner') \
+            .eq('season', season).eq('season_type', 2).execute()
+        games = response.data or []
+        if not any(is_completed(g) for g in games):
+            print(f"⚠️  No completed {season} regular-season games in the database")
+            return []
+        return project_seeds(games, nfl_teams, season)
+    except Exception as e:
+        print(f"Error projecting seeds from games: {e}")
+        return []
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""Monte Carlo playoff simulation for a season's seeded field.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py simulate --season 2025 --runs 1000000
+
+Each run plays the bracket with the rules of generate_wild_card_games and the later
+round generators: 2v7, 3v6, 4v5 (3v6, 4v5 with two byes before 2020), then the
+remaining seeds re-seeded so the best plays the worst, the better seed hosting; the
+Super Bowl is neutral. A shard simulates a block of runs at once as NumPy arrays.
+
+Runs are split into fixed-size shards, each with its own RNG stream spawned from one
+SeedSequence, so a --random-seed gives the same result with any number of workers.
+Shards run on a process pool; each writes its per-team round counts into its own row
+of a shared-memory array, so no result arrays are pickled back to the parent.
+
+Game probabilities come from team ratings (ratings.py) with --ratings, otherwise every
+game is a coin flip. Playoff games already decided in the games table (and what-ifs
+given with --assume BUF>KC) are fixed before simulating. Results are cached by their
+inputs (result_cache.py), so a repeated request is answered without simulating.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory, resource_tracker
+from typing import List, Dict, Optional, Any, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the simulate command
+    np = None
+
+import result_cache
+from espn_matching import EspnEventIndex
+from ratings import RatingModel, DEFAULT_RATINGS_PATH, HOME_FIELD
+
+DEFAULT_RUNS = 1_000_000
+SHARD_RUNS = 50_000
+
+# Round a team reached; counts[team, r] is the number of runs in which it got there
+ROUNDS = ['Playoffs', 'Divisional', 'Conference', 'Super Bowl', 'Champion']
+CONFERENCES = ['AFC', 'NFC']
+
+# Filled in each worker process by _init_worker
+_context: Dict[str, Any] = {}
+
+
+def simulate_bracket(rng, runs: int, home_matrix, neutral_matrix, seed_count: int) -> Any:
+    """Round counts (teams x ROUNDS) for `runs` brackets.
+
+    Teams are indexed conference by conference in seed order (AFC 1..seed_count, then NFC);
+    home_matrix[i, j] is the chance i beats j at home, neutral_matrix the same on a neutral field.
+    """
+    teams = 2 * seed_count
+    counts = np.zeros((teams, len(ROUNDS)), dtype=np.int64)
+    counts[:, 0] = runs
+    byes = 1 if seed_count == 7 else 2
+    champions = []
+    for conference in range(2):
+        base = conference * seed_count
+        # Wild card: best non-bye seed hosts the worst, and so on inwards
+        wild_card_home = np.arange(byes, byes + (seed_count - byes) // 2)
+        wild_card_away = seed_count - 1 - (wild_card_home - byes)
+        p = home_matrix[base + wild_card_home, base + wild_card_away]
+        winners = np.where(rng.random((runs, len(p))) < p, wild_card_home, wild_card_away)
+
+        # Divisional: re-seed, best remaining hosts the worst
+        alive = np.concatenate([np.broadcast_to(np.arange(byes), (runs, byes)), winners], axis=1)
+        alive.sort(axis=1)
+        home, away = alive[:, [0, 1]], alive[:, [3, 2]]
+        p = home_matrix[base + home, base + away]
+        finalists = np.where(rng.random((runs, 2)) < p, home, away)
+        finalists.sort(axis=1)
+
+        p = home_matrix[base + finalists[:, 0], base + finalists[:, 1]]
+        champion = np.where(rng.random(runs) < p, finalists[:, 0], finalists[:, 1]) + base
+        champions.append(champion)
+
+        counts[:, 1] += np.bincount((base + alive).ravel(), minlength=teams)
+        counts[:, 2] += np.bincount((base + finalists).ravel(), minlength=teams)
+        counts[:, 3] += np.bincount(champion, minlength=teams)
+
+    # Super Bowl: NFC champion listed as home, as in generate_super_bowl_game
+    afc, nfc = champions
+    winner = np.where(rng.random(runs) < neutral_matrix[nfc, afc], nfc, afc)
+    counts[:, 4] += np.bincount(winner, minlength=teams)
+    return counts
+
+
+def _init_worker(context: Dict[str, Any]) -> None:
+    # The parent owns the block and unlinks it; keep this process's resource tracker out of it
+    try:
+        shm = shared_memory.SharedMemory(name=context['shm_name'], track=False)
+    except TypeError:
+        # Python < 3.13: forked workers share the parent's tracker, others register their own
+        shm = shared_memory.SharedMemory(name=context['shm_name'])
+        if multiprocessing.get_start_method() != 'fork':
+            resource_tracker.unregister(shm._name, 'shared_memory')
+    _context.clear()
+    _context.update(context)
+    _context['shm'] = shm
+    _context['counts'] = np.ndarray(context['shape'], dtype=np.int64, buffer=shm.buf)
+
+
+def _run_shard(shard: int, runs: int, seed_sequence) -> int:
+    """Simulate one shard into its row of the shared counts; returns the shard index."""
+    rng = np.random.default_rng(seed_sequence)
+    _context['counts'][shard] = simulate_bracket(rng, runs, _context['home_matrix'], _context['neutral_matrix'],
+                                                 _context['seed_count'])
+    return shard
+
+
+def run_simulation(home_matrix, neutral_matrix, seed_count: int, runs: int = DEFAULT_RUNS,
+                   workers: Optional[int] = None, random_seed: Optional[int] = None) -> Tuple[Any, int]:
+    """(round counts teams x ROUNDS summed over every shard, the SeedSequence entropy used)."""
+    if np is None:
+        raise RuntimeError("numpy is required for the simulation (pip install numpy)")
+    seed_sequence = np.random.SeedSequence(random_seed)
+    shard_runs = [min(SHARD_RUNS, runs - start) for start in range(0, runs, SHARD_RUNS)]
+    streams = seed_sequence.spawn(len(shard_runs))
+    shape = (len(shard_runs), 2 * seed_count, len(ROUNDS))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+    try:
+        counts = np.ndarray(shape, dtype=np.int64, buffer=shm.buf)
+        counts[:] = 0
+        context = {'shm_name': shm.name, 'shape': shape, 'seed_count': seed_count,
+                   'home_matrix': home_matrix, 'neutral_matrix': neutral_matrix}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,)) as pool:
+            futures = [pool.submit(_run_shard, shard, shard_runs[shard], streams[shard])
+                       for shard in range(len(shard_runs))]
+            wait(futures)
+            for future in futures:
+                future.result()
+        totals = counts.sum(axis=0)
+        del counts
+    finally:
+        shm.close()
+        shm.unlink()
+    return totals, seed_sequence.entropy
+
+
+def probability_matrices(field: List[Dict[str, Any]], season: int, nfl_teams: List[Dict[str, str]],
+                         ratings_path: Optional[str] = None) -> Tuple[Any, Any]:
+    """(home, neutral) win probability matrices for the field (coin flips without ratings)."""
+    if not ratings_path:
+        coin = np.full((len(field), len(field)), 0.5)
+        return coin, coin.copy()
+    model = RatingModel(ratings_path, canonical=EspnEventIndex([], nfl_teams).canonical)
+    names = [t['team_name'] for t in field]
+    return (model.win_probability_matrix(names, season, home_field=HOME_FIELD),
+            model.win_probability_matrix(names, season, home_field=0.0))
+
+
+def known_results(supabase, season: int) -> List[Tuple[str, str]]:
+    """(winner, loser) of the season's decided playoff games."""
+    response = supabase.table('games').select('home_team, away_team, winner') \
+        .eq('season', season).eq('season_type', 3).execute()
+    results = []
+    for game in response.data or []:
+        winner = game.get('winner')
+        if winner and winner in (game['home_team'], game['away_team']):
+            results.append((winner, game['away_team'] if winner == game['home_team'] else game['home_team']))
+    return results
+
+
+def parse_assumption(value: str, field: List[Dict[str, Any]], nfl_teams: List[Dict[str, str]]) -> Tuple[str, str]:
+    """(winner, loser) team names from 'BUF>KC' (abbreviations or full names); ValueError if unknown."""
+    if '>' not in value:
+        raise ValueError(f"--assume {value}: expected WINNER>LOSER, e.g. BUF>KC")
+    canonical = EspnEventIndex([], nfl_teams).canonical
+    by_team = {canonical(t['team_name']) or t['team_name']: t['team_name'] for t in field}
+    names = []
+    for token in value.split('>', 1):
+        token = token.strip()
+        team = canonical(name=token, abbreviation=token)
+        if team not in by_team:
+            raise ValueError(f"--assume {value}: {token} is not in the playoff field")
+        names.append(by_team[team])
+    return names[0], names[1]
+
+
+def apply_results(field: List[Dict[str, Any]], matrices: Tuple[Any, ...],
+                  results: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Force decided games in the matrices (in place); returns the results that involve the field.
+
+    Two teams meet at most once in a postseason, so fixing their pairing's probability
+    to 1/0 fixes that game wherever the bracket puts it.
+    """
+    index = {t['team_name']: i for i, t in enumerate(field)}
+    applied = []
+    for winner, loser in results:
+        if winner in index and loser in index:
+            for matrix in matrices:
+                matrix[index[winner], index[loser]] = 1.0
+                matrix[index[loser], index[winner]] = 0.0
+            applied.append((winner, loser))
+    return applied
+
+
+def get_seeded_field(supabase, season: int) -> Tuple[List[Dict[str, Any]], int]:
+    """(playoff teams in AFC-then-NFC seed order, seeds per conference); ValueError if incomplete."""
+    response = supabase.table('playoff_teams').select('team_name, conference, seed').eq('season', season).execute()
+    teams = response.data or []
+    field = []
+    seed_count = None
+    for conference in CONFERENCES:
+        conference_teams = sorted((t for t in teams if (t.get('conference') or '').upper() == conference),
+                                  key=lambda t: t.get('seed') or 0)
+        seeds = [t.get('seed') for t in conference_teams]
+        if seeds not in (list(range(1, 7)), list(range(1, 8))):
+            raise ValueError(f"{season} {conference} seeds are {seeds}; expected 1-7 (1-6 before 2020)")
+        if seed_count and len(seeds) != seed_count:
+            raise ValueError(f"{season} conferences have different numbers of seeds")
+        seed_count = len(seeds)
+        field.extend(conference_teams)
+    return field, seed_count
+
+
+def print_simulation(field: List[Dict[str, Any]], result: Dict[str, Any]) -> None:
+    runs = result['runs']
+    timing = 'from cache' if result.get('cached') else \
+        f"in {result['elapsed']:.2f}s ({runs / max(result['elapsed'], 1e-9):,.0f}/s)"
+    print(f"\n{runs:,} simulated postseasons {timing}")
+    for winner, loser in result['known_results']:
+        print(f"  ✔ {winner} beat {loser}")
+    print(f"{'':34}" + ''.join(f"{name:>12}" for name in ROUNDS[1:]))
+    for team, row in zip(field, result['counts']):
+        cells = ''.join(f"{100.0 * count / runs:>11.1f}%" for count in row[1:])
+        print(f"  {team['conference']} #{team['seed']} {team['team_name']:<25}{cells}")
+
+
+def add_simulate_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `simulate` command on the main CLI parser."""
+    parser = subparsers.add_parser('simulate', parents=common_parents or [],
+                                   help="Simulate the postseason for a season's seeded playoff teams")
+    parser.add_argument('--season', type=int, required=True, help='Season (e.g. 2025)')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help=f'Postseasons to simulate (default: {DEFAULT_RUNS:,})')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--random-seed', type=int, help='Seed for repeatable results (any --workers)')
+    parser.add_argument('--ratings', nargs='?', const=DEFAULT_RATINGS_PATH, default=None, metavar='RATINGS_FILE',
+                        help='Win probabilities from team ratings (default file: team-ratings.json) instead of coin flips')
+    parser.add_argument('--assume', action='append', default=[], metavar='WINNER>LOSER',
+                        help='What-if: treat a game as decided, e.g. --assume BUF>KC (repeatable)')
+    parser.add_argument('--no-cache', action='store_true', help='Always simulate, and do not store the result')
+    parser.add_argument('--cache-dir', default=result_cache.DEFAULT_CACHE_DIR,
+                        help='Result cache directory (default: result-cache/ next to this script)')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON document to stdout')
+    return parser
+
+
+def simulate_season(supabase, season: int, nfl_teams: List[Dict[str, str]], runs: int = DEFAULT_RUNS,
+                    workers: Optional[int] = None, random_seed: Optional[int] = None,
+                    ratings_path: Optional[str] = None, assume: Optional[List[str]] = None,
+                    cache: Optional['result_cache.ResultCache'] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """(field, result) for a season, conditioned on decided playoff games and what-ifs like 'BUF>KC'.
+
+    With a cache, a result computed from the same seeds, decided games, probabilities, run
+    count and random seed is reused (result['cached'] is True).
+    """
+    field, seed_count = get_seeded_field(supabase, season)
+    assumptions = [parse_assumption(value, field, nfl_teams) for value in assume or []]
+    home_matrix, neutral_matrix = probability_matrices(field, season, nfl_teams, ratings_path)
+    model_version = result_cache.canonical_hash([np.round(home_matrix, 9).tolist(), np.round(neutral_matrix, 9).tolist()])
+    decided = apply_results(field, (home_matrix, neutral_matrix), known_results(supabase, season))
+    what_ifs = apply_results(field, (home_matrix, neutral_matrix), assumptions)
+
+    # What the database says; a change here makes the season's cached results stale
+    inputs = result_cache.canonical_hash({
+        'command': 'simulate', 'season': season,
+        'seeds': [[t['conference'], t['seed'], t['team_name']] for t in field],
+        'winners': sorted(decided), 'model': model_version,
+    })
+    key = result_cache.canonical_hash({'inputs': inputs, 'what_ifs': sorted(what_ifs), 'runs': runs,
+                                       'random_seed': random_seed})
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return field, dict(cached, cached=True)
+
+    start = time.perf_counter()
+    totals, entropy = run_simulation(home_matrix, neutral_matrix, seed_count, runs=runs,
+                                     workers=workers, random_seed=random_seed)
+    result = {'season': season, 'runs': runs, 'random_seed': int(entropy), 'elapsed': time.perf_counter() - start,
+              'known_results': [list(r) for r in decided + what_ifs], 'counts': totals.tolist()}
+    if cache is not None:
+        cache.put(key, result, scope=f"simulate:{season}", inputs=inputs)
+    return field, dict(result, cached=False)
+
+
+def run_simulate_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Run `simulate`; returns the process exit code."""
+    if np is None:
+        print("❌ numpy is required for the simulation (pip install numpy)", file=sys.stderr)
+        return 1
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        if args.ratings and not os.path.exists(args.ratings):
+            print(f"❌ Ratings file not found: {args.ratings} (run `ratings update` first)")
+            return 1
+        cache = None if args.no_cache else result_cache.ResultCache(args.cache_dir)
+        try:
+            field, result = simulate_season(supabase, args.season, nfl_teams, runs=args.runs, workers=args.workers,
+                                            random_seed=args.random_seed, ratings_path=args.ratings,
+                                            assume=args.assume, cache=cache)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        except Exception as e:
+            print(f"❌ Error simulating the postseason: {e}")
+            return 1
+        if args.random_seed is None and not result['cached']:
+            print(f"🎲 Random seed {result['random_seed']} (pass --random-seed to repeat this run)")
+
+    if args.json:
+        runs = result['runs']
+        print(json.dumps({
+            'season': args.season, 'runs': runs, 'random_seed': result['random_seed'], 'cached': result['cached'],
+            'known_results': result['known_results'],
+            'teams': [{'team_name': t['team_name'], 'conference': t['conference'], 'seed': t['seed'],
+                       **{name.lower().replace(' ', '_'): round(float(count) / runs, 6)
+                          for name, count in zip(ROUNDS[1:], row[1:])}}
+                      for t, row in zip(field, result['counts'])],
+        }))
+    else:
+        print_simulation(field, result)
+    return 0
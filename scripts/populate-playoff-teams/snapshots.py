@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Static playoff snapshot files for read-heavy pages.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py snapshots --season 2025
+
+Writes, under playoff-snapshots/<season>/ next to this script:
+  - bracket.<version>.json.gz: every playoff game (week, teams, scores, winner, status)
+  - pools/<pool_id>.<version>.json.gz: a pool's full standings as [rank, participant_id, score]
+    (scores and dense ranks as in leaderboard.py)
+  - manifest.json: for each file its current path, ETag, size and update time
+
+<version> is the start of the SHA-256 of the uncompressed JSON and the ETag is the whole
+hash, so a file's name and ETag only change when its content does. Files are gzipped once
+here (serve them with Content-Encoding: gzip); the manifest is written last, so readers
+never see a path that does not exist yet. Files from the previous manifest are kept for
+readers that fetched it just before, older ones are deleted.
+
+Regeneration is incremental: the manifest records each decided playoff game's winner and
+the latest playoff_confidence_points update. Only pools with picks on a game whose result
+changed are re-scored; a change to confidence points (or --full) re-scores every pool.
+Picks have no updated_at, and the app locks a game's picks once it kicks off, so a pick
+edited after its game was decided needs --full. Either way a file is only rewritten when
+its content changed.
+`games advance --snapshots` runs this after every evaluation, so files follow each final.
+"""
+
+import os
+import sys
+import json
+import gzip
+import hashlib
+import argparse
+import contextlib
+from datetime import datetime, timezone
+from typing import Dict, Optional, Any, Set
+
+import leaderboard
+import validation
+import interactive_mode
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'playoff-snapshots')
+MANIFEST_NAME = 'manifest.json'
+VERSION_LENGTH = 12
+MANIFEST_VERSION = 1
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _load_manifest(season_dir: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(season_dir, MANIFEST_NAME), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_snapshot_file(season_dir: str, name: str, value: Any,
+                        previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Write value as <name>.<version>.json.gz (unless the content is unchanged); returns its manifest entry."""
+    data = _encode(value)
+    digest = hashlib.sha256(data).hexdigest()
+    if previous and previous.get('etag') == f'"{digest}"' and \
+            os.path.exists(os.path.join(season_dir, previous['path'])):
+        return previous
+    path = f"{name}.{digest[:VERSION_LENGTH]}.json.gz"
+    # mtime=0 keeps the compressed bytes identical for identical content
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_atomic(os.path.join(season_dir, path), compressed)
+    return {'path': path, 'etag': f'"{digest}"', 'bytes': len(data), 'gzip_bytes': len(compressed),
+            'updated_at': datetime.now(timezone.utc).isoformat()}
+
+
+def fetch_bracket(supabase, season: int) -> Dict[str, Any]:
+    """Bracket state: the season's playoff games by week as [id, away, home, away_score, home_score, winner, status]."""
+    response = supabase.table('games') \
+        .select('id, week, away_team, home_team, away_score, home_score, winner, status') \
+        .eq('season', season).eq('season_type', 3).execute()
+    games = sorted(response.data or [], key=lambda g: (g.get('week') or 0, g['id']))
+    rounds = []
+    for week, name in sorted(interactive_mode.WEEK_NAMES.items()):
+        rounds.append({'week': week, 'round': name, 'games': [
+            [g['id'], g['away_team'], g['home_team'], g.get('away_score'), g.get('home_score'),
+             g.get('winner'), g.get('status')] for g in games if g.get('week') == week]})
+    return {'season': season, 'rounds': rounds}
+
+
+def confidence_watermark(supabase, season: int) -> Optional[str]:
+    """Latest updated_at among the season's playoff_confidence_points (None if there are none)."""
+    response = supabase.table('playoff_confidence_points').select('updated_at').eq('season', season) \
+        .order('updated_at', desc=True).limit(1).execute()
+    return response.data[0].get('updated_at') if response.data else None
+
+
+def pools_with_picks(supabase, game_ids: Set[str], page_size: int = leaderboard.PAGE_SIZE) -> Set[str]:
+    """Pools where someone picked one of the games."""
+    pools = set()
+    for game_id in sorted(game_ids):
+        start = 0
+        while True:
+            page = supabase.table('picks').select('pool_id').eq('game_id', game_id) \
+                .order('pool_id').range(start, start + page_size - 1).execute().data or []
+            pools.update(row['pool_id'] for row in page)
+            if len(page) < page_size:
+                break
+            start += page_size
+    return pools
+
+
+def pool_standings(supabase, season: int, pool_id: Optional[str], winners: Dict[str, str],
+                   page_size: int = leaderboard.PAGE_SIZE) -> Dict[str, 'leaderboard.PoolLeaderboard']:
+    """Full standings for one pool (or every pool with pool_id=None)."""
+    rows = leaderboard.stream_confidence_rows(supabase, season, page_size, pool_id=pool_id)
+    picks = leaderboard.stream_pick_rows(supabase, winners, page_size, pool_id=pool_id)
+    return leaderboard.build_leaderboards(leaderboard.participant_scores(rows, picks, winners), top=sys.maxsize)
+
+
+def publish_snapshots(supabase, season: int, out_dir: str = DEFAULT_SNAPSHOT_DIR, full: bool = False) -> Dict[str, Any]:
+    """Bring the season's snapshot files up to date; returns counts of what was rewritten."""
+    season_dir = os.path.join(out_dir, str(season))
+    previous = _load_manifest(season_dir)
+
+    bracket = fetch_bracket(supabase, season)
+    # Games the leaderboard scores: finished, with a winner
+    winners = {game[0]: game[5] for r in bracket['rounds'] for game in r['games']
+               if game[5] and validation.is_finished(game[6])}
+    watermark = confidence_watermark(supabase, season)
+
+    files = dict(previous['files']) if previous else {}
+    result = {'season': season, 'bracket': False, 'pools': 0, 'pools_total': 0, 'full': False}
+
+    entry = write_snapshot_file(season_dir, 'bracket', bracket, files.get('bracket'))
+    result['bracket'] = entry is not files.get('bracket')
+    files['bracket'] = entry
+
+    if full or previous is None or previous.get('confidence_watermark') != watermark:
+        # First run or changed picks: every pool
+        result['full'] = True
+        boards = pool_standings(supabase, season, None, winners)
+        stale_pools = {name[len('pools/'):] for name in files if name.startswith('pools/')} - set(boards)
+        for pool_id in stale_pools:
+            del files[f'pools/{pool_id}']
+    else:
+        old_winners = previous.get('winners', {})
+        changed_games = {game_id for game_id in set(winners) | set(old_winners)
+                         if old_winners.get(game_id) != winners.get(game_id)}
+        boards = {}
+        for pool_id in sorted(pools_with_picks(supabase, changed_games)):
+            boards.update(pool_standings(supabase, season, pool_id, winners))
+
+    for pool_id, board in boards.items():
+        name = f'pools/{pool_id}'
+        content = {'season': season, 'pool_id': pool_id, 'participants': board.participants,
+                   'standings': [[e['rank'], e['participant_id'], e['score']] for e in board.entries()]}
+        entry = write_snapshot_file(season_dir, name, content, files.get(name))
+        if entry is not files.get(name):
+            result['pools'] += 1
+        files[name] = entry
+    result['pools_total'] = sum(1 for name in files if name.startswith('pools/'))
+
+    manifest = {'version': MANIFEST_VERSION, 'season': season,
+                'generated_at': datetime.now(timezone.utc).isoformat(),
+                'winners': winners, 'confidence_watermark': watermark, 'files': files}
+    _write_atomic(os.path.join(season_dir, MANIFEST_NAME), json.dumps(manifest, indent=2).encode('utf-8'))
+    result['deleted'] = _prune(season_dir, manifest, previous)
+    return result
+
+
+def _prune(season_dir: str, manifest: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> int:
+    """Delete snapshot files referenced by neither the new nor the previous manifest."""
+    keep = {entry['path'] for entry in manifest['files'].values()}
+    if previous:
+        keep.update(entry['path'] for entry in previous['files'].values())
+    deleted = 0
+    for root, _, filenames in os.walk(season_dir):
+        for filename in filenames:
+            path = os.path.relpath(os.path.join(root, filename), season_dir).replace(os.sep, '/')
+            if path.endswith('.json.gz') and path not in keep:
+                os.remove(os.path.join(root, filename))
+                deleted += 1
+    return deleted
+
+
+def add_snapshots_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `snapshots` command on the main CLI parser."""
+    parser = subparsers.add_parser('snapshots', parents=common_parents or [],
+                                   help='Write gzipped bracket and pool standings files with an ETag manifest')
+    parser.add_argument('--season', type=int, required=True, help='Season (e.g. 2025)')
+    parser.add_argument('--out-dir', default=DEFAULT_SNAPSHOT_DIR,
+                        help='Snapshot directory (default: playoff-snapshots/ next to this script)')
+    parser.add_argument('--full', action='store_true', help='Re-score every pool, not just those with changed results')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON result to stdout')
+    return parser
+
+
+def print_publish_result(result: Dict[str, Any]) -> None:
+    scope = 'all pools' if result['full'] else 'pools with changed results'
+    print(f"📦 Snapshots {result['season']} ({scope}): bracket {'rewritten' if result['bracket'] else 'unchanged'}, "
+          f"{result['pools']}/{result['pools_total']} pool file(s) rewritten, {result['deleted']} old file(s) deleted")
+
+
+def run_snapshots_command(supabase, args) -> int:
+    """Run `snapshots`; returns the process exit code."""
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        try:
+            result = publish_snapshots(supabase, args.season, args.out_dir, full=args.full)
+        except Exception as e:
+            print(f"❌ Error writing snapshots: {e}")
+            return 1
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print_publish_result(result)
+    return 0
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Playoff team sources for populate-playoff-teams.
+
+Every way of fetching seeds (ESPN standings JSON API, ESPN standings page, NFL.com
+playoff picture) is wrapped in a SourceAdapter, which adds:
+  - timing: each fetch is a profiling span (source.<name>) and its duration is kept on
+    the adapter and printed
+  - caching: results are kept in memory per season and, when cache_ttl is set, on disk
+    (source-cache.json next to this script) so repeated runs skip the network; a fresh
+    entry is used before any conditional request (change_detection.py) is sent
+  - fallback: fetch_with_fallback() tries adapters in the order given to --source
+    (e.g. --source espn-api,espn,nfl) until one returns teams
+  - racing: race_sources() (--source auto) fetches from every adapter at once and takes
+    the first complete, valid field, or compares a quorum of them seed by seed
+
+Usage:
+    adapters = sources.build_adapters({'espn-api': ('ESPN standings API', fetch_api), ...})
+    teams, name = sources.fetch_with_fallback(adapters, ['espn-api', 'espn'], 2025)
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+from collections import Counter
+from typing import List, Dict, Optional, Callable, Tuple
+
+import backfill
+import profiling
+import validation
+import change_detection
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source-cache.json')
+
+# Used when --source is not given: cheapest source first, the page scrapers as fallbacks
+DEFAULT_SOURCE_ORDER = ['espn-api', 'espn', 'nfl']
+
+_cache_lock = threading.Lock()
+
+
+class SourceAdapter:
+    """One source of playoff seeds: fetch(season) returns team dicts (empty list on failure)."""
+
+    def __init__(self, name: str, label: str, fetch_func: Callable[[int], List[Dict[str, any]]],
+                 cache_ttl: float = 0, cache_path: str = DEFAULT_CACHE_PATH):
+        self.name = name
+        self.label = label
+        self._fetch_func = fetch_func
+        self.cache_ttl = cache_ttl
+        self.cache_path = cache_path
+        self.last_duration = None
+        self.last_from_cache = False
+        self._memory: Dict[int, List[Dict[str, any]]] = {}
+
+    def _cache_key(self, season: int) -> str:
+        return f"{self.name}:{season}"
+
+    def _read_disk_cache(self, season: int) -> Optional[List[Dict[str, any]]]:
+        if self.cache_ttl <= 0:
+            return None
+        with _cache_lock:
+            try:
+                with open(self.cache_path, 'r') as f:
+                    entry = json.load(f).get(self._cache_key(season))
+            except (OSError, ValueError):
+                return None
+        if entry and time.time() - entry.get('fetched_at', 0) <= self.cache_ttl:
+            return entry.get('teams')
+        return None
+
+    def _write_disk_cache(self, season: int, teams: List[Dict[str, any]]) -> None:
+        if self.cache_ttl <= 0:
+            return
+        with _cache_lock:
+            try:
+                with open(self.cache_path, 'r') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            cache[self._cache_key(season)] = {'fetched_at': time.time(), 'teams': teams}
+            try:
+                with open(self.cache_path, 'w') as f:
+                    json.dump(cache, f, indent=2)
+            except OSError as e:
+                print(f"Warning: Could not write source cache {self.cache_path}: {e}")
+
+    def fetch(self, season: int, state: Optional[Dict[str, any]] = None) -> List[Dict[str, any]]:
+        """Teams for a season from this source, using the caches when fresh.
+
+        state is this source's change-detection state; it is only used once the caches have
+        missed or expired, when the fetch revalidates against it (and may raise SourceUnchanged).
+        """
+        start = time.perf_counter()
+        with profiling.span(f'source.{self.name}'):
+            teams = self._memory.get(season)
+            if teams is None:
+                teams = self._read_disk_cache(season)
+            self.last_from_cache = teams is not None
+            if teams is None:
+                teams = (self._fetch_func(season) if state is None else self._fetch_func(season, state=state)) or []
+                if teams:
+                    self._write_disk_cache(season, teams)
+            if teams:
+                self._memory[season] = teams
+        self.last_duration = time.perf_counter() - start
+
+        origin = 'cache' if self.last_from_cache else 'network'
+        print(f"⏱️  {self.label}: {len(teams)} teams in {self.last_duration:.2f}s ({origin})")
+        return teams
+
+
+def build_adapters(fetchers: Dict[str, Tuple[str, Callable[[int], List[Dict[str, any]]]]],
+                   cache_ttl: float = 0, cache_path: str = DEFAULT_CACHE_PATH) -> Dict[str, SourceAdapter]:
+    """Adapters by name from {name: (label, fetch_func)}."""
+    return {name: SourceAdapter(name, label, func, cache_ttl=cache_ttl, cache_path=cache_path)
+            for name, (label, func) in fetchers.items()}
+
+
+def parse_source_order(value: str, available: List[str]) -> List[str]:
+    """Split a --source value like 'espn-api,nfl' into adapter names (ValueError on unknown names)."""
+    order = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in order if name not in available]
+    if not order:
+        raise ValueError(f"No source given (choose from {', '.join(available)})")
+    if unknown:
+        raise ValueError(f"Unknown source(s): {', '.join(unknown)} (choose from {', '.join(available)})")
+    return order
+
+
+def fetch_with_fallback(adapters: Dict[str, SourceAdapter], order: List[str], season: int,
+                        state_for: Optional[Callable[[str], Dict[str, any]]] = None) -> Tuple[List[Dict[str, any]], Optional[str]]:
+    """Try adapters in order; returns (teams, adapter name) from the first that returns any.
+
+    state_for(name) supplies each adapter's change-detection state (SourceUnchanged propagates).
+    """
+    for position, name in enumerate(order):
+        teams = adapters[name].fetch(season, state_for(name) if state_for else None)
+        if teams:
+            return teams, name
+        if position + 1 < len(order):
+            print(f"⚠️  {adapters[name].label} returned no teams; falling back to {adapters[order[position + 1]].label}")
+    return [], None
+
+
+def seed_conflicts(results: Dict[str, List[Dict[str, any]]]) -> Dict[Tuple[str, int], Dict[str, str]]:
+    """Seeds on which sources disagree: {(conference, seed): {source: team_name}}."""
+    by_seed: Dict[Tuple[str, int], Dict[str, str]] = {}
+    for name, teams in results.items():
+        for team in teams:
+            by_seed.setdefault((team['conference'].upper(), team['seed']), {})[name] = team['team_name']
+    return {key: picks for key, picks in sorted(by_seed.items())
+            if len(set(picks.values())) > 1 or len(picks) < len(results)}
+
+
+def race_sources(adapters: Dict[str, SourceAdapter], season: int, nfl_teams: List[Dict[str, str]],
+                 quorum: int = 1, timeout: float = 60, state_for: Optional[Callable[[str], Dict[str, any]]] = None) -> Tuple[List[Dict[str, any]], Optional[str], Dict[str, any]]:
+    """Fetch every adapter concurrently and return as soon as `quorum` of them give a valid field.
+
+    Results are checked with validation.validate_teams against nfl_teams and the season's
+    seed count. With quorum 1 the first complete, valid result wins and slower sources are abandoned.
+    With a higher quorum the valid results are compared seed by seed; conflicts are
+    reported and each seed goes to the team most sources agree on (ties go to the
+    source listed first). Returns (teams, winning source or 'quorum', report).
+    With state_for and quorum 1, a source reporting SourceUnchanged first ends the race
+    by re-raising it.
+    """
+    results_queue = queue.Queue()
+
+    def run(name: str) -> None:
+        try:
+            results_queue.put((name, adapters[name].fetch(season, state_for(name) if state_for else None), None))
+        except Exception as e:
+            results_queue.put((name, [], e))
+
+    # Daemon threads, so a hung source can't hold the process open after we have an answer
+    for name in adapters:
+        threading.Thread(target=run, args=(name,), name=f'source-{name}', daemon=True).start()
+
+    report = {'valid': [], 'invalid': {}, 'conflicts': {}}
+    valid: Dict[str, List[Dict[str, any]]] = {}
+    deadline = time.monotonic() + timeout
+    for _ in range(len(adapters)):
+        try:
+            name, teams, error = results_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            print(f"⚠️  Timed out after {timeout:.0f}s waiting for sources")
+            break
+        if isinstance(error, change_detection.SourceUnchanged) and quorum <= 1:
+            raise error
+        problems = [f"error: {error}"] if error else validation.validate_teams(teams, season, nfl_teams)
+        if problems:
+            report['invalid'][name] = problems
+            print(f"⚠️  {adapters[name].label}: {'; '.join(problems)}")
+            continue
+        valid[name] = teams
+        report['valid'].append(name)
+        if len(valid) >= quorum:
+            break
+
+    if not valid:
+        return [], None, report
+    if quorum <= 1:
+        name = report['valid'][0]
+        return valid[name], name, report
+    if len(valid) < quorum:
+        print(f"⚠️  Only {len(valid)} of the {quorum} sources needed for a quorum returned a valid field")
+        return [], None, report
+
+    conflicts = seed_conflicts(valid)
+    report['conflicts'] = {f"{conf} #{seed}": picks for (conf, seed), picks in conflicts.items()}
+    priority = [name for name in adapters if name in valid]
+    merged = []
+    for conference in ['AFC', 'NFC']:
+        for seed in range(1, backfill.seeds_per_conference(season) + 1):
+            picks = {name: next(t for t in valid[name] if t['conference'].upper() == conference and t['seed'] == seed)
+                     for name in priority}
+            votes = Counter(team['team_name'] for team in picks.values())
+            top = max(votes.values())
+            winner = next(name for name in priority if votes[picks[name]['team_name']] == top)
+            merged.append(picks[winner])
+    for key, picks in report['conflicts'].items():
+        print(f"⚠️  Sources disagree on {key}: " + ', '.join(f"{adapters[n].label}={team}" for n, team in picks.items()))
+    if validation.validate_teams(merged, season, nfl_teams):
+        print("❌ Sources disagree and no consistent field can be formed from their votes")
+        return [], None, report
+    return merged, 'quorum', report
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Synthetic playoff pools at production scale, for benchmarking.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py --db sqlite synthetic --season 2099 --pools 20000 --yes
+
+Creates, for one season:
+  - playoff_teams: 7 random teams per conference (only if the season has none)
+  - games: the whole bracket (--rounds weeks final, with scores and winners)
+  - pools and participants: --pools pools of --min-participants..--max-participants each
+  - playoff_confidence_points: one 1..14 permutation over the 14 playoff teams per participant
+  - picks: a random predicted winner of every playoff game per participant, with the
+    confidence points they gave that team
+
+Everything comes from one numpy Generator seeded with --random-seed, including the UUIDs,
+so the same arguments produce the same rows. Permutations are drawn for a whole chunk
+of participants at once (Generator.permuted on a tiled 1..14 matrix) and rows go to the
+database in --batch-size inserts. Pools are created by SYNTHETIC_CREATED_BY; --clean
+deletes the season's earlier synthetic pools (and their participants and points) first.
+
+Works against Supabase or the local SQLite stand-in (--db sqlite).
+"""
+
+import sys
+import json
+import time
+import uuid
+import argparse
+import contextlib
+from typing import List, Dict, Any, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the generator
+    np = None
+
+import interactive_mode
+import round_progression
+
+SYNTHETIC_CREATED_BY = 'synthetic-load@playoff-pools.test'
+DEFAULT_POOLS = 1000
+DEFAULT_MIN_PARTICIPANTS = 5
+DEFAULT_MAX_PARTICIPANTS = 40
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_RANDOM_SEED = 2025
+POOLS_PER_CHUNK = 500
+PLAYOFF_TEAMS = 14
+
+
+def _uuids(rng, count: int) -> List[str]:
+    """count version-4 UUIDs drawn from rng (repeatable, unlike uuid4())."""
+    raw = rng.bytes(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def confidence_permutations(rng, participants: int, teams: int = PLAYOFF_TEAMS) -> Any:
+    """participants x teams matrix whose rows are random permutations of 1..teams."""
+    return rng.permuted(np.tile(np.arange(1, teams + 1, dtype=np.int16), (participants, 1)), axis=1)
+
+
+def insert_batches(supabase, table: str, rows: List[Dict[str, Any]], batch_size: int) -> int:
+    """Insert rows batch_size at a time; returns the number of requests."""
+    requests = 0
+    for start in range(0, len(rows), batch_size):
+        supabase.table(table).insert(rows[start:start + batch_size]).execute()
+        requests += 1
+    return requests
+
+
+def seed_playoff_teams(supabase, season: int, nfl_teams: List[Dict[str, str]], rng) -> Dict[str, Dict[int, str]]:
+    """The season's seeds; 7 random teams per conference are written first if it has none."""
+    teams_by_conf = interactive_mode.get_playoff_teams(supabase, season)
+    if all(len(teams_by_conf[conf]) >= 7 for conf in ('AFC', 'NFC')):
+        return teams_by_conf
+    rows = []
+    for conference in ('AFC', 'NFC'):
+        candidates = [t for t in nfl_teams if t['conference'] == conference]
+        for seed, index in enumerate(rng.choice(len(candidates), size=7, replace=False), start=1):
+            team = candidates[index]
+            rows.append({'season': season, 'team_name': team['name'], 'team_abbreviation': team['abbreviation'],
+                         'conference': conference, 'seed': seed})
+    supabase.table('playoff_teams').upsert(rows, on_conflict='season,team_name').execute()
+    return interactive_mode.get_playoff_teams(supabase, season)
+
+
+def play_bracket(season: int, teams_by_conf: Dict[str, Dict[int, str]], rounds: int, rng) -> List[Dict[str, Any]]:
+    """Games rows for playoff weeks 1..4; weeks up to `rounds` are final with random scores."""
+    rows = []
+    previous = []
+    for week in sorted(round_progression.EXPECTED_GAMES):
+        matchups = round_progression.build_week(week, teams_by_conf, previous)
+        if not matchups:
+            break
+        week_rows = interactive_mode.build_playoff_game_rows(season, week, matchups, [])
+        for row in week_rows:
+            # Fixed kickoffs (the default is relative to today) keep the rows repeatable
+            row['kickoff_time'] = f"{season + 1}-01-{10 + 7 * (week - 1):02d}T18:00:00+00:00"
+            if week <= rounds:
+                home_score, away_score = (int(s) for s in rng.integers(3, 42, size=2))
+                if home_score == away_score:
+                    home_score += 3
+                row.update({'home_score': home_score, 'away_score': away_score, 'status': 'final',
+                            'winner': row['home_team'] if home_score > away_score else row['away_team']})
+        rows.extend(week_rows)
+        if week > rounds:
+            break
+        previous = week_rows
+    return rows
+
+
+def synthetic_pool_ids(supabase, season: int, page_size: int = DEFAULT_BATCH_SIZE) -> List[str]:
+    """IDs of the season's synthetic pools."""
+    ids = []
+    start = 0
+    while True:
+        page = supabase.table('pools').select('id').eq('season', season).eq('created_by', SYNTHETIC_CREATED_BY) \
+            .order('id').range(start, start + page_size - 1).execute().data or []
+        ids.extend(row['id'] for row in page)
+        if len(page) < page_size:
+            return ids
+        start += page_size
+
+
+def clean_synthetic(supabase, season: int, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Delete the season's synthetic pools with their participants and points; returns the pool count."""
+    ids = synthetic_pool_ids(supabase, season)
+    # Supabase cascades from pools; the local stand-in has no foreign keys, so delete children first
+    step = min(batch_size, 200)
+    for start in range(0, len(ids), step):
+        batch = ids[start:start + step]
+        supabase.table('playoff_confidence_points').delete().in_('pool_id', batch).execute()
+        supabase.table('picks').delete().in_('pool_id', batch).execute()
+        supabase.table('participants').delete().in_('pool_id', batch).execute()
+        supabase.table('pools').delete().in_('id', batch).execute()
+    return len(ids)
+
+
+def generate_pool_chunks(season: int, team_names: List[str], pools: int, min_participants: int,
+                         max_participants: int, rng, games: List[Dict[str, Any]],
+                         picks_rng) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+    """Rows for POOLS_PER_CHUNK pools at a time: {'pools': [...], 'participants': [...], 'points': [...],
+    'picks': [...]} (one pick per participant and game in `games`, drawn from picks_rng)."""
+    numbered = 0
+    for first in range(0, pools, POOLS_PER_CHUNK):
+        count = min(POOLS_PER_CHUNK, pools - first)
+        pool_ids = _uuids(rng, count)
+        sizes = rng.integers(min_participants, max_participants + 1, size=count)
+        participant_ids = _uuids(rng, int(sizes.sum()))
+        owners = np.repeat(np.arange(count), sizes)
+        points = confidence_permutations(rng, len(participant_ids), len(team_names))
+        # 1 picks the home team
+        home_picks = picks_rng.integers(0, 2, size=(len(participant_ids), len(games)))
+
+        pool_rows = [{'id': pool_id, 'name': f"Synthetic Pool {first + i + 1:06d}", 'created_by': SYNTHETIC_CREATED_BY,
+                      'season': season, 'is_active': True, 'competition_type': 'NFL_CONFIDENCE'}
+                     for i, pool_id in enumerate(pool_ids)]
+        participant_rows = []
+        point_rows = []
+        pick_rows = []
+        for number, (participant_id, owner, row, homes) in enumerate(
+                zip(participant_ids, owners.tolist(), points.tolist(), home_picks.tolist()), start=numbered + 1):
+            pool_id = pool_ids[owner]
+            participant_rows.append({'id': participant_id, 'pool_id': pool_id, 'name': f"Player {number:07d}",
+                                     'email': f"player{number:07d}@playoff-pools.test", 'is_active': True})
+            point_rows.extend({'participant_id': participant_id, 'pool_id': pool_id, 'season': season,
+                               'team_name': team, 'confidence_points': value}
+                              for team, value in zip(team_names, row))
+            points_by_team = dict(zip(team_names, row))
+            for game, home in zip(games, homes):
+                team = game['home_team'] if home else game['away_team']
+                pick_rows.append({'participant_id': participant_id, 'pool_id': pool_id, 'game_id': game['id'],
+                                  'predicted_winner': team, 'confidence_points': points_by_team.get(team, 1)})
+        numbered += len(participant_ids)
+        yield {'pools': pool_rows, 'participants': participant_rows, 'points': point_rows, 'picks': pick_rows}
+
+
+def generate(supabase, season: int, nfl_teams: List[Dict[str, str]], pools: int = DEFAULT_POOLS,
+             min_participants: int = DEFAULT_MIN_PARTICIPANTS, max_participants: int = DEFAULT_MAX_PARTICIPANTS,
+             rounds: int = 4, random_seed: int = DEFAULT_RANDOM_SEED, batch_size: int = DEFAULT_BATCH_SIZE,
+             clean: bool = False) -> Dict[str, Any]:
+    """Write a synthetic season; returns row counts, request counts and timings per table."""
+    if np is None:
+        raise RuntimeError("numpy is required for the synthetic data generator (pip install numpy)")
+    # Separate streams, so an existing season's seeds don't shift the bracket or the pools
+    teams_rng, bracket_rng, pools_rng, picks_rng = (np.random.default_rng(s)
+                                                    for s in np.random.SeedSequence(random_seed).spawn(4))
+    stats = {'season': season, 'random_seed': random_seed, 'cleaned_pools': 0, 'tables': {}}
+
+    def record(table: str, rows: int, requests: int, elapsed: float) -> None:
+        entry = stats['tables'].setdefault(table, {'rows': 0, 'requests': 0, 'seconds': 0.0})
+        entry['rows'] += rows
+        entry['requests'] += requests
+        entry['seconds'] += elapsed
+
+    if clean:
+        stats['cleaned_pools'] = clean_synthetic(supabase, season, batch_size)
+
+    start = time.perf_counter()
+    teams_by_conf = seed_playoff_teams(supabase, season, nfl_teams, teams_rng)
+    game_rows = play_bracket(season, teams_by_conf, rounds, bracket_rng)
+    supabase.table('games').upsert(game_rows, on_conflict='id').execute()
+    record('games', len(game_rows), 1, time.perf_counter() - start)
+
+    team_names = [teams_by_conf[conf][seed] for conf in ('AFC', 'NFC') for seed in sorted(teams_by_conf[conf])][:PLAYOFF_TEAMS]
+    for chunk in generate_pool_chunks(season, team_names, pools, min_participants, max_participants, pools_rng,
+                                      game_rows, picks_rng):
+        for table, key in (('pools', 'pools'), ('participants', 'participants'), ('playoff_confidence_points', 'points'),
+                           ('picks', 'picks')):
+            start = time.perf_counter()
+            requests = insert_batches(supabase, table, chunk[key], batch_size)
+            record(table, len(chunk[key]), requests, time.perf_counter() - start)
+        print(f"  ... {stats['tables']['pools']['rows']:,}/{pools:,} pools, "
+              f"{stats['tables']['participants']['rows']:,} participants")
+    return stats
+
+
+def add_synthetic_parser(subparsers, common_parents=None) -> argparse.ArgumentParser:
+    """Register the `synthetic` command on the main CLI parser."""
+    parser = subparsers.add_parser('synthetic', parents=common_parents or [],
+                                   help='Bulk-create synthetic pools, participants, confidence points, picks and playoff games')
+    parser.add_argument('--season', type=int, required=True, help='Season to fill (use one no real pool uses, e.g. 2099)')
+    parser.add_argument('--pools', type=int, default=DEFAULT_POOLS, help=f'Pools to create (default: {DEFAULT_POOLS:,})')
+    parser.add_argument('--min-participants', type=int, default=DEFAULT_MIN_PARTICIPANTS,
+                        help=f'Fewest participants per pool (default: {DEFAULT_MIN_PARTICIPANTS})')
+    parser.add_argument('--max-participants', type=int, default=DEFAULT_MAX_PARTICIPANTS,
+                        help=f'Most participants per pool (default: {DEFAULT_MAX_PARTICIPANTS})')
+    parser.add_argument('--rounds', type=int, default=4, choices=[0, 1, 2, 3, 4],
+                        help='Playoff weeks with final results (default: 4, the whole postseason)')
+    parser.add_argument('--random-seed', type=int, default=DEFAULT_RANDOM_SEED,
+                        help=f'Seed for every generated value (default: {DEFAULT_RANDOM_SEED})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Rows per insert request (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--clean', action='store_true', help="Delete the season's earlier synthetic pools first")
+    parser.add_argument('--yes', '-y', action='store_true', help='Write without asking for confirmation')
+    parser.add_argument('--json', action='store_true', help='Print a single JSON result to stdout')
+    return parser
+
+
+def run_synthetic_command(supabase, args, nfl_teams: List[Dict[str, str]]) -> int:
+    """Run `synthetic`; returns the process exit code."""
+    if args.min_participants < 1 or args.max_participants < args.min_participants:
+        print("❌ Need 1 <= --min-participants <= --max-participants", file=sys.stderr)
+        return 1
+    if not args.yes:
+        average = (args.min_participants + args.max_participants) / 2
+        print(f"About to write ~{args.pools * average:,.0f} participants and "
+              f"~{args.pools * average * PLAYOFF_TEAMS:,.0f} confidence points for season {args.season}.")
+        if input("Continue? (yes/no): ").strip().lower() not in ('yes', 'y'):
+            print("❌ Cancelled.")
+            return 1
+
+    # Keep stdout clean for the JSON document
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with redirect:
+        start = time.perf_counter()
+        try:
+            stats = generate(supabase, args.season, nfl_teams, pools=args.pools, min_participants=args.min_participants,
+                             max_participants=args.max_participants, rounds=args.rounds, random_seed=args.random_seed,
+                             batch_size=args.batch_size, clean=args.clean)
+        except Exception as e:
+            print(f"❌ Error generating synthetic data: {e}")
+            return 1
+        stats['seconds'] = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(stats))
+        return 0
+    if stats['cleaned_pools']:
+        print(f"🧹 Deleted {stats['cleaned_pools']:,} earlier synthetic pool(s)")
+    print(f"\n✅ Synthetic season {args.season} written in {stats['seconds']:.1f}s (random seed {args.random_seed})")
+    for table, entry in stats['tables'].items():
+        rate = entry['rows'] / entry['seconds'] if entry['seconds'] else 0
+        print(f"  {table:28} {entry['rows']:>12,} rows  {entry['requests']:>7,} requests  {rate:>12,.0f} rows/s")
+    return 0
@@ -0,0 +1,56 @@
+"""Shared pytest fixtures: the tool's modules on sys.path, the NFL team list and a seeded field.
+
+    python -m pytest scripts/populate-playoff-teams/tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backfill
+import interactive_mode
+import local_db
+
+SEASON = 2025
+
+
+def seeded_field(nfl_teams, season: int = SEASON):
+    """playoff_teams rows: seeds 1..the season's seed count per conference, taken in NFL_TEAMS order."""
+    teams = []
+    for conference in ['AFC', 'NFC']:
+        conf_teams = [t for t in nfl_teams if t['conference'] == conference][:backfill.seeds_per_conference(season)]
+        for seed, team in enumerate(conf_teams, 1):
+            teams.append({
+                'season': season,
+                'team_name': team['name'],
+                'team_abbreviation': team['abbreviation'],
+                'conference': conference,
+                'seed': seed,
+            })
+    return teams
+
+
+@pytest.fixture(scope='session')
+def nfl_teams():
+    return interactive_mode.populate_playoff_teams.NFL_TEAMS
+
+
+@pytest.fixture
+def playoff_teams(nfl_teams):
+    return seeded_field(nfl_teams)
+
+
+@pytest.fixture
+def field_for(nfl_teams):
+    """seeded_field for any season: field_for(2019) has six seeds per conference."""
+    return lambda season=SEASON: seeded_field(nfl_teams, season)
+
+
+@pytest.fixture
+def db():
+    client = local_db.LocalClient(':memory:')
+    yield client
+    client.close()
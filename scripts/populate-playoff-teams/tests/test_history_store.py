@@ -0,0 +1,70 @@
+"""Tests for history_store.HistoryStore refreshed from a LocalClient."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import history_store
+import interactive_mode
+
+SEASON = 2025
+
+
+@pytest.fixture
+def seeded_db(db, playoff_teams):
+    """The field plus a final Wild Card round the home teams won 24-10."""
+    db.table('playoff_teams').insert(playoff_teams).execute()
+    games = interactive_mode.generate_wild_card_games(interactive_mode.get_playoff_teams(db, SEASON))
+    rows = interactive_mode.build_playoff_game_rows(SEASON, 1, games, [])
+    for row in rows:
+        row.update(home_score=24, away_score=10, winner=row['home_team'], status='final')
+    db.table('games').insert(rows).execute()
+    return db
+
+
+def test_refresh_appends_rows_and_answers_seed_queries(seeded_db, tmp_path):
+    store = history_store.HistoryStore(str(tmp_path))
+    appended = store.refresh(seeded_db)
+    assert appended['teams'] == 14
+    assert appended['games'] == 6
+    assert store.seasons() == [SEASON]
+    assert store.seed_win_rate(2, 7) == (2, 2)
+    assert store.seed_win_rate(7, 2) == (0, 2)
+
+    reached, totals = store.round_advancement()
+    assert list(totals[1:]) == [2] * 7
+    assert list(reached[:, 0]) == list(totals)
+    assert reached[:, 1].sum() == 0  # no Divisional games stored yet
+
+
+def test_refresh_only_appends_changes(seeded_db, tmp_path):
+    store = history_store.HistoryStore(str(tmp_path))
+    store.refresh(seeded_db)
+    assert store.refresh(seeded_db) == {'teams': 0, 'games': 0, 'removed_teams': 0, 'removed_games': 0}
+
+    # The away team wins on review: the new row supersedes the stored one
+    game = seeded_db.table('games').select('*').eq('season', SEASON).execute().data[0]
+    seeded_db.table('games').update({'winner': game['away_team']}).eq('id', game['id']).execute()
+    assert store.refresh(seeded_db)['games'] == 1
+    games = store.games(SEASON, 1)
+    assert len(games['game']) == 6
+    code = store.manifest['game_ids'].index(game['id'])
+    assert store.team_name(int(games['winner'][games['game'] == code][0])) == game['away_team']
+
+
+def test_deleted_game_is_tombstoned(seeded_db, tmp_path):
+    store = history_store.HistoryStore(str(tmp_path))
+    store.refresh(seeded_db)
+    games = seeded_db.table('games').select('*').eq('season', SEASON).execute().data
+    seeded_db.table('games').delete().eq('id', games[0]['id']).execute()
+    # Deletes leave no updated_at behind, so only a reconcile finds them
+    assert store.refresh(seeded_db, reconcile=True)['removed_games'] == 1
+    assert len(store.games(SEASON, 1)['game']) == 5
+
+
+def test_reopened_store_reads_the_same_columns(seeded_db, tmp_path):
+    history_store.HistoryStore(str(tmp_path)).refresh(seeded_db)
+    reopened = history_store.HistoryStore(str(tmp_path))
+    assert reopened.seasons() == [SEASON]
+    assert len(reopened.games()['game']) == 6
+    assert reopened.seed_win_rate(3, 6) == (2, 2)
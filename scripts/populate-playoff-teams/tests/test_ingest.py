@@ -0,0 +1,130 @@
+"""Tests for the streaming ingest: batching, rejected records and the check-only run."""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+import ingest
+
+SEASON = 2025
+
+
+def game(game_id, home='Buffalo Bills', away='Denver Broncos', **values):
+    return dict({'id': game_id, 'season': SEASON, 'week': 1, 'home_team': home, 'away_team': away,
+                 'kickoff_time': '2026-01-11T18:00:00Z'}, **values)
+
+
+def write_ndjson(path, records):
+    path.write_text(''.join((r if isinstance(r, str) else json.dumps(r)) + '\n' for r in records))
+    return str(path)
+
+
+def stored(db, table):
+    return db.table(table).select('*').execute().data
+
+
+def test_records_are_upserted_in_batches(db, playoff_teams, nfl_teams, tmp_path):
+    games = [game(f"g{n}") for n in range(5)]
+    path = write_ndjson(tmp_path / 'records.ndjson', playoff_teams + games)
+
+    result = ingest.ingest(db, path, nfl_teams, batch_size=4)
+    assert result['valid'] == {'team': 14, 'game': 5} and result['invalid'] == 0
+    # 14 teams in batches of 4 (4 + 4 + 4 + 2), games in 4 + 1
+    assert result['batches'] == 6
+    assert result['rows_written'] == {'team': 14, 'game': 5}
+    assert result['incomplete_fields'] == {}
+    assert len(stored(db, 'playoff_teams')) == 14
+    assert all(g['season_type'] == 3 for g in stored(db, 'games'))
+
+    # Every write is an upsert: running the file again adds nothing
+    ingest.ingest(db, path, nfl_teams, batch_size=4)
+    assert len(stored(db, 'playoff_teams')) == 14 and len(stored(db, 'games')) == 5
+
+
+def test_repeated_game_id_keeps_the_last_record(db, nfl_teams, tmp_path):
+    path = write_ndjson(tmp_path / 'games.ndjson', [game('g1', home_score=10), game('g1', home_score=24)])
+    result = ingest.ingest(db, path, nfl_teams)
+    assert result['rows_written'] == {'team': 0, 'game': 1}
+    assert [g['home_score'] for g in stored(db, 'games')] == [24]
+
+
+def test_invalid_records_are_skipped_and_reported(db, playoff_teams, nfl_teams, tmp_path):
+    records = [
+        playoff_teams[0],
+        '{not json',
+        [1, 2],
+        {'name': 'Buffalo Bills'},
+        dict(playoff_teams[1], season='next year'),
+        dict(playoff_teams[2], team_name='Springfield Atoms'),
+        game('g1', winner='Detroit Lions'),
+        game('g2'),
+    ]
+    path = write_ndjson(tmp_path / 'mixed.ndjson', records)
+    result = ingest.ingest(db, path, nfl_teams)
+
+    assert result['records'] == 8 and result['invalid'] == 6
+    assert result['valid'] == {'team': 1, 'game': 1}
+    errors = result['errors']
+    assert errors[0].startswith('Line 2: invalid JSON')
+    assert errors[1] == 'Line 3: expected an object, got list'
+    assert errors[2] == 'Line 4: neither a team (team_name) nor a game (home_team) record'
+    assert errors[3].startswith('Line 5: season must be a year')
+    assert any(e.startswith('Line 6') and 'is not an NFL team' in e for e in errors)
+    assert any(e.startswith('Line 7') and 'is neither team' in e for e in errors)
+    assert [t['team_name'] for t in stored(db, 'playoff_teams')] == [playoff_teams[0]['team_name']]
+    assert [g['id'] for g in stored(db, 'games')] == ['g2']
+    # One team of the field is not a complete field
+    assert list(result['incomplete_fields']) == [SEASON]
+
+
+def test_reported_errors_are_capped(db, nfl_teams, tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, 'MAX_REPORTED_ERRORS', 3)
+    path = write_ndjson(tmp_path / 'bad.ndjson', ['{'] * 5)
+    result = ingest.ingest(db, path, nfl_teams)
+    assert len(result['errors']) == 3 and result['more_errors'] == 2 and result['invalid'] == 5
+
+
+def test_gzipped_csv_with_season_option(db, playoff_teams, nfl_teams, tmp_path):
+    path = tmp_path / 'teams.csv.gz'
+    with gzip.open(path, 'wt', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['team_name', 'team_abbreviation', 'conference', 'seed'])
+        writer.writeheader()
+        writer.writerows({k: t[k] for k in writer.fieldnames} for t in playoff_teams)
+
+    assert ingest.detect_format(str(path)) == 'csv'
+    result = ingest.ingest(db, str(path), nfl_teams, season=SEASON, batch_size=5)
+    assert result['valid']['team'] == 14 and result['batches'] == 3
+    seeds = {t['team_name']: t['seed'] for t in stored(db, 'playoff_teams')}
+    assert seeds == {t['team_name']: t['seed'] for t in playoff_teams}
+
+
+def test_check_only_writes_nothing(db, playoff_teams, nfl_teams, tmp_path):
+    path = write_ndjson(tmp_path / 'teams.jsonl', playoff_teams)
+    result = ingest.ingest(db, path, nfl_teams, write=False)
+    assert result['valid']['team'] == 14 and 'rows_written' not in result
+    assert stored(db, 'playoff_teams') == []
+
+
+def test_failed_batch_stops_the_ingest(db, nfl_teams, tmp_path, monkeypatch):
+    write = ingest.BatchWriter._write
+    calls = []
+
+    def fail_second(self, kind, rows):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError('connection reset')
+        return write(self, kind, rows)
+
+    monkeypatch.setattr(ingest.BatchWriter, '_write', fail_second)
+    path = write_ndjson(tmp_path / 'games.ndjson', [game(f"g{n}") for n in range(10)])
+    with pytest.raises(RuntimeError, match='connection reset'):
+        ingest.ingest(db, path, nfl_teams, batch_size=2, queue_depth=1)
+    # The batch before the failure stays written
+    assert sorted(g['id'] for g in stored(db, 'games')) == ['g0', 'g1']
+
+
+def test_unknown_format(nfl_teams, db):
+    with pytest.raises(ValueError, match='Cannot tell the format'):
+        ingest.ingest(db, 'records.txt', nfl_teams)
@@ -0,0 +1,119 @@
+"""Tests for leaderboard ranking and keyset paging against a LocalClient."""
+
+import random
+
+import pytest
+
+import leaderboard
+
+SEASON = 2025
+POOLS = ['pool-a', 'pool-b', 'pool-c']
+TEAMS = ['Buffalo Bills', 'Kansas City Chiefs', 'Detroit Lions', 'Philadelphia Eagles']
+# game id -> (home, away, winner, status)
+GAMES = {
+    'g1': ('Buffalo Bills', 'Kansas City Chiefs', 'Buffalo Bills', 'final'),
+    'g2': ('Detroit Lions', 'Philadelphia Eagles', 'Philadelphia Eagles', 'post'),
+    'g3': ('Buffalo Bills', 'Detroit Lions', 'Detroit Lions', 'scheduled'),  # winner set early: not decided
+}
+
+
+@pytest.fixture
+def pool_db(db):
+    rng = random.Random(7)
+    db.table('games').insert([
+        {'id': game_id, 'season': SEASON, 'season_type': 3, 'week': 1, 'home_team': home, 'away_team': away,
+         'kickoff_time': '2026-01-10T13:00:00', 'winner': winner, 'status': status}
+        for game_id, (home, away, winner, status) in GAMES.items()
+    ]).execute()
+    points, picks = [], []
+    for pool_id in POOLS:
+        for n in range(12):
+            participant_id = f"p{n:02d}"
+            values = rng.sample(range(1, 5), 4)
+            points += [{'participant_id': participant_id, 'pool_id': pool_id, 'season': SEASON, 'team_name': team,
+                        'confidence_points': value} for team, value in zip(TEAMS, values)]
+            picks += [{'participant_id': participant_id, 'pool_id': pool_id, 'game_id': game_id,
+                       'predicted_winner': rng.choice(GAMES[game_id][:2]), 'confidence_points': 1}
+                      for game_id in GAMES]
+    # A participant with picks but no confidence points scores each pick's own points
+    picks.append({'participant_id': 'p99', 'pool_id': 'pool-a', 'game_id': 'g1',
+                  'predicted_winner': 'Buffalo Bills', 'confidence_points': 3})
+    db.table('playoff_confidence_points').insert(points).execute()
+    db.table('picks').insert(picks).execute()
+    return db
+
+
+def expected_scores(db):
+    """{(pool, participant): score} computed directly from every row."""
+    winners = {g: w for g, (_, _, w, status) in GAMES.items() if status != 'scheduled'}
+    points = {(r['pool_id'], r['participant_id'], r['team_name']): r['confidence_points']
+              for r in db.table('playoff_confidence_points').select('*').execute().data}
+    scores = {}
+    for pick in db.table('picks').select('*').execute().data:
+        key = (pick['pool_id'], pick['participant_id'])
+        scores.setdefault(key, 0)
+        if winners.get(pick['game_id']) == pick['predicted_winner']:
+            scores[key] += points.get(key + (pick['predicted_winner'],), pick['confidence_points'])
+    return scores
+
+
+def build(db, page_size=leaderboard.PAGE_SIZE, top=5, track=None):
+    winners = leaderboard.decided_games(db, SEASON)
+    rows = leaderboard.stream_confidence_rows(db, SEASON, page_size)
+    picks = leaderboard.stream_pick_rows(db, winners, page_size)
+    return leaderboard.build_leaderboards(leaderboard.participant_scores(rows, picks, winners), top=top, track=track)
+
+
+def test_dense_ranks_and_cut_off():
+    board = leaderboard.PoolLeaderboard('pool', top=3)
+    for participant_id, score in [('d', 5), ('a', 9), ('c', 5), ('b', 5), ('e', 1)]:
+        board.add(participant_id, score)
+    # Equal scores at the cut-off keep the participant_id that sorts first
+    assert board.entries() == [{'rank': 1, 'participant_id': 'a', 'score': 9},
+                               {'rank': 2, 'participant_id': 'b', 'score': 5},
+                               {'rank': 2, 'participant_id': 'c', 'score': 5}]
+    assert board.rank_of_score(1) == 3
+    assert board.participants == 5
+
+
+def test_decided_games_need_a_finished_status(pool_db):
+    assert leaderboard.decided_games(pool_db, SEASON) == {'g1': 'Buffalo Bills', 'g2': 'Philadelphia Eagles'}
+
+
+@pytest.mark.parametrize('page_size', [5, 9, 1000])
+def test_paging_reads_every_row_once_in_order(pool_db, page_size):
+    rows = list(leaderboard.stream_confidence_rows(pool_db, SEASON, page_size))
+    keys = [(r['pool_id'], r['participant_id'], r['team_name']) for r in rows]
+    assert keys == sorted(keys)
+    assert len(keys) == len(set(keys)) == len(POOLS) * 12 * len(TEAMS)
+
+    one_pool = list(leaderboard.stream_confidence_rows(pool_db, SEASON, page_size, pool_id='pool-b'))
+    assert one_pool == [r for r in rows if r['pool_id'] == 'pool-b']
+
+
+def test_participant_larger_than_a_page_is_an_error(pool_db):
+    with pytest.raises(ValueError):
+        list(leaderboard.stream_confidence_rows(pool_db, SEASON, page_size=3))
+
+
+@pytest.mark.parametrize('page_size', [5, 1000])
+def test_leaderboards_match_direct_scores(pool_db, page_size):
+    scores = expected_scores(pool_db)
+    boards = build(pool_db, page_size, top=5, track=['p99', 'p03'])
+    assert sorted(boards) == POOLS
+    for pool_id, board in boards.items():
+        pool_scores = {p: s for (pool, p), s in scores.items() if pool == pool_id}
+        best = sorted(pool_scores.items(), key=lambda item: (-item[1], item[0]))[:5]
+        assert [(e['participant_id'], e['score']) for e in board.entries()] == best
+        assert board.participants == len(pool_scores)
+        distinct = sorted(set(pool_scores.values()), reverse=True)
+        assert board.rank_of('p03')['rank'] == distinct.index(pool_scores['p03']) + 1
+    assert boards['pool-a'].tracked['p99'] == 3
+
+
+def test_snapshots_upsert_one_row_per_pool(pool_db):
+    boards = build(pool_db)
+    assert leaderboard.write_snapshots(pool_db, boards, SEASON) == len(POOLS)
+    assert leaderboard.write_snapshots(pool_db, boards, SEASON) == len(POOLS)
+    rows = pool_db.table('playoff_leaderboards').select('*').eq('season', SEASON).execute().data
+    assert sorted(r['pool_id'] for r in rows) == POOLS
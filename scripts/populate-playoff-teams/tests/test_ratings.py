@@ -0,0 +1,76 @@
+"""Tests for ratings.RatingModel on small inline schedules."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import ratings
+
+
+def game(week, home, away, home_score=None, away_score=None, status='final', season=2024, season_type=2):
+    return {'season': season, 'season_type': season_type, 'week': week, 'home_team': home, 'away_team': away,
+            'home_score': home_score, 'away_score': away_score, 'status': status,
+            'winner': None if home_score is None else home if home_score > away_score else away}
+
+
+@pytest.fixture
+def model(tmp_path):
+    return ratings.RatingModel(str(tmp_path / 'team-ratings.json'))
+
+
+@pytest.mark.parametrize('status', ['final', 'post', 'finished', 'FINAL'])
+def test_finished_statuses_are_completed(status):
+    assert ratings.is_completed(game(1, 'A', 'B', 20, 10, status=status))
+
+
+def test_unscored_or_scheduled_games_are_not_completed():
+    assert not ratings.is_completed(game(1, 'A', 'B', status='final'))
+    assert not ratings.is_completed(dict(game(1, 'A', 'B', 0, 0, status='scheduled'), winner=None))
+
+
+def test_winner_gains_what_loser_loses(model):
+    assert model.fit([game(1, 'A', 'B', 10, 30), game(1, 'C', 'D', 27, 24)]) == [ratings.week_key(2024, 2, 1)]
+    current = dict(zip(model.teams, model.ratings))
+    assert current['B'] > ratings.MEAN_RATING > current['A']
+    assert current['C'] > ratings.MEAN_RATING > current['D']
+    assert sum(current.values()) == pytest.approx(4 * ratings.MEAN_RATING)
+    # A road win by 20 moves more than a home win by 3
+    assert current['B'] - ratings.MEAN_RATING > current['C'] - ratings.MEAN_RATING
+
+
+def test_fit_stops_at_unfinished_week_and_resumes(model, tmp_path):
+    week_1 = [game(1, 'A', 'B', 21, 7)]
+    week_2 = [game(2, 'B', 'A', status='scheduled')]
+    assert model.fit(week_1 + week_2) == [ratings.week_key(2024, 2, 1)]
+    model.save()
+
+    resumed = ratings.RatingModel(str(tmp_path / 'team-ratings.json'))
+    finished = [game(2, 'B', 'A', 14, 10)]
+    assert resumed.fit(week_1 + finished) == [ratings.week_key(2024, 2, 2)]
+
+    in_one_pass = ratings.RatingModel(str(tmp_path / 'other.json'))
+    in_one_pass.fit(week_1 + finished)
+    assert resumed.ratings_for(2024) == in_one_pass.ratings_for(2024)
+
+
+def test_postponed_game_does_not_hold_the_week(model):
+    applied = model.fit([game(1, 'A', 'B', 21, 7), game(1, 'C', 'D', status='postponed')])
+    assert applied == [ratings.week_key(2024, 2, 1)]
+    assert 'C' not in model.teams
+
+
+def test_next_season_regresses_to_the_mean(model):
+    model.fit([game(1, 'A', 'B', 35, 0)])
+    last = model.ratings_for(2024)
+    carried = model.ratings_for(2025)
+    for team, rating in last.items():
+        assert carried[team] - ratings.MEAN_RATING == pytest.approx((rating - ratings.MEAN_RATING) * (1 - ratings.SEASON_REVERSION))
+
+
+def test_win_probability_matrix(model):
+    model.fit([game(1, 'A', 'B', 35, 0)])
+    neutral = model.win_probability_matrix(['A', 'B'], 2024, home_field=0)
+    assert np.diag(neutral).tolist() == [0.5, 0.5]
+    assert neutral[0, 1] + neutral[1, 0] == pytest.approx(1.0)
+    assert neutral[0, 1] > 0.5
+    assert model.win_probability_matrix(['A', 'B'], 2024)[1, 0] > neutral[1, 0]
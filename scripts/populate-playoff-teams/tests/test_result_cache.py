@@ -0,0 +1,91 @@
+"""Tests for result_cache.ResultCache: tiers, LRU eviction and scope invalidation."""
+
+import itertools
+import os
+
+import pytest
+
+import result_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A time.time that ticks one second per call, so used_at orders every access."""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(result_cache.time, 'time', lambda: float(next(ticks)))
+
+
+def test_canonical_hash_ignores_key_order():
+    assert result_cache.canonical_hash({'a': 1, 'b': [1, 2]}) == result_cache.canonical_hash({'b': [1, 2], 'a': 1})
+    assert result_cache.canonical_hash({'a': 1}) != result_cache.canonical_hash({'a': 2})
+
+
+def test_memory_then_disk_hits(tmp_path):
+    cache = result_cache.ResultCache(str(tmp_path))
+    assert cache.get('k') is None
+    cache.put('k', {'runs': 10})
+    assert cache.get('k') == {'runs': 10}
+    assert cache.hits == {'memory': 1, 'disk': 0} and cache.misses == 1
+
+    reopened = result_cache.ResultCache(str(tmp_path))
+    assert reopened.get('k') == {'runs': 10}
+    assert reopened.hits == {'memory': 0, 'disk': 1}
+
+
+def test_memory_lru_falls_back_to_disk(tmp_path):
+    cache = result_cache.ResultCache(str(tmp_path), memory_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, key)
+    assert list(cache._memory) == ['b', 'c']
+    assert cache.get('a') == 'a'
+    assert cache.hits['disk'] == 1
+    assert list(cache._memory) == ['c', 'a']
+
+
+def test_disk_eviction_drops_least_recently_used(tmp_path, clock):
+    value = 'x' * 100
+    cache = result_cache.ResultCache(str(tmp_path), max_disk_bytes=250)
+    cache.put('a', value)
+    cache.put('b', value)
+    # Memory hits do not touch used_at, so read a back from disk
+    cache._memory.clear()
+    cache.get('a')
+    cache.put('c', value)
+
+    assert set(cache._index) == {'a', 'c'}
+    assert not os.path.exists(os.path.join(str(tmp_path), 'b.json'))
+    assert result_cache.ResultCache(str(tmp_path)).get('b') is None
+
+
+def test_new_inputs_invalidate_the_scope(tmp_path):
+    cache = result_cache.ResultCache(str(tmp_path))
+    cache.put('runs-1000', 1, scope='simulate:2025', inputs='before')
+    cache.put('runs-5000', 2, scope='simulate:2025', inputs='before')
+    cache.put('other-season', 3, scope='simulate:2024', inputs='before')
+    assert len(cache._index) == 3
+
+    # A game finished: results for the old inputs are stale
+    cache.put('runs-1000-after', 4, scope='simulate:2025', inputs='after')
+    assert cache.get('runs-1000') is None
+    assert cache.get('runs-5000') is None
+    assert cache.get('other-season') == 3
+    assert set(cache._index) == {'other-season', 'runs-1000-after'}
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = result_cache.ResultCache(str(tmp_path))
+    cache.put('k', [1, 2, 3])
+    with open(os.path.join(str(tmp_path), 'k.json'), 'w') as f:
+        f.write('{not json')
+    reopened = result_cache.ResultCache(str(tmp_path))
+    assert reopened.get('k') is None
+    assert 'k' not in reopened._index
+
+
+def test_clear(tmp_path):
+    cache = result_cache.ResultCache(str(tmp_path))
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.clear() == 2
+    assert cache.get('a') is None
+    assert result_cache.ResultCache(str(tmp_path))._index == {}
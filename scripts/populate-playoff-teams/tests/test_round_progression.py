@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Tests for round_progression.advance_rounds against a throwaway SQLite database.
+
+    python -m pytest scripts/populate-playoff-teams/tests
+"""
+
+import unittest
+
+import pytest
+
+import interactive_mode
+import local_db
+import round_progression
+
+SEASON = 2025
+
+
+def no_espn_games(week):
+    return []
+
+
+class AdvanceRoundsTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _field(self, playoff_teams):
+        self.playoff_teams = playoff_teams
+
+    def setUp(self):
+        self.supabase = local_db.LocalClient(':memory:')
+        self.supabase.table('playoff_teams').insert(self.playoff_teams).execute()
+
+        # Wild Card round final, home teams won
+        teams_by_conf = interactive_mode.get_playoff_teams(self.supabase, SEASON)
+        wild_card = round_progression.build_week(1, teams_by_conf, [])
+        rows = interactive_mode.build_playoff_game_rows(SEASON, 1, wild_card, [])
+        for row in rows:
+            row.update(winner=row['home_team'], status='final')
+        self.supabase.table('games').insert(rows).execute()
+
+    def _week(self, week):
+        return round_progression.fetch_playoff_games(self.supabase, SEASON)[week]
+
+    def _insert_stale_divisional(self, winner=False):
+        """Divisional games from an earlier bracket: real teams, wrong pairings."""
+        games = [{'away_team': g['home_team'], 'home_team': g['away_team']}
+                 for g in round_progression.build_week(2, interactive_mode.get_playoff_teams(self.supabase, SEASON),
+                                                       self._week(1))]
+        rows = interactive_mode.build_playoff_game_rows(SEASON, 2, games[:2], [])
+        for row in rows:
+            row['id'] = f"stale_{row['id']}"
+            if winner:
+                row.update(winner=row['home_team'], status='final')
+        self.supabase.table('games').insert(rows).execute()
+        return [row['id'] for row in rows]
+
+    def test_writes_next_round(self):
+        result = round_progression.advance_rounds(self.supabase, SEASON, fetch_espn_games=no_espn_games)
+        self.assertEqual(result['status'], 'advanced')
+        self.assertEqual(result['week'], 2)
+        self.assertEqual(len(self._week(2)), 4)
+
+        again = round_progression.advance_rounds(self.supabase, SEASON, fetch_espn_games=no_espn_games)
+        self.assertEqual(again['status'], 'waiting')
+
+    def test_replaces_mismatched_week(self):
+        stale_ids = self._insert_stale_divisional()
+
+        result = round_progression.advance_rounds(self.supabase, SEASON, fetch_espn_games=no_espn_games)
+        self.assertEqual(result['status'], 'advanced')
+        self.assertEqual(sorted(result['removed']), sorted(stale_ids))
+        stored = self._week(2)
+        self.assertEqual({g['id'] for g in stored}, {row['id'] for row in result['games']})
+        self.assertEqual(round_progression._matchups(stored), round_progression._matchups(result['games']))
+
+        again = round_progression.advance_rounds(self.supabase, SEASON, fetch_espn_games=no_espn_games)
+        self.assertEqual(again['status'], 'waiting')
+
+    def test_dry_run_reports_stale_games(self):
+        stale_ids = self._insert_stale_divisional()
+
+        result = round_progression.advance_rounds(self.supabase, SEASON, write=False, fetch_espn_games=no_espn_games)
+        self.assertEqual(result['status'], 'dry_run')
+        self.assertEqual(sorted(result['removed']), sorted(stale_ids))
+        self.assertEqual(sorted(g['id'] for g in self._week(2)), sorted(stale_ids))
+
+    def test_mismatched_week_with_results_is_a_conflict(self):
+        stale_ids = self._insert_stale_divisional(winner=True)
+
+        result = round_progression.advance_rounds(self.supabase, SEASON, fetch_espn_games=no_espn_games)
+        self.assertEqual(result['status'], 'conflict')
+        self.assertEqual(sorted(g['id'] for g in self._week(2)), sorted(stale_ids))
+
+
+class WatchTest(unittest.TestCase):
+    _field = AdvanceRoundsTest._field
+
+    def setUp(self):
+        AdvanceRoundsTest.setUp(self)
+        self._get_espn_game_ids = interactive_mode.get_espn_game_ids
+
+    def tearDown(self):
+        interactive_mode.get_espn_game_ids = self._get_espn_game_ids
+
+    def test_failed_poll_is_retried(self):
+        calls = []
+
+        def flaky_espn(season, week, strict=False):
+            calls.append(week)
+            if len(calls) == 1:
+                raise RuntimeError('ESPN scoreboard unavailable')
+            return []
+
+        interactive_mode.get_espn_game_ids = flaky_espn
+        results = []
+        last = round_progression.watch(self.supabase, SEASON, 0, results.append, max_polls=3)
+        self.assertEqual([r['status'] for r in results], ['error', 'advanced'])
+        self.assertEqual(results[0]['reason'], 'espn_unavailable')
+        self.assertEqual(last['status'], 'advanced')
+        self.assertEqual(len(AdvanceRoundsTest._week(self, 2)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for scenarios: clinch bounds, safe pruning and exact enumeration."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import scenarios
+import seeding
+
+SEASON = 2025
+
+
+@pytest.fixture
+def schedule(nfl_teams):
+    names = {t['abbreviation']: t['name'] for t in nfl_teams}
+
+    def build(results, remaining=()):
+        """Completed (winner, loser) games won 20-10 at home, plus scheduled (home, away) games."""
+        games = [{'home_team': names[w], 'away_team': names[l], 'home_score': 20, 'away_score': 10,
+                  'status': 'final', 'winner': names[w]} for w, l in results]
+        games += [{'home_team': names[h], 'away_team': names[a], 'home_score': None, 'away_score': None,
+                   'status': 'scheduled', 'winner': None} for h, a in remaining]
+        return games
+
+    return build
+
+
+def by_team(result):
+    return {t['team_abbreviation']: t for t in result['teams']}
+
+
+def test_exact_result_and_clinched_seed(schedule, nfl_teams):
+    # BUF is 3-0 with one game left; no other AFC team can reach its worst record
+    games = schedule([('BUF', 'NE'), ('BUF', 'NYJ'), ('BUF', 'KC'),
+                      ('DAL', 'MIA'), ('NYG', 'MIA'), ('PHI', 'MIA')], remaining=[('BUF', 'MIA')])
+    result = scenarios.run_scenarios(games, nfl_teams, SEASON, workers=1)
+    assert result['method'] == 'exact'
+    assert result['outcomes'] == 2
+    teams = by_team(result)
+    assert teams['BUF']['status'] == 'clinched #1'
+    assert teams['BUF']['seed_probability'] == {'1': 1.0}
+    # MIA is the #5 seed when it wins (1-3 beats every 0-x wild card candidate)
+    assert teams['MIA']['seed_probability'].get('5') == 0.5
+
+    afc = [t for t in result['teams'] if t['conference'] == 'AFC']
+    assert sum(t['playoff_probability'] for t in afc) == pytest.approx(7)
+    for seed in range(1, 8):
+        assert sum(t['seed_probability'].get(str(seed), 0) for t in afc) == pytest.approx(1)
+
+
+def test_home_probability_weights_outcomes(schedule, nfl_teams):
+    games = schedule([('BUF', 'NE'), ('BUF', 'NYJ'), ('BUF', 'KC'),
+                      ('DAL', 'MIA'), ('NYG', 'MIA'), ('PHI', 'MIA')], remaining=[('BUF', 'MIA')])
+    result = scenarios.run_scenarios(games, nfl_teams, SEASON, workers=1, home_probability=lambda h, a: 0.75)
+    assert by_team(result)['MIA']['seed_probability'].get('5') == 0.25
+
+
+def test_chunked_enumeration_matches_one_chunk(schedule, nfl_teams):
+    games = schedule([('BUF', 'NE'), ('KC', 'LV'), ('BAL', 'CIN')],
+                     remaining=[('BUF', 'MIA'), ('NE', 'NYJ'), ('KC', 'DEN'), ('LAC', 'LV'), ('PIT', 'CLE')])
+    whole = scenarios.run_scenarios(games, nfl_teams, SEASON, workers=1)
+    chunked = scenarios.run_scenarios(games, nfl_teams, SEASON, workers=2, chunk_size=8)
+    assert whole['outcomes'] == chunked['outcomes'] == 32
+    assert whole['teams'] == chunked['teams']
+
+
+def test_monte_carlo_is_repeatable_with_a_seed(schedule, nfl_teams):
+    games = schedule([('BUF', 'NE')], remaining=[('BUF', 'MIA'), ('KC', 'DEN'), ('PIT', 'CLE')])
+    runs = [scenarios.run_scenarios(games, nfl_teams, SEASON, exact_limit=1, samples=40, chunk_size=16,
+                                    workers=2, random_seed=7) for _ in range(2)]
+    assert runs[0]['method'] == 'monte_carlo'
+    assert runs[0]['teams'] == runs[1]['teams']
+
+
+def test_only_games_no_contender_depends_on_are_pruned(schedule, nfl_teams):
+    code = seeding.team_codes(nfl_teams)
+    names = {t['abbreviation']: t['name'] for t in nfl_teams}
+    games = schedule([('BUF', 'MIA')])
+    standings = seeding.Standings(nfl_teams, *seeding.result_matrices(nfl_teams, games))
+    eliminated = np.zeros(len(nfl_teams), dtype=bool)
+    for team in ('MIA', 'NYJ', 'JAX', 'TEN', 'CAR'):
+        eliminated[code(names[team])] = True
+    remaining = [(code(names[h]), code(names[a])) for h, a in
+                 [('NYJ', 'MIA'), ('JAX', 'TEN'), ('CAR', 'TB'), ('NO', 'TB')]]
+
+    pruned = scenarios.prunable_games(standings, remaining, eliminated)
+    # MIA has played BUF, and CAR still plays TB; only JAX v TEN moves no contender's tiebreaks
+    assert pruned == [(code(names['JAX']), code(names['TEN']))]
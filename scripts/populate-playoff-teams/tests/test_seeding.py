@@ -0,0 +1,76 @@
+"""Tests for seeding tiebreaks on small inline schedules (teams by abbreviation)."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import seeding
+
+
+@pytest.fixture
+def standings_for(nfl_teams):
+    names = {t['abbreviation']: t['name'] for t in nfl_teams}
+
+    def build(results):
+        """Standings from (winner, loser) abbreviation pairs, each a 20-10 win at home."""
+        games = [{'home_team': names[winner], 'away_team': names[loser], 'home_score': 20, 'away_score': 10,
+                  'status': 'final', 'winner': names[winner]} for winner, loser in results]
+        return seeding.Standings(nfl_teams, *seeding.result_matrices(nfl_teams, games))
+
+    return build
+
+
+def ranked(standings, teams, kind):
+    index = {name: i for i, name in enumerate(standings.names)}
+    return [standings.names[i] for i in standings.rank([index[t] for t in teams], kind)]
+
+
+def test_division_tie_goes_to_head_to_head(standings_for):
+    # MIA and BUF both 1-1; MIA won their meeting
+    standings = standings_for([('MIA', 'BUF'), ('BUF', 'KC'), ('KC', 'MIA')])
+    assert ranked(standings, ['BUF', 'MIA'], 'division') == ['MIA', 'BUF']
+
+
+def test_split_head_to_head_falls_to_division_record(standings_for):
+    # Split season series, both 2-2; BUF also beat NE, MIA lost to NYJ
+    standings = standings_for([('MIA', 'BUF'), ('BUF', 'MIA'), ('BUF', 'NE'), ('NYJ', 'MIA'),
+                               ('MIA', 'DAL'), ('KC', 'BUF')])
+    assert standings.pct[standings.names.index('BUF')] == standings.pct[standings.names.index('MIA')]
+    assert ranked(standings, ['BUF', 'MIA'], 'division') == ['BUF', 'MIA']
+
+
+def test_wild_card_sweep_separates_three_teams(standings_for):
+    # BUF, BAL and HOU are all 2-2; BUF beat both others, BAL beat HOU
+    standings = standings_for([('BUF', 'BAL'), ('BUF', 'HOU'), ('KC', 'BUF'), ('LV', 'BUF'),
+                               ('BAL', 'HOU'), ('BAL', 'LAC'), ('DEN', 'BAL'),
+                               ('HOU', 'DAL'), ('HOU', 'NYG')])
+    assert ranked(standings, ['HOU', 'BAL', 'BUF'], 'wildcard') == ['BUF', 'BAL', 'HOU']
+
+
+def test_wild_card_without_sweep_uses_conference_record(standings_for):
+    # A three-way cycle is no sweep; HOU's 2-2 has the best conference record
+    standings = standings_for([('BUF', 'BAL'), ('BAL', 'HOU'), ('HOU', 'BUF'),
+                               ('BUF', 'DAL'), ('KC', 'BUF'),
+                               ('BAL', 'NYG'), ('DEN', 'BAL'),
+                               ('HOU', 'LAC'), ('PHI', 'HOU')])
+    assert ranked(standings, ['BUF', 'BAL', 'HOU'], 'wildcard')[0] == 'HOU'
+
+
+def test_unbroken_tie_goes_to_first_abbreviation(standings_for):
+    standings = standings_for([])
+    assert ranked(standings, ['PIT', 'CLE', 'BAL', 'CIN'], 'division') == ['BAL', 'CIN', 'CLE', 'PIT']
+
+
+@pytest.mark.parametrize('season, seed_count', [(2019, 6), (2020, 7)])
+def test_division_champions_take_the_top_seeds(nfl_teams, season, seed_count):
+    names = {t['abbreviation']: t['name'] for t in nfl_teams}
+    # MIA (2-1) is a wild card behind BUF, ahead of the winless AFC North/South/West champions
+    results = [('BUF', 'MIA'), ('BUF', 'NE'), ('MIA', 'NYJ'), ('MIA', 'DAL')]
+    games = [{'home_team': names[w], 'away_team': names[l], 'home_score': 20, 'away_score': 10,
+              'status': 'final', 'winner': names[w]} for w, l in results]
+    teams = seeding.project_seeds(games, nfl_teams, season)
+    afc = {t['seed']: t['team_abbreviation'] for t in teams if t['conference'] == 'AFC'}
+    assert sorted(afc) == list(range(1, seed_count + 1))
+    assert afc[1] == 'BUF'
+    assert afc[5] == 'MIA'
+    assert set(afc[seed] for seed in (2, 3, 4)) == {'BAL', 'HOU', 'DEN'}
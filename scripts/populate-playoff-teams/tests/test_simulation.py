@@ -0,0 +1,82 @@
+"""Tests for the simulated bracket, deterministic shards and the seeded field."""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import simulation
+
+SEASON = 2025
+
+
+def home_always_wins(seed_count):
+    teams = 2 * seed_count
+    return np.ones((teams, teams)), np.zeros((teams, teams))
+
+
+@pytest.mark.parametrize('seed_count, byes', [(7, 1), (6, 2)])
+def test_favourites_win_every_round(seed_count, byes):
+    home, neutral = home_always_wins(seed_count)
+    counts = simulation.simulate_bracket(np.random.default_rng(0), 10, home, neutral, seed_count)
+    afc = counts[:seed_count]
+    assert afc[:, 0].tolist() == [10] * seed_count
+    # Byes and the wild card hosts reach the Divisional round; the road teams never do
+    assert afc[:, 1].tolist() == [10] * 4 + [0] * (seed_count - 4)
+    assert afc[:, 2].tolist() == [10, 10] + [0] * (seed_count - 2)
+    assert afc[:, 3].tolist() == [10] + [0] * (seed_count - 1)
+    # neutral_matrix[nfc, afc] is 0, so the AFC #1 wins every Super Bowl
+    assert counts[0, 4] == 10
+    assert counts[seed_count:, 4].sum() == 0
+
+
+def test_round_totals_with_coin_flips():
+    seed_count, runs = 7, 2000
+    coin = np.full((14, 14), 0.5)
+    counts = simulation.simulate_bracket(np.random.default_rng(1), runs, coin, coin, seed_count)
+    assert counts.sum(axis=0).tolist() == [14 * runs, 8 * runs, 4 * runs, 2 * runs, runs]
+    # The #1 seed's bye shows: it reaches the Divisional round every time
+    assert counts[0, 1] == runs and counts[7, 1] == runs
+
+
+def test_same_seed_gives_same_totals_with_any_worker_count(monkeypatch):
+    monkeypatch.setattr(simulation, 'SHARD_RUNS', 100)
+    coin = np.full((14, 14), 0.5)
+    one, entropy = simulation.run_simulation(coin, coin, 7, runs=350, workers=1, random_seed=42)
+    three, _ = simulation.run_simulation(coin, coin, 7, runs=350, workers=3, random_seed=42)
+    assert entropy == 42
+    assert one.tolist() == three.tolist()
+    assert one[:, 4].sum() == 350
+
+
+def test_decided_games_are_fixed(playoff_teams):
+    field = playoff_teams  # AFC seeds 1-7 are rows 0-6
+    home, neutral = np.full((14, 14), 0.5), np.full((14, 14), 0.5)
+    winner, loser = field[1]['team_name'], field[6]['team_name']
+    applied = simulation.apply_results(field, (home, neutral), [(loser, winner), ('Nobody', winner)])
+    assert applied == [(loser, winner)]
+    assert home[6, 1] == 1.0 and home[1, 6] == 0.0 and neutral[6, 1] == 1.0
+
+    counts = simulation.simulate_bracket(np.random.default_rng(2), 500, home, neutral, 7)
+    assert counts[1, 1] == 0 and counts[6, 1] == 500
+
+
+def test_parse_assumption(playoff_teams, nfl_teams):
+    first, second = playoff_teams[0], playoff_teams[1]
+    assert simulation.parse_assumption(f"{first['team_abbreviation']}>{second['team_abbreviation']}", playoff_teams,
+                                       nfl_teams) == (first['team_name'], second['team_name'])
+    with pytest.raises(ValueError):
+        simulation.parse_assumption(first['team_abbreviation'], playoff_teams, nfl_teams)
+
+
+@pytest.mark.parametrize('season, seed_count', [(2019, 6), (2025, 7)])
+def test_seeded_field(db, field_for, season, seed_count):
+    db.table('playoff_teams').insert(field_for(season)).execute()
+    field, count = simulation.get_seeded_field(db, season)
+    assert count == seed_count
+    assert [t['seed'] for t in field] == list(range(1, seed_count + 1)) * 2
+
+
+def test_incomplete_field_is_rejected(db, playoff_teams):
+    db.table('playoff_teams').insert([t for t in playoff_teams if t['seed'] != 3]).execute()
+    with pytest.raises(ValueError):
+        simulation.get_seeded_field(db, SEASON)
@@ -0,0 +1,132 @@
+"""Tests for validation: what gets rejected before anything is written."""
+
+import pytest
+
+import interactive_mode
+import validation
+
+SEASON = 2025
+
+
+def by_conference(teams):
+    field = {'AFC': {}, 'NFC': {}}
+    for team in teams:
+        field[team['conference']][team['seed']] = team['team_name']
+    return field
+
+
+def test_complete_field_is_valid(playoff_teams, field_for, nfl_teams):
+    assert validation.validate_teams(playoff_teams, SEASON, nfl_teams) == []
+    assert validation.validate_teams(field_for(2019), 2019, nfl_teams) == []
+
+
+@pytest.mark.parametrize('change, message', [
+    ({'team_name': 'Springfield Atoms'}, "is not an NFL team"),
+    ({'team_abbreviation': 'XYZ'}, "does not match"),
+    ({'conference': 'NFC'}, "plays in the AFC"),
+    ({'conference': 'ABC'}, "conference must be AFC or NFC"),
+    ({'seed': 8}, "seed must be a whole number from 1 to 7"),
+    ({'seed': '2'}, "seed must be a whole number"),
+])
+def test_bad_team_is_rejected(playoff_teams, nfl_teams, change, message):
+    playoff_teams[0].update(change)
+    errors = validation.validate_teams(playoff_teams, SEASON, nfl_teams)
+    assert any(message in error for error in errors), errors
+
+
+def test_seven_seeds_before_2020_are_rejected(playoff_teams, nfl_teams):
+    field = [dict(team, season=2019) for team in playoff_teams]
+    errors = validation.validate_teams(field, 2019, nfl_teams)
+    assert any('from 1 to 6' in error for error in errors)
+
+
+def test_duplicates_and_missing_seeds(playoff_teams, nfl_teams):
+    same_seed = dict(playoff_teams[1], seed=playoff_teams[0]['seed'])
+    errors = validation.validate_teams([playoff_teams[0], dict(playoff_teams[0]), same_seed], SEASON, nfl_teams)
+    assert any('listed twice' in error for error in errors)
+    assert any('AFC #1 is already' in error for error in errors)
+    assert any(error.startswith('AFC: missing seed(s) #2') for error in errors)
+    # A partial field is fine for updates
+    assert validation.validate_teams(playoff_teams[:3], SEASON, nfl_teams, complete=False) == []
+
+
+def test_not_a_list(nfl_teams):
+    assert validation.validate_teams({'team_name': 'Buffalo Bills'}, SEASON, nfl_teams) == \
+        ['Teams must be a list of team objects, got dict']
+
+
+def test_generated_wild_card_games_are_valid(playoff_teams, nfl_teams):
+    field = by_conference(playoff_teams)
+    games = interactive_mode.generate_wild_card_games(field)
+    assert validation.validate_games(games, 1, nfl_teams, field) == []
+
+
+@pytest.mark.parametrize('change, message', [
+    (lambda g: g.update(home_seed=g['away_seed'], away_seed=g['home_seed'],
+                        home_team=g['away_team'], away_team=g['home_team']), "the better seed hosts"),
+    (lambda g: g.update(away_team=g['home_team']), "a team cannot play itself"),
+    (lambda g: g.update(conference='NFC'), "is not in the NFC"),
+    (lambda g: g.update(away_seed=6), "is not a Wild Card pairing"),
+    (lambda g: g.update(home_seed=1, away_seed=8), "away_seed must be a whole number from 1 to 7"),
+])
+def test_bad_wild_card_game_is_rejected(playoff_teams, nfl_teams, change, message):
+    field = by_conference(playoff_teams)
+    games = interactive_mode.generate_wild_card_games(field)
+    change(games[0])
+    errors = validation.validate_games(games, 1, nfl_teams, field)
+    assert any(message in error for error in errors), errors
+
+
+def test_seeds_must_match_the_field(playoff_teams, nfl_teams):
+    field = by_conference(playoff_teams)
+    games = interactive_mode.generate_wild_card_games(field)
+    swapped = {conf: dict(seeds) for conf, seeds in field.items()}
+    swapped['AFC'][2], swapped['AFC'][3] = field['AFC'][3], field['AFC'][2]
+    errors = validation.validate_games(games, 1, nfl_teams, swapped)
+    assert any('is not the AFC #2 seed' in error for error in errors)
+
+
+def test_six_seed_wild_card_round(field_for, nfl_teams):
+    field = by_conference(field_for(2019))
+    games = interactive_mode.generate_wild_card_games(field)
+    assert len(games) == 4
+    assert validation.validate_games(games, 1, nfl_teams, field, seed_count=6) == []
+    # With six seeds #2 has a bye too
+    two_hosts = games + [{'home_team': field['AFC'][2], 'away_team': field['AFC'][5], 'conference': 'AFC',
+                          'home_seed': 2, 'away_seed': 5}]
+    errors = validation.validate_games(two_hosts, 1, nfl_teams, seed_count=6)
+    assert any('Week 1 has 5 games; the round has 4' in error for error in errors)
+    assert any('#1-#2 have a Wild Card bye' in error for error in errors)
+
+
+def test_super_bowl_is_afc_against_nfc(nfl_teams):
+    game = {'home_team': 'Buffalo Bills', 'away_team': 'Kansas City Chiefs', 'conference': 'SUPER_BOWL',
+            'home_seed': 1, 'away_seed': 2}
+    assert any('AFC vs NFC' in error for error in validation.validate_games([game], 4, nfl_teams))
+
+
+@pytest.mark.parametrize('change, message', [
+    ({'id': ''}, "id must be a non-empty string"),
+    ({'season_type': 1}, "season_type must be 2"),
+    ({'week': 5}, "week must be a whole number from 1 to 4"),
+    ({'home_score': -3}, "home_score must be empty or a whole number"),
+    ({'winner': 'Detroit Lions'}, "is neither team"),
+    ({'kickoff_time': None}, "kickoff_time is required"),
+])
+def test_bad_game_row_is_rejected(nfl_teams, change, message):
+    row = {'id': '401', 'season': SEASON, 'season_type': 3, 'week': 1, 'home_team': 'Buffalo Bills',
+           'away_team': 'Denver Broncos', 'home_score': 31, 'away_score': 7, 'winner': 'Buffalo Bills',
+           'kickoff_time': '2026-01-11T18:00:00Z'}
+    assert validation.check_game_row(row, nfl_teams, 'Line 1') == []
+    row.update(change)
+    errors = validation.check_game_row(row, nfl_teams, 'Line 1')
+    assert any(message in error for error in errors), errors
+
+
+def test_invalid_games_are_not_written(db, playoff_teams):
+    db.table('playoff_teams').insert(playoff_teams).execute()
+    games = interactive_mode.generate_wild_card_games(by_conference(playoff_teams))
+    games[0]['away_seed'] = 6
+    summary = interactive_mode.insert_playoff_games(db, SEASON, 1, games, [], espn_games=[])
+    assert summary['errors'] and summary['inserted'] == []
+    assert db.table('games').select('id').eq('season', SEASON).execute().data == []
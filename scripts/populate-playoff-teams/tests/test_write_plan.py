@@ -0,0 +1,95 @@
+"""Tests for write plans: the planned operations, applying them and refusing stale plans."""
+
+import pytest
+
+import write_plan
+
+SEASON = 2025
+
+
+def game_row(game_id, home, away, kickoff='2026-01-10T18:00:00Z'):
+    return {'id': game_id, 'season': SEASON, 'season_type': 3, 'week': 1, 'home_team': home,
+            'away_team': away, 'kickoff_time': kickoff}
+
+
+def stored_teams(db):
+    rows = db.table('playoff_teams').select('*').eq('season', SEASON).execute().data
+    return {r['team_name']: (r['team_abbreviation'], r['conference'], r['seed']) for r in rows}
+
+
+def test_empty_table_is_one_upsert(db, playoff_teams):
+    plan = write_plan.plan_teams(db, SEASON, playoff_teams)
+    assert [op['action'] for op in plan['operations']] == ['upsert']
+    assert plan['requests'] == 1 and plan['rows'] == len(playoff_teams) and plan['unchanged'] == 0
+    assert plan['baseline'] == {'requests': 2, 'rows': len(playoff_teams)}
+
+
+def test_teams_plan_holds_only_changes(db, playoff_teams, nfl_teams):
+    db.table('playoff_teams').insert(playoff_teams).execute()
+    field = [dict(t) for t in playoff_teams]
+    dropped = field.pop()
+    field[0]['team_abbreviation'] = 'CHG'
+    newcomer = next(t for t in nfl_teams if t['conference'] == dropped['conference']
+                    and t['name'] not in stored_teams(db))
+    field.append(dict(dropped, team_name=newcomer['name'], team_abbreviation=newcomer['abbreviation']))
+
+    plan = write_plan.plan_teams(db, SEASON, field)
+    delete, upsert = plan['operations']
+    assert delete['action'] == 'delete'
+    assert delete['match'] == {'season': SEASON, 'team_name': [dropped['team_name']]}
+    assert upsert['action'] == 'upsert' and upsert['row_count'] == 2
+    assert plan['unchanged'] == len(field) - 2
+    assert any(line.startswith(f"~ {field[0]['team_name']}: team_abbreviation") for line in upsert['diff'])
+
+    assert write_plan.apply_plan(db, plan) == 2
+    assert stored_teams(db) == {t['team_name']: (t['team_abbreviation'], t['conference'], t['seed']) for t in field}
+    # Applied: a new plan has nothing to write
+    assert write_plan.plan_teams(db, SEASON, field)['operations'] == []
+
+
+def test_games_plan_inserts_new_and_updates_changed(db):
+    db.table('games').insert([game_row('g1', 'Buffalo Bills', 'Denver Broncos'),
+                              game_row('g2', 'Detroit Lions', 'Green Bay Packers')]).execute()
+    db.table('games').update({'home_score': 24}).eq('id', 'g2').execute()
+    rows = [game_row('g1', 'Buffalo Bills', 'Denver Broncos'),
+            game_row('g2', 'Detroit Lions', 'Green Bay Packers', kickoff='2026-01-11T21:30:00Z'),
+            game_row('g3', 'Houston Texans', 'Pittsburgh Steelers')]
+
+    plan = write_plan.plan_games(db, SEASON, 1, rows)
+    assert [(op['action'], op['row_count']) for op in plan['operations']] == [('insert', 1), ('update', 1)]
+    assert plan['unchanged'] == 1
+    assert plan['baseline'] == {'requests': 3, 'rows': 3}
+
+    write_plan.apply_plan(db, plan)
+    games = {g['id']: g for g in db.table('games').select('*').eq('season', SEASON).execute().data}
+    assert sorted(games) == ['g1', 'g2', 'g3']
+    # Only the matchup and kickoff are updated; the score is left alone
+    assert games['g2']['kickoff_time'] == '2026-01-11T21:30:00Z' and games['g2']['home_score'] == 24
+
+
+def test_stale_plan_is_refused(db, playoff_teams, tmp_path):
+    db.table('playoff_teams').insert(playoff_teams).execute()
+    field = [dict(t) for t in playoff_teams]
+    field[0]['seed'], field[1]['seed'] = field[1]['seed'], field[0]['seed']
+    path = str(tmp_path / 'plan.json')
+    write_plan.save_plan(write_plan.plan_teams(db, SEASON, field), path)
+
+    # Someone else writes in between
+    db.table('playoff_teams').update({'seed': 7}).eq('team_name', field[2]['team_name']).execute()
+    plan = write_plan.load_plan(path)
+    with pytest.raises(write_plan.PlanError, match='changed since the plan was made'):
+        write_plan.apply_plan(db, plan)
+    assert write_plan.run_apply_plan(db, path) == 1
+    assert stored_teams(db)[field[0]['team_name']][2] == 1
+
+    assert write_plan.run_apply_plan(db, path, force=True) == 0
+    assert stored_teams(db)[field[0]['team_name']][2] == 2
+
+
+def test_unreadable_plan(tmp_path):
+    path = tmp_path / 'plan.json'
+    path.write_text('{"version": 99}')
+    with pytest.raises(write_plan.PlanError, match='is not a version 1 write plan'):
+        write_plan.load_plan(str(path))
+    with pytest.raises(write_plan.PlanError, match='Cannot read plan'):
+        write_plan.load_plan(str(tmp_path / 'missing.json'))
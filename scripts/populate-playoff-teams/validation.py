@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Checks for playoff team and game payloads, run before anything is written.
+
+    errors = validation.validate_teams(teams, season, NFL_TEAMS)
+    errors += validation.validate_games(games, week, NFL_TEAMS, teams_by_conf)
+
+Both return every problem found (an empty list means the payload is fine), so a bad
+file is reported in one go and never costs a database round trip. Team names and
+abbreviations are resolved through a TeamRegistry built once per team list: dicts
+keyed by lower-cased name and by abbreviation (including the former names and
+aliases espn_matching knows), so every check is a dict or set lookup.
+
+Teams: each one must be an NFL team (name and abbreviation agreeing), in the conference
+it is listed under, with a whole-number seed from 1 to the season's seed count; no team
+or (conference, seed) may appear twice, and a complete field has every seed in both
+conferences. Games: known teams from one conference (AFC vs NFC in the Super Bowl),
+nobody playing twice in a week, the better seed at home, the #1 seed on a bye in the
+Wild Card round, wild card pairs adding up as 2 v 7, 3 v 6, 4 v 5, and (given the field)
+seeds that match it. Streamed input (ingest.py) is checked a record at a time with
+TeamChecker and check_game_row.
+"""
+
+from typing import List, Dict, Optional, Any, Tuple
+
+from espn_matching import ABBREVIATION_ALIASES, FORMER_NAMES
+import backfill
+
+CONFERENCES = ('AFC', 'NFC')
+SUPER_BOWL = 'SUPER_BOWL'
+# games.status values the app counts as finished (normalizeGameStatus in src/types/game.ts)
+FINISHED_STATUSES = frozenset({'finished', 'final', 'post'})
+
+
+def is_finished(status: Optional[str]) -> bool:
+    return str(status or '').lower() in FINISHED_STATUSES
+
+
+class TeamRegistry:
+    """Lookup tables for one list of NFL teams."""
+
+    def __init__(self, nfl_teams: List[Dict[str, str]]):
+        self.teams = {t['abbreviation']: t for t in nfl_teams}
+        self.by_name = dict(FORMER_NAMES)
+        self.by_name.update({t['name'].lower(): t['abbreviation'] for t in nfl_teams})
+        self.by_abbreviation = {abbr: abbr for abbr in self.teams}
+        self.by_abbreviation.update(ABBREVIATION_ALIASES)
+
+    def resolve_name(self, name: Any) -> Optional[str]:
+        return self.by_name.get(name.strip().lower()) if isinstance(name, str) else None
+
+    def resolve_abbreviation(self, abbreviation: Any) -> Optional[str]:
+        return self.by_abbreviation.get(abbreviation.strip().upper()) if isinstance(abbreviation, str) else None
+
+    def conference(self, abbreviation: str) -> str:
+        return self.teams[abbreviation]['conference']
+
+
+_registries: Dict[int, Tuple[List[Dict[str, str]], TeamRegistry]] = {}
+
+
+def registry_for(nfl_teams: List[Dict[str, str]]) -> TeamRegistry:
+    """The TeamRegistry for this team list, built on first use."""
+    cached = _registries.get(id(nfl_teams))
+    if cached is None or cached[0] is not nfl_teams:
+        cached = _registries[id(nfl_teams)] = (nfl_teams, TeamRegistry(nfl_teams))
+    return cached[1]
+
+
+def _seed(value: Any, seed_count: int) -> Optional[int]:
+    """The seed if it is a whole number from 1 to seed_count, else None."""
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    return value if 1 <= value <= seed_count else None
+
+
+class TeamChecker:
+    """validate_teams one team at a time, for any number of seasons (streamed input).
+
+    Remembers each season's teams and (conference, seed) pairs to report duplicates.
+    """
+
+    def __init__(self, nfl_teams: List[Dict[str, str]]):
+        self.registry = registry_for(nfl_teams)
+        self.seen_teams: Dict[Tuple[int, str], str] = {}
+        self.seen_seeds: Dict[Tuple[int, str, int], str] = {}
+
+    def check(self, team: Any, season: int, label: str) -> List[str]:
+        """Problems with one team of `season`'s field; `label` prefixes each message."""
+        if not isinstance(team, dict):
+            return [f"{label}: expected an object, got {type(team).__name__}"]
+        registry = self.registry
+        seed_count = backfill.seeds_per_conference(season)
+        errors = []
+        name, abbreviation = team.get('team_name'), team.get('team_abbreviation')
+        label = f"{label} ({name or abbreviation or 'unnamed'})"
+
+        abbr = registry.resolve_name(name)
+        if not name:
+            errors.append(f"{label}: missing team_name")
+        elif abbr is None:
+            errors.append(f"{label}: '{name}' is not an NFL team")
+        if abbreviation and abbr and registry.resolve_abbreviation(abbreviation) != abbr:
+            errors.append(f"{label}: abbreviation '{abbreviation}' does not match {registry.teams[abbr]['name']} ({abbr})")
+
+        conference = team.get('conference')
+        conf = conference.strip().upper() if isinstance(conference, str) else None
+        if conf not in CONFERENCES:
+            errors.append(f"{label}: conference must be AFC or NFC, got {conference!r}")
+            conf = None
+        elif abbr and registry.conference(abbr) != conf:
+            errors.append(f"{label}: plays in the {registry.conference(abbr)}, not the {conf}")
+
+        seed = _seed(team.get('seed'), seed_count)
+        if seed is None:
+            errors.append(f"{label}: seed must be a whole number from 1 to {seed_count}, got {team.get('seed')!r}")
+
+        if abbr:
+            if (season, abbr) in self.seen_teams:
+                errors.append(f"{label}: listed twice (also {self.seen_teams[(season, abbr)]})")
+            else:
+                self.seen_teams[(season, abbr)] = label
+        if conf and seed:
+            if (season, conf, seed) in self.seen_seeds:
+                errors.append(f"{label}: {conf} #{seed} is already {self.seen_seeds[(season, conf, seed)]}")
+            else:
+                self.seen_seeds[(season, conf, seed)] = label
+        return errors
+
+    def missing_seeds(self, season: int) -> List[str]:
+        """One message per conference of `season` without its full set of seeds."""
+        seed_count = backfill.seeds_per_conference(season)
+        errors = []
+        for conf in CONFERENCES:
+            missing = [f"#{seed}" for seed in range(1, seed_count + 1) if (season, conf, seed) not in self.seen_seeds]
+            if missing:
+                errors.append(f"{conf}: missing seed(s) {', '.join(missing)} ({seed_count} seeds per conference in {season})")
+        return errors
+
+
+def validate_teams(teams: List[Dict[str, any]], season: int, nfl_teams: List[Dict[str, str]],
+                   complete: bool = True) -> List[str]:
+    """Every problem with a playoff field; complete=False allows a partial field (updates)."""
+    if not isinstance(teams, list):
+        return [f"Teams must be a list of team objects, got {type(teams).__name__}"]
+    checker = TeamChecker(nfl_teams)
+    errors = []
+    for i, team in enumerate(teams, 1):
+        errors.extend(checker.check(team, season, f"Team {i}"))
+    if complete:
+        errors.extend(checker.missing_seeds(season))
+    return errors
+
+
+def _games_in_week(week: int, seed_count: int) -> int:
+    return {1: 2 * (seed_count - 4), 2: 4, 3: 2, 4: 1}[week]
+
+
+def validate_games(games: List[Dict[str, any]], week: int, nfl_teams: List[Dict[str, str]],
+                   teams_by_conf: Optional[Dict[str, Dict[int, str]]] = None, seed_count: int = 7) -> List[str]:
+    """Every problem with one week's games (dicts as built by the interactive_mode generators).
+
+    teams_by_conf ({conference: {seed: team_name}}), when given, is the field the seeds must match.
+    """
+    if week not in (1, 2, 3, 4):
+        return [f"Week {week} is not a playoff week (1-4)"]
+    registry = registry_for(nfl_teams)
+    errors = []
+    if len(games) > _games_in_week(week, seed_count):
+        errors.append(f"Week {week} has {len(games)} games; the round has {_games_in_week(week, seed_count)}")
+
+    field = {}
+    for conf, seeds in (teams_by_conf or {}).items():
+        field[conf] = {seed: registry.resolve_name(name) for seed, name in seeds.items()}
+
+    playing: Dict[str, str] = {}
+    for game in games:
+        home, away = game.get('home_team'), game.get('away_team')
+        label = f"{away or '?'} @ {home or '?'}"
+        sides = {'home': registry.resolve_name(home), 'away': registry.resolve_name(away)}
+        for side, team in (('home', home), ('away', away)):
+            if sides[side] is None:
+                errors.append(f"{label}: {side} team {team!r} is not an NFL team")
+        if sides['home'] and sides['home'] == sides['away']:
+            errors.append(f"{label}: a team cannot play itself")
+            continue
+        for abbr in filter(None, sides.values()):
+            if abbr in playing:
+                errors.append(f"{label}: {registry.teams[abbr]['name']} also plays in {playing[abbr]}")
+            else:
+                playing[abbr] = label
+
+        conference = game.get('conference')
+        if week == 4:
+            if conference != SUPER_BOWL:
+                errors.append(f"{label}: the Super Bowl's conference must be {SUPER_BOWL}, got {conference!r}")
+            if all(sides.values()) and {registry.conference(a) for a in sides.values()} != set(CONFERENCES):
+                errors.append(f"{label}: the Super Bowl is AFC vs NFC")
+            continue
+
+        if conference not in CONFERENCES:
+            errors.append(f"{label}: conference must be AFC or NFC, got {conference!r}")
+            continue
+        for abbr in filter(None, sides.values()):
+            if registry.conference(abbr) != conference:
+                errors.append(f"{label}: {registry.teams[abbr]['name']} is not in the {conference}")
+
+        seeds = {side: _seed(game.get(f'{side}_seed'), seed_count) for side in ('home', 'away')}
+        for side in ('home', 'away'):
+            if seeds[side] is None:
+                errors.append(f"{label}: {side}_seed must be a whole number from 1 to {seed_count}, "
+                              f"got {game.get(f'{side}_seed')!r}")
+        if None in seeds.values():
+            continue
+        if seeds['home'] >= seeds['away']:
+            errors.append(f"{label}: the better seed hosts (home #{seeds['home']}, away #{seeds['away']})")
+        if week == 1:
+            # Seven seeds: #1 on a bye, 2 v 7, 3 v 6, 4 v 5 (six seeds: #1 and #2, 3 v 6, 4 v 5)
+            byes = 8 - seed_count
+            if seeds['home'] <= byes:
+                errors.append(f"{label}: seed(s) #1-#{byes} have a Wild Card bye" if byes > 1
+                              else f"{label}: the #1 seed has a Wild Card bye")
+            elif seeds['home'] + seeds['away'] != byes + 1 + seed_count:
+                errors.append(f"{label}: #{seeds['home']} v #{seeds['away']} is not a Wild Card pairing")
+        if conference in field:
+            for side in ('home', 'away'):
+                if sides[side] and field[conference].get(seeds[side]) != sides[side]:
+                    errors.append(f"{label}: {registry.teams[sides[side]]['name']} is not the "
+                                  f"{conference} #{seeds[side]} seed")
+    return errors
+
+
+def check_game_row(row: Any, nfl_teams: List[Dict[str, str]], label: str) -> List[str]:
+    """Problems with one games table row (as backfill writes them); `label` prefixes each message."""
+    if not isinstance(row, dict):
+        return [f"{label}: expected an object, got {type(row).__name__}"]
+    registry = registry_for(nfl_teams)
+    errors = []
+    label = f"{label} ({row.get('away_team') or '?'} @ {row.get('home_team') or '?'})"
+
+    if not row.get('id') or not isinstance(row['id'], str):
+        errors.append(f"{label}: id must be a non-empty string, got {row.get('id')!r}")
+    if isinstance(row.get('season'), bool) or not isinstance(row.get('season'), int):
+        errors.append(f"{label}: season must be a year, got {row.get('season')!r}")
+    season_type = row.get('season_type')
+    if season_type not in (2, 3):
+        errors.append(f"{label}: season_type must be 2 (regular season) or 3 (playoffs), got {season_type!r}")
+    last_week = 4 if season_type == 3 else 18
+    week = row.get('week')
+    if isinstance(week, bool) or not isinstance(week, int) or not 1 <= week <= last_week:
+        errors.append(f"{label}: week must be a whole number from 1 to {last_week}, got {week!r}")
+
+    sides = {}
+    for side in ('home', 'away'):
+        team = row.get(f'{side}_team')
+        sides[side] = registry.resolve_name(team)
+        if sides[side] is None:
+            errors.append(f"{label}: {side}_team {team!r} is not an NFL team")
+        score = row.get(f'{side}_score')
+        if score is not None and (isinstance(score, bool) or not isinstance(score, int) or score < 0):
+            errors.append(f"{label}: {side}_score must be empty or a whole number, got {score!r}")
+    if sides['home'] and sides['home'] == sides['away']:
+        errors.append(f"{label}: a team cannot play itself")
+    if row.get('winner') is not None and registry.resolve_name(row['winner']) not in filter(None, sides.values()):
+        errors.append(f"{label}: winner {row['winner']!r} is neither team")
+    if not row.get('kickoff_time') or not isinstance(row['kickoff_time'], str):
+        errors.append(f"{label}: kickoff_time is required")
+    return errors
+
+
+def print_errors(errors: List[str], subject: str) -> None:
+    """Print a validation report: one line per problem."""
+    print(f"\n❌ {subject}: {len(errors)} problem(s), nothing was written")
+    for error in errors:
+        print(f"   - {error}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Write plans: the exact database operations a teams or games write would make, and their cost.
+
+    python scripts/populate-playoff-teams/populate-playoff-teams.py --season 2025 --teams-file teams.json --plan plan.json
+    python scripts/populate-playoff-teams/populate-playoff-teams.py games generate --season 2025 --week 2 --plan plan.json
+    python scripts/populate-playoff-teams/populate-playoff-teams.py --apply-plan plan.json
+
+A plan is computed against the rows currently stored and holds only what has to change:
+  - teams: one delete for teams no longer in the field and one upsert (on season,team_name)
+    for new or changed teams; unchanged teams cost nothing
+  - games: one insert for new games and one update per game whose teams or kickoff changed
+It is printed as a diff with the requests and rows it implies, next to what the regular
+write path would cost (delete + insert of the whole field; an update per existing game).
+
+A saved plan records a digest of the rows it was computed from. --apply-plan re-reads them
+(one request) and refuses to run if they changed since (--force runs it anyway), then
+executes the operations in order, as written in the file.
+"""
+
+import json
+import hashlib
+from datetime import datetime, timezone
+from typing import List, Dict, Any
+
+PLAN_VERSION = 1
+TEAM_COLUMNS = ('team_name', 'team_abbreviation', 'conference', 'seed')
+GAME_COLUMNS = ('id', 'home_team', 'away_team', 'kickoff_time')
+
+
+class PlanError(Exception):
+    """A plan file that cannot be applied (unreadable, another version, or stale)."""
+
+
+def read_rows(supabase, table: str, match: Dict[str, Any]) -> List[Dict[str, Any]]:
+    query = supabase.table(table).select('*')
+    for column, value in match.items():
+        query = query.eq(column, value)
+    return query.execute().data or []
+
+
+def state_digest(rows: List[Dict[str, Any]], columns) -> str:
+    """Hash of the planned-against rows, restricted to the columns the plan compares."""
+    values = sorted(json.dumps([row.get(c) for c in columns], default=str) for row in rows)
+    return hashlib.sha256('\n'.join(values).encode('utf-8')).hexdigest()
+
+
+def _describe_team(row: Dict[str, Any]) -> str:
+    return f"{row['team_name']} ({row.get('team_abbreviation') or 'N/A'}) {row.get('conference')} #{row.get('seed')}"
+
+
+def _describe_game(row: Dict[str, Any]) -> str:
+    return f"{row.get('away_team')} @ {row.get('home_team')} [{row['id']}]"
+
+
+def _changes(old: Dict[str, Any], new: Dict[str, Any], columns) -> List[str]:
+    return [f"{c} {old.get(c)!r} → {new.get(c)!r}" for c in columns if old.get(c) != new.get(c)]
+
+
+def _new_plan(kind: str, season: int, table: str, match: Dict[str, Any], columns,
+              existing: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'version': PLAN_VERSION,
+        'kind': kind,
+        'season': season,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'precondition': {'table': table, 'match': match, 'columns': list(columns),
+                         'rows': len(existing), 'digest': state_digest(existing, columns)},
+        'operations': [],
+    }
+
+
+def _finish(plan: Dict[str, Any], unchanged: int, baseline_requests: int, baseline_rows: int) -> Dict[str, Any]:
+    plan['requests'] = len(plan['operations'])
+    plan['rows'] = sum(op['row_count'] for op in plan['operations'])
+    plan['unchanged'] = unchanged
+    plan['baseline'] = {'requests': baseline_requests, 'rows': baseline_rows}
+    return plan
+
+
+def plan_teams(supabase, season: int, teams: List[Dict[str, any]]) -> Dict[str, Any]:
+    """Operations that make the season's playoff_teams exactly `teams` (one read)."""
+    match = {'season': season}
+    existing = read_rows(supabase, 'playoff_teams', match)
+    plan = _new_plan('playoff_teams', season, 'playoff_teams', match, TEAM_COLUMNS, existing)
+
+    desired = {t['team_name']: {'season': season, 'team_name': t['team_name'],
+                                'team_abbreviation': t.get('team_abbreviation'),
+                                'conference': t.get('conference'), 'seed': t.get('seed')} for t in teams}
+    stored = {row['team_name']: row for row in existing}
+
+    removed = sorted((row for name, row in stored.items() if name not in desired),
+                     key=lambda r: (r.get('conference') or '', r.get('seed') or 0))
+    if removed:
+        plan['operations'].append({
+            'table': 'playoff_teams', 'action': 'delete',
+            'match': {'season': season, 'team_name': [row['team_name'] for row in removed]},
+            'row_count': len(removed), 'diff': [f"- {_describe_team(row)}" for row in removed],
+        })
+
+    upserts, diff = [], []
+    for name, row in sorted(desired.items(), key=lambda item: (item[1]['conference'] or '', item[1]['seed'] or 0)):
+        if name not in stored:
+            upserts.append(row)
+            diff.append(f"+ {_describe_team(row)}")
+        elif _changes(stored[name], row, TEAM_COLUMNS):
+            upserts.append(row)
+            diff.append(f"~ {name}: {', '.join(_changes(stored[name], row, TEAM_COLUMNS))}")
+    if upserts:
+        plan['operations'].append({
+            'table': 'playoff_teams', 'action': 'upsert', 'on_conflict': 'season,team_name',
+            'rows': upserts, 'row_count': len(upserts), 'diff': diff,
+        })
+
+    # Regular path: delete the season's teams, insert the whole field
+    return _finish(plan, len(desired) - len(upserts), 2, len(existing) + len(desired))
+
+
+def plan_games(supabase, season: int, week: int, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Operations that write one week's game rows (see build_playoff_game_rows) (one read)."""
+    match = {'season': season, 'week': week, 'season_type': 3}
+    existing = read_rows(supabase, 'games', match)
+    plan = _new_plan('games', season, 'games', match, GAME_COLUMNS, existing)
+    plan['week'] = week
+
+    stored = {row['id']: row for row in existing}
+    new_rows = [row for row in rows if row['id'] not in stored]
+    if new_rows:
+        plan['operations'].append({
+            'table': 'games', 'action': 'insert', 'rows': new_rows, 'row_count': len(new_rows),
+            'diff': [f"+ {_describe_game(row)} kickoff {row['kickoff_time']}" for row in new_rows],
+        })
+
+    unchanged = 0
+    for row in rows:
+        old = stored.get(row['id'])
+        if old is None:
+            continue
+        changes = _changes(old, row, GAME_COLUMNS[1:])
+        if not changes:
+            unchanged += 1
+            continue
+        # Only the matchup and kickoff: scores and status of an existing game are left alone
+        plan['operations'].append({
+            'table': 'games', 'action': 'update', 'match': {'id': row['id']},
+            'values': {c: row[c] for c in GAME_COLUMNS[1:]}, 'row_count': 1,
+            'diff': [f"~ {_describe_game(row)}: {', '.join(changes)}"],
+        })
+
+    # Regular path: an update per game already stored, one insert for the rest
+    matched = sum(1 for row in rows if row['id'] in stored)
+    return _finish(plan, unchanged, matched + (1 if new_rows else 0), len(rows))
+
+
+def save_plan(plan: Dict[str, Any], path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(plan, f, indent=2, default=str)
+
+
+def load_plan(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r') as f:
+            plan = json.load(f)
+    except (OSError, ValueError) as e:
+        raise PlanError(f"Cannot read plan {path}: {e}")
+    if not isinstance(plan, dict) or plan.get('version') != PLAN_VERSION:
+        raise PlanError(f"{path} is not a version {PLAN_VERSION} write plan")
+    return plan
+
+
+def print_plan(plan: Dict[str, Any]) -> None:
+    """Print the plan as a diff with its request and row counts."""
+    scope = f"season {plan['season']}" + (f", week {plan['week']}" if plan.get('week') else '')
+    baseline = plan['baseline']
+    print(f"\n📝 Plan for {plan['kind']}, {scope}: {plan['requests']} write request(s), {plan['rows']} row(s)")
+    print(f"   Regular write path: {baseline['requests']} request(s), {baseline['rows']} row(s)")
+    for op in plan['operations']:
+        target = f" on {op['on_conflict']}" if op.get('on_conflict') else ''
+        print(f"  {op['action']} {op['table']}{target} (1 request, {op['row_count']} row(s))")
+        for line in op['diff']:
+            print(f"    {line}")
+    if plan['unchanged']:
+        print(f"  = {plan['unchanged']} row(s) unchanged")
+    if not plan['operations']:
+        print("  Nothing to write")
+
+
+def _execute(supabase, op: Dict[str, Any]):
+    table = supabase.table(op['table'])
+    if op['action'] == 'insert':
+        query = table.insert(op['rows'])
+    elif op['action'] == 'upsert':
+        query = table.upsert(op['rows'], on_conflict=op['on_conflict'])
+    elif op['action'] == 'update':
+        query = table.update(op['values'])
+    elif op['action'] == 'delete':
+        query = table.delete()
+    else:
+        raise PlanError(f"Unknown operation: {op['action']}")
+    for column, value in op.get('match', {}).items():
+        query = query.in_(column, value) if isinstance(value, list) else query.eq(column, value)
+    return query.execute()
+
+
+def apply_plan(supabase, plan: Dict[str, Any], force: bool = False) -> int:
+    """Execute a plan's operations in order; returns the number of requests made."""
+    precondition = plan['precondition']
+    current = read_rows(supabase, precondition['table'], precondition['match'])
+    if state_digest(current, precondition['columns']) != precondition['digest'] and not force:
+        raise PlanError(f"{precondition['table']} changed since the plan was made "
+                        f"({precondition['rows']} row(s) then, {len(current)} now); re-plan or pass --force")
+    for op in plan['operations']:
+        _execute(supabase, op)
+    return len(plan['operations'])
+
+
+def run_apply_plan(supabase, path: str, force: bool = False) -> int:
+    """Run --apply-plan; returns the process exit code."""
+    try:
+        plan = load_plan(path)
+        print_plan(plan)
+        requests = apply_plan(supabase, plan, force=force)
+    except PlanError as e:
+        print(f"❌ {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ Error applying plan: {e}")
+        return 1
+    print(f"\n✅ Applied {path}: {requests} request(s), {plan['rows']} row(s)")
+    return 0